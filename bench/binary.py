@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+'''
+Compares the size and speed of plyj.binary with pickle. Without an archive
+the trees of synthetic sources are used, otherwise those of the first files
+in the archive, e.g. a JDK's src.zip.
+
+usage: binary.py [methods | archive [files]]
+'''
+
+import os
+import pickle
+import sys
+import time
+
+import plyj.archive
+import plyj.binary
+import plyj.parser
+
+import corpus
+
+def trees():
+    parser = plyj.parser.Parser(scanner=True)
+    if len(sys.argv) > 1 and os.path.isfile(sys.argv[1]):
+        files = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+        names = plyj.archive.java_entries(sys.argv[1])[:files]
+        parsed = [tree for _, tree in plyj.archive.parse_archive(sys.argv[1], names)]
+        return [tree for tree in parsed if tree is not None]
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    return [parser.parse_string(corpus.compilation_unit(methods))]
+
+def best_time(function, items, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for item in items:
+            function(item)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    parsed = trees()
+
+    def pickle_dumps(tree):
+        return pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+
+    for name, dumps, loads in [('pickle', pickle_dumps, pickle.loads),
+                               ('plyj.binary', plyj.binary.dumps, plyj.binary.loads)]:
+        encoded = [dumps(tree) for tree in parsed]
+        print('{:>12}: {} bytes, dump {:.3f} s, load {:.3f} s'.format(
+            name, sum(len(data) for data in encoded), best_time(dumps, parsed),
+            best_time(loads, encoded)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+'''
+Synthetic Java sources for the benchmarks in this directory. They exercise
+most of the grammar and are roughly as dense as real library code.
+'''
+
+_method = '''
+    /**
+     * Returns a value computed from list number {i}.
+     * @param list the list
+     */
+    @SuppressWarnings("unchecked")
+    public static <T extends Comparable<? super T>> int method{i}(List<T> list, int[] values, String name) throws Exception {{
+        int total = 0; // running total
+        for (int j = 0; j < values.length; j++) {{
+            total += values[j] * 2 + (j % 3 == 0 ? 1 : -1);
+        }}
+        for (T t : list) {{
+            if (t != null && t.compareTo(list.get(0)) > 0) {{
+                total = total + name.length() << 1;
+            }} else {{
+                throw new IllegalArgumentException("bad value: " + t + " in " + name);
+            }}
+        }}
+        Map<String, List<Integer>> map = new HashMap<String, List<Integer>>();
+        try {{
+            map.put(name, new ArrayList<Integer>(Arrays.asList(1, 2, 3)));
+        }} catch (RuntimeException e) {{
+            return -1;
+        }} finally {{
+            total++;
+        }}
+        return (int) Math.max(total, 0L);
+    }}
+
+    private final Object field{i} = new Object();
+'''
+
+def compilation_unit(methods=150):
+    '''
+    Return the source of a class with the given number of methods. The
+    default is about as big as java/util/Collections.java.
+    '''
+    parts = ['package java.util;\n\n',
+             'import java.io.Serializable;\n',
+             'import java.util.function.*;\n\n',
+             '/**\n * Synthetic utility class.\n */\n',
+             'public class Collections {\n']
+    for i in range(methods):
+        parts.append(_method.format(i=i))
+    parts.append('}\n')
+    return ''.join(parts)
+
+def class_with_fields(fields):
+    '''Return the source of a class declaring the given number of fields.'''
+    parts = ['class Fields {\n']
+    for i in range(fields):
+        parts.append('    int field{0} = {0};\n'.format(i))
+    parts.append('}\n')
+    return ''.join(parts)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+'''
+Compares writing a tree as JSON with plyj.export to building a dictionary
+of it and writing that with json.dump(): the time and the peak memory it
+takes on top of the tree.
+
+usage: export.py [methods]
+'''
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import plyj.export
+import plyj.model
+import plyj.parser
+
+import corpus
+
+def as_dict(value):
+    if isinstance(value, plyj.model.SourceElement):
+        result = {'_type': value.__class__.__name__}
+        for name in value._fields:
+            result[name] = as_dict(getattr(value, name))
+        return result
+    if isinstance(value, list):
+        return [as_dict(item) for item in value]
+    return value
+
+def via_dict(tree, out):
+    json.dump(as_dict(tree), out)
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    tree = plyj.parser.Parser(scanner=True).parse_string(corpus.compilation_unit(methods))
+    with open(os.devnull, 'w') as out:
+        for name, export in [('json.dump', via_dict),
+                             ('plyj.export', lambda tree, out: plyj.export.write_json(
+                                 tree, out, positions=False))]:
+            best = None
+            for _ in range(3):
+                start = time.time()
+                export(tree, out)
+                elapsed = time.time() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+            tracemalloc.start()
+            export(tree, out)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print('{:>12}: {:.3f} s, peak {} bytes'.format(name, best, peak))
+
+if __name__ == '__main__':
+    main()
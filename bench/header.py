@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+'''
+Compares extracting the package and imports of a compilation unit with
+parse_header_string() to parsing all of it.
+
+usage: header.py [methods]
+'''
+
+import sys
+import time
+
+import plyj.parser
+
+import corpus
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    source = corpus.compilation_unit(methods)
+    parser = plyj.parser.Parser(scanner=True)
+    for name, parse in [('parse_string', parser.parse_string),
+                        ('parse_header_string', parser.parse_header_string)]:
+        best = None
+        for _ in range(5):
+            start = time.time()
+            parse(source)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        print('{:>20}: {:.6f} s, {:.0f} files/s'.format(name, best, 1 / best))
+
+if __name__ == '__main__':
+    main()
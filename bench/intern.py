@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+'''
+Measures how much memory parsed trees retain with and without interning,
+for one file and for several files sharing an Interner.
+
+usage: intern.py [methods] [files]
+'''
+
+import sys
+import time
+import tracemalloc
+
+import plyj.parser
+import plyj.model as m
+
+import corpus
+
+def retained(parse, sources):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    trees = [parse(source) for source in sources]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return trees, size
+
+def best_time(parse, source, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        parse(source)
+        times.append(time.time() - start)
+    return min(times)
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    source = corpus.compilation_unit(methods)
+    sources = [source] * files
+
+    for name, parser in [('plain', plyj.parser.Parser()),
+                         ('intern', plyj.parser.Parser(intern=True)),
+                         ('intern, shared', plyj.parser.Parser(intern=m.Interner()))]:
+        parser.parse_string(source)
+        _, one = retained(parser.parse_string, [source])
+        _, many = retained(parser.parse_string, sources)
+        print('{:15} {:.3f} s, {} bytes for one file, {} bytes for {}'.format(
+            name, best_time(parser.parse_string, source), one, many, files))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+'''
+Compares parsing whole compilation units with parsing them with lazy_bodies,
+which skips the bodies of methods.
+
+usage: lazy_bodies.py [methods]
+'''
+
+import sys
+import time
+
+import plyj.parser
+
+import corpus
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    source = corpus.compilation_unit(methods)
+    for name, parser in [('full', plyj.parser.Parser()),
+                         ('lazy', plyj.parser.Parser(lazy_bodies=True)),
+                         ('full, scanner', plyj.parser.Parser(scanner=True)),
+                         ('lazy, scanner', plyj.parser.Parser(scanner=True, lazy_bodies=True))]:
+        best = None
+        for _ in range(5):
+            start = time.time()
+            parser.parse_string(source)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        print('{:>14}: {:.3f} s'.format(name, best))
+
+if __name__ == '__main__':
+    main()
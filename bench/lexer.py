@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+'''
+Measures the throughput of the PLY lexer and of the hand-written scanner.
+
+usage: lexer.py [methods]
+'''
+
+import sys
+import time
+
+import plyj.parser
+import plyj.scanner
+
+import corpus
+
+def lex(lexer, source):
+    lexer.input(source)
+    count = 0
+    token = lexer.token
+    while token() is not None:
+        count += 1
+    return count
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    source = corpus.compilation_unit(methods)
+    for name, lexer in [('ply', plyj.parser.Parser().lexer.clone()),
+                        ('scanner', plyj.scanner.Scanner())]:
+        best = None
+        for _ in range(20):
+            start = time.time()
+            count = lex(lexer, source)
+            elapsed = time.time() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        print('{:>8}: {} tokens in {:.3f} s, {:.0f} tokens/s'.format(
+            name, count, best, count / best))
+
+if __name__ == '__main__':
+    main()
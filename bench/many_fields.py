@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+'''
+Parses classes with a growing number of fields. The time per field should
+stay about the same as the class grows.
+
+usage: many_fields.py [fields]
+'''
+
+import sys
+import time
+
+import plyj.parser
+
+import corpus
+
+def main():
+    fields = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    parser = plyj.parser.Parser()
+    for count in (fields // 4, fields // 2, fields):
+        source = corpus.class_with_fields(count)
+        start = time.time()
+        tree = parser.parse_string(source)
+        elapsed = time.time() - start
+        assert len(tree.type_declarations[0].body) == count
+        print('{:>7} fields: {:.2f} s, {:.1f} us per field'.format(
+            count, elapsed, elapsed / count * 1e6))
+
+if __name__ == '__main__':
+    main()
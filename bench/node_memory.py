@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+'''
+Measures how much memory the elements of a parsed tree occupy.
+
+usage: node_memory.py [methods]
+'''
+
+import sys
+import tracemalloc
+
+import plyj.parser
+import plyj.model as m
+
+import corpus
+
+def count_elements(tree):
+    count = 0
+    stack = [tree]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, list):
+            stack.extend(element)
+        elif isinstance(element, m.SourceElement):
+            count += 1
+            stack.extend(getattr(element, f) for f in element._fields)
+    return count
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    source = corpus.compilation_unit(methods)
+    parser = plyj.parser.Parser()
+    parser.parse_string(source)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = parser.parse_string(source)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    elements = count_elements(tree)
+    print('source:   {} bytes'.format(len(source)))
+    print('elements: {}'.format(elements))
+    print('retained: {} bytes'.format(retained))
+    print('per element: {:.1f} bytes'.format(float(retained) / elements))
+
+if __name__ == '__main__':
+    main()
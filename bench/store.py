@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+'''
+Compares answering a query over many compilation units from a plyj.store
+file with holding their trees in memory: the memory it takes and the time
+to list the names of all methods.
+
+usage: store.py [files] [methods]
+'''
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import plyj.parser
+import plyj.store
+
+import corpus
+
+def method_names(tree):
+    names = []
+    stack = [tree]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, list):
+            stack.extend(element)
+        elif isinstance(element, plyj.model.MethodDeclaration):
+            names.append(element.name)
+        elif isinstance(element, plyj.model.SourceElement):
+            stack.extend(getattr(element, f) for f in element._fields)
+    return names
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    methods = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    parser = plyj.parser.Parser(scanner=True)
+    source = corpus.compilation_unit(methods)
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'corpus.store')
+
+        tracemalloc.start()
+        trees = [parser.parse_string(source) for _ in range(files)]
+        in_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.time()
+        names = [name for tree in trees for name in method_names(tree)]
+        print('trees: {} bytes, {} methods in {:.3f} s'.format(in_memory, len(names),
+                                                               time.time() - start))
+
+        start = time.time()
+        plyj.store.write_store(path, (('F{}.java'.format(n), tree) for n, tree in enumerate(trees)))
+        written = time.time() - start
+        del trees
+
+        tracemalloc.start()
+        with plyj.store.Store(path) as store:
+            start = time.time()
+            names = [method.name for method in store.find('MethodDeclaration')]
+            elapsed = time.time() - start
+            used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print('store: {} bytes on disk written in {:.3f} s, {} bytes in memory, '
+              '{} methods in {:.3f} s'.format(os.path.getsize(path), written, used, len(names),
+                                               elapsed))
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
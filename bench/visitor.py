@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+'''
+Measures visiting a tree with the visitor of example/symbols_visitor.py,
+which only implements a few visit_ methods. It collects the lines it would
+print instead of printing them.
+
+usage: visitor.py [methods]
+'''
+
+import sys
+import time
+
+import plyj.model as m
+import plyj.parser
+
+import corpus
+
+class SymbolsVisitor(m.Visitor):
+
+    def __init__(self):
+        super(SymbolsVisitor, self).__init__()
+        self.lines = []
+
+    def visit_ClassDeclaration(self, class_decl):
+        return self.visit_type_declaration(class_decl)
+
+    def visit_InterfaceDeclaration(self, interface_decl):
+        return self.visit_type_declaration(interface_decl)
+
+    def visit_type_declaration(self, type_decl):
+        self.lines.append(str(type_decl.name))
+        return True
+
+    def visit_FieldDeclaration(self, field_decl):
+        for var_decl in field_decl.variable_declarators:
+            self.lines.append(var_decl.variable.name)
+
+    def visit_MethodDeclaration(self, method_decl):
+        self.lines.append(method_decl.name)
+        return True
+
+    def visit_VariableDeclaration(self, var_declaration):
+        for var_decl in var_declaration.variable_declarators:
+            self.lines.append(var_decl.variable.name)
+
+def main():
+    methods = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    tree = plyj.parser.Parser().parse_string(corpus.compilation_unit(methods))
+    best = None
+    for _ in range(20):
+        start = time.time()
+        tree.accept(SymbolsVisitor())
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    print('{} elements visited in {:.4f} s'.format(sum(1 for _ in tree.walk()) // 2, best))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+'''
+Parse the Java sources inside zip archives such as a JDK's src.zip or a
+Maven -sources.jar without extracting them.
+'''
+
+import zipfile
+
+from . import batch
+from .parser import get_parser
+
+def java_entries(archive):
+    '''
+    Return the names of all .java files in archive, which is a path or an
+    open zipfile.ZipFile.
+    '''
+    if not isinstance(archive, zipfile.ZipFile):
+        with zipfile.ZipFile(archive) as zf:
+            return java_entries(zf)
+    return [info.filename for info in archive.infolist()
+            if info.filename.endswith('.java') and not info.filename.endswith('/')]
+
+def read_entry(archive, name, encoding='utf-8'):
+    '''
+    Return the decoded content of entry name of the open zipfile.ZipFile
+    archive. Bytes that are not valid in encoding are replaced.
+    '''
+    return archive.read(name).decode(encoding, 'replace')
+
+# the archive of a pool worker
+_archive = None
+_encoding = None
+
+def _init_worker(path, encoding):
+    global _archive, _encoding
+    batch._init_worker()
+    if _archive is not None:
+        _archive.close()
+    _archive = zipfile.ZipFile(path)
+    _encoding = encoding
+
+def _parse(name):
+    # in a worker, the outcome is sent back to parse_archive()
+    try:
+        content = read_entry(_archive, name, _encoding)
+    except Exception as e:
+        return name, None, batch._describe(e), []
+    return batch._outcome(name, batch._parser.parse_string, content)
+
+def parse_archive(path, names=None, workers=1, encoding='utf-8', ordered=True, chunksize=8):
+    '''
+    Parse the .java entries of the archive at path and yield a
+    plyj.batch.ParseResult for each of them, with the entry name as its
+    path. A ParseResult unpacks into an (entry_name, compilation_unit) pair;
+    compilation_unit is None for entries that could not be parsed and error
+    tells why.
+
+    names restricts parsing to the given entries. With more than one worker
+    the entries are parsed in a process pool whose workers each open the
+    archive themselves; see plyj.batch.parse_many() for workers, ordered and
+    chunksize.
+    '''
+    if names is None:
+        names = java_entries(path)
+    if workers == 1:
+        # nothing global, several of these may be running at once
+        parser = get_parser()
+        with zipfile.ZipFile(path) as zf:
+            for name in names:
+                try:
+                    content = read_entry(zf, name, encoding)
+                except Exception as e:
+                    yield batch.ParseResult(name, error=batch._describe(e))
+                    continue
+                yield batch._parsed(name, parser.parse_string, content)
+        return
+    for outcome in batch._map(_parse, names, workers, ordered, chunksize,
+                              initializer=_init_worker, initargs=(path, encoding)):
+        yield batch._result(outcome)
@@ -0,0 +1,136 @@
+'''
+Parse many files in parallel using a pool of worker processes.
+
+Parsing is CPU bound and plyj is pure Python, so threads do not help much.
+parse_many() fans the files out over multiprocessing workers that each load
+the parser tables once when they start.
+'''
+
+import multiprocessing
+import pickle
+
+from .diagnostics import Diagnostics
+from .model import Interner
+from .parser import get_parser
+
+class ParseResult(object):
+    '''
+    The outcome of parsing a single file. Either compilation_unit is set or
+    error describes why the file could not be parsed. diagnostics lists the
+    problems the parser found, see plyj.diagnostics.
+    '''
+
+    def __init__(self, path, compilation_unit=None, error=None, diagnostics=()):
+        self.path = path
+        self.compilation_unit = compilation_unit
+        self.error = error
+        self.diagnostics = list(diagnostics)
+
+    def __iter__(self):
+        # unpacks into (path, compilation_unit) pairs
+        yield self.path
+        yield self.compilation_unit
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return 'ParseResult({!r})'.format(self.path)
+        return 'ParseResult({!r}, error={!r})'.format(self.path, self.error)
+
+# the parser of a pool worker
+_parser = None
+
+def _init_worker(recover=False, intern=False):
+    global _parser
+    _parser = get_parser(recover=recover, intern=intern)
+
+def _describe(e):
+    return '{}: {}'.format(e.__class__.__name__, e)
+
+def _parse(path):
+    return _outcome(path, _parser.parse_file, path)
+
+def _outcome(name, parse, *args):
+    # The tree is pickled here rather than by the pool so that a tree that
+    # cannot be sent back (e.g. one too deep for pickle) only fails its own
+    # file instead of the whole batch.
+    result = _parsed(name, parse, *args)
+    if not result.ok:
+        return name, None, result.error, result.diagnostics
+    try:
+        return name, pickle.dumps(result.compilation_unit, pickle.HIGHEST_PROTOCOL), None, \
+            result.diagnostics
+    except Exception as e:
+        return name, None, _describe(e), result.diagnostics
+
+def _parsed(name, parse, *args):
+    # Returns the ParseResult of parse(*args); files parsed in the calling
+    # process use this directly.
+    diagnostics = Diagnostics(name)
+    try:
+        tree = parse(*args, diagnostics=diagnostics)
+    except Exception as e:
+        return ParseResult(name, error=_describe(e), diagnostics=diagnostics)
+    if tree is None:
+        errors = diagnostics.syntax_errors
+        return ParseResult(name, error=str(errors[0]) if errors else 'unable to parse',
+                           diagnostics=diagnostics)
+    return ParseResult(name, tree, diagnostics=diagnostics)
+
+def _result(outcome, interner=None):
+    path, data, error, diagnostics = outcome
+    if error is not None:
+        return ParseResult(path, error=error, diagnostics=diagnostics)
+    try:
+        tree = pickle.loads(data)
+        if interner is not None:
+            tree = interner.intern(tree)
+        return ParseResult(path, tree, diagnostics=diagnostics)
+    except Exception as e:
+        return ParseResult(path, error=_describe(e), diagnostics=diagnostics)
+
+def parse_many(paths, workers=None, ordered=True, chunksize=1, recover=False, intern=False):
+    '''
+    Parse the files in paths and yield a ParseResult for each of them.
+
+    workers is the number of processes to use and defaults to the number of
+    CPUs. With workers=1 the files are parsed in the calling process. If
+    ordered is False results are yielded as soon as they are available
+    instead of in the order of paths. A file that fails to parse is reported
+    through its ParseResult and does not stop the batch. With recover=True
+    files with syntax errors are parsed as far as possible, see Parser.
+
+    With intern=True equal leaves and strings are shared between all trees of
+    the batch, see plyj.model.Interner. Pass an Interner to share them with
+    other trees as well.
+    '''
+    interner = None
+    if intern:
+        interner = intern if isinstance(intern, Interner) else Interner()
+    if workers == 1:
+        # nothing global, several of these may be running at once
+        parser = get_parser(recover=recover, intern=interner or False)
+        for path in paths:
+            yield _parsed(path, parser.parse_file, path)
+        return
+    # workers share leaves within a file, which makes the pickles smaller
+    for outcome in _map(_parse, paths, workers, ordered, chunksize,
+                        initargs=(recover, bool(intern))):
+        yield _result(outcome, interner)
+
+def _map(work, items, workers, ordered, chunksize, initializer=_init_worker, initargs=()):
+    pool = multiprocessing.Pool(workers, initializer=initializer, initargs=initargs)
+    try:
+        if ordered:
+            outcomes = pool.imap(work, items, chunksize)
+        else:
+            outcomes = pool.imap_unordered(work, items, chunksize)
+        for outcome in outcomes:
+            yield outcome
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,468 @@
+'''
+A compact binary encoding of parsed trees.
+
+dumps() encodes a tree, usually a CompilationUnit, and loads() restores it
+with positions, labels, comments and diagnostics, so the copy is
+indistinguishable from the tree that was dumped. Elements that are shared,
+e.g. by Parser(intern=True), are still shared in the copy. The encoding is a
+fraction of the size of a pickle of the same tree.
+
+The encoding starts with a header and three tables:
+
+* the element classes that occur, each with a checksum of its slot names
+* the strings, stored once each
+* the line indexes the positions of the elements refer to
+
+The tree follows in prefix order. Every value starts with a kind, an element
+is followed by its position and the values of its slots, a list by its
+length and its items. All numbers, kinds included, are varints: seven bits
+per byte, least significant first, the high bit set on all but the last
+byte.
+'''
+
+import struct
+import zlib
+
+from .diagnostics import Diagnostic, Diagnostics
+from .model import Comments, LazyBody, LineIndex, SourceElement
+from . import model
+
+MAGIC = b'plyj'
+VERSION = 2
+
+# kinds of values, element classes follow with the index of their entry in
+# the class table added to ELEMENT
+ABSENT, NONE, FALSE, TRUE, INT, STRING, LIST, LAZY_BODY, REFERENCE, \
+    FROZENSET, DIAGNOSTICS, COMMENTS, ELEMENT = range(13)
+
+# slots that are handled as part of the position
+_position_slots = frozenset(SourceElement.__slots__)
+
+_layouts = {}
+
+def _layout(cls):
+    # The slots of an element class that are stored: its fields followed by
+    # labels, comments and the like.
+    layout = _layouts.get(cls)
+    if layout is None:
+        slots = []
+        for klass in reversed(cls.__mro__):
+            for slot in klass.__dict__.get('__slots__', ()):
+                if slot not in _position_slots and slot not in cls._fields and slot not in slots:
+                    slots.append(slot)
+        layout = _layouts[cls] = tuple(cls._fields) + tuple(slots)
+    return layout
+
+def _checksum(cls):
+    return zlib.crc32(_encode(' '.join(_layout(cls)))) & 0xffffffff
+
+def dumps(tree):
+    '''Return the encoding of tree as bytes.'''
+    return _Writer().write(tree)
+
+def dump(tree, _file):
+    '''Write the encoding of tree to the binary file object _file.'''
+    _file.write(dumps(tree))
+
+def loads(data):
+    '''Return the tree encoded in data. Raises ValueError if data is not one.'''
+    return _Reader(data).read()
+
+def load(_file):
+    '''Return the tree read from the binary file object _file.'''
+    return loads(_file.read())
+
+def _write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, pos):
+    # returns the number at pos and the position behind it
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def _zigzag(value):
+    # maps signed to unsigned numbers: 0, -1, 1, -2... to 0, 1, 2, 3...
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value):
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+def _encode(text):
+    return text.encode('utf-8', 'surrogatepass')
+
+class _Writer(object):
+
+    def __init__(self):
+        self.out = bytearray()
+        self.classes = {}
+        self.strings = {}
+        self.lines = {}
+        self.line_indexes = []
+        # ids of the elements without a position that were written, they may
+        # be shared
+        self.written = {}
+
+    def write(self, tree):
+        self._write_tree(tree)
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        _write_varint(header, len(self.classes))
+        for cls in sorted(self.classes, key=self.classes.get):
+            self._write_bytes(header, _encode(cls.__name__))
+            _write_varint(header, _checksum(cls))
+        _write_varint(header, len(self.strings))
+        for string in sorted(self.strings, key=self.strings.get):
+            self._write_bytes(header, _encode(string))
+        _write_varint(header, len(self.line_indexes))
+        for lines in self.line_indexes:
+            first_line, line_starts = lines.__getstate__()
+            _write_varint(header, _zigzag(first_line))
+            _write_varint(header, len(line_starts))
+            previous = 0
+            for start in line_starts:
+                _write_varint(header, start - previous)
+                previous = start
+        return bytes(header + self.out)
+
+    def _write_bytes(self, out, data):
+        _write_varint(out, len(data))
+        out.extend(data)
+
+    def _write_tree(self, tree):
+        out = self.out
+        append = out.append
+        classes = self.classes
+        written = self.written
+        # starts are stored relative to the start of the element before
+        previous = 0
+        stack = [tree]
+        pop = stack.pop
+        while stack:
+            value = pop()
+            if isinstance(value, SourceElement):
+                start = value._start
+                if start is None:
+                    reference = written.get(id(value))
+                    if reference is not None:
+                        append(REFERENCE)
+                        _write_varint(out, reference)
+                        continue
+                    written[id(value)] = len(written)
+                cls = value.__class__
+                tag = classes.get(cls)
+                if tag is None:
+                    tag = classes[cls] = len(classes)
+                _write_varint(out, ELEMENT + tag)
+                if start is None:
+                    append(0)
+                else:
+                    _write_varint(out, self._lines(value._lines) + 1)
+                    _write_varint(out, _zigzag(start - previous))
+                    _write_varint(out, value._end - start)
+                    previous = start
+                layout = _layout(cls)
+                for name in reversed(layout):
+                    stack.append(getattr(value, name, _absent))
+            elif isinstance(value, list):
+                if isinstance(value, Diagnostics):
+                    self._write_diagnostics(value)
+                elif isinstance(value, LazyBody) and not value.parsed:
+                    append(LAZY_BODY)
+                    _write_varint(out, self._string(value._text))
+                    _write_varint(out, value.start)
+                    _write_varint(out, self._lines(value._lines))
+                    options = value._options
+                    if options is None:
+                        append(0)
+                    else:
+                        scanner, recover, intern = options
+                        append(1 + scanner + 2 * recover + 4 * bool(intern))
+                else:
+                    append(LIST)
+                    _write_varint(out, len(value))
+                    stack.extend(reversed(value))
+            elif isinstance(value, Comments):
+                append(COMMENTS)
+                _write_varint(out, self._string(value.source))
+                _write_varint(out, len(value.entries))
+                for entry in value.entries:
+                    _write_varint(out, entry)
+            else:
+                self._write_simple(value)
+
+    def _write_simple(self, value):
+        out = self.out
+        if value is _absent:
+            out.append(ABSENT)
+        elif value is None:
+            out.append(NONE)
+        elif value is False:
+            out.append(FALSE)
+        elif value is True:
+            out.append(TRUE)
+        elif isinstance(value, str):
+            out.append(STRING)
+            _write_varint(out, self._string(value))
+        elif isinstance(value, int):
+            out.append(INT)
+            _write_varint(out, _zigzag(value))
+        elif isinstance(value, frozenset):
+            out.append(FROZENSET)
+            _write_varint(out, len(value))
+            for item in sorted(value):
+                self._write_simple(item)
+        else:
+            raise TypeError('can not encode {!r}'.format(value))
+
+    def _write_diagnostics(self, diagnostics):
+        out = self.out
+        out.append(DIAGNOSTICS)
+        self._write_simple(diagnostics.file)
+        _write_varint(out, len(diagnostics))
+        for d in diagnostics:
+            for value in (d.message, d.offset, d.lineno, d.kind, d.token, d.expected, d.file):
+                self._write_simple(value)
+
+    def _string(self, string):
+        index = self.strings.get(string)
+        if index is None:
+            index = self.strings[string] = len(self.strings)
+        return index
+
+    def _lines(self, lines):
+        index = self.lines.get(id(lines))
+        if index is None:
+            index = self.lines[id(lines)] = len(self.line_indexes)
+            self.line_indexes.append(lines)
+        return index
+
+class _Absent(object):
+    # the value of a slot that is not set, e.g. the label of a statement
+    # without one
+
+    def __repr__(self):
+        return '_absent'
+
+_absent = _Absent()
+
+class _Reader(object):
+
+    def __init__(self, data):
+        self.data = bytearray(data)
+        self.pos = 0
+
+    def read(self):
+        data = self.data
+        if data[:len(MAGIC)] != bytearray(MAGIC) or len(data) <= len(MAGIC):
+            raise ValueError('not an encoded tree')
+        if data[len(MAGIC)] != VERSION:
+            raise ValueError('unsupported version {}'.format(data[len(MAGIC)]))
+        self.pos = len(MAGIC) + 1
+        try:
+            self.classes = [self._read_class() for _ in range(self._varint())]
+            self.strings = [self._read_string() for _ in range(self._varint())]
+            self.line_indexes = [self._read_lines() for _ in range(self._varint())]
+            tree = self._read_tree()
+        except IndexError:
+            raise ValueError('truncated encoding')
+        except (AttributeError, KeyError, OverflowError, TypeError, UnicodeDecodeError,
+                struct.error) as e:
+            # damaged data puts values where they do not belong
+            raise ValueError('corrupt encoding: {}'.format(e))
+        if self.pos != len(data):
+            raise ValueError('garbage after the encoded tree')
+        return tree
+
+    def _varint(self):
+        value, self.pos = _read_varint(self.data, self.pos)
+        return value
+
+    def _read_string(self):
+        length = self._varint()
+        start = self.pos
+        self.pos += length
+        if self.pos > len(self.data):
+            raise IndexError()
+        return bytes(self.data[start:self.pos]).decode('utf-8', 'surrogatepass')
+
+    def _read_class(self):
+        name = self._read_string()
+        checksum = self._varint()
+        cls = getattr(model, name, None)
+        if not (isinstance(cls, type) and issubclass(cls, SourceElement)):
+            raise ValueError('unknown element class {}'.format(name))
+        if checksum != _checksum(cls):
+            raise ValueError('{} has different slots now'.format(name))
+        return cls, _layout(cls)
+
+    def _read_lines(self):
+        first_line = _unzigzag(self._varint())
+        line_starts = []
+        start = 0
+        for _ in range(self._varint()):
+            start += self._varint()
+            line_starts.append(start)
+        lines = LineIndex.__new__(LineIndex)
+        lines.__setstate__((first_line, line_starts))
+        return lines
+
+    def _read_tree(self):
+        # The values are read into frames [container, slot names or None for
+        # lists, values read, values expected]. The values of the innermost
+        # container are read until one is a container itself, which is then
+        # put on top of the stack. The tree is read into the list at the bottom.
+        data = self.data
+        pos = self.pos
+        classes = self.classes
+        strings = self.strings
+        line_indexes = self.line_indexes
+        # the elements are new, so no cached hash is dropped by setting them
+        setattr = object.__setattr__
+        previous = 0
+        shared = []
+        units = []
+        root = []
+        stack = [[root, None, 0, 1]]
+        while stack:
+            frame = stack[-1]
+            container, layout, index, count = frame
+            opened = False
+            while index < count:
+                kind = data[pos]
+                pos += 1
+                if kind >= 0x80:
+                    kind, pos = _read_varint(data, pos - 1)
+                if kind >= ELEMENT:
+                    cls, slots = classes[kind - ELEMENT]
+                    value = cls.__new__(cls)
+                    lines = data[pos]
+                    pos += 1
+                    if lines:
+                        if lines >= 0x80:
+                            lines, pos = _read_varint(data, pos - 1)
+                        delta = data[pos]
+                        pos += 1
+                        if delta >= 0x80:
+                            delta, pos = _read_varint(data, pos - 1)
+                        length = data[pos]
+                        pos += 1
+                        if length >= 0x80:
+                            length, pos = _read_varint(data, pos - 1)
+                        previous += delta // 2 if not delta & 1 else -(delta + 1) // 2
+                        setattr(value, '_start', previous)
+                        setattr(value, '_end', previous + length)
+                        setattr(value, '_lines', line_indexes[lines - 1])
+                    else:
+                        setattr(value, '_start', None)
+                        setattr(value, '_end', None)
+                        setattr(value, '_lines', None)
+                        shared.append(value)
+                    if cls is model.CompilationUnit:
+                        units.append(value)
+                    if slots:
+                        stack.append([value, slots, 0, len(slots)])
+                        opened = True
+                elif kind == STRING:
+                    value = data[pos]
+                    pos += 1
+                    if value >= 0x80:
+                        value, pos = _read_varint(data, pos - 1)
+                    value = strings[value]
+                elif kind == NONE:
+                    value = None
+                elif kind == LIST:
+                    length = data[pos]
+                    pos += 1
+                    if length >= 0x80:
+                        length, pos = _read_varint(data, pos - 1)
+                    value = []
+                    if length:
+                        stack.append([value, None, 0, length])
+                        opened = True
+                elif kind == ABSENT:
+                    index += 1
+                    continue
+                elif kind == INT:
+                    value, pos = _read_varint(data, pos)
+                    value = value // 2 if not value & 1 else -(value + 1) // 2
+                elif kind == FALSE:
+                    value = False
+                elif kind == TRUE:
+                    value = True
+                elif kind == REFERENCE:
+                    value, pos = _read_varint(data, pos)
+                    value = shared[value]
+                elif kind == LAZY_BODY:
+                    text, pos = _read_varint(data, pos)
+                    start, pos = _read_varint(data, pos)
+                    lines, pos = _read_varint(data, pos)
+                    options = data[pos]
+                    pos += 1
+                    if options:
+                        options -= 1
+                        options = bool(options & 1), bool(options & 2), bool(options & 4)
+                    else:
+                        options = None
+                    value = LazyBody(strings[text], start, line_indexes[lines], options)
+                    # units are not nested, the body belongs to the last one
+                    if units:
+                        value._unit = units[-1]
+                elif kind == COMMENTS:
+                    source, pos = _read_varint(data, pos)
+                    entries = []
+                    length, pos = _read_varint(data, pos)
+                    for _ in range(length):
+                        entry, pos = _read_varint(data, pos)
+                        entries.append(entry)
+                    value = Comments(strings[source], entries)
+                else:
+                    self.pos = pos - 1
+                    value = self._read_simple()
+                    pos = self.pos
+                if layout is None:
+                    container.append(value)
+                else:
+                    setattr(container, layout[index], value)
+                index += 1
+                if opened:
+                    break
+            frame[2] = index
+            if not opened:
+                stack.pop()
+        self.pos = pos
+        for unit in units:
+            if unit.comments is not None:
+                unit.comments.associate(unit)
+        return root[0]
+
+    def _read_simple(self):
+        kind = self._varint()
+        if kind == ABSENT:
+            return _absent
+        if kind == NONE:
+            return None
+        if kind == FALSE:
+            return False
+        if kind == TRUE:
+            return True
+        if kind == INT:
+            return _unzigzag(self._varint())
+        if kind == STRING:
+            return self.strings[self._varint()]
+        if kind == FROZENSET:
+            return frozenset(self._read_simple() for _ in range(self._varint()))
+        if kind == DIAGNOSTICS:
+            diagnostics = Diagnostics(self._read_simple())
+            for _ in range(self._varint()):
+                diagnostics.append(Diagnostic(*[self._read_simple() for _ in range(7)]))
+            return diagnostics
+        raise ValueError('unexpected kind {}'.format(kind))
@@ -0,0 +1,163 @@
+'''
+An on-disk cache of parsed compilation units.
+
+Entries are keyed by a hash of the source, its encoding, the options of the
+parser and the grammar, so a cached tree is served for unchanged files
+without running the lexer or the parser.
+'''
+
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+from .parser import get_parser, grammar_hash
+
+# bump when the way trees are stored changes
+_FORMAT = '4'
+
+class ParseCache(object):
+    '''
+    Wraps a Parser and stores the trees it produces below directory. The
+    cache is bounded to max_size bytes; when it grows beyond that the least
+    recently used entries are evicted.
+
+    hits, misses and evictions count what happened since the cache was
+    created.
+    '''
+
+    def __init__(self, directory, max_size=256 * 1024 * 1024, parser=None):
+        if parser is None:
+            parser = get_parser()
+        self.directory = directory
+        self.max_size = max_size
+        self.parser = parser
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def parse_file(self, _file, encoding='utf-8'):
+        if type(_file) == str:
+            with open(_file, 'rb') as f:
+                content = f.read()
+        else:
+            content = _file.read()
+        if not isinstance(content, bytes):
+            content = content.encode(encoding)
+        return self._parse(content, encoding)
+
+    def parse_string(self, code, encoding='utf-8'):
+        return self._parse(code.encode(encoding), encoding)
+
+    def key(self, content, encoding='utf-8'):
+        '''Return the cache key of the source bytes content.'''
+        parser = self.parser
+        options = (parser.scanner, parser.keep_comments, parser.recover, parser.lazy_bodies,
+                   bool(parser.intern))
+        digest = hashlib.sha1()
+        digest.update(_FORMAT.encode('ascii'))
+        digest.update(grammar_hash().encode('ascii'))
+        digest.update('{} {}\n'.format(' '.join(str(int(o)) for o in options),
+                                       encoding).encode('ascii'))
+        digest.update(content)
+        return digest.hexdigest()
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            os.remove(path)
+        self._size = 0
+
+    def _parse(self, content, encoding):
+        path = self._path(self.key(content, encoding))
+        tree = self._load(path)
+        if tree is not None:
+            self.hits += 1
+            return tree
+        self.misses += 1
+        tree = self.parser.parse_string(content.decode(encoding, 'replace'))
+        if tree is not None:
+            self._store(path, tree)
+        return tree
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def _load(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+        try:
+            tree = pickle.loads(zlib.decompress(data))
+        except Exception:
+            # corrupt or written by an incompatible version of plyj
+            self._remove(path)
+            return None
+        try:
+            # the modification time doubles as the last access time
+            os.utime(path, None)
+        except OSError:
+            pass
+        return tree
+
+    def _store(self, path, tree):
+        try:
+            data = zlib.compress(pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            # trees too deep for pickle are simply not cached
+            return
+        size = self._current_size()
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.rename(tmp, path)
+        self._size = size + len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        if self._size is not None:
+            self._size -= size
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _current_size(self):
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        return self._size
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
@@ -0,0 +1,80 @@
+'''
+Problems found while parsing a source.
+
+The lexer and the parser do not print anything. Every problem is recorded as
+a Diagnostic in the Diagnostics of the parse, or raised as a ParseError if
+the parser was asked to stop at the first one.
+'''
+
+LEXICAL = 'lexical'
+SYNTAX = 'syntax'
+
+class Diagnostic(object):
+    '''
+    A problem found in file (None if the source did not come from a file).
+    offset is where in the source the problem was found and lineno the line
+    it is on. kind is LEXICAL for characters that do not start a token and
+    SYNTAX for syntax errors. token is the text of the offending token, None
+    at the end of the input, and expected the set of token types the parser
+    would have accepted instead.
+    '''
+
+    def __init__(self, message, offset=None, lineno=None, kind=SYNTAX, token=None,
+                 expected=None, file=None):
+        self.message = message
+        self.offset = offset
+        self.lineno = lineno
+        self.kind = kind
+        self.token = token
+        self.expected = expected
+        self.file = file
+
+    def __str__(self):
+        location = [str(part) for part in (self.file, self.lineno) if part is not None]
+        if not location:
+            return self.message
+        return '{}: {}'.format(':'.join(location), self.message)
+
+    def __repr__(self):
+        return 'Diagnostic({!r}, offset={!r}, lineno={!r})'.format(
+            self.message, self.offset, self.lineno)
+
+class Diagnostics(list):
+    '''
+    The diagnostics of a parse in the order they were found. Pass one to a
+    parse method to collect them whatever the outcome of the parse.
+    '''
+
+    def __init__(self, file=None):
+        super(Diagnostics, self).__init__()
+        self.file = file
+
+    def add(self, message, offset=None, lineno=None, kind=SYNTAX, token=None, expected=None):
+        diagnostic = Diagnostic(message, offset, lineno, kind, token, expected, self.file)
+        self.append(diagnostic)
+        return diagnostic
+
+    @property
+    def syntax_errors(self):
+        return [d for d in self if d.kind == SYNTAX]
+
+class ParseError(Exception):
+    '''Raised for the first problem if the parser should not carry on.'''
+
+    def __init__(self, diagnostic):
+        super(ParseError, self).__init__(str(diagnostic))
+        self.diagnostic = diagnostic
+
+def report(lexer, message, offset, lineno, kind=SYNTAX, token=None, expected=None):
+    '''
+    Record a problem in the diagnostics of the parse lexer is used for.
+    offset is into the lexer input. Raises ParseError if the parse should
+    stop at the first problem.
+    '''
+    diagnostics = getattr(lexer, 'diagnostics', None)
+    if diagnostics is None:
+        return
+    diagnostic = diagnostics.add(message, offset - lexer.source_start, lineno, kind,
+                                 token, expected)
+    if lexer.raise_errors:
+        raise ParseError(diagnostic)
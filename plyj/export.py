@@ -0,0 +1,129 @@
+'''
+Export parsed trees as JSON for programs that are not written in Python.
+
+An element becomes an object with its class name under "_type", its position
+(start, end, lineno, col_offset, end_lineno and end_col_offset, left out if
+it has none) and its fields under their names; statements with a label have
+it under "label". Lists become arrays and strings, numbers, booleans and None
+become their JSON counterparts. Comments and diagnostics are not exported.
+
+The JSON is written to a text file object while the tree is walked, in
+pieces of a bounded size, so nothing as big as the tree is built in between.
+'''
+
+from json.encoder import encode_basestring_ascii as _string
+
+from .model import SourceElement
+
+# pieces collected before they are written
+_BUFFERED = 4096
+
+def write_json(tree, out, positions=True):
+    '''
+    Write tree, usually a CompilationUnit, as JSON to the text file object
+    out. With positions=False the positions of elements are left out.
+    '''
+    writer = _Writer(out, positions)
+    writer.write(tree)
+    writer.flush()
+
+def write_ndjson(units, out, positions=True):
+    '''
+    Write units, which are (name, compilation_unit) pairs such as those
+    plyj.archive.parse_archive() yields, to out as newline delimited JSON:
+    one line {"name": ..., "compilation_unit": ...} per unit. The compilation
+    unit is null for files that could not be parsed.
+    '''
+    writer = _Writer(out, positions)
+    for name, unit in units:
+        writer.emit('{"name":' + _string(name) + ',"compilation_unit":')
+        writer.write(unit)
+        writer.emit('}\n')
+    writer.flush()
+
+class _Writer(object):
+
+    def __init__(self, out, positions):
+        self.out = out
+        self.positions = positions
+        self.parts = []
+        # class -> the key of every field with the separator in front of it
+        self.keys = {}
+
+    def emit(self, text):
+        self.parts.append(text)
+        if len(self.parts) >= _BUFFERED:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.out.write(''.join(self.parts))
+            del self.parts[:]
+
+    def write(self, tree):
+        parts = self.parts
+        emit = parts.append
+        keys = self.keys
+        positions = self.positions
+        # values still to be written, or text to write as it is
+        stack = [tree]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            if len(parts) >= _BUFFERED:
+                self.flush()
+            value = pop()
+            if isinstance(value, _Text):
+                emit(value)
+            elif isinstance(value, SourceElement):
+                cls = value.__class__
+                fields = keys.get(cls)
+                if fields is None:
+                    fields = keys[cls] = [(name, _Text(',' + _string(name) + ':'))
+                                          for name in cls._fields]
+                emit('{"_type":"' + cls.__name__ + '"')
+                if positions and value._start is not None:
+                    lineno, col_offset = value._position(value._start)
+                    end_lineno, end_col_offset = value._position(value._end)
+                    emit(',"start":{},"end":{},"lineno":{},"col_offset":{},"end_lineno":{},'
+                         '"end_col_offset":{}'.format(value._start, value._end, lineno,
+                                                      col_offset, end_lineno, end_col_offset))
+                # Break and Continue have a label field instead
+                label = getattr(value, 'label', None) if 'label' not in cls._fields else None
+                if label is not None:
+                    emit(',"label":' + _string(label))
+                push(_END_OBJECT)
+                for name, key in reversed(fields):
+                    push(getattr(value, name))
+                    push(key)
+            elif isinstance(value, list):
+                if not value:
+                    emit('[]')
+                    continue
+                emit('[')
+                push(_END_ARRAY)
+                for index in range(len(value) - 1, 0, -1):
+                    push(value[index])
+                    push(_COMMA)
+                push(value[0])
+            elif isinstance(value, str):
+                emit(_string(value))
+            elif value is None:
+                emit('null')
+            elif value is True:
+                emit('true')
+            elif value is False:
+                emit('false')
+            elif isinstance(value, int):
+                emit(str(value))
+            else:
+                raise TypeError('can not export {!r}'.format(value))
+
+class _Text(str):
+    # text on the stack of _Writer.write() that is written as it is, unlike
+    # the strings in fields
+    __slots__ = ()
+
+_END_OBJECT = _Text('}')
+_END_ARRAY = _Text(']')
+_COMMA = _Text(',')
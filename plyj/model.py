@@ -1,13 +1,276 @@
+import array
+import bisect
+import re
+import threading
+import types
+import weakref
+
+class LineIndex(object):
+    '''
+    Maps offsets into a source text to line and column numbers. All nodes of
+    a parsed file share one index which is only built on the first lookup.
+    '''
+
+    _newline = re.compile('\n')
+
+    def __init__(self, source, first_line=1):
+        self.first_line = first_line
+        self._source = source
+        self._line_starts = None
+
+    def line_starts(self):
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in self._newline.finditer(self._source)]
+            self._source = None
+        return self._line_starts
+
+    def update(self, source):
+        '''Make the index map offsets into source instead.'''
+        self._source = source
+        self._line_starts = None
+
+    def position(self, offset):
+        '''Return the line and column of offset, columns start at 0.'''
+        line_starts = self.line_starts()
+        line = bisect.bisect_right(line_starts, offset) - 1
+        return self.first_line + line, offset - line_starts[line]
+
+    def __getstate__(self):
+        return self.first_line, self.line_starts()
+
+    def __setstate__(self, state):
+        self.first_line, self._line_starts = state
+        self._source = None
+
+class Comments(object):
+    '''
+    The comments of a compilation unit. They are kept in one flat array of
+    integers, three per comment: its offset in the source, its length and its
+    kind (LINE, BLOCK or JAVADOC).
+
+    A Javadoc comment that directly precedes a declaration (only whitespace
+    and other comments in between) documents it; javadoc() looks that up.
+    '''
+
+    LINE = 0
+    BLOCK = 1
+    JAVADOC = 2
+
+    def __init__(self, source, entries=()):
+        self.source = source
+        self.entries = array.array('l', entries)
+        # start offset of a declaration -> index of its Javadoc comment
+        self._documented = {}
+
+    def __len__(self):
+        return len(self.entries) // 3
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('comment index out of range')
+        return tuple(self.entries[3 * index:3 * index + 3])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def text(self, index):
+        offset, length, _ = self[index]
+        return self.source[offset:offset + length]
+
+    def javadoc(self, declaration):
+        '''
+        Return the text of the Javadoc comment of declaration or None. Other
+        elements are never documented, even where they start with a
+        documented declaration, e.g. its first annotation.
+        '''
+        if declaration.__class__ not in _documentable:
+            return None
+        index = self._documented.get(declaration.start)
+        if index is None:
+            return None
+        return self.text(index)
+
+    def associate(self, tree):
+        '''Find the declarations in tree that are documented.'''
+        self._documented = {}
+        self._associate(tree)
+
+    def _associate(self, tree):
+        # adds the documented declarations in tree
+        entries = self.entries
+        offsets = entries[::3]
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, list):
+                # declarations in bodies that were not parsed are not looked at
+                if not isinstance(element, LazyBody) or element.parsed:
+                    stack.extend(element)
+                continue
+            if not isinstance(element, SourceElement):
+                continue
+            if element.__class__ in _documentable and element.start is not None:
+                index = self._preceding_javadoc(offsets, element.start)
+                if index is not None:
+                    self._documented[element.start] = index
+            stack.extend(getattr(element, f) for f in element._fields)
+
+    def _preceding_javadoc(self, offsets, start):
+        entries = self.entries
+        end = start
+        index = bisect.bisect_left(offsets, start) - 1
+        while index >= 0:
+            offset, length, kind = entries[3 * index:3 * index + 3]
+            if self.source[offset + length:end].strip():
+                return None
+            if kind == Comments.JAVADOC:
+                return index
+            end = offset
+            index -= 1
+        return None
+
+    def __repr__(self):
+        return 'Comments({} comments)'.format(len(self))
+
+class LazyBody(list):
+    '''
+    The statements of a method, constructor or initializer body that was
+    skipped by Parser(lazy_bodies=True). Only the text of the body is kept;
+    it is parsed the first time the list is looked at or changed, which
+    raises plyj.diagnostics.ParseError if the body has syntax errors. start
+    and end are the offsets of its braces.
+
+    The body is parsed like the parser it was skipped by would have: with
+    its scanner and recover settings, interned with the Interner its tree was
+    interned with, and with its problems and documented declarations added to
+    the diagnostics and comments of its compilation unit.
+    '''
+
+    __slots__ = ('start', 'end', '_text', '_lines', '_options', '_unit', '_interner')
+
+    def __init__(self, text, start, lines, options=None):
+        super(LazyBody, self).__init__()
+        self.start = start
+        self.end = start + len(text)
+        self._text = text
+        self._lines = lines
+        # the scanner, recover and intern arguments of the parser
+        self._options = options
+        self._unit = None
+        self._interner = None
+
+    @property
+    def parsed(self):
+        return self._text is None
+
+    def parse(self):
+        '''Parse the body now if that has not happened yet.'''
+        if self._text is None:
+            return
+        # imported here because the parser builds these
+        from .diagnostics import ParseError
+        from .parser import Parser
+        with _lazy_lock:
+            # another thread may have parsed the body in the meantime
+            text = self._text
+            if text is None:
+                return
+            scanner, recover, intern = self._options or (True, False, False)
+            parser = Parser(scanner, recover=recover)
+            block, diagnostics = parser._parse_fragment(text, self.start, '* ', self._lines)
+            if block is None or diagnostics and not recover:
+                raise ParseError(diagnostics[0])
+            interner = self._interner
+            if interner is None and intern:
+                interner = Interner()
+            if interner is not None:
+                block = interner.intern(block)
+            # threads that find _text cleared do not take the lock, so the
+            # statements must be in place before
+            list.extend(self, block.statements)
+            self._text = None
+            unit = self._unit
+            if unit is not None:
+                if unit.diagnostics is not None:
+                    unit.diagnostics.extend(diagnostics)
+                if unit.comments is not None:
+                    unit.comments._associate(self)
+
+    def __repr__(self):
+        if self._text is not None:
+            return 'LazyBody({}, {})'.format(self.start, self.end)
+        return list.__repr__(self)
+
+    def __reduce__(self):
+        if self._text is not None:
+            # a copy interns with an Interner of its own
+            return LazyBody, (self._text, self.start, self._lines, self._options), \
+                (None, {'_unit': self._unit})
+        return list, (list(self),)
+
+# held while a LazyBody is parsed, bodies can be shared between threads
+_lazy_lock = threading.RLock()
+
+def _parsing(method):
+    def parsing(self, *args):
+        self.parse()
+        for arg in args:
+            if isinstance(arg, LazyBody):
+                arg.parse()
+        return method(self, *args)
+    parsing.__name__ = method.__name__
+    return parsing
+
+# every method of list that looks at or changes the items; some are missing
+# on older Pythons
+for _name in ('__iter__', '__reversed__', '__len__', '__contains__', '__getitem__',
+              '__setitem__', '__delitem__', '__getslice__', '__setslice__',
+              '__delslice__', '__eq__', '__ne__', '__lt__', '__le__', '__gt__',
+              '__ge__', '__add__', '__mul__', '__rmul__', '__iadd__', '__imul__',
+              'append', 'extend', 'insert', 'pop', 'remove', 'index', 'count',
+              'reverse', 'sort', 'copy', 'clear'):
+    if hasattr(list, _name):
+        setattr(LazyBody, _name, _parsing(getattr(list, _name)))
+del _name
+
 # Base node
 class SourceElement(object):
     '''
     A SourceElement is the base class for all elements that occur in a Java
     file parsed by plyj.
+
+    Elements created by the parser know where they occur in the source: start
+    and end are the offsets of their first and one past their last character
+    (an expression in parentheses includes them). Line and column numbers are
+    computed from these on demand. Elements created by other means have no
+    position and all of these are None.
+
+    Elements are numerous, so every class declares __slots__ instead of
+    carrying an instance dictionary. _fields names the children of an element
+    in the order they are visited; Statement subclasses additionally have a
+    label slot that is set for labeled statements.
+
+    Elements compare equal if they are of the same class and have equal
+    fields and labels. Their hash is computed from the same, so subtrees can
+    be used as dictionary keys. Hashes are cached and computed from the
+    cached hashes of the subnodes, so hashing every subtree of a tree takes
+    time linear in its size. Assigning a field or a label of any element
+    drops all cached hashes; changing a list of subnodes in place does not,
+    call plyj.model.forget_hashes() after doing that.
     '''
 
+    __slots__ = ('_start', '_end', '_lines', '_hash')
+    _fields = ()
+
     def __init__(self):
         super(SourceElement, self).__init__()
-        self._fields = []
+        setattr = object.__setattr__
+        setattr(self, '_start', None)
+        setattr(self, '_end', None)
+        setattr(self, '_lines', None)
 
     def __repr__(self):
         equals = ("{0}={1!r}".format(k, getattr(self, k))
@@ -16,41 +279,324 @@ class SourceElement(object):
         return "{0}({1})".format(self.__class__.__name__, args)
 
     def __eq__(self, other):
-        try:
-            return self.__dict__ == other.__dict__
-        except AttributeError:
+        # positions do not take part in comparisons
+        if self is other:
+            return True
+        if not isinstance(other, SourceElement):
             return False
+        return _equal(self, other, 0)
+
+    def __hash__(self):
+        return _hash(self, 0)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # there is nothing to drop while no hash was cached
+        if _generation[1] and name not in _unhashed:
+            _generation[:] = [object(), False]
+
+    def __setstate__(self, state):
+        # a copy is new, so restoring it does not drop any cached hash
+        if isinstance(state, tuple):
+            state = state[1]
+        setattr = object.__setattr__
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def __ne__(self, other):
         return not self == other
 
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def end(self):
+        return self._end
+
+    @property
+    def lineno(self):
+        return self._position(self._start)[0]
+
+    @property
+    def col_offset(self):
+        return self._position(self._start)[1]
+
+    @property
+    def end_lineno(self):
+        return self._position(self._end)[0]
+
+    @property
+    def end_col_offset(self):
+        return self._position(self._end)[1]
+
+    def _position(self, offset):
+        if offset is None or self._lines is None:
+            return None, None
+        return self._lines.position(offset)
+
+    # classes that visit their subnodes differently override this with a
+    # method that visits the element and pushes what is left to do for
+    # accept() onto its stack
+    _traverse = None
+
     def accept(self, visitor):
         """
-        default implementation that visit the subnodes in the order
-        they are stored in self_field
+        visit this element and the subnodes in the order they are stored in
+        _fields. visit_X is called for an element of class X and, only if it
+        returns True, then for its subnodes, leave_X after them. The tree is
+        traversed with an explicit stack, so it may be of any depth. The
+        methods of a visitor class are only looked up once per element class.
+        """
+        handlers = _dispatch(visitor)
+        leave = _LEAVE
+        stack = [self]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            item = pop()
+            if item is leave:
+                # the subnodes of the element below have been visited
+                item = pop()
+                handlers[item.__class__][1](visitor, item)
+            elif item.__class__ is tuple:
+                # a call deferred by _traverse
+                item[0](item[1])
+            elif item._traverse is not None:
+                item._traverse(visitor, stack)
+            else:
+                push(item)
+                push(leave)
+                if handlers[item.__class__][0](visitor, item):
+                    # pushed in reverse, so they are popped in order
+                    for f in reversed(item._fields):
+                        field = getattr(item, f)
+                        if field:
+                            if isinstance(field, list):
+                                for elem in reversed(field):
+                                    if isinstance(elem, SourceElement):
+                                        push(elem)
+                            elif isinstance(field, SourceElement):
+                                push(field)
+
+    def walk(self):
         """
-        class_name = self.__class__.__name__
-        visit = getattr(visitor, 'visit_' + class_name)
-        if visit(self):
-            for f in self._fields:
-                field = getattr(self, f)
-                if field:
-                    if isinstance(field, list):
-                        for elem in field:
-                            if isinstance(elem, SourceElement):
-                                elem.accept(visitor)
-                    elif isinstance(field, SourceElement):
-                        field.accept(visitor)
-        getattr(visitor, 'leave_' + class_name)(self)
+        yield (element, True) when an element is visited and (element, False)
+        when it is left, in the order accept() calls visit_ and leave_ on a
+        visitor whose visit_ methods all return True.
+        """
+        leave = _LEAVE
+        recorder = _Recorder()
+        events = recorder.events
+        stack = [self]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            item = pop()
+            if item is leave:
+                yield pop(), False
+                continue
+            if item.__class__ is tuple:
+                item[0](item[1])
+            elif item._traverse is not None:
+                item._traverse(recorder, stack)
+            else:
+                push(item)
+                push(leave)
+                yield item, True
+                _push_subnodes(item, push)
+                continue
+            for event in events:
+                yield event
+            del events[:]
+
+# Comparing and hashing recurse into subnodes up to this depth, deeper
+# subtrees are handled with an explicit stack, which is slower
+_MAX_DEPTH = 100
+
+# Cached hashes are (token, hash) pairs that are only valid while their
+# token is current, the first item; the second tells whether any hash was
+# cached with it. A copy of a tree (e.g. from pickle) gets tokens of its own,
+# so its hashes are computed again.
+_generation = [object(), False]
+
+# slots that do not take part in comparisons
+_unhashed = frozenset(['_start', '_end', '_lines', '_hash'])
+
+def forget_hashes():
+    '''
+    Drop the cached hashes of all elements. Needed after a list of subnodes
+    was changed in place.
+    '''
+    _generation[:] = [object(), False]
+
+def _equal(a, b, depth):
+    # whether the elements a and b are equal
+    if a.__class__ is not b.__class__:
+        return False
+    if depth >= _MAX_DEPTH:
+        return _equal_deep(a, b)
+    for name in a._fields:
+        x = getattr(a, name)
+        y = getattr(b, name)
+        if x is y:
+            continue
+        if isinstance(x, SourceElement):
+            if not isinstance(y, SourceElement) or not _equal(x, y, depth + 1):
+                return False
+        elif isinstance(x, list):
+            if not isinstance(y, list) or len(x) != len(y):
+                return False
+            for v, w in zip(x, y):
+                if v is w:
+                    continue
+                if isinstance(v, SourceElement):
+                    if not isinstance(w, SourceElement) or not _equal(v, w, depth + 1):
+                        return False
+                elif v != w:
+                    return False
+        elif x != y:
+            return False
+    return getattr(a, 'label', None) == getattr(b, 'label', None)
+
+def _equal_deep(a, b):
+    stack = [(a, b)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        a, b = pop()
+        if a is b:
+            continue
+        if isinstance(a, list) and isinstance(b, list):
+            if len(a) != len(b):
+                return False
+            for pair in zip(reversed(a), reversed(b)):
+                push(pair)
+        elif isinstance(a, SourceElement) and isinstance(b, SourceElement):
+            if a.__class__ is not b.__class__:
+                return False
+            if getattr(a, 'label', None) != getattr(b, 'label', None):
+                return False
+            for name in reversed(a._fields):
+                push((getattr(a, name), getattr(b, name)))
+        elif isinstance(a, (SourceElement, list)) or isinstance(b, (SourceElement, list)):
+            return False
+        elif a != b:
+            return False
+    return True
+
+def _hash(element, depth):
+    token = _generation[0]
+    cached = getattr(element, '_hash', None)
+    if cached is not None and cached[0] is token:
+        return cached[1]
+    if depth >= _MAX_DEPTH:
+        return _hash_deep(element, token)
+    values = [element.__class__, getattr(element, 'label', None)]
+    for name in element._fields:
+        values.append(_hash_value(getattr(element, name), depth))
+    value = hash(tuple(values))
+    object.__setattr__(element, '_hash', (token, value))
+    _generation[1] = True
+    return value
+
+def _hash_value(value, depth):
+    if isinstance(value, SourceElement):
+        return _hash(value, depth + 1)
+    if isinstance(value, (list, tuple)):
+        return hash(tuple([_hash_value(v, depth) for v in value]))
+    return hash(value)
+
+def _hash_deep(element, token):
+    # hashes the subnodes first, from an explicit stack
+
+    def fresh(element):
+        cached = getattr(element, '_hash', None)
+        return cached is not None and cached[0] is token
+
+    def value_hash(value):
+        if isinstance(value, SourceElement):
+            return value._hash[1]
+        if isinstance(value, (list, tuple)):
+            return hash(tuple([value_hash(v) for v in value]))
+        return hash(value)
+
+    stack = [element]
+    while stack:
+        top = stack[-1]
+        pending = [e for e in _subnodes(top) if not fresh(e)]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        if fresh(top):
+            # pushed more than once
+            continue
+        values = [top.__class__, getattr(top, 'label', None)]
+        for name in top._fields:
+            values.append(value_hash(getattr(top, name)))
+        object.__setattr__(top, '_hash', (token, hash(tuple(values))))
+        _generation[1] = True
+    return element._hash[1]
+
+def _subnodes(value):
+    # the elements in the fields of an element or in a list
+    if isinstance(value, SourceElement):
+        values = [getattr(value, name) for name in value._fields]
+    else:
+        values = value
+    subnodes = []
+    for v in values:
+        if isinstance(v, SourceElement):
+            subnodes.append(v)
+        elif isinstance(v, (list, tuple)):
+            subnodes.extend(_subnodes(v))
+    return subnodes
+
+# marks that the element below it on the stack of accept() is to be left
+_LEAVE = object()
+
+def _push_subnodes(element, push):
+    # pushes the subnodes of element in reverse, so they are popped in order
+    for f in reversed(element._fields):
+        field = getattr(element, f)
+        if field:
+            if isinstance(field, list):
+                for elem in reversed(field):
+                    if isinstance(elem, SourceElement):
+                        push(elem)
+            elif isinstance(field, SourceElement):
+                push(field)
+
+class _Recorder(object):
+    # a visitor that records the calls of accept() for SourceElement.walk()
+
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, name):
+        entering = name.startswith('visit_')
+        events = self.events
+
+        def record(element):
+            events.append((element, entering))
+            return True
+        setattr(self, name, record)
+        return record
 
 
 class CompilationUnit(SourceElement):
+    # comments is a Comments object if the parser was asked to keep them,
+    # diagnostics lists the syntax errors the parser recovered from
+    _fields = ('package_declaration', 'import_declarations',
+               'type_declarations')
+    __slots__ = _fields + ('comments', 'diagnostics')
 
     def __init__(self, package_declaration=None, import_declarations=None,
                  type_declarations=None):
         super(CompilationUnit, self).__init__()
-        self._fields = [
-            'package_declaration', 'import_declarations', 'type_declarations']
+        self.comments = None
+        self.diagnostics = []
         if import_declarations is None:
             import_declarations = []
         if type_declarations is None:
@@ -60,10 +606,11 @@ class CompilationUnit(SourceElement):
         self.type_declarations = type_declarations
 
 class PackageDeclaration(SourceElement):
+    _fields = ('name', 'modifiers')
+    __slots__ = _fields
 
     def __init__(self, name, modifiers=None):
         super(PackageDeclaration, self).__init__()
-        self._fields = ['name', 'modifiers']
         if modifiers is None:
             modifiers = []
         self.name = name
@@ -71,22 +618,24 @@ class PackageDeclaration(SourceElement):
 
 
 class ImportDeclaration(SourceElement):
+    _fields = ('name', 'static', 'on_demand')
+    __slots__ = _fields
 
     def __init__(self, name, static=False, on_demand=False):
         super(ImportDeclaration, self).__init__()
-        self._fields = ['name', 'static', 'on_demand']
         self.name = name
         self.static = static
         self.on_demand = on_demand
 
 
 class ClassDeclaration(SourceElement):
+    _fields = ('name', 'body', 'modifiers', 'type_parameters', 'extends',
+               'implements')
+    __slots__ = _fields
 
     def __init__(self, name, body, modifiers=None, type_parameters=None,
                  extends=None, implements=None):
         super(ClassDeclaration, self).__init__()
-        self._fields = ['name', 'body', 'modifiers',
-                        'type_parameters', 'extends', 'implements']
         if modifiers is None:
             modifiers = []
         if type_parameters is None:
@@ -101,20 +650,22 @@ class ClassDeclaration(SourceElement):
         self.implements = implements
 
 class ClassInitializer(SourceElement):
+    _fields = ('block', 'static')
+    __slots__ = _fields
 
     def __init__(self, block, static=False):
         super(ClassInitializer, self).__init__()
-        self._fields = ['block', 'static']
         self.block = block
         self.static = static
 
 class ConstructorDeclaration(SourceElement):
+    _fields = ('name', 'block', 'modifiers', 'type_parameters', 'parameters',
+               'throws')
+    __slots__ = _fields
 
     def __init__(self, name, block, modifiers=None, type_parameters=None,
                  parameters=None, throws=None):
         super(ConstructorDeclaration, self).__init__()
-        self._fields = ['name', 'block', 'modifiers',
-                        'type_parameters', 'parameters', 'throws']
         if modifiers is None:
             modifiers = []
         if type_parameters is None:
@@ -129,13 +680,14 @@ class ConstructorDeclaration(SourceElement):
         self.throws = throws
 
 class EmptyDeclaration(SourceElement):
-    pass
+    __slots__ = ()
 
 class FieldDeclaration(SourceElement):
+    _fields = ('type', 'variable_declarators', 'modifiers')
+    __slots__ = _fields
 
     def __init__(self, type, variable_declarators, modifiers=None):
         super(FieldDeclaration, self).__init__()
-        self._fields = ['type', 'variable_declarators', 'modifiers']
         if modifiers is None:
             modifiers = []
         self.type = type
@@ -143,14 +695,14 @@ class FieldDeclaration(SourceElement):
         self.modifiers = modifiers
 
 class MethodDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'type_parameters', 'parameters',
+               'return_type', 'body', 'abstract', 'extended_dims', 'throws')
+    __slots__ = _fields
 
     def __init__(self, name, modifiers=None, type_parameters=None,
                  parameters=None, return_type='void', body=None, abstract=False,
                  extended_dims=0, throws=None):
         super(MethodDeclaration, self).__init__()
-        self._fields = ['name', 'modifiers', 'type_parameters', 'parameters',
-                        'return_type', 'body', 'abstract', 'extended_dims',
-                        'throws']
         if modifiers is None:
             modifiers = []
         if type_parameters is None:
@@ -168,10 +720,11 @@ class MethodDeclaration(SourceElement):
         self.throws = throws
 
 class FormalParameter(SourceElement):
+    _fields = ('variable', 'type', 'modifiers', 'vararg')
+    __slots__ = _fields
 
     def __init__(self, variable, type, modifiers=None, vararg=False):
         super(FormalParameter, self).__init__()
-        self._fields = ['variable', 'type', 'modifiers', 'vararg']
         if modifiers is None:
             modifiers = []
         self.variable = variable
@@ -187,36 +740,39 @@ class Variable(SourceElement):
     # type with two variable declarators;This closely resembles the source code.
     # If the variable is to go away, the type has to be duplicated for every
     # variable...
+    _fields = ('name', 'dimensions')
+    __slots__ = _fields
 
     def __init__(self, name, dimensions=0):
         super(Variable, self).__init__()
-        self._fields = ['name', 'dimensions']
         self.name = name
         self.dimensions = dimensions
 
 
 class VariableDeclarator(SourceElement):
+    _fields = ('variable', 'initializer')
+    __slots__ = _fields
 
     def __init__(self, variable, initializer=None):
         super(VariableDeclarator, self).__init__()
-        self._fields = ['variable', 'initializer']
         self.variable = variable
         self.initializer = initializer
 
 class Throws(SourceElement):
+    _fields = ('types',)
+    __slots__ = _fields
 
     def __init__(self, types):
         super(Throws, self).__init__()
-        self._fields = ['types']
         self.types = types
 
 class InterfaceDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'extends', 'type_parameters', 'body')
+    __slots__ = _fields
 
     def __init__(self, name, modifiers=None, extends=None, type_parameters=None,
                  body=None):
         super(InterfaceDeclaration, self).__init__()
-        self._fields = [
-            'name', 'modifiers', 'extends', 'type_parameters', 'body']
         if modifiers is None:
             modifiers = []
         if extends is None:
@@ -232,12 +788,12 @@ class InterfaceDeclaration(SourceElement):
         self.body = body
 
 class EnumDeclaration(SourceElement):
+    _fields = ('name', 'implements', 'modifiers', 'type_parameters', 'body')
+    __slots__ = _fields
 
     def __init__(self, name, implements=None, modifiers=None,
                  type_parameters=None, body=None):
         super(EnumDeclaration, self).__init__()
-        self._fields = [
-            'name', 'implements', 'modifiers', 'type_parameters', 'body']
         if implements is None:
             implements = []
         if modifiers is None:
@@ -253,10 +809,11 @@ class EnumDeclaration(SourceElement):
         self.body = body
 
 class EnumConstant(SourceElement):
+    _fields = ('name', 'arguments', 'modifiers', 'body')
+    __slots__ = _fields
 
     def __init__(self, name, arguments=None, modifiers=None, body=None):
         super(EnumConstant, self).__init__()
-        self._fields = ['name', 'arguments', 'modifiers', 'body']
         if arguments is None:
             arguments = []
         if modifiers is None:
@@ -269,13 +826,13 @@ class EnumConstant(SourceElement):
         self.body = body
 
 class AnnotationDeclaration(SourceElement):
+    _fields = ('name', 'modifiers', 'type_parameters', 'extends', 'implements',
+               'body')
+    __slots__ = _fields
 
     def __init__(self, name, modifiers=None, type_parameters=None, extends=None,
                  implements=None, body=None):
         super(AnnotationDeclaration, self).__init__()
-        self._fields = [
-            'name', 'modifiers', 'type_parameters', 'extends', 'implements',
-            'body']
         if modifiers is None:
             modifiers = []
         if type_parameters is None:
@@ -292,12 +849,13 @@ class AnnotationDeclaration(SourceElement):
         self.body = body
 
 class AnnotationMethodDeclaration(SourceElement):
+    _fields = ('name', 'type', 'parameters', 'default', 'modifiers',
+               'type_parameters', 'extended_dims')
+    __slots__ = _fields
 
     def __init__(self, name, type, parameters=None, default=None,
                  modifiers=None, type_parameters=None, extended_dims=0):
         super(AnnotationMethodDeclaration, self).__init__()
-        self._fields = ['name', 'type', 'parameters', 'default',
-                        'modifiers', 'type_parameters', 'extended_dims']
         if parameters is None:
             parameters = []
         if modifiers is None:
@@ -313,10 +871,11 @@ class AnnotationMethodDeclaration(SourceElement):
         self.extended_dims = extended_dims
 
 class Annotation(SourceElement):
+    _fields = ('name', 'members', 'single_member')
+    __slots__ = _fields
 
     def __init__(self, name, members=None, single_member=None):
         super(Annotation, self).__init__()
-        self._fields = ['name', 'members', 'single_member']
         if members is None:
             members = []
         self.name = name
@@ -325,20 +884,22 @@ class Annotation(SourceElement):
 
 
 class AnnotationMember(SourceElement):
+    _fields = ('name', 'value')
+    __slots__ = _fields
 
     def __init__(self, name, value):
-        super(SourceElement, self).__init__()
-        self._fields = ['name', 'value']
+        super(AnnotationMember, self).__init__()
         self.name = name
         self.value = value
 
 
 class Type(SourceElement):
+    _fields = ('name', 'type_arguments', 'enclosed_in', 'dimensions')
+    __slots__ = _fields
 
     def __init__(self, name, type_arguments=None, enclosed_in=None,
                  dimensions=0):
         super(Type, self).__init__()
-        self._fields = ['name', 'type_arguments', 'enclosed_in', 'dimensions']
         if type_arguments is None:
             type_arguments = []
         self.name = name
@@ -348,30 +909,33 @@ class Type(SourceElement):
 
 
 class Wildcard(SourceElement):
+    _fields = ('bounds',)
+    __slots__ = _fields
 
     def __init__(self, bounds=None):
         super(Wildcard, self).__init__()
-        self._fields = ['bounds']
         if bounds is None:
             bounds = []
         self.bounds = bounds
 
 
 class WildcardBound(SourceElement):
+    _fields = ('type', 'extends', '_super')
+    __slots__ = _fields
 
     def __init__(self, type, extends=False, _super=False):
         super(WildcardBound, self).__init__()
-        self._fields = ['type', 'extends', '_super']
         self.type = type
         self.extends = extends
         self._super = _super
 
 
 class TypeParameter(SourceElement):
+    _fields = ('name', 'extends')
+    __slots__ = _fields
 
     def __init__(self, name, extends=None):
         super(TypeParameter, self).__init__()
-        self._fields = ['name', 'extends']
         if extends is None:
             extends = []
         self.name = name
@@ -379,105 +943,110 @@ class TypeParameter(SourceElement):
 
 
 class Expression(SourceElement):
+    __slots__ = ()
 
     def __init__(self):
         super(Expression, self).__init__()
-        self._fields = []
 
 class BinaryExpression(Expression):
+    _fields = ('operator', 'lhs', 'rhs')
+    __slots__ = _fields
 
     def __init__(self, operator, lhs, rhs):
         super(BinaryExpression, self).__init__()
-        self._fields = ['operator', 'lhs', 'rhs']
         self.operator = operator
         self.lhs = lhs
         self.rhs = rhs
 
 class Assignment(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Conditional(Expression):
+    _fields = ('predicate', 'if_true', 'if_false')
+    __slots__ = _fields
 
     def __init__(self, predicate, if_true, if_false):
-        super(self.__class__, self).__init__()
-        self._fields = ['predicate', 'if_true', 'if_false']
+        super(Conditional, self).__init__()
         self.predicate = predicate
         self.if_true = if_true
         self.if_false = if_false
 
 class ConditionalOr(BinaryExpression):
-    pass
+    __slots__ = ()
 
 class ConditionalAnd(BinaryExpression):
-    pass
+    __slots__ = ()
 
 class Or(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Xor(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class And(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Equality(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class InstanceOf(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Relational(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Shift(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Additive(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Multiplicative(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class Unary(Expression):
+    _fields = ('sign', 'expression')
+    __slots__ = _fields
 
     def __init__(self, sign, expression):
         super(Unary, self).__init__()
-        self._fields = ['sign', 'expression']
         self.sign = sign
         self.expression = expression
 
 
 class Cast(Expression):
+    _fields = ('target', 'expression')
+    __slots__ = _fields
 
     def __init__(self, target, expression):
         super(Cast, self).__init__()
-        self._fields = ['target', 'expression']
         self.target = target
         self.expression = expression
 
 
 class Statement(SourceElement):
-    pass
+    __slots__ = ()
 
 class Empty(Statement):
-    pass
+    __slots__ = ('label',)
 
 
 class Block(Statement):
+    _fields = ('statements',)
+    __slots__ = _fields + ('label',)
 
     def __init__(self, statements=None):
         super(Statement, self).__init__()
-        self._fields = ['statements']
         if statements is None:
             statements = []
         self.statements = statements
@@ -487,21 +1056,23 @@ class Block(Statement):
             yield s
 
 class VariableDeclaration(Statement, FieldDeclaration):
-    pass
+    __slots__ = ('label',)
 
 class ArrayInitializer(SourceElement):
+    _fields = ('elements',)
+    __slots__ = _fields
     def __init__(self, elements=None):
         super(ArrayInitializer, self).__init__()
-        self._fields = ['elements']
         if elements is None:
             elements = []
         self.elements = elements
 
 
 class MethodInvocation(Expression):
+    _fields = ('name', 'arguments', 'type_arguments', 'target')
+    __slots__ = _fields
     def __init__(self, name, arguments=None, type_arguments=None, target=None):
         super(MethodInvocation, self).__init__()
-        self._fields = ['name', 'arguments', 'type_arguments', 'target']
         if arguments is None:
             arguments = []
         if type_arguments is None:
@@ -512,37 +1083,41 @@ class MethodInvocation(Expression):
         self.target = target
 
 class IfThenElse(Statement):
+    _fields = ('predicate', 'if_true', 'if_false')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, predicate, if_true=None, if_false=None):
         super(IfThenElse, self).__init__()
-        self._fields = ['predicate', 'if_true', 'if_false']
         self.predicate = predicate
         self.if_true = if_true
         self.if_false = if_false
 
 class While(Statement):
+    _fields = ('predicate', 'body')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, predicate, body=None):
         super(While, self).__init__()
-        self._fields = ['predicate', 'body']
         self.predicate = predicate
         self.body = body
 
 class For(Statement):
+    _fields = ('init', 'predicate', 'update', 'body')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, init, predicate, update, body):
         super(For, self).__init__()
-        self._fields = ['init', 'predicate', 'update', 'body']
         self.init = init
         self.predicate = predicate
         self.update = update
         self.body = body
 
 class ForEach(Statement):
+    _fields = ('type', 'variable', 'iterable', 'body', 'modifiers')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, type, variable, iterable, body, modifiers=None):
         super(ForEach, self).__init__()
-        self._fields = ['type', 'variable', 'iterable', 'body', 'modifiers']
         if modifiers is None:
             modifiers = []
         self.type = type
@@ -553,87 +1128,97 @@ class ForEach(Statement):
 
 
 class Assert(Statement):
+    _fields = ('predicate', 'message')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, predicate, message=None):
         super(Assert, self).__init__()
-        self._fields = ['predicate', 'message']
         self.predicate = predicate
         self.message = message
 
 
 class Switch(Statement):
+    _fields = ('expression', 'switch_cases')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, expression, switch_cases):
         super(Switch, self).__init__()
-        self._fields = ['expression', 'switch_cases']
         self.expression = expression
         self.switch_cases = switch_cases
 
 class SwitchCase(SourceElement):
+    _fields = ('cases', 'body')
+    __slots__ = _fields
 
     def __init__(self, cases, body=None):
         super(SwitchCase, self).__init__()
-        self._fields = ['cases', 'body']
         if body is None:
             body = []
         self.cases = cases
         self.body = body
 
 class DoWhile(Statement):
+    _fields = ('predicate', 'body')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, predicate, body=None):
         super(DoWhile, self).__init__()
-        self._fields = ['predicate', 'body']
         self.predicate = predicate
         self.body = body
 
 
 class Continue(Statement):
+    _fields = ('label',)
+    __slots__ = _fields
 
     def __init__(self, label=None):
         super(Continue, self).__init__()
-        self._fields = ['label']
         self.label = label
 
 
 class Break(Statement):
+    _fields = ('label',)
+    __slots__ = _fields
 
     def __init__(self, label=None):
         super(Break, self).__init__()
-        self._fields = ['label']
         self.label = label
 
 
 class Return(Statement):
+    _fields = ('result',)
+    __slots__ = _fields + ('label',)
 
     def __init__(self, result=None):
         super(Return, self).__init__()
-        self._fields = ['result']
         self.result = result
 
 
 class Synchronized(Statement):
+    _fields = ('monitor', 'body')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, monitor, body):
         super(Synchronized, self).__init__()
-        self._fields = ['monitor', 'body']
         self.monitor = monitor
         self.body = body
 
 
 class Throw(Statement):
+    _fields = ('exception',)
+    __slots__ = _fields + ('label',)
 
     def __init__(self, exception):
         super(Throw, self).__init__()
-        self._fields = ['exception']
         self.exception = exception
 
 
 class Try(Statement):
+    _fields = ('block', 'catches', '_finally', 'resources')
+    __slots__ = _fields + ('label',)
 
     def __init__(self, block, catches=None, _finally=None, resources=None):
         super(Try, self).__init__()
-        self._fields = ['block', 'catches', '_finally', 'resources']
         if catches is None:
             catches = []
         if resources is None:
@@ -643,21 +1228,23 @@ class Try(Statement):
         self._finally = _finally
         self.resources = resources
 
-    def accept(self, visitor):
-        if visitor.visit_Try(self):
-            for s in self.block:
-                s.accept(visitor)
-        for c in self.catches:
-            visitor.visit_Catch(c)
+    def _traverse(self, visitor, stack):
+        # the statements of the block, the catches without their subnodes and
+        # the finally block; Try is not left
         if self._finally:
-            self._finally.accept(visitor)
+            stack.append(self._finally)
+        for c in reversed(self.catches):
+            stack.append((visitor.visit_Catch, c))
+        if visitor.visit_Try(self):
+            stack.extend(reversed(list(self.block)))
 
 
 class Catch(SourceElement):
+    _fields = ('variable', 'modifiers', 'types', 'block')
+    __slots__ = _fields
 
     def __init__(self, variable, modifiers=None, types=None, block=None):
         super(Catch, self).__init__()
-        self._fields = ['variable', 'modifiers', 'types', 'block']
         if modifiers is None:
             modifiers = []
         if types is None:
@@ -669,10 +1256,11 @@ class Catch(SourceElement):
 
 
 class Resource(SourceElement):
+    _fields = ('variable', 'type', 'modifiers', 'initializer')
+    __slots__ = _fields
 
     def __init__(self, variable, type=None, modifiers=None, initializer=None):
         super(Resource, self).__init__()
-        self._fields = ['variable', 'type', 'modifiers', 'initializer']
         if modifiers is None:
             modifiers = []
         self.variable = variable
@@ -687,9 +1275,11 @@ class ConstructorInvocation(Statement):
     This is a variant of either this() or super(), NOT a "new" expression.
     """
 
+    _fields = ('name', 'target', 'type_arguments', 'arguments')
+    __slots__ = _fields + ('label',)
+
     def __init__(self, name, target=None, type_arguments=None, arguments=None):
         super(ConstructorInvocation, self).__init__()
-        self._fields = ['name', 'target', 'type_arguments', 'arguments']
         if type_arguments is None:
             type_arguments = []
         if arguments is None:
@@ -701,12 +1291,12 @@ class ConstructorInvocation(Statement):
 
 
 class InstanceCreation(Expression):
+    _fields = ('type', 'type_arguments', 'arguments', 'body', 'enclosed_in')
+    __slots__ = _fields
 
     def __init__(self, type, type_arguments=None, arguments=None, body=None,
                  enclosed_in=None):
         super(InstanceCreation, self).__init__()
-        self._fields = [
-            'type', 'type_arguments', 'arguments', 'body', 'enclosed_in']
         if type_arguments is None:
             type_arguments = []
         if arguments is None:
@@ -721,28 +1311,31 @@ class InstanceCreation(Expression):
 
 
 class FieldAccess(Expression):
+    _fields = ('name', 'target')
+    __slots__ = _fields
 
     def __init__(self, name, target):
         super(FieldAccess, self).__init__()
-        self._fields = ['name', 'target']
         self.name = name
         self.target = target
 
 
 class ArrayAccess(Expression):
+    _fields = ('index', 'target')
+    __slots__ = _fields
 
     def __init__(self, index, target):
         super(ArrayAccess, self).__init__()
-        self._fields = ['index', 'target']
         self.index = index
         self.target = target
 
 
 class ArrayCreation(Expression):
+    _fields = ('type', 'dimensions', 'initializer')
+    __slots__ = _fields
 
     def __init__(self, type, dimensions=None, initializer=None):
         super(ArrayCreation, self).__init__()
-        self._fields = ['type', 'dimensions', 'initializer']
         if dimensions is None:
             dimensions = []
         self.type = type
@@ -751,26 +1344,29 @@ class ArrayCreation(Expression):
 
 
 class Literal(SourceElement):
+    _fields = ('value',)
+    __slots__ = _fields
 
     def __init__(self, value):
         super(Literal, self).__init__()
-        self._fields = ['value']
         self.value = value
 
 
 class ClassLiteral(SourceElement):
+    _fields = ('type',)
+    __slots__ = _fields
 
     def __init__(self, type):
         super(ClassLiteral, self).__init__()
-        self._fields = ['type']
         self.type = type
 
 
 class Name(SourceElement):
+    _fields = ('value',)
+    __slots__ = _fields
 
     def __init__(self, value):
         super(Name, self).__init__()
-        self._fields = ['value']
         self.value = value
 
     def append_name(self, name):
@@ -780,13 +1376,143 @@ class Name(SourceElement):
             self.value = self.value + '.' + name
 
 
+class ErrorNode(SourceElement):
+    '''
+    Takes the place of a statement, member or type declaration that could
+    not be parsed. It spans the source that was skipped.
+    '''
+
+    __slots__ = ()
+
+
 class ExpressionStatement(Statement):
+    _fields = ('expression',)
+    __slots__ = _fields + ('label',)
     def __init__(self, expression):
         super(ExpressionStatement, self).__init__()
-        self._fields = ['expression']
         self.expression = expression
 
 
+# the declarations Javadoc comments are associated with (local variables
+# are not among them)
+_documentable = frozenset([
+    ClassDeclaration, InterfaceDeclaration, EnumDeclaration,
+    AnnotationDeclaration, ConstructorDeclaration, MethodDeclaration,
+    FieldDeclaration, AnnotationMethodDeclaration, EnumConstant])
+
+# the leaves Interner shares between their occurrences
+_internable = frozenset([
+    Annotation, ClassLiteral, Literal, Name, Type, Variable, Wildcard,
+    WildcardBound])
+
+
+class Interner(object):
+    '''
+    Makes equal leaves of trees one shared element: names, literals, types,
+    variables and annotations whose parts are all strings, numbers or shared
+    elements themselves. The strings in trees are shared as well. One
+    Interner can be used for many trees, e.g. all files of a project.
+
+    A shared element occurs in many places, so it has no position, and it
+    must not be changed; replace it with a new element instead.
+    '''
+
+    def __init__(self):
+        self._elements = {}
+        # ids of the shared elements, which are kept alive by _elements
+        self._shared = set()
+        self._strings = {}
+
+    def intern(self, tree):
+        '''
+        Share the leaves and strings of tree with those seen before and
+        return it. A tree that is a leaf itself may be replaced by a shared
+        element, which is returned instead. Bodies that were not parsed yet
+        are left alone.
+        '''
+        strings = self._strings
+        # shared elements and strings are equal to what they replace, so the
+        # cached hashes stay valid and the fields are set directly
+        setattr = object.__setattr__
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if element is None:
+                element = stack.pop()
+                for name in element._fields:
+                    value = getattr(element, name)
+                    if isinstance(value, SourceElement):
+                        if value.__class__ in _internable:
+                            shared = self._share(value)
+                            if shared is not value:
+                                setattr(element, name, shared)
+                    elif isinstance(value, list):
+                        if isinstance(value, LazyBody) and not value.parsed:
+                            # interned with this once it is parsed
+                            value._interner = self
+                            continue
+                        for index, item in enumerate(value):
+                            if isinstance(item, SourceElement):
+                                if item.__class__ in _internable:
+                                    shared = self._share(item)
+                                    if shared is not item:
+                                        list.__setitem__(value, index, shared)
+                            elif isinstance(item, str):
+                                list.__setitem__(value, index, strings.setdefault(item, item))
+                    elif isinstance(value, str):
+                        setattr(element, name, strings.setdefault(value, value))
+                continue
+            # the fields are done once the None above them is popped
+            stack.append(element)
+            stack.append(None)
+            for name in element._fields:
+                value = getattr(element, name)
+                if isinstance(value, SourceElement):
+                    if id(value) not in self._shared:
+                        stack.append(value)
+                elif isinstance(value, list):
+                    if isinstance(value, LazyBody) and not value.parsed:
+                        continue
+                    for item in value:
+                        if isinstance(item, SourceElement) and id(item) not in self._shared:
+                            stack.append(item)
+        if tree.__class__ in _internable:
+            return self._share(tree)
+        return tree
+
+    def _share(self, element):
+        # Returns the shared element equal to element, which becomes the
+        # shared one if there is none yet. Its subnodes are shared already.
+        # Elements with a part that is not shared are returned as they are.
+        key = [element.__class__]
+        for name in element._fields:
+            value = getattr(element, name)
+            if isinstance(value, SourceElement):
+                if id(value) not in self._shared:
+                    return element
+                key.append(id(value))
+            elif isinstance(value, list):
+                items = []
+                for item in value:
+                    if isinstance(item, SourceElement):
+                        if id(item) not in self._shared:
+                            return element
+                        items.append(id(item))
+                    else:
+                        items.append(item)
+                key.append(tuple(items))
+            else:
+                key.append(value)
+        key = tuple(key)
+        shared = self._elements.get(key)
+        if shared is None:
+            shared = self._elements.setdefault(key, element)
+            if shared is element:
+                element._start = element._end = element._lines = None
+                self._shared.add(id(element))
+        return shared
+
+
 class Visitor(object):
 
     def __init__(self, verbose=False):
@@ -803,3 +1529,60 @@ class Visitor(object):
                 print(msg.format(name, element))
             return True
         return f
+
+class _Handlers(dict):
+    # Maps element classes to the visit_ and leave_ methods of a visitor
+    # class as plain functions that take the visitor and the element. Each
+    # pair is looked up once, on first use.
+
+    def __init__(self, visitor_class, dynamic=False):
+        super(_Handlers, self).__init__()
+        # weak, _handlers is keyed by the class
+        self.visitor_class = weakref.ref(visitor_class)
+        self.dynamic = dynamic
+
+    def __missing__(self, element_class):
+        name = element_class.__name__
+        handlers = self._handler('visit_' + name), self._handler('leave_' + name)
+        self[element_class] = handlers
+        return handlers
+
+    def _handler(self, name):
+        visitor_class = self.visitor_class()
+        if not self.dynamic:
+            for cls in visitor_class.__mro__:
+                if name in cls.__dict__:
+                    handler = cls.__dict__[name]
+                    if isinstance(handler, types.FunctionType):
+                        return handler
+                    break
+            else:
+                if getattr(visitor_class, '__getattr__', None) is Visitor.__getattr__:
+                    return _ignore
+        return _lookup(name)
+
+def _ignore(visitor, element):
+    return True
+
+def _lookup(name):
+    def handler(visitor, element):
+        return getattr(visitor, name)(element)
+    return handler
+
+_handlers = weakref.WeakKeyDictionary()
+
+def _dispatch(visitor):
+    # Returns the _Handlers of the class of visitor. Methods that are not
+    # found on the class the usual way are looked up on the visitor at every
+    # call, and so is everything for verbose visitors, for visitors with
+    # methods of their own and for classes with a custom __getattribute__.
+    cls = visitor.__class__
+    attributes = getattr(visitor, '__dict__', {})
+    if getattr(visitor, 'verbose', False) \
+            or cls.__getattribute__ is not object.__getattribute__ \
+            or any(name.startswith(('visit_', 'leave_')) for name in attributes):
+        return _Handlers(cls, dynamic=True)
+    handlers = _handlers.get(cls)
+    if handlers is None:
+        handlers = _handlers[cls] = _Handlers(cls)
+    return handlers
@@ -1,7 +1,15 @@
 #!/usr/bin/env python2
 
+import copy
+import hashlib
+import importlib
+import os
+import re
+import threading
+
 import ply.lex as lex
 import ply.yacc as yacc
+from .diagnostics import LEXICAL, SYNTAX, Diagnostics, report
 from .model import *
 
 class MyLexer(object):
@@ -17,6 +25,7 @@ class MyLexer(object):
                 'break', 'continue', 'return', 'throw', 'try', 'catch', 'finally', 'new',
                 'package', 'import'
     )
+    keyword_types = dict((k, k.upper()) for k in keywords)
 
     tokens = [
         'NAME',
@@ -35,7 +44,10 @@ class MyLexer(object):
 
         'PLUSPLUS', 'MINUSMINUS',
 
-        'ELLIPSIS'
+        'ELLIPSIS',
+
+        # a skipped body, see _BodySkipper
+        'BODY'
     ] + [k.upper() for k in keywords]
     literals = '()+-*/=?:,.^|&~!=[]{};<>@%'
 
@@ -43,11 +55,25 @@ class MyLexer(object):
     t_CHAR_LITERAL = r'\'([^\\\n]|(\\.))*?\''
     t_STRING_LITERAL = r'\"([^\\\n]|(\\.))*?\"'
 
-    t_ignore_LINE_COMMENT = '//.*'
+    # Comments are skipped. If the lexer has a comments list they are
+    # recorded in it as offset, length and kind.
+
+    def t_LINE_COMMENT(self, t):
+        '//.*'
+        comments = getattr(t.lexer, 'comments', None)
+        if comments is not None:
+            comments.extend((t.lexpos, len(t.value), Comments.LINE))
 
     def t_BLOCK_COMMENT(self, t):
         r'/\*(.|\n)*?\*/'
         t.lexer.lineno += t.value.count('\n')
+        comments = getattr(t.lexer, 'comments', None)
+        if comments is not None:
+            if t.value.startswith('/**') and len(t.value) > 4:
+                kind = Comments.JAVADOC
+            else:
+                kind = Comments.BLOCK
+            comments.extend((t.lexpos, len(t.value), kind))
 
     t_OR = r'\|\|'
     t_AND = '&&'
@@ -82,8 +108,7 @@ class MyLexer(object):
 
     def t_NAME(self, t):
         '[A-Za-z_$][A-Za-z0-9_$]*'
-        if t.value in MyLexer.keywords:
-            t.type = t.value.upper()
+        t.type = MyLexer.keyword_types.get(t.value, 'NAME')
         return t
 
     def t_newline(self, t):
@@ -92,10 +117,12 @@ class MyLexer(object):
 
     def t_newline2(self, t):
         r'(\r\n)+'
-        t.lexer.lineno += len(t.value) / 2
+        t.lexer.lineno += len(t.value) // 2
 
     def t_error(self, t):
-        print("Illegal character '{}' ({}) in line {}".format(t.value[0], hex(ord(t.value[0])), t.lexer.lineno))
+        c = t.value[0]
+        report(t.lexer, "illegal character '{}' ({})".format(c, hex(ord(c))),
+               t.lexpos, t.lexer.lineno, LEXICAL, c)
         t.lexer.skip(1)
 
 class ExpressionParser(object):
@@ -411,9 +438,9 @@ class ExpressionParser(object):
                                 | primitive_type dims '.' CLASS
                                 | primitive_type '.' CLASS'''
         if len(p) == 4:
-            p[0] = ClassLiteral(Type(p[1]))
+            p[0] = ClassLiteral(_place(p, Type(p[1]), 1, 1))
         else:
-            p[0] = ClassLiteral(Type(p[1], dimensions=p[2]))
+            p[0] = ClassLiteral(_place(p, Type(p[1], dimensions=p[2]), 1, 2))
 
     def p_dims_opt(self, p):
         '''dims_opt : dims'''
@@ -441,27 +468,27 @@ class ExpressionParser(object):
 
     def p_cast_expression(self, p):
         '''cast_expression : '(' primitive_type dims_opt ')' unary_expression'''
-        p[0] = Cast(Type(p[2], dimensions=p[3]), p[5])
+        p[0] = Cast(_place(p, Type(p[2], dimensions=p[3]), 2, 3), p[5])
 
     def p_cast_expression2(self, p):
         '''cast_expression : '(' name type_arguments dims_opt ')' unary_expression_not_plus_minus'''
-        p[0] = Cast(Type(p[2], type_arguments=p[3], dimensions=p[4]), p[6])
+        p[0] = Cast(_place(p, Type(p[2], type_arguments=p[3], dimensions=p[4]), 2, 4), p[6])
 
     def p_cast_expression3(self, p):
         '''cast_expression : '(' name type_arguments '.' class_or_interface_type dims_opt ')' unary_expression_not_plus_minus'''
         p[5].dimensions = p[6]
-        p[5].enclosed_in = Type(p[2], type_arguments=p[3])
-        p[0] = Cast(p[5], p[8])
+        p[5].enclosed_in = _place(p, Type(p[2], type_arguments=p[3]), 2, 3)
+        p[0] = Cast(_place(p, p[5], 2, 6), p[8])
 
     def p_cast_expression4(self, p):
         '''cast_expression : '(' name ')' unary_expression_not_plus_minus'''
         # technically it's not necessarily a type but could be a type parameter
-        p[0] = Cast(Type(p[2]), p[4])
+        p[0] = Cast(_place(p, Type(p[2]), 2, 2), p[4])
 
     def p_cast_expression5(self, p):
         '''cast_expression : '(' name dims ')' unary_expression_not_plus_minus'''
         # technically it's not necessarily a type but could be a type parameter
-        p[0] = Cast(Type(p[2], dimensions=p[3]), p[5])
+        p[0] = Cast(_place(p, Type(p[2], dimensions=p[3]), 2, 3), p[5])
 
 class StatementParser(object):
 
@@ -469,6 +496,17 @@ class StatementParser(object):
         '''block : '{' block_statements_opt '}' '''
         p[0] = Block(p[2])
 
+    def p_block_lazy(self, p):
+        '''block : BODY'''
+        p[0] = Block(p.lexer.lazy_body(p[1], p.slice[1].lexpos))
+
+    def p_block_error(self, p):
+        '''block : '{' error '}'
+                 | '{' block_statements error '}' '''
+        statements = p[2] if len(p) == 5 else []
+        statements.append(_error_node(p, len(p) - 2))
+        p[0] = Block(statements)
+
     def p_block_statements_opt(self, p):
         '''block_statements_opt : block_statements'''
         p[0] = p[1]
@@ -483,7 +521,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_block_statement(self, p):
         '''block_statement : local_variable_declaration_statement
@@ -494,6 +533,10 @@ class StatementParser(object):
                            | enum_declaration'''
         p[0] = p[1]
 
+    def p_block_statement_error(self, p):
+        '''block_statement : error ';' '''
+        p[0] = _error_node(p, 1)
+
     def p_local_variable_declaration_statement(self, p):
         '''local_variable_declaration_statement : local_variable_declaration ';' '''
         p[0] = p[1]
@@ -512,7 +555,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_variable_declarator(self, p):
         '''variable_declarator : variable_declarator_id
@@ -595,7 +639,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_method_invocation(self, p):
         '''method_invocation : NAME '(' argument_list_opt ')' '''
@@ -671,7 +716,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_expression_opt(self, p):
         '''expression_opt : expression
@@ -702,11 +748,11 @@ class StatementParser(object):
 
     def p_enhanced_for_statement_header_init(self, p):
         '''enhanced_for_statement_header_init : FOR '(' type NAME dims_opt'''
-        p[0] = {'modifiers': [], 'type': p[3], 'variable': Variable(p[4], dimensions=p[5])}
+        p[0] = {'modifiers': [], 'type': p[3], 'variable': _place(p, Variable(p[4], dimensions=p[5]), 4, 5)}
 
     def p_enhanced_for_statement_header_init2(self, p):
         '''enhanced_for_statement_header_init : FOR '(' modifiers type NAME dims_opt'''
-        p[0] = {'modifiers': p[3], 'type': p[4], 'variable': Variable(p[5], dimensions=p[6])}
+        p[0] = {'modifiers': p[3], 'type': p[4], 'variable': _place(p, Variable(p[5], dimensions=p[6]), 5, 6)}
 
     def p_statement_no_short_if(self, p):
         '''statement_no_short_if : statement_without_trailing_substatement
@@ -743,11 +789,11 @@ class StatementParser(object):
 
     def p_switch_block3(self, p):
         '''switch_block : '{' switch_labels '}' '''
-        p[0] = [SwitchCase(p[2])]
+        p[0] = [_place(p, SwitchCase(p[2]), 2, 2)]
 
     def p_switch_block4(self, p):
         '''switch_block : '{' switch_block_statements switch_labels '}' '''
-        p[0] = p[2] + [SwitchCase(p[3])]
+        p[0] = p[2] + [_place(p, SwitchCase(p[3]), 3, 3)]
 
     def p_switch_block_statements(self, p):
         '''switch_block_statements : switch_block_statement
@@ -755,7 +801,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_switch_block_statement(self, p):
         '''switch_block_statement : switch_labels block_statements'''
@@ -767,7 +814,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_switch_label(self, p):
         '''switch_label : CASE constant_expression ':'
@@ -831,7 +879,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_catches_opt(self, p):
         '''catches_opt : catches'''
@@ -859,7 +908,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_try_statement_with_resources(self, p):
         '''try_statement_with_resources : TRY resource_specification try_block catches_opt
@@ -884,7 +934,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_trailing_semicolon(self, p):
         '''trailing_semicolon : ';' '''
@@ -981,7 +1032,8 @@ class StatementParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_dim_with_or_without_expr(self, p):
         '''dim_with_or_without_expr : '[' expression ']'
@@ -1039,7 +1091,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_modifier(self, p):
         '''modifier : PUBLIC
@@ -1139,7 +1192,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_argument_list(self, p):
         '''type_argument_list : type_argument
@@ -1147,7 +1201,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_argument(self, p):
         '''type_argument : reference_type
@@ -1174,7 +1229,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_argument2(self, p):
         '''type_argument2 : reference_type2
@@ -1196,7 +1252,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_argument3(self, p):
         '''type_argument3 : reference_type3
@@ -1285,7 +1342,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_parameter(self, p):
         '''type_parameter : type_parameter_header
@@ -1304,7 +1362,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_additional_bound(self, p):
         '''additional_bound : '&' reference_type'''
@@ -1316,7 +1375,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_type_parameter1(self, p):
         '''type_parameter1 : type_parameter_header '>'
@@ -1335,7 +1395,8 @@ class TypeParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_additional_bound1(self, p):
         '''additional_bound1 : '&' reference_type1'''
@@ -1354,6 +1415,11 @@ class ClassParser(object):
         '''type_declaration : ';' '''
         p[0] = EmptyDeclaration()
 
+    def p_type_declaration_error(self, p):
+        '''type_declaration : error ';'
+                            | error '}' '''
+        p[0] = _error_node(p, 1)
+
     def p_class_declaration(self, p):
         '''class_declaration : class_header class_body'''
         p[0] = ClassDeclaration(p[1]['name'], p[2], modifiers=p[1]['modifiers'],
@@ -1403,7 +1469,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_interface_type(self, p):
         '''interface_type : class_or_interface_type'''
@@ -1413,6 +1480,13 @@ class ClassParser(object):
         '''class_body : '{' class_body_declarations_opt '}' '''
         p[0] = p[2]
 
+    def p_class_body_error(self, p):
+        '''class_body : '{' error '}'
+                      | '{' class_body_declarations error '}' '''
+        declarations = p[2] if len(p) == 5 else []
+        declarations.append(_error_node(p, len(p) - 2))
+        p[0] = declarations
+
     def p_class_body_declarations_opt(self, p):
         '''class_body_declarations_opt : class_body_declarations'''
         p[0] = p[1]
@@ -1427,7 +1501,12 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
+
+    def p_class_body_declaration_error(self, p):
+        '''class_body_declaration : error ';' '''
+        p[0] = _error_node(p, 1)
 
     def p_class_body_declaration(self, p):
         '''class_body_declaration : class_member_declaration
@@ -1494,7 +1573,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_formal_parameter(self, p):
         '''formal_parameter : modifiers_opt type variable_declarator_id
@@ -1519,7 +1599,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_class_type_elt(self, p):
         '''class_type_elt : class_type'''
@@ -1529,6 +1610,17 @@ class ClassParser(object):
         '''method_body : '{' block_statements_opt '}' '''
         p[0] = p[2]
 
+    def p_method_body_lazy(self, p):
+        '''method_body : BODY'''
+        p[0] = p.lexer.lazy_body(p[1], p.slice[1].lexpos)
+
+    def p_method_body_error(self, p):
+        '''method_body : '{' error '}'
+                       | '{' block_statements error '}' '''
+        statements = p[2] if len(p) == 5 else []
+        statements.append(_error_node(p, len(p) - 2))
+        p[0] = statements
+
     def p_method_declaration(self, p):
         '''method_declaration : abstract_method_declaration
                               | method_header method_body'''
@@ -1607,6 +1699,17 @@ class ClassParser(object):
         '''interface_body : '{' interface_member_declarations_opt '}' '''
         p[0] = p[2]
 
+    def p_interface_body_error(self, p):
+        '''interface_body : '{' error '}'
+                          | '{' interface_member_declarations error '}' '''
+        declarations = p[2] if len(p) == 5 else []
+        declarations.append(_error_node(p, len(p) - 2))
+        p[0] = declarations
+
+    def p_interface_member_declaration_error(self, p):
+        '''interface_member_declaration : error ';' '''
+        p[0] = _error_node(p, 1)
+
     def p_interface_member_declarations_opt(self, p):
         '''interface_member_declarations_opt : interface_member_declarations'''
         p[0] = p[1]
@@ -1621,7 +1724,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_interface_member_declaration(self, p):
         '''interface_member_declaration : constant_declaration
@@ -1681,7 +1785,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_enum_constant(self, p):
         '''enum_constant : enum_constant_header class_body
@@ -1726,7 +1831,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_enum_body_declarations_opt(self, p):
         '''enum_body_declarations_opt : enum_declarations'''
@@ -1787,7 +1893,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_annotation_type_member_declaration(self, p):
         '''annotation_type_member_declaration : annotation_method_header ';'
@@ -1843,7 +1950,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_annotation(self, p):
         '''annotation : normal_annotation
@@ -1873,7 +1981,8 @@ class ClassParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_member_value_pair(self, p):
         '''member_value_pair : simple_name '=' member_value'''
@@ -1946,7 +2055,8 @@ class CompilationUnitParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_import_declaration(self, p):
         '''import_declaration : single_type_import_declaration
@@ -1977,7 +2087,8 @@ class CompilationUnitParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
 class MyParser(ExpressionParser, NameParser, LiteralParser, TypeParser, ClassParser, StatementParser, CompilationUnitParser):
 
@@ -1995,46 +2106,720 @@ class MyParser(ExpressionParser, NameParser, LiteralParser, TypeParser, ClassPar
         '''goal : '*' block_statement'''
         p[0] = p[2]
 
+    def p_goal_class_member(self, p):
+        '''goal : '~' class_body_declaration'''
+        p[0] = p[2]
+
+    def p_goal_interface_member(self, p):
+        '''goal : '!' interface_member_declaration'''
+        p[0] = p[2]
+
     def p_error(self, p):
-        print('error: {}'.format(p))
+        # errors at the end of the input are recorded by Parser.parse_string
+        if p is not None and hasattr(p, 'lexer'):
+            report(p.lexer, 'unexpected {!r}'.format(p.value), p.lexpos, p.lineno,
+                   SYNTAX, p.value, _expected(getattr(p.lexer, 'parser', None)))
 
     def p_empty(self, p):
         '''empty :'''
 
-class Parser(object):
+_grammar_hash = None
+
+def grammar_hash():
+    '''
+    Return a digest of the lexer and parser specification. The tables that
+    ship with plyj record the digest they were generated for and are ignored
+    when it does not match.
+    '''
+    global _grammar_hash
+    if _grammar_hash is None:
+        parts = [getattr(lex, '__tabversion__', ''), getattr(yacc, '__tabversion__', ''),
+                 ' '.join(MyLexer.tokens), MyLexer.literals]
+        rules = [(k, getattr(MyLexer, k)) for k in dir(MyLexer) if k.startswith('t_')]
+        # PLY tries function rules in the order they are defined in
+        rules.sort(key=lambda rule: (hasattr(rule[1], '__code__') and rule[1].__code__.co_firstlineno, rule[0]))
+        for name, rule in rules:
+            parts.append(name)
+            parts.append(getattr(rule, '__doc__', None) if callable(rule) else rule)
+        for name in sorted(dir(MyParser)):
+            if name.startswith('p_'):
+                parts.append(name)
+                parts.append(getattr(MyParser, name).__doc__ or '')
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update((part or '').encode('utf-8'))
+        _grammar_hash = digest.hexdigest()
+    return _grammar_hash
+
+def _table_module(name):
+    # returns the fully qualified name of a shipped table module if it exists
+    # and was generated for the current grammar
+    module_name = __name__.rpartition('.')[0] + '.' + name
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if getattr(module, '_plyj_grammar_hash', None) != grammar_hash():
+        return None
+    return module_name
+
+def _build_lexer():
+    lextab = _table_module('lextab')
+    if lextab is None:
+        return lex.lex(module=MyLexer())
+    return lex.lex(module=MyLexer(), optimize=1, lextab=lextab)
+
+def _build_parser():
+    tabmodule = _table_module('parsetab')
+    if tabmodule is None:
+        # the shipped tables are stale or missing: yacc still validates
+        # whatever it finds against its own signature and regenerates the
+        # tables in memory if needed, but it never writes them anywhere
+        return yacc.yacc(module=MyParser(), start='goal', debug=False, write_tables=False)
+    return yacc.yacc(module=MyParser(), start='goal', optimize=1, debug=False,
+                     write_tables=False, tabmodule=tabmodule)
+
+def write_tables(outputdir=None):
+    '''
+    Generate lextab.py and parsetab.py for the current grammar. By default
+    they are written next to this module. Run this after changing the grammar.
+    '''
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+    lexer = lex.lex(module=MyLexer())
+    lexer.writetab('lextab', outputdir)
+    # an unused module name makes sure yacc cannot pick up existing tables
+    yacc.yacc(module=MyParser(), start='goal', debug=False, tabmodule='_plyj_parsetab',
+              outputdir=outputdir)
+    with open(os.path.join(outputdir, '_plyj_parsetab.py')) as f:
+        content = f.read().replace('_plyj_parsetab.py', 'parsetab.py', 1)
+    with open(os.path.join(outputdir, 'parsetab.py'), 'w') as f:
+        f.write(content)
+    os.remove(os.path.join(outputdir, '_plyj_parsetab.py'))
+    for name in ('lextab', 'parsetab'):
+        with open(os.path.join(outputdir, name + '.py'), 'a') as f:
+            f.write('_plyj_grammar_hash = {!r}\n'.format(grammar_hash()))
+
+def _track(action, length, LexToken=lex.LexToken, SourceElement=SourceElement,
+           setattr=object.__setattr__):
+    # Wraps the action of a grammar rule with length symbols on its right hand
+    # side so that it records where the reduced symbol starts and ends and
+    # passes that on to the element it produced. Tokens already know their
+    # lexpos; the end of a token is implied by its value.
+    if length == 1:
+        # by far the most common case, e.g. expression : assignment
+        def tracked(p):
+            action(p)
+            symbols = p.slice
+            result = symbols[0]
+            symbol = symbols[1]
+            start = symbol.lexpos
+            if symbol.__class__ is LexToken:
+                end = start + len(symbol.value)
+            else:
+                end = symbol.endlexpos
+                if result.value is symbol.value:
+                    # passed through, the element already knows its position
+                    result.lexpos = start
+                    result.endlexpos = end
+                    return
+            result.lexpos = start
+            result.endlexpos = end
+            if start is not None:
+                value = result.value
+                if isinstance(value, SourceElement):
+                    lexer = p.lexer
+                    setattr(value, '_start', start - lexer.source_start)
+                    setattr(value, '_end', end - lexer.source_start)
+                    setattr(value, '_lines', lexer.line_index)
+        return tracked
+
+    def tracked(p):
+        action(p)
+        symbols = p.slice
+        start = end = None
+        for symbol in symbols[1:]:
+            start = symbol.lexpos
+            if start is not None:
+                break
+        if start is not None:
+            for symbol in symbols[:0:-1]:
+                if symbol.__class__ is LexToken:
+                    end = symbol.lexpos + len(symbol.value)
+                    break
+                end = symbol.endlexpos
+                if end is not None:
+                    break
+        result = symbols[0]
+        result.lexpos = start
+        result.endlexpos = end
+        if start is not None:
+            value = result.value
+            if isinstance(value, SourceElement):
+                lexer = p.lexer
+                setattr(value, '_start', start - lexer.source_start)
+                setattr(value, '_end', end - lexer.source_start)
+                setattr(value, '_lines', lexer.line_index)
+    return tracked
+
+def _place(p, element, first, last, LexToken=lex.LexToken):
+    # Gives element, which the action of a rule builds but does not return,
+    # the position of the symbols first to last of the rule like _track()
+    # does for the result. Returns element.
+    symbols = p.slice
+    start = end = None
+    for symbol in symbols[first:last + 1]:
+        start = symbol.lexpos
+        if start is not None:
+            break
+    if start is None:
+        return element
+    for symbol in symbols[last:first - 1:-1]:
+        if symbol.__class__ is LexToken:
+            end = symbol.lexpos + len(symbol.value)
+            break
+        end = symbol.endlexpos
+        if end is not None:
+            break
+    lexer = p.lexer
+    element._start = start - lexer.source_start
+    element._end = end - lexer.source_start
+    element._lines = lexer.line_index
+    return element
+
+_blank = re.compile('[ \t\f\r\n]*')
+
+def _error_node(p, index):
+    # Returns an ErrorNode for the input skipped by error recovery. The error
+    # symbol p[index] only knows where the error was detected; the skipped
+    # input starts after the symbol before it and ends before the one after.
+    symbols = p.slice
+    before = symbols[index - 1] if index > 1 else p.stack[-1]
+    if before.__class__ is lex.LexToken:
+        start = before.lexpos + len(before.value)
+    else:
+        start = getattr(before, 'endlexpos', None)
+    error = symbols[index]
+    if start is None:
+        start = getattr(error, 'lexpos', None)
+    node = ErrorNode()
+    if start is not None:
+        lexer = p.lexer
+        start = _blank.match(lexer.lexdata, start).end()
+        end = symbols[index + 1].lexpos
+        while end > start and lexer.lexdata[end - 1] in ' \t\f\r\n':
+            end -= 1
+        # seen by _track if the node is the result of the rule
+        error.lexpos = start
+        node._start = start - lexer.source_start
+        node._end = end - lexer.source_start
+        node._lines = lexer.line_index
+    return node
+
+_tables = None
+_tables_lock = threading.Lock()
+
+def _get_tables():
+    # the lexer and parser built here are never used directly, parsers only
+    # work on copies of them
+    global _tables
+    if _tables is None:
+        with _tables_lock:
+            if _tables is None:
+                lexer = _build_lexer()
+                # where the source starts in the lexer input (after the goal
+                # prefix) and the line index shared by the parsed elements
+                lexer.source_start = 0
+                lexer.line_index = None
+                lexer.comments = None
+                lexer.diagnostics = None
+                lexer.raise_errors = False
+                lexer.parser = None
+                parser = _build_parser()
+                for production in parser.productions:
+                    if production.callable is not None and production.name != 'goal':
+                        production.callable = _track(production.callable, production.len)
+                _tables = (lexer, parser)
+    return _tables
+
+def _unclosed_braces(code):
+    from .scanner import scan
+    depth = 0
+    for type, _, _, _ in scan(code):
+        if type == '{':
+            depth += 1
+        elif type == '}':
+            depth -= 1
+    return depth
+
+def _expected(parser):
+    # the tokens the parser would have accepted in the state it is in
+    if parser is None:
+        return None
+    return frozenset(t for t in parser.action[parser.state] if t != 'error')
+
+_TYPE_BODY, _OPAQUE_BODY, _NESTED = range(3)
+
+class _BodySkipper(object):
+    # Stands in for the lexer of a parse with Parser(lazy_bodies=True). The
+    # tokens of method, constructor and initializer bodies are not passed on,
+    # a single BODY token whose value is the text of the body takes their
+    # place. Bodies are recognized by their tokens alone: a brace directly in
+    # the body of a class or interface that does not open the body of a
+    # nested type and is not inside parentheses or a field initializer. The
+    # bodies of enums and annotation types are passed on as they are.
+
+    def __init__(self, lexer, options, member=False):
+        self.lexer = lexer
+        # the LazyBody of every BODY token and the parser options they get
+        self.options = options
+        self.bodies = []
+        self.lexdata = ''
+        self.source_start = lexer.source_start
+        self.line_index = lexer.line_index
+        self.comments = lexer.comments
+        self.diagnostics = lexer.diagnostics
+        self.raise_errors = lexer.raise_errors
+        self.parser = lexer.parser
+        # the kinds of the braces the current token is in
+        self._braces = [_TYPE_BODY] if member else []
+        self._pending = []
+        self._reset()
+
+    def _reset(self):
+        # a new member or type declaration starts
+        self._declares = None
+        self._parens = 0
+        self._initializer = False
+        self._previous = None
+
+    def input(self, source):
+        self.lexdata = source
+        self.lexer.input(source)
+
+    def token(self):
+        if self._pending:
+            return self._pending.pop()
+        token = self.lexer.token()
+        if token is None:
+            return None
+        type = token.type
+        braces = self._braces
+        if braces and braces[-1] is not _TYPE_BODY:
+            if type == '{':
+                braces.append(_NESTED)
+            elif type == '}':
+                if braces.pop() is _OPAQUE_BODY and (not braces or braces[-1] is _TYPE_BODY):
+                    self._reset()
+            return token
+        if type == '{':
+            if self._declares is not None:
+                braces.append(self._declares)
+                self._reset()
+            elif self._parens or self._initializer or not braces:
+                braces.append(_NESTED)
+            else:
+                return self._body(token)
+        elif type == '}':
+            if braces:
+                braces.pop()
+            self._reset()
+        elif type == '(':
+            self._parens += 1
+        elif type == ')':
+            self._parens -= 1
+        elif self._parens:
+            pass
+        elif type == ';':
+            self._reset()
+            return token
+        elif type == '=':
+            self._initializer = True
+        elif not self._initializer:
+            if type == 'CLASS':
+                self._declares = _TYPE_BODY
+            elif type == 'INTERFACE':
+                self._declares = _OPAQUE_BODY if self._previous == '@' else _TYPE_BODY
+            elif type == 'ENUM':
+                self._declares = _OPAQUE_BODY
+        self._previous = type
+        return token
+
+    def _body(self, token):
+        tokens = [token]
+        depth = 1
+        while depth:
+            last = self.lexer.token()
+            if last is None:
+                # not closed, the parser gets to see what is wrong
+                tokens.reverse()
+                self._pending = tokens
+                return self._pending.pop()
+            tokens.append(last)
+            if last.type == '{':
+                depth += 1
+            elif last.type == '}':
+                depth -= 1
+        body = lex.LexToken()
+        body.type = 'BODY'
+        body.value = self.lexdata[token.lexpos:last.lexpos + 1]
+        body.lineno = token.lineno
+        body.lexpos = token.lexpos
+        self._reset()
+        return body
+
+    def lazy_body(self, text, lexpos):
+        body = LazyBody(text, lexpos - self.source_start, self.line_index, self.options)
+        self.bodies.append(body)
+        return body
+
+def _member_at(tree, start, end):
+    # Returns the innermost member of a class or interface body that the text
+    # between start and end lies strictly inside of as (body, index, goal
+    # prefix), None if there is none.
+    found = None
+    elements, prefix = tree.type_declarations, None
+    while True:
+        for i, element in enumerate(elements):
+            if isinstance(element, SourceElement) and element._start is not None \
+                    and element._start < start and end < element._end:
+                break
+        else:
+            return found
+        if prefix is not None:
+            found = elements, i, prefix
+        if isinstance(element, ClassDeclaration):
+            elements, prefix = element.body, '~ '
+        elif isinstance(element, InterfaceDeclaration):
+            elements, prefix = element.body, '! '
+        else:
+            return found
+
+def _shift(tree, start, end, delta, skip):
+    # Moves the elements behind the text between start and end, which was
+    # replaced by text delta characters longer, and the ends of the elements
+    # around it. skip and the elements before the text are left alone.
+    stack = [tree]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, list):
+            if isinstance(element, LazyBody) and not element.parsed:
+                if element.start >= end:
+                    element.start += delta
+                    element.end += delta
+            else:
+                stack.extend(element)
+            continue
+        if element is skip or not isinstance(element, SourceElement):
+            continue
+        element_start = element._start
+        if element_start is not None:
+            if element._end <= start:
+                continue
+            if element_start >= end:
+                element._start = element_start + delta
+            element._end += delta
+        for name in element._fields:
+            stack.append(getattr(element, name))
+
+def _header_declaration(keyword, keyword_start, tokens, code, lines):
+    # Builds the package or import declaration whose keyword starts at
+    # keyword_start from the tokens after the keyword like the grammar would,
+    # None if they do not form one.
+    static = on_demand = False
+    parts = []
+    name_start = name_end = None
+    expect_name = True
+    for type, start, end, _ in tokens:
+        if expect_name:
+            if type == 'NAME':
+                if name_start is None:
+                    name_start = start
+                name_end = end
+                parts.append(code[start:end])
+                expect_name = False
+            elif type == 'STATIC' and keyword == 'IMPORT' and not static and not parts:
+                static = True
+            elif type == '*' and keyword == 'IMPORT' and parts:
+                on_demand = True
+                expect_name = False
+            else:
+                return None
+        elif type == '.' and not on_demand:
+            expect_name = True
+        elif type == ';':
+            name = Name('.'.join(parts))
+            name._start, name._end, name._lines = name_start, name_end, lines
+            if keyword == 'IMPORT':
+                declaration = ImportDeclaration(name, static=static, on_demand=on_demand)
+            else:
+                declaration = PackageDeclaration(name)
+            declaration._start, declaration._end, declaration._lines = keyword_start, end, lines
+            return declaration
+        else:
+            return None
+    return None
+
+def get_parser(scanner=False, comments=False, recover=False, raise_errors=False,
+               lazy_bodies=False, intern=False):
+    '''
+    Return a new Parser. The lexer and parser tables are built once per
+    process and shared by every Parser, so this only allocates the state of
+    a single parse.
+    '''
+    return Parser(scanner, comments, recover, raise_errors, lazy_bodies, intern)
 
-    def __init__(self):
-        self.lexer = lex.lex(module=MyLexer(), optimize=1)
-        self.parser = yacc.yacc(module=MyParser(), start='goal', optimize=1)
+class Parser(object):
+    '''
+    Parses Java source code. A Parser can be shared between threads: every
+    call works on its own copy of the lexer and of the parse state, self.lexer
+    and self.parser are never modified.
+
+    With scanner=True source is split into tokens by the hand-written scanner
+    in plyj.scanner instead of the PLY lexer. Both produce the same tokens,
+    the scanner is faster.
+
+    With comments=True the comments of a parsed compilation unit are kept in
+    its comments attribute, see plyj.model.Comments. Otherwise it is None.
+
+    A source with syntax errors is normally not parsed at all. With
+    recover=True the parser skips to the end of the statement or member the
+    error occurs in and carries on; what was skipped is replaced by an
+    ErrorNode and the errors are listed in the diagnostics attribute of the
+    compilation unit. Missing closing braces at the end are supplied.
+
+    Problems are never printed. Pass a plyj.diagnostics.Diagnostics to the
+    parse methods to collect them whatever the outcome of the parse. With
+    raise_errors=True the first problem is raised as a ParseError instead.
+
+    With lazy_bodies=True the bodies of methods, constructors and initializers
+    of compilation units are only matched brace for brace instead of being
+    parsed, which is much faster if only declarations are of interest. Their
+    statements are a plyj.model.LazyBody that is parsed when it is first
+    looked at; syntax errors in bodies are only found then.
+
+    With intern=True equal names, literals, types and other leaves of a
+    parsed tree are one shared element without a position, and equal strings
+    one string, see plyj.model.Interner. Pass an Interner instead to share
+    them between all trees of this parser, e.g. a whole project.
+    '''
+
+    def __init__(self, scanner=False, comments=False, recover=False, raise_errors=False,
+                 lazy_bodies=False, intern=False):
+        lexer, parser = _get_tables()
+        if scanner:
+            # imported here because the scanner is built from MyLexer
+            from .scanner import Scanner
+            self.lexer = Scanner()
+        else:
+            self.lexer = lexer.clone()
+        self.parser = copy.copy(parser)
+        self.scanner = scanner
+        self.keep_comments = comments
+        self.recover = recover
+        self.raise_errors = raise_errors
+        self.lazy_bodies = lazy_bodies
+        self.intern = intern
 
     def tokenize_string(self, code):
-        self.lexer.input(code)
-        for token in self.lexer:
+        lexer = self.lexer.clone()
+        lexer.input(code)
+        for token in lexer:
             print(token)
 
     def tokenize_file(self, _file):
         if type(_file) == str:
             _file = open(_file)
-        content = ''
-        for line in _file:
-            content += line
-        return self.tokenize_string(content)
-
-    def parse_expression(self, code, debug=0, lineno=1):
-        return self.parse_string(code, debug, lineno, prefix='--')
-
-    def parse_statement(self, code, debug=0, lineno=1):
-        return self.parse_string(code, debug, lineno, prefix='* ')
-
-    def parse_string(self, code, debug=0, lineno=1, prefix='++'):
-        self.lexer.lineno = lineno
-        return self.parser.parse(prefix + code, lexer=self.lexer, debug=debug)
+        return self.tokenize_string(_file.read())
+
+    def tokens(self, source, lineno=1):
+        '''
+        Yield the tokens of source one at a time as plyj.scanner.Token
+        records. Nothing is kept for tokens already yielded and their text is
+        only copied out of source when asked for, so this works on sources of
+        any size. Comments and whitespace are skipped.
+        '''
+        from .scanner import Token, scan
+        for type, start, end, line in scan(source, 0, lineno):
+            yield Token(type, start, end, line, source)
+
+    def parse_expression(self, code, debug=0, lineno=1, diagnostics=None):
+        return self.parse_string(code, debug, lineno, prefix='--', diagnostics=diagnostics)
+
+    def parse_statement(self, code, debug=0, lineno=1, diagnostics=None):
+        return self.parse_string(code, debug, lineno, prefix='* ', diagnostics=diagnostics)
+
+    def parse_string(self, code, debug=0, lineno=1, prefix='++', diagnostics=None):
+        _file = diagnostics.file if diagnostics is not None else None
+        tree, lexer = self._parse(code, '', debug, lineno, prefix, _file)
+        if tree is None and self.recover and prefix == '++':
+            depth = _unclosed_braces(code)
+            if depth > 0:
+                end_of_input = lexer.diagnostics[-1]
+                tree, lexer = self._parse(code, '}' * depth, debug, lineno, prefix, _file)
+                lexer.diagnostics.append(end_of_input)
+        if diagnostics is not None:
+            diagnostics.extend(lexer.diagnostics)
+        if not self.recover and lexer.diagnostics.syntax_errors:
+            return None
+        if self.intern and tree is not None:
+            tree = self._interner().intern(tree)
+        if isinstance(tree, CompilationUnit):
+            tree.diagnostics = lexer.diagnostics
+            if self.keep_comments:
+                entries = lexer.comments
+                for i in range(0, len(entries), 3):
+                    entries[i] -= len(prefix)
+                tree.comments = Comments(code, entries)
+                tree.comments.associate(tree)
+            for body in getattr(lexer, 'bodies', ()):
+                body._unit = tree
+        return tree
+
+    def _parse(self, code, suffix, debug, lineno, prefix, _file):
+        lexer = self.lexer.clone()
+        lexer.lineno = lineno
+        lexer.source_start = len(prefix)
+        lexer.line_index = LineIndex(code, lineno)
+        lexer.diagnostics = Diagnostics(_file)
+        lexer.raise_errors = self.raise_errors
+        if self.keep_comments:
+            lexer.comments = []
+        parser = copy.copy(self.parser)
+        lexer.parser = parser
+        if self.lazy_bodies and prefix == '++':
+            lexer = _BodySkipper(lexer, self._body_options())
+        tree = parser.parse(prefix + code + suffix, lexer=lexer, debug=debug)
+        if tree is None:
+            # PLY gives up on errors at the end of the input without telling
+            # p_error where it is
+            end = len(prefix) + len(code)
+            report(lexer, 'unexpected end of input', end,
+                   lexer.line_index.position(len(code))[0], SYNTAX, None, _expected(parser))
+        return tree, lexer
+
+    def reparse(self, tree, source, start, end, text, debug=0):
+        '''
+        Return the compilation unit of source after the text between the
+        offsets start and end was replaced by text. tree is the compilation
+        unit of source as returned by this parser.
+
+        If the edit lies inside a member of a class or interface body, only
+        that member is parsed again. It replaces the old member in tree, which
+        is updated in place and returned; every other element is kept and
+        those behind the edit are moved. Otherwise, or if the member can not
+        be parsed on its own any more, the new source is parsed from scratch.
+        '''
+        new_source = source[:start] + text + source[end:]
+        member = None
+        if tree is not None and not tree.diagnostics and tree.comments is None:
+            member = _member_at(tree, start, end)
+        if member is not None:
+            body, index, prefix = member
+            old = body[index]
+            delta = len(text) - (end - start)
+            lines = old._lines
+            bodies = []
+            new, problems = self._parse_fragment(new_source[old._start:old._end + delta],
+                                                 old._start, prefix, lines, debug, bodies)
+            if new is not None and not problems:
+                if self.intern:
+                    new = self._interner().intern(new)
+                body[index] = new
+                forget_hashes()
+                for lazy in bodies:
+                    lazy._unit = tree
+                lines.update(new_source)
+                _shift(tree, start, end, delta, new)
+                return tree
+        return self.parse_string(new_source, debug=debug)
+
+    def _body_options(self):
+        # what a LazyBody needs to be parsed like this parser would
+        return self.scanner, self.recover, bool(self.intern)
+
+    def _interner(self):
+        if isinstance(self.intern, Interner):
+            return self.intern
+        return Interner()
+
+    def _parse_fragment(self, code, offset, prefix, lines, debug=0, bodies=None):
+        # Parses code, which is found at offset in the source that lines
+        # indexes; the elements get positions in that source. Returns the
+        # result and the diagnostics of the parse. Skipped bodies are added
+        # to bodies.
+        lexer = self.lexer.clone()
+        lexer.lineno = lines.position(offset)[0]
+        lexer.source_start = len(prefix) - offset
+        lexer.line_index = lines
+        lexer.diagnostics = Diagnostics()
+        lexer.raise_errors = False
+        lexer.comments = None
+        parser = copy.copy(self.parser)
+        lexer.parser = parser
+        if self.lazy_bodies and prefix in ('~ ', '! '):
+            lexer = _BodySkipper(lexer, self._body_options(), member=True)
+            if bodies is not None:
+                lexer.bodies = bodies
+        tree = parser.parse(prefix + code, lexer=lexer, debug=debug)
+        if tree is None and not lexer.diagnostics:
+            end = offset + len(code)
+            report(lexer, 'unexpected end of input', end + lexer.source_start,
+                   lines.position(end)[0], SYNTAX, None, _expected(parser))
+        return tree, lexer.diagnostics
+
+    def parse_header_string(self, code, lineno=1, diagnostics=None):
+        '''
+        Return the package declaration (None if there is none) and the list
+        of import declarations of the compilation unit in code. Only the
+        tokens up to the first type declaration are looked at and they are
+        not run through the parser, so this is much faster than parsing
+        everything. Returns None if the package or the imports have syntax
+        errors.
+        '''
+        from .scanner import scan
+        problems = []
+        lines = LineIndex(code, lineno)
+        tokens = scan(code, 0, lineno, lambda *problem: problems.append(problem))
+        package = None
+        imports = []
+        fallback = False
+        for type, start, _, _ in tokens:
+            if type == 'IMPORT':
+                declaration = _header_declaration(type, start, tokens, code, lines)
+                imports.append(declaration)
+            elif type == 'PACKAGE' and package is None and not imports:
+                package = declaration = _header_declaration(type, start, tokens, code, lines)
+            else:
+                # annotations at the start belong to the package or to the
+                # first type
+                fallback = type == 'PACKAGE' or (type == '@' and package is None and not imports)
+                break
+            if declaration is None:
+                fallback = True
+                break
+        if fallback or problems:
+            # let the parser sort it out and report what is wrong
+            tree = self.parse_string(code, lineno=lineno, diagnostics=diagnostics)
+            if tree is None:
+                return None
+            return tree.package_declaration, tree.import_declarations
+        return package, imports
+
+    def parse_header_file(self, _file, diagnostics=None):
+        if diagnostics is None:
+            diagnostics = Diagnostics(_file if type(_file) == str else getattr(_file, 'name', None))
+        if type(_file) == str:
+            _file = open(_file)
+        return self.parse_header_string(_file.read(), diagnostics=diagnostics)
 
-    def parse_file(self, _file, debug=0):
+    def parse_file(self, _file, debug=0, diagnostics=None):
+        if diagnostics is None:
+            diagnostics = Diagnostics(_file if type(_file) == str else getattr(_file, 'name', None))
         if type(_file) == str:
             _file = open(_file)
         content = _file.read()
-        return self.parse_string(content, debug=debug)
+        return self.parse_string(content, debug=debug, diagnostics=diagnostics)
 
 if __name__ == '__main__':
     # for testing
@@ -0,0 +1,671 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "goalABSTRACT AND AND_ASSIGN ASSERT BLOCK_COMMENT BODY BOOLEAN BREAK BYTE CASE CATCH CHAR CHAR_LITERAL CLASS CONTINUE DEFAULT DIVIDE_ASSIGN DO DOUBLE ELLIPSIS ELSE ENUM EQ EXTENDS FALSE FINAL FINALLY FLOAT FOR GTEQ IF IMPLEMENTS IMPORT INSTANCEOF INT INTERFACE LINE_COMMENT LONG LSHIFT LSHIFT_ASSIGN LTEQ MINUSMINUS MINUS_ASSIGN NAME NATIVE NEQ NEW NULL NUM OR OR_ASSIGN PACKAGE PLUSPLUS PLUS_ASSIGN PRIVATE PROTECTED PUBLIC REMAINDER_ASSIGN RETURN RRSHIFT RRSHIFT_ASSIGN RSHIFT RSHIFT_ASSIGN SHORT STATIC STRICTFP STRING_LITERAL SUPER SWITCH SYNCHRONIZED THIS THROW THROWS TIMES_ASSIGN TRANSIENT TRUE TRY VOID VOLATILE WHILE XOR_ASSIGNexpression : assignment_expressionexpression_not_name : assignment_expression_not_nameassignment_expression : assignment\n                                 | conditional_expressionassignment_expression_not_name : assignment\n                                          | conditional_expression_not_nameassignment : postfix_expression assignment_operator assignment_expressionassignment_operator : '='\n                               | TIMES_ASSIGN\n                               | DIVIDE_ASSIGN\n                               | REMAINDER_ASSIGN\n                               | PLUS_ASSIGN\n                               | MINUS_ASSIGN\n                               | LSHIFT_ASSIGN\n                               | RSHIFT_ASSIGN\n                               | RRSHIFT_ASSIGN\n                               | AND_ASSIGN\n                               | OR_ASSIGN\n                               | XOR_ASSIGNconditional_expression : conditional_or_expression\n                                  | conditional_or_expression '?' expression ':' conditional_expressionconditional_expression_not_name : conditional_or_expression_not_name\n                                           | conditional_or_expression_not_name '?' expression ':' conditional_expression\n                                           | name '?' expression ':' conditional_expressionconditional_or_expression : conditional_and_expression\n                                     | conditional_or_expression OR conditional_and_expressionconditional_or_expression_not_name : conditional_and_expression_not_name\n                                              | conditional_or_expression_not_name OR conditional_and_expression\n                                              | name OR conditional_and_expressionconditional_and_expression : inclusive_or_expression\n                                      | conditional_and_expression AND inclusive_or_expressionconditional_and_expression_not_name : inclusive_or_expression_not_name\n                                               | conditional_and_expression_not_name AND inclusive_or_expression\n                                               | name AND inclusive_or_expressioninclusive_or_expression : exclusive_or_expression\n                                   | inclusive_or_expression '|' exclusive_or_expressioninclusive_or_expression_not_name : exclusive_or_expression_not_name\n                                            | inclusive_or_expression_not_name '|' exclusive_or_expression\n                                            | name '|' exclusive_or_expressionexclusive_or_expression : and_expression\n                                   | exclusive_or_expression '^' and_expressionexclusive_or_expression_not_name : and_expression_not_name\n                                            | exclusive_or_expression_not_name '^' and_expression\n                                            | name '^' and_expressionand_expression : equality_expression\n                          | and_expression '&' equality_expressionand_expression_not_name : equality_expression_not_name\n                                   | and_expression_not_name '&' equality_expression\n                                   | name '&' equality_expressionequality_expression : instanceof_expression\n                               | equality_expression EQ instanceof_expression\n                               | equality_expression NEQ instanceof_expressionequality_expression_not_name : instanceof_expression_not_name\n                                        | equality_expression_not_name EQ instanceof_expression\n                                        | name EQ instanceof_expression\n                                        | equality_expression_not_name NEQ instanceof_expression\n                                        | name NEQ instanceof_expressioninstanceof_expression : relational_expression\n                                 | instanceof_expression INSTANCEOF reference_typeinstanceof_expression_not_name : relational_expression_not_name\n                                          | name INSTANCEOF reference_type\n                                          | instanceof_expression_not_name INSTANCEOF reference_typerelational_expression : shift_expression\n                                 | relational_expression '>' shift_expression\n                                 | relational_expression '<' shift_expression\n                                 | relational_expression GTEQ shift_expression\n                                 | relational_expression LTEQ shift_expressionrelational_expression_not_name : shift_expression_not_name\n                                          | shift_expression_not_name '<' shift_expression\n                                          | name '<' shift_expression\n                                          | shift_expression_not_name '>' shift_expression\n                                          | name '>' shift_expression\n                                          | shift_expression_not_name GTEQ shift_expression\n                                          | name GTEQ shift_expression\n                                          | shift_expression_not_name LTEQ shift_expression\n                                          | name LTEQ shift_expressionshift_expression : additive_expression\n                            | shift_expression LSHIFT additive_expression\n                            | shift_expression RSHIFT additive_expression\n                            | shift_expression RRSHIFT additive_expressionshift_expression_not_name : additive_expression_not_name\n                                     | shift_expression_not_name LSHIFT additive_expression\n                                     | name LSHIFT additive_expression\n                                     | shift_expression_not_name RSHIFT additive_expression\n                                     | name RSHIFT additive_expression\n                                     | shift_expression_not_name RRSHIFT additive_expression\n                                     | name RRSHIFT additive_expressionadditive_expression : multiplicative_expression\n                               | additive_expression '+' multiplicative_expression\n                               | additive_expression '-' multiplicative_expressionadditive_expression_not_name : multiplicative_expression_not_name\n                                        | additive_expression_not_name '+' multiplicative_expression\n                                        | name '+' multiplicative_expression\n                                        | additive_expression_not_name '-' multiplicative_expression\n                                        | name '-' multiplicative_expressionmultiplicative_expression : unary_expression\n                                     | multiplicative_expression '*' unary_expression\n                                     | multiplicative_expression '/' unary_expression\n                                     | multiplicative_expression '%' unary_expressionmultiplicative_expression_not_name : unary_expression_not_name\n                                              | multiplicative_expression_not_name '*' unary_expression\n                                              | name '*' unary_expression\n                                              | multiplicative_expression_not_name '/' unary_expression\n                                              | name '/' unary_expression\n                                              | multiplicative_expression_not_name '%' unary_expression\n                                              | name '%' unary_expressionunary_expression : pre_increment_expression\n                            | pre_decrement_expression\n                            | '+' unary_expression\n                            | '-' unary_expression\n                            | unary_expression_not_plus_minusunary_expression_not_name : pre_increment_expression\n                                     | pre_decrement_expression\n                                     | '+' unary_expression\n                                     | '-' unary_expression\n                                     | unary_expression_not_plus_minus_not_namepre_increment_expression : PLUSPLUS unary_expressionpre_decrement_expression : MINUSMINUS unary_expressionunary_expression_not_plus_minus : postfix_expression\n                                           | '~' unary_expression\n                                           | '!' unary_expression\n                                           | cast_expressionunary_expression_not_plus_minus_not_name : postfix_expression_not_name\n                                                    | '~' unary_expression\n                                                    | '!' unary_expression\n                                                    | cast_expressionpostfix_expression : primary\n                              | name\n                              | post_increment_expression\n                              | post_decrement_expressionpostfix_expression_not_name : primary\n                                       | post_increment_expression\n                                       | post_decrement_expressionpost_increment_expression : postfix_expression PLUSPLUSpost_decrement_expression : postfix_expression MINUSMINUSprimary : primary_no_new_array\n                   | array_creation_with_array_initializer\n                   | array_creation_without_array_initializerprimary_no_new_array : literal\n                                | THIS\n                                | class_instance_creation_expression\n                                | field_access\n                                | method_invocation\n                                | array_accessprimary_no_new_array : '(' name ')'\n                                | '(' expression_not_name ')' primary_no_new_array : name '.' THIS\n                                | name '.' SUPERprimary_no_new_array : name '.' CLASS\n                                | name dims '.' CLASS\n                                | primitive_type dims '.' CLASS\n                                | primitive_type '.' CLASSdims_opt : dimsdims_opt : emptydims : dims_loopdims_loop : one_dim_loop\n                     | dims_loop one_dim_loopone_dim_loop : '[' ']' cast_expression : '(' primitive_type dims_opt ')' unary_expressioncast_expression : '(' name type_arguments dims_opt ')' unary_expression_not_plus_minuscast_expression : '(' name type_arguments '.' class_or_interface_type dims_opt ')' unary_expression_not_plus_minuscast_expression : '(' name ')' unary_expression_not_plus_minuscast_expression : '(' name dims ')' unary_expression_not_plus_minusblock : '{' block_statements_opt '}' block : BODYblock : '{' error '}'\n                 | '{' block_statements error '}' block_statements_opt : block_statementsblock_statements_opt : emptyblock_statements : block_statement\n                            | block_statements block_statementblock_statement : local_variable_declaration_statement\n                           | statement\n                           | class_declaration\n                           | interface_declaration\n                           | annotation_type_declaration\n                           | enum_declarationblock_statement : error ';' local_variable_declaration_statement : local_variable_declaration ';' local_variable_declaration : type variable_declaratorslocal_variable_declaration : modifiers type variable_declaratorsvariable_declarators : variable_declarator\n                                | variable_declarators ',' variable_declaratorvariable_declarator : variable_declarator_id\n                               | variable_declarator_id '=' variable_initializervariable_declarator_id : NAME dims_optvariable_initializer : expression\n                                | array_initializerstatement : statement_without_trailing_substatement\n                     | labeled_statement\n                     | if_then_statement\n                     | if_then_else_statement\n                     | while_statement\n                     | for_statement\n                     | enhanced_for_statementstatement_without_trailing_substatement : block\n                                                   | expression_statement\n                                                   | assert_statement\n                                                   | empty_statement\n                                                   | switch_statement\n                                                   | do_statement\n                                                   | break_statement\n                                                   | continue_statement\n                                                   | return_statement\n                                                   | synchronized_statement\n                                                   | throw_statement\n                                                   | try_statement\n                                                   | try_statement_with_resourcesexpression_statement : statement_expression ';'\n                                | explicit_constructor_invocationstatement_expression : assignment\n                                | pre_increment_expression\n                                | pre_decrement_expression\n                                | post_increment_expression\n                                | post_decrement_expression\n                                | method_invocation\n                                | class_instance_creation_expressioncomma_opt : ','\n                     | emptyarray_initializer : '{' comma_opt '}' array_initializer : '{' variable_initializers '}'\n                             | '{' variable_initializers ',' '}' variable_initializers : variable_initializer\n                                 | variable_initializers ',' variable_initializermethod_invocation : NAME '(' argument_list_opt ')' method_invocation : name '.' type_arguments NAME '(' argument_list_opt ')'\n                             | primary '.' type_arguments NAME '(' argument_list_opt ')'\n                             | SUPER '.' type_arguments NAME '(' argument_list_opt ')' method_invocation : name '.' NAME '(' argument_list_opt ')'\n                             | primary '.' NAME '(' argument_list_opt ')'\n                             | SUPER '.' NAME '(' argument_list_opt ')' labeled_statement : label ':' statementlabeled_statement_no_short_if : label ':' statement_no_short_iflabel : NAMEif_then_statement : IF '(' expression ')' statementif_then_else_statement : IF '(' expression ')' statement_no_short_if ELSE statementif_then_else_statement_no_short_if : IF '(' expression ')' statement_no_short_if ELSE statement_no_short_ifwhile_statement : WHILE '(' expression ')' statementwhile_statement_no_short_if : WHILE '(' expression ')' statement_no_short_iffor_statement : FOR '(' for_init_opt ';' expression_opt ';' for_update_opt ')' statementfor_statement_no_short_if : FOR '(' for_init_opt ';' expression_opt ';' for_update_opt ')' statement_no_short_iffor_init_opt : for_init\n                        | emptyfor_init : statement_expression_list\n                    | local_variable_declarationstatement_expression_list : statement_expression\n                                     | statement_expression_list ',' statement_expressionexpression_opt : expression\n                          | emptyfor_update_opt : for_update\n                          | emptyfor_update : statement_expression_listenhanced_for_statement : enhanced_for_statement_header statementenhanced_for_statement_no_short_if : enhanced_for_statement_header statement_no_short_ifenhanced_for_statement_header : enhanced_for_statement_header_init ':' expression ')' enhanced_for_statement_header_init : FOR '(' type NAME dims_optenhanced_for_statement_header_init : FOR '(' modifiers type NAME dims_optstatement_no_short_if : statement_without_trailing_substatement\n                                 | labeled_statement_no_short_if\n                                 | if_then_else_statement_no_short_if\n                                 | while_statement_no_short_if\n                                 | for_statement_no_short_if\n                                 | enhanced_for_statement_no_short_ifassert_statement : ASSERT expression ';'\n                            | ASSERT expression ':' expression ';' empty_statement : ';' switch_statement : SWITCH '(' expression ')' switch_blockswitch_block : '{' '}' switch_block : '{' switch_block_statements '}' switch_block : '{' switch_labels '}' switch_block : '{' switch_block_statements switch_labels '}' switch_block_statements : switch_block_statement\n                                   | switch_block_statements switch_block_statementswitch_block_statement : switch_labels block_statementsswitch_labels : switch_label\n                         | switch_labels switch_labelswitch_label : CASE constant_expression ':'\n                        | DEFAULT ':' constant_expression : expressiondo_statement : DO statement WHILE '(' expression ')' ';' break_statement : BREAK ';'\n                           | BREAK NAME ';' continue_statement : CONTINUE ';'\n                              | CONTINUE NAME ';' return_statement : RETURN expression_opt ';' synchronized_statement : SYNCHRONIZED '(' expression ')' blockthrow_statement : THROW expression ';' try_statement : TRY try_block catches\n                         | TRY try_block catches_opt finallytry_block : blockcatches : catch_clause\n                   | catches catch_clausecatches_opt : catchescatches_opt : emptycatch_clause : CATCH '(' catch_formal_parameter ')' blockcatch_formal_parameter : modifiers_opt catch_type variable_declarator_idcatch_type : union_typeunion_type : type\n                      | union_type '|' typetry_statement_with_resources : TRY resource_specification try_block catches_opt\n                                        | TRY resource_specification try_block catches_opt finallyresource_specification : '(' resources semi_opt ')' semi_opt : ';'\n                    | emptyresources : resource\n                     | resources trailing_semicolon resourcetrailing_semicolon : ';' resource : type variable_declarator_id '=' variable_initializerresource : modifiers type variable_declarator_id '=' variable_initializerfinally : FINALLY blockexplicit_constructor_invocation : THIS '(' argument_list_opt ')' ';'\n                                           | SUPER '(' argument_list_opt ')' ';' explicit_constructor_invocation : type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | type_arguments THIS '(' argument_list_opt ')' ';' explicit_constructor_invocation : primary '.' SUPER '(' argument_list_opt ')' ';'\n                                           | name '.' SUPER '(' argument_list_opt ')' ';'\n                                           | primary '.' THIS '(' argument_list_opt ')' ';'\n                                           | name '.' THIS '(' argument_list_opt ')' ';' explicit_constructor_invocation : primary '.' type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | name '.' type_arguments SUPER '(' argument_list_opt ')' ';'\n                                           | primary '.' type_arguments THIS '(' argument_list_opt ')' ';'\n                                           | name '.' type_arguments THIS '(' argument_list_opt ')' ';' class_instance_creation_expression : NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : primary '.' NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : primary '.' NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : class_instance_creation_expression_name NEW class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression : class_instance_creation_expression_name NEW type_arguments class_type '(' argument_list_opt ')' class_body_optclass_instance_creation_expression_name : name '.' class_body_opt : class_body\n                          | emptyfield_access : primary '.' NAME\n                        | SUPER '.' NAMEarray_access : name '[' expression ']'\n                        | primary_no_new_array '[' expression ']'\n                        | array_creation_with_array_initializer '[' expression ']' array_creation_with_array_initializer : NEW primitive_type dim_with_or_without_exprs array_initializer\n                                                 | NEW class_or_interface_type dim_with_or_without_exprs array_initializerdim_with_or_without_exprs : dim_with_or_without_expr\n                                     | dim_with_or_without_exprs dim_with_or_without_exprdim_with_or_without_expr : '[' expression ']'\n                                    | '[' ']' array_creation_without_array_initializer : NEW primitive_type dim_with_or_without_exprs\n                                                    | NEW class_or_interface_type dim_with_or_without_exprsname : simple_name\n                | qualified_namesimple_name : NAMEqualified_name : name '.' simple_nameliteral : NUM\n                   | CHAR_LITERAL\n                   | STRING_LITERAL\n                   | TRUE\n                   | FALSE\n                   | NULLmodifiers_opt : modifiersmodifiers_opt : emptymodifiers : modifier\n                     | modifiers modifiermodifier : PUBLIC\n                    | PROTECTED\n                    | PRIVATE\n                    | STATIC\n                    | ABSTRACT\n                    | FINAL\n                    | NATIVE\n                    | SYNCHRONIZED\n                    | TRANSIENT\n                    | VOLATILE\n                    | STRICTFP\n                    | annotationtype : primitive_type\n                | reference_typeprimitive_type : BOOLEAN\n                          | VOID\n                          | BYTE\n                          | SHORT\n                          | INT\n                          | LONG\n                          | CHAR\n                          | FLOAT\n                          | DOUBLEreference_type : class_or_interface_type\n                          | array_typeclass_or_interface_type : class_or_interface\n                                   | generic_typeclass_type : class_or_interface_typeclass_or_interface : name\n                              | generic_type '.' namegeneric_type : class_or_interface type_argumentsgeneric_type : class_or_interface '<' '>' array_type : primitive_type dims\n                      | name dimsarray_type : generic_type dimsarray_type : generic_type '.' name dimstype_arguments : '<' type_argument_list1type_argument_list1 : type_argument1\n                               | type_argument_list ',' type_argument1type_argument_list : type_argument\n                              | type_argument_list ',' type_argumenttype_argument : reference_type\n                         | wildcardtype_argument1 : reference_type1\n                          | wildcard1reference_type1 : reference_type '>'\n                           | class_or_interface '<' type_argument_list2type_argument_list2 : type_argument2\n                               | type_argument_list ',' type_argument2type_argument2 : reference_type2\n                          | wildcard2reference_type2 : reference_type RSHIFT\n                           | class_or_interface '<' type_argument_list3type_argument_list3 : type_argument3\n                               | type_argument_list ',' type_argument3type_argument3 : reference_type3\n                          | wildcard3reference_type3 : reference_type RRSHIFTwildcard : '?'\n                    | '?' wildcard_boundswildcard_bounds : EXTENDS reference_type\n                           | SUPER reference_typewildcard1 : '?' '>'\n                     | '?' wildcard_bounds1wildcard_bounds1 : EXTENDS reference_type1\n                            | SUPER reference_type1wildcard2 : '?' RSHIFT\n                     | '?' wildcard_bounds2wildcard_bounds2 : EXTENDS reference_type2\n                            | SUPER reference_type2wildcard3 : '?' RRSHIFT\n                     | '?' wildcard_bounds3wildcard_bounds3 : EXTENDS reference_type3\n                            | SUPER reference_type3type_parameter_header : NAMEtype_parameters : '<' type_parameter_list1type_parameter_list : type_parameter\n                               | type_parameter_list ',' type_parametertype_parameter : type_parameter_header\n                          | type_parameter_header EXTENDS reference_type\n                          | type_parameter_header EXTENDS reference_type additional_bound_listadditional_bound_list : additional_bound\n                                 | additional_bound_list additional_boundadditional_bound : '&' reference_typetype_parameter_list1 : type_parameter1\n                                | type_parameter_list ',' type_parameter1type_parameter1 : type_parameter_header '>'\n                           | type_parameter_header EXTENDS reference_type1\n                           | type_parameter_header EXTENDS reference_type additional_bound_list1additional_bound_list1 : additional_bound1\n                                  | additional_bound_list additional_bound1additional_bound1 : '&' reference_type1type_declaration : class_declaration\n                            | interface_declaration\n                            | enum_declaration\n                            | annotation_type_declarationtype_declaration : ';' type_declaration : error ';'\n                            | error '}' class_declaration : class_header class_bodyclass_header : class_header_name class_header_extends_opt class_header_implements_optclass_header_name : class_header_name1 type_parameters\n                             | class_header_name1class_header_name1 : modifiers_opt CLASS NAMEclass_header_extends_opt : class_header_extends\n                                    | emptyclass_header_extends : EXTENDS class_typeclass_header_implements_opt : class_header_implements\n                                       | emptyclass_header_implements : IMPLEMENTS interface_type_listinterface_type_list : interface_type\n                               | interface_type_list ',' interface_typeinterface_type : class_or_interface_typeclass_body : '{' class_body_declarations_opt '}' class_body : '{' error '}'\n                      | '{' class_body_declarations error '}' class_body_declarations_opt : class_body_declarationsclass_body_declarations_opt : emptyclass_body_declarations : class_body_declaration\n                                   | class_body_declarations class_body_declarationclass_body_declaration : error ';' class_body_declaration : class_member_declaration\n                                  | static_initializer\n                                  | constructor_declarationclass_body_declaration : blockclass_member_declaration : field_declaration\n                                    | class_declaration\n                                    | method_declaration\n                                    | interface_declaration\n                                    | enum_declaration\n                                    | annotation_type_declarationclass_member_declaration : ';' field_declaration : modifiers_opt type variable_declarators ';' static_initializer : STATIC blockconstructor_declaration : constructor_header method_bodyconstructor_header : constructor_header_name formal_parameter_list_opt ')' method_header_throws_clause_optconstructor_header_name : modifiers_opt type_parameters NAME '('\n                                   | modifiers_opt NAME '(' formal_parameter_list_opt : formal_parameter_listformal_parameter_list_opt : emptyformal_parameter_list : formal_parameter\n                                 | formal_parameter_list ',' formal_parameterformal_parameter : modifiers_opt type variable_declarator_id\n                            | modifiers_opt type ELLIPSIS variable_declarator_idmethod_header_throws_clause_opt : method_header_throws_clause\n                                           | emptymethod_header_throws_clause : THROWS class_type_listclass_type_list : class_type_elt\n                           | class_type_list ',' class_type_eltclass_type_elt : class_typemethod_body : '{' block_statements_opt '}' method_body : BODYmethod_body : '{' error '}'\n                       | '{' block_statements error '}' method_declaration : abstract_method_declaration\n                              | method_header method_bodyabstract_method_declaration : method_header ';' method_header : method_header_name formal_parameter_list_opt ')' method_header_extended_dims method_header_throws_clause_optmethod_header_name : modifiers_opt type_parameters type NAME '('\n                              | modifiers_opt type NAME '(' method_header_extended_dims : dims_optinterface_declaration : interface_header interface_bodyinterface_header : interface_header_name interface_header_extends_optinterface_header_name : interface_header_name1 type_parameters\n                                 | interface_header_name1interface_header_name1 : modifiers_opt INTERFACE NAMEinterface_header_extends_opt : interface_header_extendsinterface_header_extends_opt : emptyinterface_header_extends : EXTENDS interface_type_listinterface_body : '{' interface_member_declarations_opt '}' interface_body : '{' error '}'\n                          | '{' interface_member_declarations error '}' interface_member_declaration : error ';' interface_member_declarations_opt : interface_member_declarationsinterface_member_declarations_opt : emptyinterface_member_declarations : interface_member_declaration\n                                         | interface_member_declarations interface_member_declarationinterface_member_declaration : constant_declaration\n                                        | abstract_method_declaration\n                                        | class_declaration\n                                        | interface_declaration\n                                        | enum_declaration\n                                        | annotation_type_declarationinterface_member_declaration : ';' constant_declaration : field_declarationenum_declaration : enum_header enum_bodyenum_header : enum_header_name class_header_implements_optenum_header_name : modifiers_opt ENUM NAME\n                            | modifiers_opt ENUM NAME type_parametersenum_body : '{' enum_body_declarations_opt '}' enum_body : '{' ',' enum_body_declarations_opt '}' enum_body : '{' enum_constants ',' enum_body_declarations_opt '}' enum_body : '{' enum_constants enum_body_declarations_opt '}' enum_constants : enum_constant\n                          | enum_constants ',' enum_constantenum_constant : enum_constant_header class_body\n                         | enum_constant_headerenum_constant_header : enum_constant_header_name arguments_optenum_constant_header_name : modifiers_opt NAMEarguments_opt : argumentsarguments_opt : emptyarguments : '(' argument_list_opt ')' argument_list_opt : argument_listargument_list_opt : emptyargument_list : expression\n                         | argument_list ',' expressionenum_body_declarations_opt : enum_declarationsenum_body_declarations_opt : emptyenum_declarations : ';' class_body_declarations_optannotation_type_declaration : annotation_type_declaration_header annotation_type_bodyannotation_type_declaration_header : annotation_type_declaration_header_name class_header_extends_opt class_header_implements_optannotation_type_declaration_header_name : modifiers '@' INTERFACE NAMEannotation_type_declaration_header_name : modifiers '@' INTERFACE NAME type_parametersannotation_type_declaration_header_name : '@' INTERFACE NAME type_parametersannotation_type_declaration_header_name : '@' INTERFACE NAMEannotation_type_body : '{' annotation_type_member_declarations_opt '}' annotation_type_member_declarations_opt : annotation_type_member_declarationsannotation_type_member_declarations_opt : emptyannotation_type_member_declarations : annotation_type_member_declaration\n                                               | annotation_type_member_declarations annotation_type_member_declarationannotation_type_member_declaration : annotation_method_header ';'\n                                              | constant_declaration\n                                              | constructor_declaration\n                                              | type_declarationannotation_method_header : annotation_method_header_name formal_parameter_list_opt ')' method_header_extended_dims annotation_method_header_default_value_optannotation_method_header_name : modifiers_opt type_parameters type NAME '('\n                                         | modifiers_opt type NAME '(' annotation_method_header_default_value_opt : default_value\n                                                      | emptydefault_value : DEFAULT member_valuemember_value : conditional_expression_not_name\n                        | name\n                        | annotation\n                        | member_value_array_initializermember_value_array_initializer : '{' member_values ',' '}'\n                                          | '{' member_values '}' member_value_array_initializer : '{' ',' '}'\n                                          | '{' '}' member_values : member_value\n                         | member_values ',' member_valueannotation : normal_annotation\n                      | marker_annotation\n                      | single_member_annotationnormal_annotation : annotation_name '(' member_value_pairs_opt ')' annotation_name : '@' namemember_value_pairs_opt : member_value_pairsmember_value_pairs_opt : emptymember_value_pairs : member_value_pair\n                              | member_value_pairs ',' member_value_pairmember_value_pair : simple_name '=' member_valuemarker_annotation : annotation_namesingle_member_annotation : annotation_name '(' single_member_annotation_member_value ')' single_member_annotation_member_value : member_valuecompilation_unit : package_declarationcompilation_unit : package_declaration import_declarationscompilation_unit : package_declaration import_declarations type_declarationscompilation_unit : package_declaration type_declarationscompilation_unit : import_declarationscompilation_unit : type_declarationscompilation_unit : import_declarations type_declarationscompilation_unit : emptypackage_declaration : package_declaration_name ';' package_declaration_name : modifiers PACKAGE name\n                                    | PACKAGE nameimport_declarations : import_declaration\n                               | import_declarations import_declarationimport_declaration : single_type_import_declaration\n                              | type_import_on_demand_declaration\n                              | single_static_import_declaration\n                              | static_import_on_demand_declarationsingle_type_import_declaration : IMPORT name ';' type_import_on_demand_declaration : IMPORT name '.' '*' ';' single_static_import_declaration : IMPORT STATIC name ';' static_import_on_demand_declaration : IMPORT STATIC name '.' '*' ';' type_declarations : type_declaration\n                             | type_declarations type_declarationgoal : PLUSPLUS compilation_unitgoal : MINUSMINUS expressiongoal : '*' block_statementgoal : '~' class_body_declarationgoal : '!' interface_member_declarationempty :"
+    
+_lr_action_items = {'PLUSPLUS':([0,3,4,57,62,64,65,66,67,69,70,71,72,73,74,76,77,78,79,80,81,82,86,88,89,90,91,92,93,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,168,170,172,180,181,182,183,184,187,188,192,245,247,249,251,274,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,306,313,314,315,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,380,381,382,383,385,389,391,392,394,396,398,403,407,409,410,411,438,517,520,521,522,523,524,525,526,532,533,534,535,536,538,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,572,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,601,604,605,606,607,608,610,636,642,644,645,649,656,657,659,660,662,663,664,667,668,669,671,672,674,675,677,685,686,687,691,692,693,708,722,723,726,727,730,741,743,758,763,764,768,770,771,772,773,774,788,802,824,826,827,828,829,831,832,833,836,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,949,951,953,959,961,964,966,968,977,978,983,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1039,1041,1046,1048,1049,1050,1051,1052,1053,1054,1055,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1114,1115,1116,1118,1119,1121,1122,1123,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1163,1164,1166,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1184,1188,1189,1190,1193,],[2,74,74,74,279,-127,-128,-129,-130,-136,-137,-138,-345,-346,74,-139,-140,-141,-142,-143,-144,74,-347,-349,-350,-351,-352,-353,-354,74,74,74,74,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,74,74,74,-165,-210,74,74,-347,74,74,-129,-130,-143,-141,-140,-127,-128,279,-458,-520,-544,-568,74,279,74,74,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,74,74,74,74,74,74,74,-128,-127,-129,-130,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-178,-179,74,74,-128,74,74,-253,-128,74,-170,-209,74,-281,-283,74,-290,74,74,74,74,-128,-345,74,-127,-129,-130,279,-128,-332,-147,-148,-149,-348,-347,-145,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-146,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-333,-152,-343,-339,74,-344,74,74,-232,-145,74,-347,-128,-127,-164,-166,-171,-264,74,-282,-284,-285,-287,-288,-291,-294,-640,-333,74,74,-332,-148,-147,74,-472,-473,-528,-529,-548,74,-574,74,-145,74,74,74,-150,-334,-335,-336,-128,74,74,-151,-337,-340,74,-342,-338,74,-225,74,74,74,74,74,74,-167,74,-292,-289,-300,-293,-255,74,74,74,74,-474,-530,-549,-551,74,74,74,74,74,74,74,-341,-640,74,-235,-189,74,-238,-128,-265,-267,-286,-310,-301,74,-311,-312,74,74,74,74,-550,74,-230,-229,-231,-220,-221,74,-640,-324,-330,-331,-640,74,74,74,74,74,74,-268,74,-275,74,74,-313,-314,74,-640,-227,-226,-228,-222,-323,-327,-640,-236,-269,74,-270,-276,74,-278,-280,-295,-315,-317,-316,-318,-640,-326,-328,74,74,74,74,-271,-277,-319,-321,-320,-322,-325,-240,74,74,74,]),'MINUSMINUS':([0,3,4,57,62,64,65,66,67,69,70,71,72,73,74,76,77,78,79,80,81,82,86,88,89,90,91,92,93,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,168,170,172,180,181,182,183,184,187,188,192,245,247,249,251,274,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,306,313,314,315,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,380,381,382,383,385,389,391,392,394,396,398,403,407,409,410,411,438,517,520,521,522,523,524,525,526,532,533,534,535,536,538,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,572,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,601,604,605,606,607,608,610,636,642,644,645,649,656,657,659,660,662,663,664,667,668,669,671,672,674,675,677,685,686,687,691,692,693,708,722,723,726,727,730,741,743,758,763,764,768,770,771,772,773,774,788,802,824,826,827,828,829,831,832,833,836,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,949,951,953,959,961,964,966,968,977,978,983,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1039,1041,1046,1048,1049,1050,1051,1052,1053,1054,1055,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1114,1115,1116,1118,1119,1121,1122,1123,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1163,1164,1166,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1184,1188,1189,1190,1193,],[3,57,57,57,280,-127,-128,-129,-130,-136,-137,-138,-345,-346,57,-139,-140,-141,-142,-143,-144,57,-347,-349,-350,-351,-352,-353,-354,57,57,57,57,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,57,57,57,-165,-210,57,57,-347,57,57,-129,-130,-143,-141,-140,-127,-128,280,-458,-520,-544,-568,57,280,57,57,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,57,57,57,57,57,57,57,-128,-127,-129,-130,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-178,-179,57,57,-128,57,57,-253,-128,57,-170,-209,57,-281,-283,57,-290,57,57,57,57,-128,-345,57,-127,-129,-130,280,-128,-332,-147,-148,-149,-348,-347,-145,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-146,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-333,-152,-343,-339,57,-344,57,57,-232,-145,57,-347,-128,-127,-164,-166,-171,-264,57,-282,-284,-285,-287,-288,-291,-294,-640,-333,57,57,-332,-148,-147,57,-472,-473,-528,-529,-548,57,-574,57,-145,57,57,57,-150,-334,-335,-336,-128,57,57,-151,-337,-340,57,-342,-338,57,-225,57,57,57,57,57,57,-167,57,-292,-289,-300,-293,-255,57,57,57,57,-474,-530,-549,-551,57,57,57,57,57,57,57,-341,-640,57,-235,-189,57,-238,-128,-265,-267,-286,-310,-301,57,-311,-312,57,57,57,57,-550,57,-230,-229,-231,-220,-221,57,-640,-324,-330,-331,-640,57,57,57,57,57,57,-268,57,-275,57,57,-313,-314,57,-640,-227,-226,-228,-222,-323,-327,-640,-236,-269,57,-270,-276,57,-278,-280,-295,-315,-317,-316,-318,-640,-326,-328,57,57,57,57,-271,-277,-319,-321,-320,-322,-325,-240,57,57,57,]),'*':([0,62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,325,328,329,330,331,332,335,365,366,367,368,380,460,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,630,631,632,633,634,721,722,723,763,771,772,773,774,775,788,797,798,799,800,801,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[4,-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,362,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,569,-131,-132,-133,594,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,569,719,569,-345,-131,-132,-133,569,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,362,362,-97,-98,-99,917,-472,-473,-145,-150,-334,-335,-336,-162,-128,362,362,-102,-104,-106,362,362,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'~':([0,3,57,74,82,111,112,117,118,154,164,170,172,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,379,381,394,403,409,410,411,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,741,758,763,764,768,770,778,802,824,829,833,837,838,846,855,874,875,878,879,936,941,942,944,946,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1107,1117,1169,],[5,117,117,117,333,117,117,117,117,333,117,117,117,333,333,117,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,333,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,333,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,333,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,333,117,117,]),'!':([0,3,57,74,82,111,112,117,118,154,164,170,172,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,379,381,394,403,409,410,411,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,741,758,763,764,768,770,778,802,824,829,833,837,838,846,855,874,875,878,879,936,941,942,944,946,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1107,1117,1169,],[6,118,118,118,334,118,118,118,118,334,118,118,118,334,334,118,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,334,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,334,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,334,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,334,118,118,]),'$end':([1,2,7,8,9,10,11,13,14,15,18,19,20,21,22,23,24,25,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,120,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,161,163,175,176,190,191,195,197,198,199,200,201,202,203,204,205,206,207,211,216,218,219,220,221,222,223,224,225,229,230,232,233,234,235,240,241,242,245,247,249,251,275,276,279,280,299,300,304,365,366,367,368,369,370,377,383,392,396,398,407,418,420,422,423,425,426,435,436,437,439,443,444,453,455,459,527,529,532,533,534,535,536,538,541,542,543,546,547,572,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,642,659,660,663,667,668,669,671,672,674,675,677,695,696,698,700,701,720,722,723,726,727,730,743,763,771,772,773,774,775,826,827,828,831,832,836,852,857,858,861,862,882,883,887,888,890,891,894,896,899,900,902,916,918,919,920,923,939,948,950,959,961,966,968,978,984,985,988,989,992,997,998,1011,1012,1013,1016,1023,1024,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1066,1080,1081,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1125,1133,1136,1142,1143,1147,1148,1151,1152,1156,1157,1158,1163,1164,1165,1166,1171,1174,1175,1176,1177,1178,1180,1182,1184,1188,],[0,-640,-635,-612,-616,-617,-619,-455,-623,-633,-625,-626,-627,-628,-451,-452,-453,-454,-636,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-637,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-165,-210,-382,-383,-384,-385,-638,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-513,-639,-542,-536,-537,-538,-539,-540,-541,-543,-613,-615,-618,-624,-634,-620,-347,-456,-457,-458,-520,-544,-568,-118,-119,-134,-135,-155,-156,-117,-109,-110,-120,-121,-178,-179,-387,-253,-209,-281,-283,-290,-389,-393,-395,-396,-402,-403,-479,-492,-493,-510,-514,-515,-531,-614,-629,-7,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-232,-164,-166,-264,-282,-284,-285,-287,-288,-291,-294,-640,-390,-388,-404,-421,-422,-631,-472,-473,-528,-529,-548,-574,-145,-150,-334,-335,-336,-162,-151,-337,-340,-342,-338,-225,-167,-292,-289,-300,-293,-394,-397,-405,-406,-408,-409,-423,-424,-509,-511,-491,-630,-474,-530,-549,-551,-21,-163,-159,-341,-640,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-410,-425,-426,-512,-632,-550,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-268,-313,-314,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-236,-269,-270,-280,-295,-315,-317,-316,-318,-416,-429,-430,-640,-326,-161,-328,-271,-319,-321,-320,-322,-413,-431,-432,-325,-240,]),'ENUM':([2,4,5,6,8,9,10,11,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,54,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,189,197,198,199,200,201,202,203,204,205,206,207,208,210,211,214,218,219,220,221,222,223,224,225,227,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,251,252,273,369,370,383,389,390,391,392,396,398,407,435,436,437,438,439,443,444,453,455,459,464,465,466,469,470,471,478,483,484,485,487,488,489,491,536,642,659,660,662,663,667,668,669,671,672,674,675,677,708,720,722,723,725,726,727,729,730,736,743,744,745,755,756,852,857,858,861,862,899,900,902,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1023,1024,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[-640,-640,-640,-640,-640,-640,-640,-356,-455,-623,-633,-355,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,269,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-355,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-640,-165,-210,-366,-356,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,269,-513,-355,-542,-536,-537,-538,-539,-540,-541,-543,269,-355,-640,-640,-355,-640,-624,-634,-620,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,-178,-179,-253,-640,-356,-170,-209,-281,-283,-290,-479,-492,-493,-640,-510,-514,-515,-531,-640,-629,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,269,-348,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-640,-631,-472,-473,-478,-528,-529,-535,-548,-640,-574,-578,-579,-602,-610,-167,-292,-289,-300,-293,-509,-511,-491,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-632,-550,-268,-640,-275,-313,-314,-236,-269,-640,-270,-276,-640,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'CLASS':([2,4,5,6,8,9,10,11,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,54,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,189,197,198,199,200,201,202,203,204,205,206,207,208,210,211,214,218,219,220,221,222,223,224,225,227,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,251,252,273,296,338,369,370,383,389,390,391,392,396,398,407,416,435,436,437,438,439,443,444,453,455,459,464,465,466,469,470,471,478,483,484,485,487,488,489,491,536,539,549,603,642,659,660,662,663,667,668,669,671,672,674,675,677,708,720,722,723,725,726,727,729,730,736,743,744,745,755,756,850,852,857,858,861,862,899,900,902,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1023,1024,1065,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[-640,-640,-640,-640,-640,-640,-640,-356,-455,-623,-633,-355,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,270,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-355,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-640,-165,-210,-366,-356,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,270,-513,-355,-542,-536,-537,-538,-539,-540,-541,-543,270,-355,-640,-640,-355,-640,-624,-634,-620,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,535,604,-178,-179,-253,-640,-356,-170,-209,-281,-283,-290,535,-479,-492,-493,-640,-510,-514,-515,-531,-640,-629,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,270,-348,771,535,826,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-640,-631,-472,-473,-478,-528,-529,-535,-548,-640,-574,-578,-579,-602,-610,535,-167,-292,-289,-300,-293,-509,-511,-491,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-632,-550,535,-268,-640,-275,-313,-314,-236,-269,-640,-270,-276,-640,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'INTERFACE':([2,4,5,6,8,9,10,11,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,54,55,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,189,197,198,199,200,201,202,203,204,205,206,207,208,210,211,214,218,219,220,221,222,223,224,225,227,228,229,230,231,232,233,234,235,237,238,240,241,242,245,246,247,248,249,251,252,273,369,370,383,389,390,391,392,396,398,407,435,436,437,438,439,443,444,453,455,459,464,465,466,469,470,471,478,483,484,485,487,488,489,491,536,642,659,660,662,663,667,668,669,671,672,674,675,677,708,720,722,723,725,726,727,729,730,736,743,744,745,755,756,852,857,858,861,862,899,900,902,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1023,1024,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[-640,-640,-640,-640,-640,-640,-640,-356,-455,-623,-633,-355,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,271,272,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-355,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-640,-165,-210,-366,-356,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,271,-513,-355,-542,-536,-537,-538,-539,-540,-541,-543,271,-355,-640,-640,-355,-640,-624,-634,-620,-358,457,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,-178,-179,-253,-640,-356,-170,-209,-281,-283,-290,-479,-492,-493,-640,-510,-514,-515,-531,-640,-629,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,271,-348,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-640,-631,-472,-473,-478,-528,-529,-535,-548,-640,-574,-578,-579,-602,-610,-167,-292,-289,-300,-293,-509,-511,-491,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-632,-550,-268,-640,-275,-313,-314,-236,-269,-640,-270,-276,-640,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'PACKAGE':([2,16,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,237,240,273,536,755,756,],[17,236,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-358,-347,-603,-348,-602,-610,]),';':([2,4,5,6,8,9,10,12,13,14,15,18,19,20,21,22,23,24,25,26,49,50,51,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,162,163,166,167,169,170,175,176,177,178,179,180,181,182,183,190,191,196,197,198,199,200,201,202,203,204,205,206,207,211,212,217,218,219,220,221,222,223,224,225,226,229,230,232,233,234,235,239,240,241,242,243,245,246,247,248,249,250,251,252,273,275,276,279,280,299,300,304,312,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,344,345,365,366,367,368,369,370,371,372,373,374,377,378,382,383,388,389,391,392,393,396,397,398,399,400,401,402,404,407,418,420,422,423,425,426,435,436,437,438,439,443,444,453,455,456,459,461,463,464,466,468,469,471,473,474,477,478,479,480,483,485,486,487,488,489,494,516,517,518,519,522,523,524,527,529,532,533,534,535,536,538,541,542,543,546,547,572,575,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,640,641,642,647,651,652,653,654,655,659,660,661,662,663,667,668,669,671,672,674,675,677,678,679,695,696,698,700,701,707,708,709,710,717,719,720,722,723,724,725,726,727,728,729,730,733,736,737,738,739,740,742,743,744,745,755,756,761,763,771,772,773,774,775,780,781,782,783,784,785,786,787,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,835,836,840,841,842,843,844,845,846,847,852,853,857,858,861,862,869,870,871,882,883,887,888,890,891,894,896,899,900,901,902,907,908,913,914,916,917,918,919,920,922,923,925,927,937,938,939,948,950,959,961,966,968,977,978,979,980,981,982,984,985,988,989,992,994,997,998,999,1000,1011,1012,1013,1016,1018,1019,1020,1022,1023,1024,1025,1026,1034,1039,1041,1042,1044,1045,1046,1048,1049,1051,1052,1053,1054,1055,1058,1059,1061,1064,1066,1068,1070,1073,1078,1080,1081,1082,1083,1086,1087,1090,1091,1093,1094,1097,1099,1101,1104,1105,1106,1114,1115,1116,1118,1119,1121,1122,1123,1125,1128,1133,1134,1136,1137,1138,1141,1142,1143,1146,1147,1148,1149,1150,1151,1152,1153,1154,1156,1157,1158,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1184,1187,1188,1189,1193,],[13,128,197,218,13,13,13,235,-455,-623,-633,-625,-626,-627,-628,-451,-452,-453,-454,241,-599,-600,-601,-609,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-172,-173,-174,-175,-176,-177,369,-266,370,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,128,128,-165,392,-210,128,396,398,-640,-382,-383,-211,-212,-213,-214,-215,-216,-217,-384,-385,435,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-513,444,453,-542,-536,-537,-538,-539,-540,-541,-543,444,13,13,13,-624,-634,-620,-622,-347,-456,-457,459,-458,197,-520,218,-544,478,-568,13,-603,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-385,-387,-109,-110,-120,-121,-178,-179,-180,-182,-184,-640,-387,128,-640,-253,369,128,-170,-209,663,-281,667,-283,668,669,-248,-249,671,-290,-389,-393,-395,-396,-402,-403,-479,-492,-493,128,-510,-514,-515,-531,13,-621,-629,720,435,197,-477,453,218,-534,478,478,-552,197,-555,-640,13,-577,745,-580,-581,-582,-386,-589,-590,-591,-592,-131,-132,-133,-7,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-154,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-186,-153,-181,-391,-392,-232,846,-242,-243,-244,-245,-246,-164,-166,369,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,865,-305,-390,-388,-404,-421,-422,369,128,902,-640,-640,916,-631,-472,-473,435,-478,-528,-529,453,-535,-548,478,197,-554,-556,-558,-559,-557,-574,-578,-579,-602,-610,-596,-145,-150,-334,-335,-336,-162,-29,-34,-39,-44,-49,-55,-57,-61,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-388,-225,-183,-185,-187,-188,128,128,-640,-640,-167,984,-292,-289,-300,-293,-255,997,998,-394,-397,-405,-406,-408,-409,-423,-424,-509,-511,369,-491,-503,-504,-640,-519,-630,1023,-474,-530,-549,-553,-551,-640,-640,-594,-595,-21,-163,-159,-341,-640,-235,-189,128,-238,1063,-186,-640,-247,-265,-267,-286,-310,-301,-306,-311,-312,1080,1081,-410,-425,-426,-512,-505,-506,-508,-516,-632,-550,-560,-640,-593,-230,-229,-160,-24,-23,-231,-220,-221,-640,-324,-330,-331,-640,128,128,-640,-186,-268,128,-275,1142,-308,-313,-314,1147,1148,1151,1152,-411,-412,-414,-415,-407,-427,-428,-583,-586,-587,-640,-227,-226,-228,-222,-323,-327,-640,-236,1169,-269,128,-270,-276,128,-278,-280,-295,-309,-315,-317,1174,1175,-316,-318,1176,1177,-416,-429,-430,-507,-588,-640,-326,-161,-328,128,128,-640,128,-271,-277,-319,-321,-320,-322,-413,-431,-432,-325,1190,-240,128,128,]),'error':([2,4,5,6,8,9,10,13,14,15,18,19,20,21,22,23,24,25,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,197,198,199,200,201,202,203,204,205,206,207,211,218,219,220,221,222,223,224,225,229,230,232,233,234,235,241,242,245,246,247,248,249,251,252,369,370,383,389,391,392,396,398,407,435,436,437,438,439,443,444,453,455,459,464,466,469,471,478,483,485,487,488,489,642,659,660,662,663,667,668,669,671,672,674,675,677,708,720,722,723,725,726,727,729,730,736,743,744,745,852,857,858,861,862,899,900,902,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1023,1024,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[26,127,196,217,26,26,26,-455,-623,-633,-625,-626,-627,-628,-451,-452,-453,-454,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,388,-165,-210,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-513,-542,-536,-537,-538,-539,-540,-541,-543,26,26,26,-624,-634,-620,-456,-457,-458,463,-520,468,-544,-568,26,-178,-179,-253,661,-170,-209,-281,-283,-290,-479,-492,-493,707,-510,-514,-515,-531,26,-629,724,-477,728,-534,196,26,-577,-580,-581,-582,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,901,-631,-472,-473,-478,-528,-529,-535,-548,196,-574,-578,-579,-167,-292,-289,-300,-293,-509,-511,-491,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-632,-550,-268,127,-275,-313,-314,-236,-269,127,-270,-276,127,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'IMPORT':([2,8,9,14,18,19,20,21,229,233,235,459,720,916,1023,],[28,28,28,-623,-625,-626,-627,-628,28,-624,-620,-629,-631,-630,-632,]),'PUBLIC':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[34,34,34,34,34,34,34,-455,-623,-633,34,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,34,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,34,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,34,34,34,-542,-536,-537,-538,-539,-540,-541,-543,34,34,34,34,34,-624,-634,-620,-358,-347,-456,-457,-458,34,-520,34,-544,34,-568,34,-603,-178,-179,34,-253,34,-170,-209,-281,-283,-290,34,-479,-492,-493,34,-510,-514,-515,34,-531,34,-629,34,-477,34,-534,34,34,-577,-580,-581,-582,34,-348,-232,34,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,34,34,-496,34,-631,-472,-473,-478,-528,-529,-535,-548,34,34,-574,-578,-579,-602,-610,-167,-292,-289,34,-300,-293,34,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,34,-268,34,-275,-313,-314,-584,-236,-269,34,-270,-276,34,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'PROTECTED':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[35,35,35,35,35,35,35,-455,-623,-633,35,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,35,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,35,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,35,35,35,-542,-536,-537,-538,-539,-540,-541,-543,35,35,35,35,35,-624,-634,-620,-358,-347,-456,-457,-458,35,-520,35,-544,35,-568,35,-603,-178,-179,35,-253,35,-170,-209,-281,-283,-290,35,-479,-492,-493,35,-510,-514,-515,35,-531,35,-629,35,-477,35,-534,35,35,-577,-580,-581,-582,35,-348,-232,35,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,35,35,-496,35,-631,-472,-473,-478,-528,-529,-535,-548,35,35,-574,-578,-579,-602,-610,-167,-292,-289,35,-300,-293,35,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,35,-268,35,-275,-313,-314,-584,-236,-269,35,-270,-276,35,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'PRIVATE':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[36,36,36,36,36,36,36,-455,-623,-633,36,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,36,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,36,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,36,36,36,-542,-536,-537,-538,-539,-540,-541,-543,36,36,36,36,36,-624,-634,-620,-358,-347,-456,-457,-458,36,-520,36,-544,36,-568,36,-603,-178,-179,36,-253,36,-170,-209,-281,-283,-290,36,-479,-492,-493,36,-510,-514,-515,36,-531,36,-629,36,-477,36,-534,36,36,-577,-580,-581,-582,36,-348,-232,36,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,36,36,-496,36,-631,-472,-473,-478,-528,-529,-535,-548,36,36,-574,-578,-579,-602,-610,-167,-292,-289,36,-300,-293,36,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,36,-268,36,-275,-313,-314,-584,-236,-269,36,-270,-276,36,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'STATIC':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,28,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[29,29,208,29,29,29,29,-455,-623,-633,29,-625,-626,-627,-628,-451,-452,-453,-454,-357,244,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,29,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,29,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,29,29,29,-542,-536,-537,-538,-539,-540,-541,-543,29,29,29,29,29,-624,-634,-620,-358,-347,-456,-457,-458,208,-520,29,-544,29,-568,29,-603,-178,-179,29,-253,29,-170,-209,-281,-283,-290,29,-479,-492,-493,29,-510,-514,-515,29,-531,29,-629,208,-477,29,-534,208,29,-577,-580,-581,-582,29,-348,-232,29,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,29,29,-496,29,-631,-472,-473,-478,-528,-529,-535,-548,29,208,-574,-578,-579,-602,-610,-167,-292,-289,29,-300,-293,29,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,29,-268,29,-275,-313,-314,-584,-236,-269,29,-270,-276,29,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'ABSTRACT':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[37,37,37,37,37,37,37,-455,-623,-633,37,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,37,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,37,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,37,37,37,-542,-536,-537,-538,-539,-540,-541,-543,37,37,37,37,37,-624,-634,-620,-358,-347,-456,-457,-458,37,-520,37,-544,37,-568,37,-603,-178,-179,37,-253,37,-170,-209,-281,-283,-290,37,-479,-492,-493,37,-510,-514,-515,37,-531,37,-629,37,-477,37,-534,37,37,-577,-580,-581,-582,37,-348,-232,37,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,37,37,-496,37,-631,-472,-473,-478,-528,-529,-535,-548,37,37,-574,-578,-579,-602,-610,-167,-292,-289,37,-300,-293,37,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,37,-268,37,-275,-313,-314,-584,-236,-269,37,-270,-276,37,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'FINAL':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[38,38,38,38,38,38,38,-455,-623,-633,38,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,38,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,38,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,38,38,38,-542,-536,-537,-538,-539,-540,-541,-543,38,38,38,38,38,-624,-634,-620,-358,-347,-456,-457,-458,38,-520,38,-544,38,-568,38,-603,-178,-179,38,-253,38,-170,-209,-281,-283,-290,38,-479,-492,-493,38,-510,-514,-515,38,-531,38,-629,38,-477,38,-534,38,38,-577,-580,-581,-582,38,-348,-232,38,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,38,38,-496,38,-631,-472,-473,-478,-528,-529,-535,-548,38,38,-574,-578,-579,-602,-610,-167,-292,-289,38,-300,-293,38,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,38,-268,38,-275,-313,-314,-584,-236,-269,38,-270,-276,38,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'NATIVE':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[39,39,39,39,39,39,39,-455,-623,-633,39,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,39,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,39,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,39,39,39,-542,-536,-537,-538,-539,-540,-541,-543,39,39,39,39,39,-624,-634,-620,-358,-347,-456,-457,-458,39,-520,39,-544,39,-568,39,-603,-178,-179,39,-253,39,-170,-209,-281,-283,-290,39,-479,-492,-493,39,-510,-514,-515,39,-531,39,-629,39,-477,39,-534,39,39,-577,-580,-581,-582,39,-348,-232,39,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,39,39,-496,39,-631,-472,-473,-478,-528,-529,-535,-548,39,39,-574,-578,-579,-602,-610,-167,-292,-289,39,-300,-293,39,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,39,-268,39,-275,-313,-314,-584,-236,-269,39,-270,-276,39,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'SYNCHRONIZED':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,378,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,844,845,852,857,858,860,861,862,864,865,869,899,900,902,903,904,916,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1058,1059,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[40,171,40,40,40,40,40,-455,-623,-633,40,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,40,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,384,171,-165,-210,384,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,40,40,40,-542,-536,-537,-538,-539,-540,-541,-543,40,40,40,40,40,-624,-634,-620,-358,-347,-456,-457,-458,40,-520,40,-544,40,-568,40,-603,-178,-179,384,40,-253,171,-170,-209,-281,-283,-290,40,-479,-492,-493,171,-510,-514,-515,40,-531,40,-629,40,-477,40,-534,40,40,-577,-580,-581,-582,40,-348,-232,40,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,40,171,-496,40,-631,-472,-473,-478,-528,-529,-535,-548,40,40,-574,-578,-579,-602,-610,384,384,-167,-292,-289,40,-300,-293,40,-307,-255,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,384,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,384,384,40,-268,171,-275,-313,-314,-584,-236,-269,171,-270,-276,171,-278,-280,-295,-315,-317,-316,-318,384,384,384,-271,-277,-319,-321,-320,-322,-240,384,384,]),'TRANSIENT':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[41,41,41,41,41,41,41,-455,-623,-633,41,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,41,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,41,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,41,41,41,-542,-536,-537,-538,-539,-540,-541,-543,41,41,41,41,41,-624,-634,-620,-358,-347,-456,-457,-458,41,-520,41,-544,41,-568,41,-603,-178,-179,41,-253,41,-170,-209,-281,-283,-290,41,-479,-492,-493,41,-510,-514,-515,41,-531,41,-629,41,-477,41,-534,41,41,-577,-580,-581,-582,41,-348,-232,41,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,41,41,-496,41,-631,-472,-473,-478,-528,-529,-535,-548,41,41,-574,-578,-579,-602,-610,-167,-292,-289,41,-300,-293,41,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,41,-268,41,-275,-313,-314,-584,-236,-269,41,-270,-276,41,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'VOLATILE':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[42,42,42,42,42,42,42,-455,-623,-633,42,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,42,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,42,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,42,42,42,-542,-536,-537,-538,-539,-540,-541,-543,42,42,42,42,42,-624,-634,-620,-358,-347,-456,-457,-458,42,-520,42,-544,42,-568,42,-603,-178,-179,42,-253,42,-170,-209,-281,-283,-290,42,-479,-492,-493,42,-510,-514,-515,42,-531,42,-629,42,-477,42,-534,42,42,-577,-580,-581,-582,42,-348,-232,42,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,42,42,-496,42,-631,-472,-473,-478,-528,-529,-535,-548,42,42,-574,-578,-579,-602,-610,-167,-292,-289,42,-300,-293,42,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,42,-268,42,-275,-313,-314,-584,-236,-269,42,-270,-276,42,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'STRICTFP':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[43,43,43,43,43,43,43,-455,-623,-633,43,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,43,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,43,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,43,43,43,-542,-536,-537,-538,-539,-540,-541,-543,43,43,43,43,43,-624,-634,-620,-358,-347,-456,-457,-458,43,-520,43,-544,43,-568,43,-603,-178,-179,43,-253,43,-170,-209,-281,-283,-290,43,-479,-492,-493,43,-510,-514,-515,43,-531,43,-629,43,-477,43,-534,43,43,-577,-580,-581,-582,43,-348,-232,43,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,43,43,-496,43,-631,-472,-473,-478,-528,-529,-535,-548,43,43,-574,-578,-579,-602,-610,-167,-292,-289,43,-300,-293,43,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,43,-268,43,-275,-313,-314,-584,-236,-269,43,-270,-276,43,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'@':([2,4,5,6,8,9,10,13,14,15,16,18,19,20,21,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,171,197,198,199,200,201,202,203,204,205,206,207,208,211,213,214,215,218,219,220,221,222,223,224,225,228,229,230,231,232,233,234,235,237,240,241,242,245,246,247,248,249,250,251,252,273,274,369,370,382,383,389,391,392,396,398,407,408,435,436,437,438,439,443,444,450,453,455,459,464,466,469,471,478,483,485,487,488,489,490,521,536,642,650,659,660,662,663,667,668,669,671,672,674,675,677,681,708,713,715,720,722,723,725,726,727,729,730,733,736,743,744,745,755,756,758,852,857,858,860,861,862,864,865,899,900,902,903,904,916,918,919,920,923,936,966,968,978,984,985,988,989,992,997,998,1016,1017,1023,1024,1028,1061,1066,1068,1070,1080,1081,1107,1108,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[55,55,55,55,55,55,55,-455,-623,-633,238,-625,-626,-627,-628,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,238,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,55,-165,-210,-366,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,-513,451,238,451,-542,-536,-537,-538,-539,-540,-541,-543,238,55,55,238,55,-624,-634,-620,-358,-347,-456,-457,-458,55,-520,55,-544,451,-568,55,-603,451,-178,-179,451,-253,55,-170,-209,-281,-283,-290,451,-479,-492,-493,55,-510,-514,-515,451,-531,55,-629,55,-477,55,-534,55,55,-577,-580,-581,-582,451,451,-348,-232,451,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,451,55,-496,451,-631,-472,-473,-478,-528,-529,-535,-548,451,55,-574,-578,-579,-602,-610,451,-167,-292,-289,451,-300,-293,451,-307,-509,-511,-491,-518,-495,-630,-474,-530,-549,-551,451,-235,-189,-238,-265,-267,-286,-310,-301,-311,-312,-512,-517,-632,-550,-585,451,-268,55,-275,-313,-314,451,-584,-236,-269,55,-270,-276,55,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'THIS':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,186,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,296,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,415,416,422,423,425,426,438,521,547,549,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,690,694,698,700,701,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,850,852,855,857,858,861,862,869,874,875,878,879,883,887,888,890,891,894,896,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1011,1012,1013,1024,1036,1050,1057,1058,1059,1060,1061,1063,1065,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[77,184,77,77,77,77,77,77,77,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,77,184,184,-165,-210,77,184,77,77,414,-458,-520,-544,-568,77,77,77,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,77,77,533,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-178,-179,184,77,77,77,-253,184,-170,-209,77,-281,-283,77,-290,77,77,77,689,693,-395,-396,-402,-403,184,77,77,533,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-232,77,-164,-166,-171,-264,77,-282,-284,-285,-287,-288,-291,-294,-640,77,77,877,881,-404,-421,-422,184,-472,-473,-528,-529,-548,77,-574,77,77,77,77,77,77,77,77,77,77,77,77,184,184,77,77,533,-167,77,-292,-289,-300,-293,-255,77,77,77,77,-397,-405,-406,-408,-409,-423,-424,-474,-530,-549,-551,77,77,77,77,77,77,77,77,77,-235,-189,184,-238,-265,-267,-286,-310,-301,77,-311,-312,77,77,77,77,-410,-425,-426,-550,77,77,77,184,184,77,77,77,533,-268,184,-275,77,77,-313,-314,-411,-412,-414,-415,-407,-427,-428,77,77,-236,-269,184,-270,-276,184,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,184,184,77,184,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,184,77,184,]),'(':([3,4,56,57,72,73,74,82,86,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,160,161,163,164,165,166,168,170,171,172,173,184,185,190,240,245,247,249,251,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,341,343,344,345,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,384,389,391,392,394,396,398,403,407,409,410,411,413,414,418,422,423,425,426,438,442,480,494,521,532,536,538,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,601,607,609,610,617,636,642,645,649,659,660,662,663,664,666,667,668,669,671,672,674,675,676,677,685,686,687,688,689,691,692,693,695,698,700,701,708,710,711,722,723,726,727,730,741,742,743,758,763,764,766,767,768,769,770,778,802,824,825,829,833,835,837,838,839,844,845,846,849,852,855,857,858,861,862,869,874,875,876,877,878,879,880,881,883,887,888,890,891,894,896,905,918,919,920,923,927,936,940,941,942,944,946,949,951,953,964,965,966,968,975,976,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1011,1012,1013,1024,1027,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[82,154,274,277,-345,-346,277,82,346,277,277,277,277,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,379,82,381,382,154,154,-165,-210,82,394,154,346,82,403,82,408,410,411,-384,-347,-458,-520,-544,-568,-603,277,82,82,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,82,277,82,277,82,82,277,277,277,277,277,-386,610,-385,-387,82,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,-178,-179,154,82,82,154,-253,403,154,-170,-209,82,-281,-283,82,-290,82,82,82,686,687,-389,-395,-396,-402,-403,154,713,741,-386,277,768,-348,770,277,82,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,82,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,277,824,82,833,82,838,82,-232,277,346,-164,-166,-171,-264,82,855,-282,-284,-285,-287,-288,-291,-294,860,-640,824,82,82,874,875,768,878,879,-390,-404,-421,-422,154,903,904,-472,-473,-528,-529,-548,82,-557,-574,277,277,277,941,942,82,944,82,277,277,82,953,82,82,-388,82,82,964,154,154,82,154,-167,82,-292,-289,-300,-293,-255,82,82,1003,1004,82,82,1007,1008,-397,-405,-406,-408,-409,-423,-424,1017,-474,-530,-549,-551,1028,277,1036,82,82,82,277,277,277,82,82,1057,-235,-189,1060,1061,154,-238,-265,-267,-286,-310,-301,82,-311,-312,82,82,82,82,-410,-425,-426,-550,1108,82,82,82,154,154,82,154,154,-268,154,-275,82,82,-313,-314,-411,-412,-414,-415,-407,-427,-428,277,277,-236,-269,154,-270,-276,154,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,154,154,82,154,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,154,154,154,]),'NEW':([3,4,57,74,82,94,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,415,416,438,521,547,549,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,850,851,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1065,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[85,193,85,85,85,348,85,85,85,85,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,85,193,193,-165,-210,85,193,85,85,-458,-520,-544,-568,85,85,85,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,85,85,530,-329,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-178,-179,193,85,85,193,-253,193,-170,-209,85,-281,-283,85,-290,85,85,85,530,-329,193,85,85,-329,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-232,85,-164,-166,-171,-264,85,-282,-284,-285,-287,-288,-291,-294,-640,85,85,193,-472,-473,-528,-529,-548,85,-574,85,85,85,85,85,85,85,85,85,85,85,85,193,193,85,193,-329,530,-167,85,-292,-289,-300,-293,-255,85,85,85,85,-474,-530,-549,-551,85,85,85,85,85,85,85,85,85,-235,-189,193,-238,-265,-267,-286,-310,-301,85,-311,-312,85,85,85,85,-550,85,85,85,193,193,85,193,193,-329,-268,193,-275,85,85,-313,-314,85,85,-236,-269,193,-270,-276,193,-278,-280,-295,-315,-317,-316,-318,193,193,85,193,-271,-277,-319,-321,-320,-322,-240,193,193,193,]),'NAME':([3,4,5,6,13,17,22,23,24,25,27,28,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,55,56,57,72,73,74,82,85,95,96,97,98,99,100,101,102,103,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,158,159,160,161,163,164,166,167,168,169,170,171,172,175,176,188,189,190,191,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,236,237,238,240,241,242,244,245,246,247,248,249,250,251,252,256,260,264,267,269,270,271,272,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,305,326,327,333,334,336,342,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,375,376,377,378,379,381,382,383,386,389,391,392,394,396,398,403,407,408,409,410,411,412,415,416,417,418,419,420,421,422,423,425,426,435,436,437,438,439,440,441,442,443,444,447,449,450,451,453,454,457,458,460,464,465,466,469,470,471,476,478,481,483,484,485,487,488,489,490,491,500,501,521,530,531,536,537,538,541,542,547,549,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,602,607,610,611,618,635,636,640,641,642,645,648,649,650,656,659,660,662,663,664,667,668,669,671,672,674,675,677,680,681,686,687,690,694,695,696,697,698,699,700,701,703,704,705,708,711,712,713,715,716,721,722,723,725,726,727,729,730,733,736,741,743,744,745,747,748,749,750,751,752,755,756,757,758,763,764,765,768,770,777,778,802,824,829,833,837,838,844,845,846,848,849,850,851,852,855,857,858,860,861,862,864,865,868,869,874,875,878,879,882,883,887,888,890,891,894,896,899,900,902,903,904,909,912,918,919,920,923,926,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1065,1066,1068,1070,1071,1075,1076,1077,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1103,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[86,168,-640,-640,-455,240,-451,-452,-453,-454,-357,240,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,240,-609,86,-345,-346,86,86,240,-373,-374,-375,-376,-377,-378,-379,-380,-381,86,86,86,86,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,374,240,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,86,168,-371,-372,168,-165,-210,86,168,397,-347,399,86,-366,86,-382,-383,-387,-356,-384,-385,240,240,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,442,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,240,-355,240,-358,240,-347,-456,-457,240,-458,-640,-520,-640,-544,-640,-568,-640,240,240,240,505,506,507,508,509,-603,86,86,86,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,86,86,532,538,86,-155,-156,86,86,86,86,86,86,86,86,601,240,86,86,240,86,86,86,240,86,86,86,86,86,86,86,86,86,86,86,86,-178,-179,374,-371,-387,168,86,86,649,-253,-391,168,-170,-209,86,-281,-283,86,-290,240,86,86,86,685,691,538,-392,-389,240,-393,240,-395,-396,-402,-403,-479,-492,-493,168,-510,710,711,-347,-514,-515,-356,240,-355,240,-531,240,718,240,240,-640,-356,-477,-640,-356,-534,-356,-640,742,-640,-356,-577,-580,-581,-582,-640,442,-434,-443,86,240,767,-348,769,-347,-158,-157,86,538,86,86,86,86,86,86,86,86,240,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,240,86,86,86,86,86,86,86,86,86,86,86,86,825,86,86,240,240,374,86,-391,-392,-232,86,847,-347,240,-387,-164,-166,-171,-264,86,-282,-284,-285,-287,-288,-291,-294,-640,374,240,86,86,767,769,-390,-388,240,-404,240,-421,-422,240,240,240,168,-347,905,-496,-640,374,240,-472,-473,-478,-528,-529,-535,-548,-640,-640,86,-574,-578,-579,711,927,240,505,-445,240,-602,-610,240,86,86,86,240,86,86,240,86,86,86,86,86,86,86,168,168,86,981,649,538,691,-167,86,-292,-289,-640,-300,-293,240,-307,374,-255,86,86,86,86,-394,-397,-405,-406,-408,-409,-423,-424,-509,-511,-491,-518,-495,240,374,-474,-530,-549,-551,1027,-444,-446,86,86,86,86,86,86,86,86,86,-235,-189,168,-238,-265,-267,-286,-310,240,-301,86,-311,-312,86,86,86,86,240,240,-410,-425,-426,240,240,-512,-517,-550,-585,-447,-448,240,86,86,86,168,168,86,649,649,538,-268,168,-275,86,374,-297,-298,86,-313,-314,-411,-412,-414,-415,-407,-427,-428,240,86,-584,-449,-450,86,-236,-269,168,-270,-276,168,-278,-280,-295,240,-315,-317,-316,-318,240,-416,-429,-430,240,240,168,168,86,168,-271,-277,-299,-319,-321,-320,-322,-413,-431,-432,-240,168,649,168,]),'NUM':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[88,88,88,88,88,88,88,88,88,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,88,88,88,-165,-210,88,88,88,88,-458,-520,-544,-568,88,88,88,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-178,-179,88,88,88,88,-253,88,-170,-209,88,-281,-283,88,-290,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-232,88,-164,-166,-171,-264,88,-282,-284,-285,-287,-288,-291,-294,-640,88,88,88,-472,-473,-528,-529,-548,88,-574,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-167,88,-292,-289,-300,-293,-255,88,88,88,88,-474,-530,-549,-551,88,88,88,88,88,88,88,88,88,-235,-189,88,-238,-265,-267,-286,-310,-301,88,-311,-312,88,88,88,88,-550,88,88,88,88,88,88,88,88,-268,88,-275,88,88,-313,-314,88,88,-236,-269,88,-270,-276,88,-278,-280,-295,-315,-317,-316,-318,88,88,88,88,-271,-277,-319,-321,-320,-322,-240,88,88,88,]),'CHAR_LITERAL':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[89,89,89,89,89,89,89,89,89,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,89,89,89,-165,-210,89,89,89,89,-458,-520,-544,-568,89,89,89,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-178,-179,89,89,89,89,-253,89,-170,-209,89,-281,-283,89,-290,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-232,89,-164,-166,-171,-264,89,-282,-284,-285,-287,-288,-291,-294,-640,89,89,89,-472,-473,-528,-529,-548,89,-574,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-167,89,-292,-289,-300,-293,-255,89,89,89,89,-474,-530,-549,-551,89,89,89,89,89,89,89,89,89,-235,-189,89,-238,-265,-267,-286,-310,-301,89,-311,-312,89,89,89,89,-550,89,89,89,89,89,89,89,89,-268,89,-275,89,89,-313,-314,89,89,-236,-269,89,-270,-276,89,-278,-280,-295,-315,-317,-316,-318,89,89,89,89,-271,-277,-319,-321,-320,-322,-240,89,89,89,]),'STRING_LITERAL':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[90,90,90,90,90,90,90,90,90,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,90,90,90,-165,-210,90,90,90,90,-458,-520,-544,-568,90,90,90,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-178,-179,90,90,90,90,-253,90,-170,-209,90,-281,-283,90,-290,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-232,90,-164,-166,-171,-264,90,-282,-284,-285,-287,-288,-291,-294,-640,90,90,90,-472,-473,-528,-529,-548,90,-574,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-167,90,-292,-289,-300,-293,-255,90,90,90,90,-474,-530,-549,-551,90,90,90,90,90,90,90,90,90,-235,-189,90,-238,-265,-267,-286,-310,-301,90,-311,-312,90,90,90,90,-550,90,90,90,90,90,90,90,90,-268,90,-275,90,90,-313,-314,90,90,-236,-269,90,-270,-276,90,-278,-280,-295,-315,-317,-316,-318,90,90,90,90,-271,-277,-319,-321,-320,-322,-240,90,90,90,]),'TRUE':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[91,91,91,91,91,91,91,91,91,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,91,91,91,-165,-210,91,91,91,91,-458,-520,-544,-568,91,91,91,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-178,-179,91,91,91,91,-253,91,-170,-209,91,-281,-283,91,-290,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-232,91,-164,-166,-171,-264,91,-282,-284,-285,-287,-288,-291,-294,-640,91,91,91,-472,-473,-528,-529,-548,91,-574,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-167,91,-292,-289,-300,-293,-255,91,91,91,91,-474,-530,-549,-551,91,91,91,91,91,91,91,91,91,-235,-189,91,-238,-265,-267,-286,-310,-301,91,-311,-312,91,91,91,91,-550,91,91,91,91,91,91,91,91,-268,91,-275,91,91,-313,-314,91,91,-236,-269,91,-270,-276,91,-278,-280,-295,-315,-317,-316,-318,91,91,91,91,-271,-277,-319,-321,-320,-322,-240,91,91,91,]),'FALSE':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[92,92,92,92,92,92,92,92,92,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,92,92,92,-165,-210,92,92,92,92,-458,-520,-544,-568,92,92,92,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-178,-179,92,92,92,92,-253,92,-170,-209,92,-281,-283,92,-290,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-232,92,-164,-166,-171,-264,92,-282,-284,-285,-287,-288,-291,-294,-640,92,92,92,-472,-473,-528,-529,-548,92,-574,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-167,92,-292,-289,-300,-293,-255,92,92,92,92,-474,-530,-549,-551,92,92,92,92,92,92,92,92,92,-235,-189,92,-238,-265,-267,-286,-310,-301,92,-311,-312,92,92,92,92,-550,92,92,92,92,92,92,92,92,-268,92,-275,92,92,-313,-314,92,92,-236,-269,92,-270,-276,92,-278,-280,-295,-315,-317,-316,-318,92,92,92,92,-271,-277,-319,-321,-320,-322,-240,92,92,92,]),'NULL':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,861,862,869,874,875,878,879,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1024,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1188,1189,1190,1193,],[93,93,93,93,93,93,93,93,93,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,93,93,93,-165,-210,93,93,93,93,-458,-520,-544,-568,93,93,93,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-178,-179,93,93,93,93,-253,93,-170,-209,93,-281,-283,93,-290,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-232,93,-164,-166,-171,-264,93,-282,-284,-285,-287,-288,-291,-294,-640,93,93,93,-472,-473,-528,-529,-548,93,-574,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-167,93,-292,-289,-300,-293,-255,93,93,93,93,-474,-530,-549,-551,93,93,93,93,93,93,93,93,93,-235,-189,93,-238,-265,-267,-286,-310,-301,93,-311,-312,93,93,93,93,-550,93,93,93,93,93,93,93,93,-268,93,-275,93,93,-313,-314,93,93,-236,-269,93,-270,-276,93,-278,-280,-295,-315,-317,-316,-318,93,93,93,93,-271,-277,-319,-321,-320,-322,-240,93,93,93,]),'SUPER':([3,4,57,74,82,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,172,186,245,247,249,251,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,296,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,409,410,411,415,416,422,423,425,426,430,438,521,547,549,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,659,660,662,663,664,667,668,669,671,672,674,675,677,686,687,690,694,698,700,701,708,722,723,726,727,730,741,743,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,850,852,855,857,858,861,862,869,874,875,878,879,883,887,888,890,891,893,894,896,918,919,920,923,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,992,995,997,998,1003,1004,1007,1008,1011,1012,1013,1024,1036,1050,1057,1058,1059,1060,1061,1063,1065,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1096,1097,1099,1101,1107,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[83,185,83,83,83,83,83,83,83,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,83,185,185,-165,-210,83,185,83,83,413,-458,-520,-544,-568,83,83,83,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,83,83,534,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-178,-179,185,83,83,658,-253,185,-170,-209,83,-281,-283,83,-290,83,83,83,688,692,-395,-396,-402,-403,704,185,83,83,534,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-232,83,-164,-166,-171,-264,83,-282,-284,-285,-287,-288,-291,-294,-640,83,83,876,880,-404,-421,-422,185,-472,-473,-528,-529,-548,83,-574,83,83,83,83,83,83,83,83,83,83,83,83,185,185,83,658,534,-167,83,-292,-289,-300,-293,-255,83,83,83,83,-397,-405,-406,-408,-409,1015,-423,-424,-474,-530,-549,-551,83,83,83,83,83,83,83,83,83,-235,-189,185,-238,-265,-267,-286,-310,-301,83,-311,-312,83,83,83,83,-410,-425,-426,-550,83,83,83,185,185,83,658,658,534,-268,185,-275,83,83,-313,-314,-411,-412,-414,-415,1160,-407,-427,-428,83,83,-236,-269,185,-270,-276,185,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,185,185,83,185,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,185,658,185,]),'BOOLEAN':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[95,95,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,95,-345,-346,95,95,95,95,95,95,95,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,95,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,95,95,95,-165,-210,95,95,95,-366,95,-356,95,95,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,95,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,95,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,95,95,95,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-178,-179,95,95,95,95,-253,95,-170,-209,95,-281,-283,95,-290,95,95,95,95,95,-479,-492,-493,95,-510,95,-514,-515,-356,95,-355,-531,95,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,95,-434,-443,95,-348,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-232,95,95,-164,-166,-171,-264,95,-282,-284,-285,-287,-288,-291,-294,-640,95,95,95,95,-404,95,95,95,95,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,95,-574,-578,-579,95,-445,95,-602,-610,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-167,95,-292,-289,-640,-300,-293,95,-307,-255,95,95,95,95,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,95,95,95,95,95,95,95,95,95,-235,-189,95,-238,-265,-267,-286,-310,95,-301,95,-311,-312,95,95,95,95,95,95,-410,-425,-426,95,95,-512,-517,-550,-585,-447,-448,95,95,95,95,95,95,95,95,95,-268,95,-275,95,95,-313,-314,-411,-412,-414,-415,-407,-427,-428,95,-584,-449,-450,95,-236,-269,95,-270,-276,95,-278,-280,-295,95,-315,-317,-316,-318,95,-416,-429,-430,95,95,95,95,95,95,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,95,95,95,]),'VOID':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[96,96,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,96,-345,-346,96,96,96,96,96,96,96,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,96,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,96,96,96,-165,-210,96,96,96,-366,96,-356,96,96,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,96,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,96,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,96,96,96,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-178,-179,96,96,96,96,-253,96,-170,-209,96,-281,-283,96,-290,96,96,96,96,96,-479,-492,-493,96,-510,96,-514,-515,-356,96,-355,-531,96,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,96,-434,-443,96,-348,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-232,96,96,-164,-166,-171,-264,96,-282,-284,-285,-287,-288,-291,-294,-640,96,96,96,96,-404,96,96,96,96,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,96,-574,-578,-579,96,-445,96,-602,-610,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-167,96,-292,-289,-640,-300,-293,96,-307,-255,96,96,96,96,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,96,96,96,96,96,96,96,96,96,-235,-189,96,-238,-265,-267,-286,-310,96,-301,96,-311,-312,96,96,96,96,96,96,-410,-425,-426,96,96,-512,-517,-550,-585,-447,-448,96,96,96,96,96,96,96,96,96,-268,96,-275,96,96,-313,-314,-411,-412,-414,-415,-407,-427,-428,96,-584,-449,-450,96,-236,-269,96,-270,-276,96,-278,-280,-295,96,-315,-317,-316,-318,96,-416,-429,-430,96,96,96,96,96,96,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,96,96,96,]),'BYTE':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[97,97,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,97,-345,-346,97,97,97,97,97,97,97,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,97,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,97,97,97,-165,-210,97,97,97,-366,97,-356,97,97,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,97,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,97,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,97,97,97,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-178,-179,97,97,97,97,-253,97,-170,-209,97,-281,-283,97,-290,97,97,97,97,97,-479,-492,-493,97,-510,97,-514,-515,-356,97,-355,-531,97,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,97,-434,-443,97,-348,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-232,97,97,-164,-166,-171,-264,97,-282,-284,-285,-287,-288,-291,-294,-640,97,97,97,97,-404,97,97,97,97,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,97,-574,-578,-579,97,-445,97,-602,-610,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-167,97,-292,-289,-640,-300,-293,97,-307,-255,97,97,97,97,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,97,97,97,97,97,97,97,97,97,-235,-189,97,-238,-265,-267,-286,-310,97,-301,97,-311,-312,97,97,97,97,97,97,-410,-425,-426,97,97,-512,-517,-550,-585,-447,-448,97,97,97,97,97,97,97,97,97,-268,97,-275,97,97,-313,-314,-411,-412,-414,-415,-407,-427,-428,97,-584,-449,-450,97,-236,-269,97,-270,-276,97,-278,-280,-295,97,-315,-317,-316,-318,97,-416,-429,-430,97,97,97,97,97,97,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,97,97,97,]),'SHORT':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[98,98,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,98,-345,-346,98,98,98,98,98,98,98,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,98,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,98,98,98,-165,-210,98,98,98,-366,98,-356,98,98,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,98,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,98,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,98,98,98,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-178,-179,98,98,98,98,-253,98,-170,-209,98,-281,-283,98,-290,98,98,98,98,98,-479,-492,-493,98,-510,98,-514,-515,-356,98,-355,-531,98,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,98,-434,-443,98,-348,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-232,98,98,-164,-166,-171,-264,98,-282,-284,-285,-287,-288,-291,-294,-640,98,98,98,98,-404,98,98,98,98,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,98,-574,-578,-579,98,-445,98,-602,-610,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-167,98,-292,-289,-640,-300,-293,98,-307,-255,98,98,98,98,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,98,98,98,98,98,98,98,98,98,-235,-189,98,-238,-265,-267,-286,-310,98,-301,98,-311,-312,98,98,98,98,98,98,-410,-425,-426,98,98,-512,-517,-550,-585,-447,-448,98,98,98,98,98,98,98,98,98,-268,98,-275,98,98,-313,-314,-411,-412,-414,-415,-407,-427,-428,98,-584,-449,-450,98,-236,-269,98,-270,-276,98,-278,-280,-295,98,-315,-317,-316,-318,98,-416,-429,-430,98,98,98,98,98,98,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,98,98,98,]),'INT':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[99,99,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,99,-345,-346,99,99,99,99,99,99,99,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,99,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,99,99,99,-165,-210,99,99,99,-366,99,-356,99,99,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,99,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,99,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,99,99,99,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-178,-179,99,99,99,99,-253,99,-170,-209,99,-281,-283,99,-290,99,99,99,99,99,-479,-492,-493,99,-510,99,-514,-515,-356,99,-355,-531,99,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,99,-434,-443,99,-348,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-232,99,99,-164,-166,-171,-264,99,-282,-284,-285,-287,-288,-291,-294,-640,99,99,99,99,-404,99,99,99,99,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,99,-574,-578,-579,99,-445,99,-602,-610,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-167,99,-292,-289,-640,-300,-293,99,-307,-255,99,99,99,99,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,99,99,99,99,99,99,99,99,99,-235,-189,99,-238,-265,-267,-286,-310,99,-301,99,-311,-312,99,99,99,99,99,99,-410,-425,-426,99,99,-512,-517,-550,-585,-447,-448,99,99,99,99,99,99,99,99,99,-268,99,-275,99,99,-313,-314,-411,-412,-414,-415,-407,-427,-428,99,-584,-449,-450,99,-236,-269,99,-270,-276,99,-278,-280,-295,99,-315,-317,-316,-318,99,-416,-429,-430,99,99,99,99,99,99,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,99,99,99,]),'LONG':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[100,100,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,100,-345,-346,100,100,100,100,100,100,100,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,100,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,100,100,100,-165,-210,100,100,100,-366,100,-356,100,100,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,100,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,100,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,100,100,100,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-178,-179,100,100,100,100,-253,100,-170,-209,100,-281,-283,100,-290,100,100,100,100,100,-479,-492,-493,100,-510,100,-514,-515,-356,100,-355,-531,100,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,100,-434,-443,100,-348,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-232,100,100,-164,-166,-171,-264,100,-282,-284,-285,-287,-288,-291,-294,-640,100,100,100,100,-404,100,100,100,100,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,100,-574,-578,-579,100,-445,100,-602,-610,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-167,100,-292,-289,-640,-300,-293,100,-307,-255,100,100,100,100,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,100,100,100,100,100,100,100,100,100,-235,-189,100,-238,-265,-267,-286,-310,100,-301,100,-311,-312,100,100,100,100,100,100,-410,-425,-426,100,100,-512,-517,-550,-585,-447,-448,100,100,100,100,100,100,100,100,100,-268,100,-275,100,100,-313,-314,-411,-412,-414,-415,-407,-427,-428,100,-584,-449,-450,100,-236,-269,100,-270,-276,100,-278,-280,-295,100,-315,-317,-316,-318,100,-416,-429,-430,100,100,100,100,100,100,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,100,100,100,]),'CHAR':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[101,101,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,101,-345,-346,101,101,101,101,101,101,101,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,101,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,101,101,101,-165,-210,101,101,101,-366,101,-356,101,101,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,101,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,101,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,101,101,101,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-178,-179,101,101,101,101,-253,101,-170,-209,101,-281,-283,101,-290,101,101,101,101,101,-479,-492,-493,101,-510,101,-514,-515,-356,101,-355,-531,101,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,101,-434,-443,101,-348,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-232,101,101,-164,-166,-171,-264,101,-282,-284,-285,-287,-288,-291,-294,-640,101,101,101,101,-404,101,101,101,101,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,101,-574,-578,-579,101,-445,101,-602,-610,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-167,101,-292,-289,-640,-300,-293,101,-307,-255,101,101,101,101,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,101,101,101,101,101,101,101,101,101,-235,-189,101,-238,-265,-267,-286,-310,101,-301,101,-311,-312,101,101,101,101,101,101,-410,-425,-426,101,101,-512,-517,-550,-585,-447,-448,101,101,101,101,101,101,101,101,101,-268,101,-275,101,101,-313,-314,-411,-412,-414,-415,-407,-427,-428,101,-584,-449,-450,101,-236,-269,101,-270,-276,101,-278,-280,-295,101,-315,-317,-316,-318,101,-416,-429,-430,101,101,101,101,101,101,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,101,101,101,]),'FLOAT':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[102,102,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,102,-345,-346,102,102,102,102,102,102,102,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,102,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,102,102,102,-165,-210,102,102,102,-366,102,-356,102,102,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,102,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,102,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,102,102,102,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-178,-179,102,102,102,102,-253,102,-170,-209,102,-281,-283,102,-290,102,102,102,102,102,-479,-492,-493,102,-510,102,-514,-515,-356,102,-355,-531,102,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,102,-434,-443,102,-348,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-232,102,102,-164,-166,-171,-264,102,-282,-284,-285,-287,-288,-291,-294,-640,102,102,102,102,-404,102,102,102,102,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,102,-574,-578,-579,102,-445,102,-602,-610,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-167,102,-292,-289,-640,-300,-293,102,-307,-255,102,102,102,102,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,102,102,102,102,102,102,102,102,102,-235,-189,102,-238,-265,-267,-286,-310,102,-301,102,-311,-312,102,102,102,102,102,102,-410,-425,-426,102,102,-512,-517,-550,-585,-447,-448,102,102,102,102,102,102,102,102,102,-268,102,-275,102,102,-313,-314,-411,-412,-414,-415,-407,-427,-428,102,-584,-449,-450,102,-236,-269,102,-270,-276,102,-278,-280,-295,102,-315,-317,-316,-318,102,-416,-429,-430,102,102,102,102,102,102,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,102,102,102,]),'DOUBLE':([3,4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,56,57,72,73,74,82,85,111,112,117,118,121,122,123,124,125,126,128,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,157,160,161,163,164,166,170,171,172,189,193,194,197,198,199,200,201,202,203,204,205,206,207,208,210,211,213,214,215,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,274,277,278,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,369,370,378,379,381,382,383,389,391,392,394,396,398,403,407,408,409,410,411,419,435,436,437,438,439,441,443,444,447,449,450,453,454,464,465,466,469,470,471,478,483,484,485,487,488,489,490,491,500,501,521,536,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,642,645,650,659,660,662,663,664,667,668,669,671,672,674,675,677,681,686,687,697,698,699,703,704,708,713,715,722,723,725,726,727,729,730,736,741,743,744,745,747,751,752,755,756,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,852,855,857,858,860,861,862,864,865,869,874,875,878,879,887,888,890,891,899,900,902,903,904,918,919,920,923,929,931,936,941,942,944,946,949,951,953,964,966,968,977,978,984,985,988,989,991,992,995,997,998,1003,1004,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1024,1028,1029,1031,1033,1036,1050,1057,1058,1059,1060,1061,1063,1066,1068,1070,1071,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1108,1109,1111,1117,1125,1133,1134,1136,1137,1138,1141,1142,1143,1145,1147,1148,1151,1152,1155,1156,1157,1158,1159,1160,1167,1168,1169,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1190,1193,],[103,103,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,-609,103,-345,-346,103,103,103,103,103,103,103,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,103,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,103,103,103,-165,-210,103,103,103,-366,103,-356,103,103,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,103,-513,-640,-355,-640,-542,-536,-537,-538,-539,-540,-541,-543,103,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,103,103,103,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-178,-179,103,103,103,103,-253,103,-170,-209,103,-281,-283,103,-290,103,103,103,103,103,-479,-492,-493,103,-510,103,-514,-515,-356,103,-355,-531,103,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,-640,103,-434,-443,103,-348,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-232,103,103,-164,-166,-171,-264,103,-282,-284,-285,-287,-288,-291,-294,-640,103,103,103,103,-404,103,103,103,103,-496,-640,-472,-473,-478,-528,-529,-535,-548,-640,103,-574,-578,-579,103,-445,103,-602,-610,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-167,103,-292,-289,-640,-300,-293,103,-307,-255,103,103,103,103,-405,-406,-408,-409,-509,-511,-491,-518,-495,-474,-530,-549,-551,-444,-446,103,103,103,103,103,103,103,103,103,-235,-189,103,-238,-265,-267,-286,-310,103,-301,103,-311,-312,103,103,103,103,103,103,-410,-425,-426,103,103,-512,-517,-550,-585,-447,-448,103,103,103,103,103,103,103,103,103,-268,103,-275,103,103,-313,-314,-411,-412,-414,-415,-407,-427,-428,103,-584,-449,-450,103,-236,-269,103,-270,-276,103,-278,-280,-295,103,-315,-317,-316,-318,103,-416,-429,-430,103,103,103,103,103,103,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,103,103,103,]),'+':([3,57,62,64,65,66,67,69,70,71,72,73,74,76,77,78,79,80,81,82,86,88,89,90,91,92,93,109,110,111,112,113,114,115,116,117,118,119,154,164,170,172,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,304,305,306,313,314,315,324,325,326,327,328,329,330,331,332,333,334,335,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,379,380,381,394,403,409,410,411,517,520,521,522,523,524,526,532,533,534,535,536,538,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,572,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,604,605,606,607,608,610,627,628,629,630,631,632,633,634,636,645,664,686,687,722,723,741,758,763,764,768,770,771,772,773,774,775,788,794,795,796,797,798,799,800,801,802,816,817,818,819,820,821,822,823,824,826,827,828,829,831,832,833,836,837,838,846,855,874,875,878,879,918,936,941,942,944,948,949,950,951,953,959,961,964,995,1003,1004,1007,1008,1036,1039,1041,1042,1046,1048,1049,1050,1051,1052,1053,1054,1055,1057,1060,1071,1079,1107,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1169,1184,],[111,111,-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,111,-139,-140,-141,-142,-143,-144,326,-347,-349,-350,-351,-352,-353,-354,360,-88,111,111,-96,-107,-108,-111,111,111,-122,326,111,111,111,326,-118,-119,326,111,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,111,111,111,111,111,111,-117,111,567,-131,-132,-133,592,-91,111,111,-100,-112,-113,-116,-123,111,111,-126,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-109,-110,-120,-121,111,567,111,111,111,111,111,111,567,-345,326,-131,-132,-133,567,-332,-147,-148,-149,-348,-347,-145,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-146,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-114,-115,-124,-125,-333,-152,-343,-339,111,-344,111,360,360,360,-89,-90,-97,-98,-99,111,111,111,111,111,-472,-473,111,326,-145,111,111,111,-150,-334,-335,-336,-162,-128,360,360,360,-93,-95,-102,-104,-106,111,360,360,360,-92,-94,-101,-103,-105,111,-151,-337,-340,111,-342,-338,111,-225,111,111,111,111,111,111,111,111,-474,326,111,111,111,-163,111,-159,111,111,-341,-640,111,111,111,111,111,111,111,-230,-229,-160,-231,-220,-221,111,-640,-324,-330,-331,-640,111,111,111,111,326,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,111,-325,]),'-':([3,57,62,64,65,66,67,69,70,71,72,73,74,76,77,78,79,80,81,82,86,88,89,90,91,92,93,109,110,111,112,113,114,115,116,117,118,119,154,164,170,172,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,298,301,302,303,304,305,306,313,314,315,324,325,326,327,328,329,330,331,332,333,334,335,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,379,380,381,394,403,409,410,411,517,520,521,522,523,524,526,532,533,534,535,536,538,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,572,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,604,605,606,607,608,610,627,628,629,630,631,632,633,634,636,645,664,686,687,722,723,741,758,763,764,768,770,771,772,773,774,775,788,794,795,796,797,798,799,800,801,802,816,817,818,819,820,821,822,823,824,826,827,828,829,831,832,833,836,837,838,846,855,874,875,878,879,918,936,941,942,944,948,949,950,951,953,959,961,964,995,1003,1004,1007,1008,1036,1039,1041,1042,1046,1048,1049,1050,1051,1052,1053,1054,1055,1057,1060,1071,1079,1107,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1169,1184,],[112,112,-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,112,-139,-140,-141,-142,-143,-144,327,-347,-349,-350,-351,-352,-353,-354,361,-88,112,112,-96,-107,-108,-111,112,112,-122,327,112,112,112,327,-118,-119,327,112,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,112,112,112,112,112,112,-117,112,568,-131,-132,-133,593,-91,112,112,-100,-112,-113,-116,-123,112,112,-126,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-109,-110,-120,-121,112,568,112,112,112,112,112,112,568,-345,327,-131,-132,-133,568,-332,-147,-148,-149,-348,-347,-145,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-146,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-114,-115,-124,-125,-333,-152,-343,-339,112,-344,112,361,361,361,-89,-90,-97,-98,-99,112,112,112,112,112,-472,-473,112,327,-145,112,112,112,-150,-334,-335,-336,-162,-128,361,361,361,-93,-95,-102,-104,-106,112,361,361,361,-92,-94,-101,-103,-105,112,-151,-337,-340,112,-342,-338,112,-225,112,112,112,112,112,112,112,112,-474,327,112,112,112,-163,112,-159,112,112,-341,-640,112,112,112,112,112,112,112,-230,-229,-160,-231,-220,-221,112,-640,-324,-330,-331,-640,112,112,112,112,327,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,112,-325,]),'IF':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[153,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,153,153,-165,-210,153,-458,-520,-544,-568,-178,-179,153,-253,153,-170,-209,-281,-283,-290,153,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,153,-472,-473,-528,-529,-548,-574,965,153,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,965,-238,-265,-267,-286,-310,-301,-311,-312,-550,153,965,-268,153,-275,-313,-314,-236,-269,153,-270,-276,153,-278,-280,-295,-315,-317,-316,-318,965,965,153,-271,-277,-319,-321,-320,-322,-240,965,965,]),'WHILE':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,395,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[155,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,155,155,-165,-210,155,-458,-520,-544,-568,-178,-179,155,-253,155,-170,-209,666,-281,-283,-290,155,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,155,-472,-473,-528,-529,-548,-574,975,155,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,975,-238,-265,-267,-286,-310,-301,-311,-312,-550,155,975,-268,155,-275,-313,-314,-236,-269,155,-270,-276,155,-278,-280,-295,-315,-317,-316,-318,975,975,155,-271,-277,-319,-321,-320,-322,-240,975,975,]),'FOR':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[156,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,156,156,-165,-210,156,-458,-520,-544,-568,-178,-179,156,-253,156,-170,-209,-281,-283,-290,156,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,156,-472,-473,-528,-529,-548,-574,976,156,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,976,-238,-265,-267,-286,-310,-301,-311,-312,-550,156,976,-268,156,-275,-313,-314,-236,-269,156,-270,-276,156,-278,-280,-295,-315,-317,-316,-318,976,976,156,-271,-277,-319,-321,-320,-322,-240,976,976,]),'{':([4,5,30,31,32,33,45,46,47,48,52,53,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,173,190,197,198,199,200,201,202,203,204,205,206,207,208,209,211,212,240,245,246,247,249,251,253,254,255,257,258,259,261,262,263,265,266,268,274,299,300,344,345,369,370,378,383,389,391,392,396,398,406,407,418,422,423,425,426,435,436,437,438,439,443,444,464,466,478,479,480,492,493,494,495,496,497,498,499,500,501,506,507,508,509,521,536,541,542,575,605,606,608,636,638,642,659,660,662,663,667,668,669,671,672,674,675,677,695,698,700,701,708,714,717,718,722,723,725,726,727,730,736,738,739,740,742,743,751,753,754,758,828,829,831,835,844,845,852,854,856,857,858,859,861,862,869,883,887,888,890,891,894,896,899,900,902,906,907,908,913,914,915,918,919,920,923,928,929,931,936,959,961,966,968,977,978,984,985,988,989,992,993,995,997,998,1011,1012,1013,1016,1018,1019,1020,1022,1024,1025,1029,1031,1050,1051,1055,1058,1059,1066,1068,1070,1074,1079,1080,1081,1090,1091,1093,1094,1097,1099,1101,1107,1109,1111,1114,1123,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1161,1163,1167,1168,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1193,],[160,160,246,248,250,252,-640,-640,-640,-640,-461,-523,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,160,160,-165,-210,160,160,-384,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,160,438,-513,438,-347,-458,160,-520,-544,-568,-640,-463,-464,-521,-525,-526,-545,-466,-467,-640,-460,-522,521,-155,-156,-385,-387,-178,-179,160,-253,160,-170,-209,-281,-283,160,-290,-389,-395,-396,-402,-403,-479,-492,-493,160,-510,-514,-515,160,-477,160,246,-640,-459,-465,-386,-527,-469,-471,-468,-569,-434,-443,-546,-462,-524,-573,521,-348,-158,-157,-154,829,-339,829,829,-153,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-390,-404,-421,-422,160,-640,-640,-570,-472,-473,-478,-528,-529,-548,160,-556,-558,-559,-557,-574,-445,-547,-572,521,-340,829,-342,-388,160,160,-167,986,160,-292,-289,160,-300,-293,-255,-397,-405,-406,-408,-409,-423,-424,-509,-511,-491,-494,-503,-504,-640,-519,-571,-474,-530,-549,-551,-470,-444,-446,521,-341,246,-235,-189,160,-238,-265,-267,-286,-310,-301,-302,829,-311,-312,-410,-425,-426,-512,-505,-506,-508,-516,-550,-560,-447,-448,829,246,246,160,160,-268,160,-275,160,829,-313,-314,-411,-412,-414,-415,-407,-427,-428,521,-449,-450,246,246,-236,-269,160,-270,-276,160,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,-507,246,160,160,160,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,160,160,]),'BODY':([4,5,72,73,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,173,190,197,198,199,200,201,202,203,204,205,206,207,208,209,211,212,240,245,246,247,249,251,299,300,344,345,369,370,378,383,389,391,392,396,398,406,407,418,422,423,425,426,435,436,437,438,439,443,444,464,466,478,494,536,541,542,575,638,642,659,660,662,663,667,668,669,671,672,674,675,677,695,698,700,701,708,714,717,722,723,725,726,727,730,736,743,835,844,845,852,856,857,858,859,861,862,869,883,887,888,890,891,894,896,899,900,902,906,907,908,913,914,918,919,920,923,966,968,977,978,984,985,988,989,992,993,997,998,1011,1012,1013,1016,1018,1019,1020,1022,1024,1058,1059,1066,1068,1070,1074,1080,1081,1090,1091,1093,1094,1097,1099,1101,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1161,1167,1168,1170,1171,1172,1174,1175,1176,1177,1178,1180,1182,1188,1189,1193,],[161,161,-345,-346,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,161,161,-165,-210,161,161,-384,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,161,439,-513,439,-347,-458,161,-520,-544,-568,-155,-156,-385,-387,-178,-179,161,-253,161,-170,-209,-281,-283,161,-290,-389,-395,-396,-402,-403,-479,-492,-493,161,-510,-514,-515,161,-477,161,-386,-348,-158,-157,-154,-153,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-390,-404,-421,-422,161,-640,-640,-472,-473,-478,-528,-529,-548,161,-574,-388,161,161,-167,161,-292,-289,161,-300,-293,-255,-397,-405,-406,-408,-409,-423,-424,-509,-511,-491,-494,-503,-504,-640,-519,-474,-530,-549,-551,-235,-189,161,-238,-265,-267,-286,-310,-301,-302,-311,-312,-410,-425,-426,-512,-505,-506,-508,-516,-550,161,161,-268,161,-275,161,-313,-314,-411,-412,-414,-415,-407,-427,-428,-236,-269,161,-270,-276,161,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,-507,161,161,161,-271,-277,-319,-321,-320,-322,-413,-431,-432,-240,161,161,]),'ASSERT':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[164,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,164,164,-165,-210,164,-458,-520,-544,-568,-178,-179,164,-253,164,-170,-209,-281,-283,-290,164,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,164,-472,-473,-528,-529,-548,-574,164,164,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,164,-238,-265,-267,-286,-310,-301,-311,-312,-550,164,164,-268,164,-275,-313,-314,-236,-269,164,-270,-276,164,-278,-280,-295,-315,-317,-316,-318,164,164,164,-271,-277,-319,-321,-320,-322,-240,164,164,]),'SWITCH':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[165,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,165,165,-165,-210,165,-458,-520,-544,-568,-178,-179,165,-253,165,-170,-209,-281,-283,-290,165,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,165,-472,-473,-528,-529,-548,-574,165,165,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,165,-238,-265,-267,-286,-310,-301,-311,-312,-550,165,165,-268,165,-275,-313,-314,-236,-269,165,-270,-276,165,-278,-280,-295,-315,-317,-316,-318,165,165,165,-271,-277,-319,-321,-320,-322,-240,165,165,]),'DO':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[166,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,166,166,-165,-210,166,-458,-520,-544,-568,-178,-179,166,-253,166,-170,-209,-281,-283,-290,166,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,166,-472,-473,-528,-529,-548,-574,166,166,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,166,-238,-265,-267,-286,-310,-301,-311,-312,-550,166,166,-268,166,-275,-313,-314,-236,-269,166,-270,-276,166,-278,-280,-295,-315,-317,-316,-318,166,166,166,-271,-277,-319,-321,-320,-322,-240,166,166,]),'BREAK':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[167,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,167,167,-165,-210,167,-458,-520,-544,-568,-178,-179,167,-253,167,-170,-209,-281,-283,-290,167,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,167,-472,-473,-528,-529,-548,-574,167,167,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,167,-238,-265,-267,-286,-310,-301,-311,-312,-550,167,167,-268,167,-275,-313,-314,-236,-269,167,-270,-276,167,-278,-280,-295,-315,-317,-316,-318,167,167,167,-271,-277,-319,-321,-320,-322,-240,167,167,]),'CONTINUE':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[169,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,169,169,-165,-210,169,-458,-520,-544,-568,-178,-179,169,-253,169,-170,-209,-281,-283,-290,169,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,169,-472,-473,-528,-529,-548,-574,169,169,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,169,-238,-265,-267,-286,-310,-301,-311,-312,-550,169,169,-268,169,-275,-313,-314,-236,-269,169,-270,-276,169,-278,-280,-295,-315,-317,-316,-318,169,169,169,-271,-277,-319,-321,-320,-322,-240,169,169,]),'RETURN':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[170,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,170,170,-165,-210,170,-458,-520,-544,-568,-178,-179,170,-253,170,-170,-209,-281,-283,-290,170,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,170,-472,-473,-528,-529,-548,-574,170,170,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,170,-238,-265,-267,-286,-310,-301,-311,-312,-550,170,170,-268,170,-275,-313,-314,-236,-269,170,-270,-276,170,-278,-280,-295,-315,-317,-316,-318,170,170,170,-271,-277,-319,-321,-320,-322,-240,170,170,]),'THROW':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[172,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,172,172,-165,-210,172,-458,-520,-544,-568,-178,-179,172,-253,172,-170,-209,-281,-283,-290,172,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,172,-472,-473,-528,-529,-548,-574,172,172,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,172,-238,-265,-267,-286,-310,-301,-311,-312,-550,172,172,-268,172,-275,-313,-314,-236,-269,172,-270,-276,172,-278,-280,-295,-315,-317,-316,-318,172,172,172,-271,-277,-319,-321,-320,-322,-240,172,172,]),'TRY':([4,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,245,247,249,251,369,370,378,383,389,391,392,396,398,407,438,642,659,660,662,663,667,668,669,671,672,674,675,677,708,722,723,726,727,730,743,844,845,852,857,858,861,862,869,918,919,920,923,966,968,977,978,984,985,988,989,992,997,998,1024,1058,1059,1066,1068,1070,1080,1081,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1167,1168,1170,1171,1172,1174,1175,1176,1177,1188,1189,1193,],[173,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,173,173,-165,-210,173,-458,-520,-544,-568,-178,-179,173,-253,173,-170,-209,-281,-283,-290,173,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,173,-472,-473,-528,-529,-548,-574,173,173,-167,-292,-289,-300,-293,-255,-474,-530,-549,-551,-235,-189,173,-238,-265,-267,-286,-310,-301,-311,-312,-550,173,173,-268,173,-275,-313,-314,-236,-269,173,-270,-276,173,-278,-280,-295,-315,-317,-316,-318,173,173,173,-271,-277,-319,-321,-320,-322,-240,173,173,]),'<':([4,5,6,13,22,23,24,25,27,29,34,35,36,37,38,39,40,41,42,43,44,49,50,51,52,53,56,62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,85,86,88,89,90,91,92,93,107,108,109,110,113,114,115,116,119,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,157,160,161,163,166,168,188,189,190,193,197,198,199,200,201,202,203,204,205,206,207,208,210,211,214,218,219,220,221,222,223,224,225,227,228,237,240,241,242,245,246,247,248,249,251,252,273,275,276,279,280,295,296,304,306,313,314,315,323,324,325,328,329,330,331,332,335,336,345,348,365,366,367,368,369,370,377,378,380,383,389,391,392,396,398,407,412,415,416,429,432,435,436,437,438,439,442,443,444,453,464,465,466,469,470,471,478,483,484,485,487,488,489,491,506,507,508,509,517,520,522,523,524,526,530,532,533,534,535,536,538,547,549,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,642,649,656,659,660,662,663,667,668,669,671,672,674,675,677,696,708,711,718,722,723,725,726,727,729,730,736,743,744,745,755,756,763,771,772,773,774,775,788,794,795,796,797,798,799,800,801,816,817,818,819,820,821,822,823,826,827,828,831,832,835,836,844,845,850,851,852,857,858,861,862,869,886,898,899,900,902,918,919,920,923,948,950,959,961,966,968,977,978,984,985,988,989,992,997,998,1016,1024,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1058,1059,1065,1066,1068,1070,1080,1081,1114,1115,1116,1118,1119,1121,1122,1123,1125,1133,1134,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1163,1164,1165,1166,1167,1168,1170,1171,1172,1174,1175,1176,1177,1184,1188,1189,1193,],[194,-640,-640,-455,-451,-452,-453,-454,-357,-362,-359,-360,-361,-363,-364,-365,-366,-367,-368,-369,-370,-599,-600,-601,267,267,-609,-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,194,-347,-349,-350,-351,-352,-353,-354,354,-63,-77,-88,-96,-107,-108,-111,-122,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,194,194,-165,-210,194,-347,-387,-356,419,194,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-362,267,-513,-355,-542,-536,-537,-538,-539,-540,-541,-543,267,-355,-358,-347,-456,-457,-458,-640,-520,-640,-544,-568,-640,-603,-118,-119,-134,-135,194,194,-117,560,-131,-132,-133,585,-81,-91,-100,-112,-113,-116,-123,-126,194,-387,194,-109,-110,-120,-121,-178,-179,-387,194,645,-253,194,-170,-209,-281,-283,-290,194,194,194,699,-387,-479,-492,-493,194,-510,-347,-514,-515,-531,-640,-356,-477,-640,-356,-534,-640,-640,-356,-577,-580,-581,-582,267,267,-462,-524,267,645,-345,-131,-132,-133,560,194,-332,-147,-148,-149,-348,-347,-145,194,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-232,-347,-387,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-388,194,-347,267,-472,-473,-478,-528,-529,-535,-548,-640,-574,-578,-579,-602,-610,-145,-150,-334,-335,-336,-162,-387,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-388,-225,194,194,194,194,-167,-292,-289,-300,-293,-255,1009,-388,-509,-511,-491,-474,-530,-549,-551,-163,-159,-341,-640,-235,-189,194,-238,-265,-267,-286,-310,-301,-311,-312,-512,-550,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,194,194,194,-268,194,-275,-313,-314,-640,-227,-226,-228,-222,-323,-327,-640,-236,-269,194,-270,-276,194,-278,-280,-295,-315,-317,-316,-318,-640,-326,-161,-328,194,194,194,-271,-277,-319,-321,-320,-322,-325,-240,194,194,]),'}':([13,22,23,24,25,26,49,50,51,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,160,161,163,175,176,190,191,197,198,199,200,201,202,203,204,205,206,207,211,218,219,220,221,222,223,224,225,240,241,242,245,246,247,248,249,250,251,252,273,275,276,279,280,299,300,304,312,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,369,370,377,383,387,388,389,390,391,392,396,398,407,418,420,422,423,425,426,435,436,437,438,439,443,444,453,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,482,483,484,485,487,488,489,516,517,518,519,521,522,523,524,527,529,532,533,534,535,536,538,541,542,543,546,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,642,659,660,661,662,663,667,668,669,671,672,674,675,677,695,696,698,700,701,706,707,708,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,742,743,744,745,755,756,759,760,761,762,763,771,772,773,774,775,780,781,782,783,784,785,786,787,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,829,831,832,836,842,843,852,857,858,861,862,882,883,887,888,890,891,894,896,899,900,901,902,918,919,920,921,922,923,936,937,938,939,948,950,954,955,956,957,958,959,961,966,968,978,984,985,986,988,989,992,997,998,1011,1012,1013,1016,1024,1025,1034,1035,1039,1041,1042,1044,1045,1046,1048,1049,1050,1051,1052,1053,1054,1055,1066,1067,1068,1069,1070,1080,1081,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1120,1121,1122,1123,1125,1133,1134,1135,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1156,1157,1158,1163,1164,1165,1166,1171,1172,1174,1175,1176,1177,1178,1180,1182,1184,1188,],[-455,-451,-452,-453,-454,242,-599,-600,-601,-609,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-640,-165,-210,-382,-383,-384,-385,-490,-480,-481,-482,-483,-484,-485,-486,-487,-488,-489,-513,-542,-536,-537,-538,-539,-540,-541,-543,-347,-456,-457,-458,-640,-520,-640,-544,-640,-568,-640,-603,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-178,-179,-387,-253,659,660,-168,-169,-170,-209,-281,-283,-290,-389,-393,-395,-396,-402,-403,-479,-492,-493,-640,-510,-514,-515,-531,722,723,-475,-476,-477,726,727,-532,-533,-534,730,-640,-640,-565,-566,-552,-640,-555,-640,743,-575,-576,-577,-580,-581,-582,-589,-590,-591,-592,761,-131,-132,-133,-7,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-232,-164,-166,852,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-390,-388,-404,-421,-422,899,900,-168,-472,-473,918,-478,-528,-529,919,-535,-548,920,-566,-640,923,-567,-475,-554,-556,-558,-559,-557,-574,-578,-579,-602,-610,937,938,-596,-597,-145,-150,-334,-335,-336,-162,-29,-34,-39,-44,-49,-55,-57,-61,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-640,-342,-338,-225,-187,-188,-167,-292,-289,-300,-293,-394,-397,-405,-406,-408,-409,-423,-424,-509,-511,1016,-491,-474,-530,-549,1024,-553,-551,1034,-594,-595,-21,-163,-159,1048,1049,-218,-219,-223,-341,-640,-235,-189,-238,-265,-267,1066,-286,-310,-301,-311,-312,-410,-425,-426,-512,-550,-560,-593,-598,-230,-229,-160,-24,-23,-231,-220,-221,1119,-640,-324,-330,-331,-640,-268,1133,1136,-272,-275,-313,-314,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-224,-323,-327,-640,-236,-269,1171,-273,-270,-276,-274,-278,-280,-295,-315,-317,-316,-318,-416,-429,-430,-640,-326,-161,-328,-271,-277,-319,-321,-320,-322,-413,-431,-432,-325,-240,]),'EXTENDS':([45,46,48,52,53,266,268,430,500,501,503,505,507,508,509,698,718,751,754,887,888,890,891,893,915,929,931,1011,1012,1013,1029,1031,1090,1091,1093,1094,1096,1097,1099,1101,1109,1111,1156,1157,1158,1178,1180,1182,],[256,260,256,-461,-523,-460,-522,703,-434,-443,752,-433,-462,-524,-573,-404,-570,-445,-572,-405,-406,-408,-409,1014,-571,-444,-446,-410,-425,-426,-447,-448,-411,-412,-414,-415,1159,-407,-427,-428,-449,-450,-416,-429,-430,-413,-431,-432,]),'IMPLEMENTS':([45,47,48,52,72,73,190,240,253,254,255,265,266,344,345,418,422,423,425,426,493,494,500,501,506,507,509,536,695,698,700,701,718,751,753,754,835,883,887,888,890,891,894,896,915,929,931,1011,1012,1013,1029,1031,1090,1091,1093,1094,1097,1099,1101,1109,1111,1156,1157,1158,1178,1180,1182,],[-640,264,-640,-461,-345,-346,-384,-347,264,-463,-464,264,-460,-385,-387,-389,-395,-396,-402,-403,-465,-386,-434,-443,-546,-462,-573,-348,-390,-404,-421,-422,-570,-445,-547,-572,-388,-397,-405,-406,-408,-409,-423,-424,-571,-444,-446,-410,-425,-426,-447,-448,-411,-412,-414,-415,-407,-427,-428,-449,-450,-416,-429,-430,-413,-431,-432,]),')':([49,50,51,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,115,116,119,175,176,177,178,179,180,181,182,183,190,191,213,215,240,273,274,275,276,279,280,299,300,304,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,344,345,346,365,366,367,368,374,377,380,410,411,418,420,422,423,425,426,445,446,447,448,452,490,510,511,512,513,514,515,516,517,518,519,520,522,523,524,526,527,529,532,533,534,535,536,538,541,542,543,546,547,548,550,572,573,574,575,597,598,599,600,601,604,605,606,608,610,612,613,614,615,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,640,641,643,646,655,665,670,678,679,682,683,684,686,687,695,696,698,700,701,713,722,723,741,746,755,756,761,763,768,770,771,772,773,774,775,776,780,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,826,827,828,831,832,833,834,835,836,838,842,843,863,865,866,872,873,874,875,878,879,882,883,887,888,890,891,894,896,903,904,910,911,918,924,933,935,937,938,939,941,942,943,944,945,947,948,950,952,953,959,960,961,962,963,964,982,987,990,994,1001,1002,1003,1004,1005,1006,1007,1008,1011,1012,1013,1017,1021,1028,1034,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1051,1052,1053,1054,1055,1056,1063,1078,1084,1085,1088,1089,1090,1091,1093,1094,1097,1099,1101,1108,1113,1114,1115,1116,1118,1119,1121,1122,1123,1124,1127,1129,1130,1131,1132,1144,1146,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,1190,1192,],[-599,-600,-601,-609,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-373,-374,-375,-376,-377,-378,-379,-380,-381,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-211,-212,-213,-214,-215,-216,-217,-384,-385,-640,-640,-347,-603,-640,-118,-119,-134,-135,-155,-156,-117,547,572,-640,-2,-5,-6,-22,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-385,-387,-640,-109,-110,-120,-121,-640,-387,644,-640,-640,-389,-393,-395,-396,-402,-403,714,-497,-498,-499,717,-640,755,756,-604,-605,-611,-606,-589,-590,-591,-592,-345,-131,-132,-133,763,-7,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-640,778,-146,802,-153,-154,-114,-115,-124,-125,-333,-152,-343,-339,-344,-640,836,-561,-562,-563,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-186,-153,-391,-392,844,845,-246,854,856,-640,-305,869,870,871,-640,-640,-390,-388,-404,-421,-422,-496,-472,-473,-640,925,-602,-610,-596,-145,-640,-640,-150,-334,-335,-336,-162,946,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-640,-151,-337,-340,-342,-338,-640,961,-388,-225,-640,-187,-188,993,-303,-304,999,1000,-640,-640,-640,-640,-394,-397,-405,-406,-408,-409,-423,-424,-518,-495,-500,-501,-474,1025,-607,-608,-594,-595,-21,-640,-640,1039,-640,1041,-640,-163,-159,1046,-640,-341,1051,-640,-564,1055,-640,-247,1073,1074,-306,1082,1083,-640,-640,1086,1087,-640,-640,-410,-425,-426,-517,-502,-585,-593,-640,1114,1115,-230,1116,-229,-160,1117,-24,-23,-231,1118,-220,-221,-640,-324,-330,-331,-640,1123,-640,-308,1149,1150,1153,1154,-411,-412,-414,-415,-407,-427,-428,-584,1163,-640,-227,-226,-228,-222,-323,-327,-640,1167,1168,1170,-250,-251,-252,-296,-309,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,-640,1193,]),',':([49,50,51,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,177,178,179,180,181,182,183,190,191,240,250,273,275,276,279,280,299,300,304,312,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,344,345,365,366,367,368,371,372,373,374,377,386,417,418,420,422,423,424,425,426,427,428,429,430,431,432,433,446,448,474,477,479,480,494,495,496,497,498,502,503,504,505,512,515,516,517,518,519,521,522,523,524,527,529,532,533,534,535,536,538,541,542,543,546,547,572,575,597,598,599,600,601,604,605,606,608,613,615,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,640,641,653,655,695,696,698,700,701,702,709,710,722,723,737,738,739,740,742,755,756,759,761,762,763,771,772,773,774,775,780,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,829,831,832,835,836,840,841,842,843,847,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,910,911,918,922,927,928,930,932,933,935,937,938,939,948,950,955,958,959,961,962,980,981,982,1011,1012,1013,1018,1019,1020,1021,1025,1030,1032,1034,1035,1039,1041,1042,1044,1045,1046,1048,1049,1051,1052,1053,1054,1055,1064,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1110,1112,1114,1115,1116,1118,1119,1120,1121,1122,1123,1132,1156,1157,1158,1161,1163,1164,1165,1166,1178,1179,1180,1181,1182,1183,1184,],[-599,-600,-601,-609,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-211,-212,-213,-214,-215,-216,-217,-384,-385,-347,473,-603,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-385,-387,-109,-110,-120,-121,635,-182,-184,-640,-387,-391,-392,-389,-393,-395,-396,697,-402,-403,-398,-400,-384,-417,-401,-387,-385,715,-499,733,-552,-555,-640,-386,749,-469,-471,749,750,-437,-435,-433,757,-606,-589,-590,-591,-592,760,-131,-132,-133,-7,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-154,-114,-115,-124,-125,-333,-152,-343,-339,-344,837,-563,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-186,-153,635,-391,-392,849,-246,-390,-388,-404,-421,-422,-418,635,-640,-472,-473,-554,-556,-558,-559,-557,-602,-610,936,-596,-597,-145,-150,-334,-335,-336,-162,-29,-34,-39,-44,-49,-55,-57,-61,-387,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,956,-342,-338,-388,-225,-183,-185,-187,-188,-640,-394,-397,-399,-400,-384,-405,-406,1010,-408,-409,-400,-417,-423,-419,-424,-420,-388,-500,-501,-474,-553,-640,-470,-436,-438,-607,-608,-594,-595,-21,-163,-159,1050,-223,-341,-640,-564,-186,-640,-247,-410,-425,-426,1103,-506,-508,-502,-560,-439,-440,-593,-598,-230,-229,-160,-24,-23,-231,-220,-221,-640,-324,-330,-331,-640,-186,-411,-412,1155,-414,-415,-400,-417,-407,-400,-427,-419,-428,-420,-441,-442,-640,-227,-226,-228,-222,-224,-323,-327,-640,849,-416,-429,-430,-507,-640,-326,-161,-328,-413,-400,-431,-419,-432,-420,-325,]),':':([59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,152,168,174,175,176,190,191,240,275,276,279,280,299,300,304,365,366,367,368,377,393,418,420,422,423,425,426,527,528,529,532,533,534,535,536,538,541,542,543,546,547,572,575,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,638,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,779,803,826,827,828,831,832,836,847,882,883,887,888,890,891,894,896,918,939,948,950,959,961,974,980,981,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1064,1072,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1139,1140,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,378,-234,409,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,-109,-110,-120,-121,-387,664,-389,-393,-395,-396,-402,-403,-7,764,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-154,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-153,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,949,951,-151,-337,-340,-342,-338,-225,-640,-394,-397,-405,-406,-408,-409,-423,-424,-474,-21,-163,-159,-341,-640,1059,-256,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-257,1141,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,1172,-279,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),']':([59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,298,299,300,304,339,365,366,367,368,377,418,420,422,423,425,426,527,529,532,533,534,535,536,538,540,541,542,543,544,545,546,547,572,601,604,605,606,607,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,826,827,828,830,831,832,836,882,883,887,888,890,891,894,896,918,939,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,541,-155,-156,-117,541,-109,-110,-120,-121,-387,-389,-393,-395,-396,-402,-403,-7,-26,-332,-147,-148,-149,-348,-347,772,-158,-157,-31,773,774,-36,-145,-146,-333,-152,-343,-339,831,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-151,-337,-340,959,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-21,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'/':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,325,328,329,330,331,332,335,365,366,367,368,380,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,630,631,632,633,634,722,723,763,771,772,773,774,775,788,797,798,799,800,801,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,363,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,570,-131,-132,-133,595,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,570,570,-345,-131,-132,-133,570,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,363,363,-97,-98,-99,-472,-473,-145,-150,-334,-335,-336,-162,-128,363,363,-102,-104,-106,363,363,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'%':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,325,328,329,330,331,332,335,365,366,367,368,380,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,630,631,632,633,634,722,723,763,771,772,773,774,775,788,797,798,799,800,801,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,364,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,571,-131,-132,-133,596,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,571,571,-345,-131,-132,-133,571,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,364,364,-97,-98,-99,-472,-473,-145,-150,-334,-335,-336,-162,-128,364,364,-102,-104,-106,364,364,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'LSHIFT':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,108,109,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,722,723,763,771,772,773,774,775,788,789,791,792,793,794,795,796,797,798,799,800,801,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,357,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,564,-131,-132,-133,589,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,564,564,-345,-131,-132,-133,564,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,357,357,357,357,-78,-79,-80,-89,-90,-97,-98,-99,-472,-473,-145,-150,-334,-335,-336,-162,-128,357,357,357,357,-83,-85,-87,-93,-95,-102,-104,-106,357,357,357,357,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'RSHIFT':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,108,109,110,113,114,115,116,119,175,176,240,275,276,279,280,299,300,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,418,420,422,423,425,426,432,433,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,698,700,701,722,723,763,771,772,773,774,775,788,789,791,792,793,794,795,796,797,798,799,800,801,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,886,887,888,890,891,892,893,894,896,898,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1179,1180,1181,1182,1183,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,358,-77,-88,-96,-107,-108,-111,-122,-382,-383,-347,-118,-119,-134,-135,-155,-156,-117,565,-131,-132,-133,590,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,565,-389,-393,-395,-396,-402,-403,-387,-385,565,-345,-131,-132,-133,565,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,358,358,358,358,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-128,358,358,358,358,-83,-85,-87,-93,-95,-102,-104,-106,358,358,358,358,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-384,-405,-406,-408,-409,1011,1012,-423,-424,-388,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,1011,1012,-407,1011,-427,1011,-428,1011,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,1011,-431,1011,-432,1011,-325,]),'RRSHIFT':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,108,109,110,113,114,115,116,119,175,176,240,275,276,279,280,299,300,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,418,420,422,423,425,426,432,433,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,698,700,701,722,723,763,771,772,773,774,775,788,789,791,792,793,794,795,796,797,798,799,800,801,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,886,887,888,890,891,894,896,898,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1095,1096,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1179,1180,1181,1182,1183,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,359,-77,-88,-96,-107,-108,-111,-122,-382,-383,-347,-118,-119,-134,-135,-155,-156,-117,566,-131,-132,-133,591,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,566,-389,-393,-395,-396,-402,-403,-387,-385,566,-345,-131,-132,-133,566,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,359,359,359,359,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-128,359,359,359,359,-83,-85,-87,-93,-95,-102,-104,-106,359,359,359,359,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-384,-405,-406,-408,-409,-423,-424,-388,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,1156,1157,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,1156,-431,1156,-432,1156,-325,]),'>':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,107,108,109,110,113,114,115,116,119,175,176,240,275,276,279,280,299,300,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,386,417,418,419,420,422,423,425,426,428,429,430,432,433,503,505,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,698,699,700,701,722,723,763,771,772,773,774,775,788,794,795,796,797,798,799,800,801,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,885,886,887,888,890,891,892,893,894,895,896,897,898,918,932,948,950,959,961,1009,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1112,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1179,1180,1181,1182,1183,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,353,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-347,-118,-119,-134,-135,-155,-156,-117,561,-131,-132,-133,586,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,561,-391,-392,-389,695,-393,-395,-396,-402,-403,698,-384,700,-387,-385,751,-433,561,-345,-131,-132,-133,561,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-404,695,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-387,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,698,-384,-405,-406,-408,-409,698,700,-423,698,-424,698,-388,-474,698,-163,-159,-341,-640,695,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,698,700,-407,698,-427,698,-428,698,698,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,698,-431,698,-432,698,-325,]),'GTEQ':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,107,108,109,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,722,723,763,771,772,773,774,775,794,795,796,797,798,799,800,801,816,817,818,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,355,-63,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,562,-131,-132,-133,587,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,562,562,-345,-131,-132,-133,562,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-472,-473,-145,-150,-334,-335,-336,-162,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'LTEQ':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,107,108,109,110,113,114,115,116,119,275,276,279,280,304,306,313,314,315,323,324,325,328,329,330,331,332,335,365,366,367,368,380,517,520,522,523,524,526,532,533,534,535,536,538,547,572,597,598,599,600,601,604,605,606,608,623,624,625,626,627,628,629,630,631,632,633,634,722,723,763,771,772,773,774,775,794,795,796,797,798,799,800,801,816,817,818,819,820,821,822,823,826,827,828,831,832,836,918,948,950,959,961,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1165,1166,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,356,-63,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,563,-131,-132,-133,588,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,563,563,-345,-131,-132,-133,563,-332,-147,-148,-149,-348,-347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-472,-473,-145,-150,-334,-335,-336,-162,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-474,-163,-159,-341,-640,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-161,-328,-325,]),'INSTANCEOF':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,352,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,559,-131,-132,-133,584,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,559,-389,-393,-395,-396,-402,-403,559,-345,-131,-132,-133,559,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,352,352,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,352,352,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,352,352,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'EQ':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,350,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,557,-131,-132,-133,582,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,557,-389,-393,-395,-396,-402,-403,557,-345,-131,-132,-133,557,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,350,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,350,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,350,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'NEQ':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,351,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,558,-131,-132,-133,583,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,558,-389,-393,-395,-396,-402,-403,558,-345,-131,-132,-133,558,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,351,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,351,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,351,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'&':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,429,432,433,517,520,522,523,524,526,532,533,534,535,536,538,541,542,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,898,918,932,948,950,959,961,1011,1012,1013,1030,1032,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1110,1112,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,349,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,556,-131,-132,-133,581,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,556,-389,-393,-395,-396,-402,-403,-384,-387,-385,556,-345,-131,-132,-133,556,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,349,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,349,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,349,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-388,-474,1033,-163,-159,-341,-640,-410,-425,-426,1033,-440,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-441,-442,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'^':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,532,533,534,535,536,538,541,542,546,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,347,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,555,-131,-132,-133,580,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,555,-389,-393,-395,-396,-402,-403,555,-345,-131,-132,-133,555,-332,-147,-148,-149,-348,-347,-158,-157,347,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,347,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,347,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'|':([62,64,65,66,67,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,115,116,119,159,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,376,377,380,418,420,422,423,425,426,517,520,522,523,524,526,532,533,534,535,536,538,541,542,543,546,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1076,1077,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1173,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,-136,-137,-138,-345,-346,305,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-373,-374,-375,-376,-377,-378,-379,-380,-381,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-372,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,554,-131,-132,-133,579,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-371,-387,554,-389,-393,-395,-396,-402,-403,554,-345,-131,-132,-133,554,-332,-147,-148,-149,-348,-347,-158,-157,305,-36,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,305,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,305,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,1145,-298,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-299,-413,-431,-432,-325,]),'AND':([62,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,313,314,315,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,529,532,533,534,535,536,538,541,542,543,546,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,780,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,-127,-128,-129,-130,301,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,553,-131,-132,-133,578,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,553,-389,-393,-395,-396,-402,-403,553,-345,-131,-132,-133,553,301,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,301,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,301,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'?':([62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,194,240,275,276,279,280,299,300,304,306,312,313,314,315,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,419,420,422,423,425,426,517,520,522,523,524,526,529,532,533,534,535,536,538,541,542,543,546,547,560,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,697,698,699,700,701,722,723,763,771,772,773,774,775,780,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1009,1010,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1155,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,293,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,430,-347,-118,-119,-134,-135,-155,-156,-117,551,576,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,551,-389,430,-393,-395,-396,-402,-403,551,-345,-131,-132,-133,551,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,430,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,430,-404,893,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,1096,893,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,1096,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'OR':([62,63,64,65,66,67,68,69,70,71,72,73,75,76,77,78,79,80,81,86,87,88,89,90,91,92,93,104,105,106,107,108,109,110,113,114,115,116,119,175,176,190,191,240,275,276,279,280,299,300,304,306,312,313,314,315,316,317,318,319,320,321,322,323,324,325,328,329,330,331,332,335,365,366,367,368,377,380,418,420,422,423,425,426,517,520,522,523,524,526,529,532,533,534,535,536,538,541,542,543,546,547,572,597,598,599,600,601,604,605,606,608,616,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,640,641,695,696,698,700,701,722,723,763,771,772,773,774,775,780,781,782,783,784,785,786,787,788,789,791,792,793,794,795,796,797,798,799,800,801,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,826,827,828,831,832,836,882,883,887,888,890,891,894,896,918,948,950,959,961,1011,1012,1013,1039,1041,1042,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1165,1166,1178,1180,1182,1184,],[-119,294,-127,-128,-129,-130,-25,-136,-137,-138,-345,-346,-30,-139,-140,-141,-142,-143,-144,-347,-35,-349,-350,-351,-352,-353,-354,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-382,-383,-384,-385,-347,-118,-119,-134,-135,-155,-156,-117,552,577,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-387,552,-389,-393,-395,-396,-402,-403,552,-345,-131,-132,-133,552,-26,-332,-147,-148,-149,-348,-347,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-333,-152,-343,-339,-344,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-391,-392,-390,-388,-404,-421,-422,-472,-473,-145,-150,-334,-335,-336,-162,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-337,-340,-342,-338,-225,-394,-397,-405,-406,-408,-409,-423,-424,-474,-163,-159,-341,-640,-410,-425,-426,-230,-229,-160,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-161,-328,-413,-431,-432,-325,]),'=':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,240,279,280,299,300,306,313,314,315,373,374,380,385,520,526,532,533,534,535,536,538,541,542,547,572,575,601,604,605,606,608,637,638,644,649,656,657,685,691,692,693,710,722,723,771,772,773,774,826,827,828,831,832,836,847,867,918,927,934,959,961,980,981,983,996,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1064,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[281,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,281,-347,-134,-135,-155,-156,-128,-127,-129,-130,636,-640,-128,-128,758,-128,-332,-147,-148,-149,-348,-347,-158,-157,-145,-146,-154,-333,-152,-343,-339,-344,-186,-153,-145,-347,-128,-127,-333,-332,-148,-147,-640,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-640,995,-474,-640,758,-341,-640,-186,-640,-128,1079,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-186,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'TIMES_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[282,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,282,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'DIVIDE_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[283,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,283,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'REMAINDER_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[284,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,284,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'PLUS_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[285,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,285,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'MINUS_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[286,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,286,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'LSHIFT_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[287,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,287,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'RSHIFT_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[288,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,288,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'RRSHIFT_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[289,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,289,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'AND_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[290,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,290,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'OR_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[291,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,291,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'XOR_ASSIGN':([62,64,65,66,67,69,70,71,72,73,76,77,78,79,80,81,86,88,89,90,91,92,93,168,180,181,182,183,184,187,188,192,279,280,306,313,314,315,380,385,526,532,533,534,535,536,538,547,572,601,604,605,606,608,644,649,656,657,685,691,692,693,722,723,771,772,773,774,826,827,828,831,832,836,918,959,961,983,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1114,1115,1116,1118,1119,1121,1122,1123,1163,1164,1166,1184,],[292,-127,-128,-129,-130,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,-347,-349,-350,-351,-352,-353,-354,-347,-129,-130,-143,-141,-140,-127,-128,292,-134,-135,-128,-127,-129,-130,-128,-128,-128,-332,-147,-148,-149,-348,-347,-145,-146,-333,-152,-343,-339,-344,-145,-347,-128,-127,-333,-332,-148,-147,-472,-473,-150,-334,-335,-336,-151,-337,-340,-342,-338,-225,-474,-341,-640,-128,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-640,-227,-226,-228,-222,-323,-327,-640,-640,-326,-328,-325,]),'.':([64,65,69,70,71,72,73,76,77,78,79,80,81,83,84,86,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,158,168,182,183,184,185,187,188,191,239,240,243,273,297,299,300,306,308,313,337,344,345,377,380,385,386,417,418,422,423,425,426,432,433,442,456,461,517,520,522,526,532,533,534,535,536,538,541,542,547,548,550,572,574,601,604,605,606,608,644,649,656,657,658,685,691,692,693,695,696,698,700,701,711,722,723,763,771,772,773,774,788,790,826,827,828,831,832,835,836,883,887,888,890,891,894,896,898,918,959,961,983,1011,1012,1013,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1166,1178,1180,1182,1184,],[295,296,-136,-137,-138,-345,-346,-139,-140,-141,-142,-143,-144,336,338,-347,-349,-350,-351,-352,-353,-354,-373,-374,-375,-376,-377,-378,-379,-380,-381,338,-347,-143,-141,-140,412,415,416,421,458,-347,460,458,539,-155,-156,549,338,295,603,611,458,458,549,416,603,539,-389,-395,-396,-402,-403,458,705,-347,458,721,549,-345,295,549,-332,-147,-148,-149,-348,-347,-158,-157,-145,777,539,-146,603,-333,-152,-343,-339,-344,-145,-347,850,851,412,-333,-332,-148,-147,-390,458,-404,-421,-422,-347,-472,-473,-145,-150,-334,-335,-336,549,338,-151,-337,-340,-342,-338,458,-225,-397,-405,-406,-408,-409,-423,-424,458,-474,-341,-640,1065,-410,-425,-426,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-328,-413,-431,-432,-325,]),'[':([65,69,70,72,73,76,77,78,79,80,81,84,86,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,158,168,182,183,184,188,190,191,240,299,300,306,308,340,341,344,345,374,376,377,380,385,418,422,423,425,426,432,433,434,442,517,520,526,532,533,534,535,536,538,541,542,547,548,572,601,604,605,606,608,644,649,656,685,691,692,693,695,696,698,700,701,710,711,717,722,723,763,771,772,773,774,788,790,826,827,828,831,832,835,836,847,883,887,888,890,891,894,896,898,918,925,927,947,959,961,981,983,1011,1012,1013,1039,1041,1046,1048,1049,1051,1052,1053,1054,1055,1090,1091,1093,1094,1097,1099,1101,1114,1115,1116,1118,1119,1121,1122,1123,1156,1157,1158,1163,1164,1166,1178,1180,1182,1184,],[298,302,303,-345,-346,-139,-140,-141,-142,-143,-144,339,-347,-349,-350,-351,-352,-353,-354,-373,-374,-375,-376,-377,-378,-379,-380,-381,339,-347,-143,-141,-140,298,-384,339,-347,339,-156,298,339,607,607,-385,-387,339,339,339,298,298,-389,-395,-396,-402,-403,339,339,339,-347,298,-345,298,-332,-147,-148,-149,-348,-347,-158,-157,-145,339,-146,-333,-152,607,-339,607,-145,-347,298,-333,-332,-148,-147,-390,339,-404,-421,-422,339,-347,339,-472,-473,-145,-150,-334,-335,-336,298,339,-151,-337,-340,-342,-338,-388,-225,339,-397,-405,-406,-408,-409,-423,-424,339,-474,339,339,339,-341,-640,339,298,-410,-425,-426,-230,-229,-231,-220,-221,-640,-324,-330,-331,-640,-411,-412,-414,-415,-407,-427,-428,-640,-227,-226,-228,-222,-323,-327,-640,-416,-429,-430,-640,-326,-328,-413,-431,-432,-325,]),'ELLIPSIS':([72,73,95,96,97,98,99,100,101,102,103,159,175,176,190,191,240,299,300,376,377,418,420,422,423,425,426,536,541,542,640,641,695,696,698,700,701,716,882,883,887,888,890,891,894,896,1011,1012,1013,1090,1091,1093,1094,1097,1099,1101,1156,1157,1158,1178,1180,1182,],[-345,-346,-373,-374,-375,-376,-377,-378,-379,-380,-381,-372,-382,-383,-384,-385,-347,-155,-156,-371,-387,-389,-393,-395,-396,-402,-403,-348,-158,-157,-391,-392,-390,-388,-404,-421,-422,912,-394,-397,-405,-406,-408,-409,-423,-424,-410,-425,-426,-411,-412,-414,-415,-407,-427,-428,-416,-429,-430,-413,-431,-432,]),'CASE':([121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,161,163,245,247,249,251,369,370,383,391,392,396,398,407,642,659,660,662,663,667,668,669,671,672,674,675,677,722,723,726,727,730,743,852,857,858,861,862,918,919,920,923,966,968,978,984,985,986,988,989,992,997,998,1024,1066,1067,1068,1069,1070,1080,1081,1125,1133,1134,1135,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-165,-210,-458,-520,-544,-568,-178,-179,-253,-170,-209,-281,-283,-290,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-472,-473,-528,-529,-548,-574,-167,-292,-289,-300,-293,-474,-530,-549,-551,-235,-189,-238,-265,-267,1071,-286,-310,-301,-311,-312,-550,-268,1071,1071,-272,-275,-313,-314,-236,-269,1071,-273,-270,-276,-274,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'DEFAULT':([121,122,123,124,125,126,128,130,131,132,133,134,135,136,139,140,141,142,143,144,145,146,147,148,149,150,151,161,163,245,247,249,251,299,300,369,370,383,391,392,396,398,407,541,542,575,638,642,659,660,662,663,667,668,669,671,672,674,675,677,722,723,726,727,730,743,852,857,858,861,862,914,918,919,920,923,925,966,968,978,984,985,986,988,989,992,997,998,1024,1026,1066,1067,1068,1069,1070,1080,1081,1125,1133,1134,1135,1136,1137,1138,1141,1142,1143,1147,1148,1151,1152,1171,1172,1174,1175,1176,1177,1188,],[-172,-173,-174,-175,-176,-177,-266,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-165,-210,-458,-520,-544,-568,-155,-156,-178,-179,-253,-170,-209,-281,-283,-290,-158,-157,-154,-153,-232,-164,-166,-171,-264,-282,-284,-285,-287,-288,-291,-294,-640,-472,-473,-528,-529,-548,-574,-167,-292,-289,-300,-293,-519,-474,-530,-549,-551,-640,-235,-189,-238,-265,-267,1072,-286,-310,-301,-311,-312,-550,1107,-268,1072,1072,-272,-275,-313,-314,-236,-269,1072,-273,-270,-276,-274,-278,-280,-295,-315,-317,-316,-318,-271,-277,-319,-321,-320,-322,-240,]),'ELSE':([128,139,140,141,142,143,144,145,146,147,148,149,150,151,161,163,392,396,398,407,659,660,663,667,668,669,671,672,674,675,677,852,857,858,861,862,967,968,969,970,971,972,973,984,985,988,989,992,997,998,1062,1066,1080,1081,1126,1133,1136,1142,1143,1147,1148,1151,1152,1171,1174,1175,1176,1177,1185,1186,1191,1194,],[-266,-196,-197,-198,-199,-200,-201,-202,-203,-204,-205,-206,-207,-208,-165,-210,-209,-281,-283,-290,-164,-166,-264,-282,-284,-285,-287,-288,-291,-294,-640,-167,-292,-289,-300,-293,1058,-258,-259,-260,-261,-262,-263,-265,-267,-286,-310,-301,-311,-312,-254,-268,-313,-314,-233,-269,-270,-280,-295,-315,-317,-316,-318,-271,-319,-321,-320,-322,1189,-239,-237,-241,]),'CATCH':([161,405,407,659,660,672,674,677,852,857,862,1143,],[-165,676,-290,-164,-166,676,-291,676,-167,-292,676,-295,]),'FINALLY':([161,405,407,659,660,672,673,674,675,677,852,857,861,862,1143,],[-165,-640,-290,-164,-166,-293,859,-291,-294,-640,-167,-292,859,-293,-295,]),'THROWS':([299,300,541,542,575,638,714,717,913,914,],[-155,-156,-158,-157,-154,-153,909,-640,909,-519,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'goal':([0,],[1,]),'compilation_unit':([2,],[7,]),'package_declaration':([2,],[8,]),'import_declarations':([2,8,],[9,229,]),'type_declarations':([2,8,9,229,],[10,230,232,455,]),'empty':([2,4,5,6,8,9,10,45,46,47,48,160,170,213,215,229,230,232,246,248,250,252,253,265,274,308,346,374,382,389,405,410,411,438,455,464,469,473,474,478,480,483,490,548,610,677,678,686,687,708,710,714,715,717,733,736,741,768,770,824,829,833,838,846,847,860,874,875,878,879,913,925,927,941,942,944,947,953,961,964,981,1003,1004,1007,1008,1026,1036,1051,1055,1061,1063,1068,1114,1123,1134,1138,1163,1169,1190,],[11,189,189,189,189,189,189,255,259,263,255,390,402,447,447,189,189,189,465,470,476,484,263,263,513,575,614,575,652,189,675,614,614,390,189,189,189,732,732,465,740,189,447,575,614,675,866,614,614,189,575,908,189,575,476,189,614,614,614,614,957,614,614,402,575,189,614,614,614,614,908,575,575,614,614,614,575,614,1054,614,575,614,614,614,614,1106,614,1054,1054,652,1131,189,1054,1054,189,189,1054,402,1131,]),'package_declaration_name':([2,],[12,]),'import_declaration':([2,8,9,229,],[14,14,233,233,]),'type_declaration':([2,8,9,10,229,230,232,252,455,483,],[15,15,15,234,15,234,234,489,234,489,]),'modifiers':([2,4,5,6,8,9,10,160,213,215,229,230,232,246,248,250,252,382,389,408,438,455,464,469,478,483,490,708,715,733,736,860,864,1061,1068,1134,1138,],[16,138,214,228,231,231,231,138,450,450,231,231,231,214,228,450,214,650,138,681,138,231,214,228,214,214,450,138,450,450,214,450,681,650,138,138,138,]),'single_type_import_declaration':([2,8,9,229,],[18,18,18,18,]),'type_import_on_demand_declaration':([2,8,9,229,],[19,19,19,19,]),'single_static_import_declaration':([2,8,9,229,],[20,20,20,20,]),'static_import_on_demand_declaration':([2,8,9,229,],[21,21,21,21,]),'class_declaration':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[22,123,203,221,22,22,22,123,22,22,22,203,221,22,123,123,22,203,221,203,22,123,203,123,123,123,]),'interface_declaration':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[23,124,205,222,23,23,23,124,23,23,23,205,222,23,124,124,23,205,222,205,23,124,205,124,124,124,]),'enum_declaration':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[24,126,206,223,24,24,24,126,24,24,24,206,223,24,126,126,24,206,223,206,24,126,206,126,126,126,]),'annotation_type_declaration':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[25,125,207,224,25,25,25,125,25,25,25,207,224,25,125,125,25,207,224,207,25,125,207,125,125,125,]),'modifier':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,382,389,408,438,450,455,464,469,478,483,490,650,681,708,715,733,736,860,864,1061,1068,1134,1138,],[27,27,27,27,27,27,27,237,237,27,27,237,27,237,27,27,237,27,27,27,27,27,27,27,27,27,237,27,27,27,27,27,27,237,237,27,27,27,27,27,27,27,27,27,27,]),'class_header':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'interface_header':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'enum_header':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'annotation_type_declaration_header':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'annotation':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,274,382,389,408,438,450,455,464,469,478,483,490,521,650,681,708,715,733,736,758,860,864,936,1061,1068,1107,1134,1138,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,518,44,44,44,44,44,44,44,44,44,44,44,518,44,44,44,44,44,44,518,44,44,518,44,44,518,44,44,]),'class_header_name':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'interface_header_name':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'enum_header_name':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'annotation_type_declaration_header_name':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'normal_annotation':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,274,382,389,408,438,450,455,464,469,478,483,490,521,650,681,708,715,733,736,758,860,864,936,1061,1068,1107,1134,1138,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'marker_annotation':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,274,382,389,408,438,450,455,464,469,478,483,490,521,650,681,708,715,733,736,758,860,864,936,1061,1068,1107,1134,1138,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'single_member_annotation':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,274,382,389,408,438,450,455,464,469,478,483,490,521,650,681,708,715,733,736,758,860,864,936,1061,1068,1107,1134,1138,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'class_header_name1':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'interface_header_name1':([2,4,5,6,8,9,10,160,229,230,232,246,248,252,389,438,455,464,469,478,483,708,736,1068,1134,1138,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'modifiers_opt':([2,4,5,6,8,9,10,160,213,215,229,230,232,246,248,250,252,389,438,455,464,469,478,483,490,708,715,733,736,860,1068,1134,1138,],[54,54,210,227,54,54,54,54,449,449,54,54,54,210,227,481,491,54,54,54,210,227,210,491,449,54,449,481,210,991,54,54,54,]),'annotation_name':([2,4,5,6,8,9,10,16,138,160,213,214,215,228,229,230,231,232,246,248,250,252,274,382,389,408,438,450,455,464,469,478,483,490,521,650,681,708,715,733,736,758,860,864,936,1061,1068,1107,1134,1138,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'expression':([3,164,170,172,293,298,302,303,346,379,381,394,403,409,410,411,551,576,607,610,636,664,686,687,741,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[58,393,401,404,528,540,544,545,615,643,646,665,670,682,615,615,779,803,830,615,842,853,615,615,615,615,615,615,842,615,962,615,401,987,615,615,615,615,615,615,615,615,615,842,615,615,615,615,615,842,1124,1127,1140,842,401,]),'assignment_expression':([3,164,170,172,278,293,298,302,303,346,379,381,394,403,409,410,411,551,576,607,610,636,664,686,687,741,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[59,59,59,59,527,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'assignment':([3,4,82,154,157,160,164,166,170,172,277,278,293,298,302,303,346,378,379,381,382,389,394,403,409,410,411,438,551,576,607,610,636,664,686,687,708,741,768,770,824,829,833,837,838,844,845,846,849,855,874,875,878,879,941,942,944,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[60,177,310,310,177,177,60,177,60,60,310,60,60,60,60,60,60,177,60,60,177,177,60,60,60,60,60,177,60,60,60,60,60,60,60,60,177,60,60,60,60,60,60,60,60,177,177,60,177,60,60,60,60,60,60,60,60,60,60,177,60,60,60,60,60,60,60,60,177,177,60,177,177,177,60,60,177,177,177,177,60,177,177,177,177,]),'conditional_expression':([3,164,170,172,278,293,298,302,303,346,379,381,394,403,409,410,411,551,576,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,939,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,1044,1045,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'postfix_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[62,192,276,276,192,276,276,276,276,192,192,192,62,192,62,62,525,192,62,62,276,62,276,62,62,276,276,276,276,276,62,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,192,62,62,192,192,62,62,62,62,62,192,525,276,62,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,62,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,276,62,62,62,276,62,62,62,192,62,525,276,276,62,62,276,276,62,62,62,62,62,192,192,62,192,62,62,62,62,62,525,62,62,62,276,276,276,62,62,192,62,62,62,62,62,62,62,62,192,192,62,192,192,192,62,62,525,276,192,192,192,192,62,192,192,192,192,]),'conditional_or_expression':([3,164,170,172,278,293,298,302,303,346,379,381,394,403,409,410,411,551,576,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'primary':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[64,187,64,64,313,64,64,64,64,313,187,187,64,187,64,64,522,313,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,187,64,64,657,187,64,64,64,64,64,187,522,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,187,64,522,64,64,64,64,64,64,64,64,64,64,64,187,187,64,657,64,64,64,64,64,522,64,64,64,64,64,64,64,64,187,64,64,64,64,64,64,64,64,187,187,64,657,657,187,64,64,522,64,187,187,187,187,64,187,187,657,187,]),'name':([3,4,17,28,55,57,74,82,85,111,112,117,118,138,154,157,160,164,166,170,172,193,194,210,227,236,238,244,256,260,264,274,277,278,293,294,298,301,302,303,305,326,327,333,334,342,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,408,409,410,411,419,421,438,441,449,451,454,491,521,530,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,611,618,636,645,650,664,681,686,687,697,699,703,704,705,708,741,747,749,752,758,763,764,765,768,770,777,778,802,824,829,833,837,838,844,845,846,849,855,864,874,875,878,879,909,936,941,942,944,946,949,951,953,964,977,991,995,1003,1004,1007,1008,1009,1010,1014,1015,1033,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1103,1107,1117,1134,1138,1145,1155,1159,1160,1167,1168,1169,1170,1189,1190,1193,],[65,188,239,243,273,65,65,306,345,65,65,65,65,377,380,385,188,65,385,65,65,345,432,377,377,456,273,461,345,345,345,517,526,65,65,65,65,65,65,65,65,65,65,65,65,345,65,65,345,65,65,65,377,65,65,65,65,65,65,65,65,65,65,65,65,385,65,65,656,188,65,65,377,65,65,65,432,696,188,377,377,273,377,377,517,345,65,65,65,65,65,65,65,65,65,377,788,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,377,65,65,65,65,65,65,65,65,65,65,65,65,65,65,835,345,65,65,377,65,377,65,65,432,432,432,432,898,188,65,377,345,432,517,65,65,345,65,65,345,65,65,65,65,65,65,65,385,385,65,983,65,377,65,65,65,65,345,517,65,65,65,65,65,65,65,65,385,377,65,65,65,65,65,432,432,432,432,432,65,65,65,385,385,65,656,983,188,65,65,345,517,65,188,188,377,432,432,432,385,385,65,385,385,983,385,]),'post_increment_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[66,180,66,66,314,66,66,66,66,314,180,180,66,180,66,66,523,314,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,180,66,66,180,180,66,66,66,66,66,180,523,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,180,66,523,66,66,66,66,66,66,66,66,66,66,66,180,180,66,180,66,66,66,66,66,523,66,66,66,66,66,66,66,66,180,66,66,66,66,66,66,66,66,180,180,66,180,180,180,66,66,523,66,180,180,180,180,66,180,180,180,180,]),'post_decrement_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[67,181,67,67,315,67,67,67,67,315,181,181,67,181,67,67,524,315,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,181,67,67,181,181,67,67,67,67,67,181,524,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,181,67,524,67,67,67,67,67,67,67,67,67,67,67,181,181,67,181,67,67,67,67,67,524,67,67,67,67,67,67,67,67,181,67,67,67,67,67,67,67,67,181,181,67,181,181,181,67,67,524,67,181,181,181,181,67,181,181,181,181,]),'conditional_and_expression':([3,164,170,172,278,293,294,298,302,303,346,379,381,394,403,409,410,411,551,552,576,577,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[68,68,68,68,68,68,529,68,68,68,68,68,68,68,68,68,68,68,68,780,68,804,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'primary_no_new_array':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'array_creation_with_array_initializer':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'array_creation_without_array_initializer':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'simple_name':([3,4,17,28,55,57,74,82,85,111,112,117,118,138,154,157,160,164,166,170,172,193,194,210,227,236,238,244,256,260,264,274,277,278,293,294,296,298,301,302,303,305,326,327,333,334,342,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,408,409,410,411,416,419,421,438,441,449,451,454,458,460,491,521,530,547,549,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,611,618,636,645,650,664,681,686,687,697,699,703,704,705,708,721,741,747,749,752,757,758,763,764,765,768,770,777,778,802,824,829,833,837,838,844,845,846,849,850,855,864,874,875,878,879,909,936,941,942,944,946,949,951,953,964,977,991,995,1003,1004,1007,1008,1009,1010,1014,1015,1033,1036,1050,1057,1058,1059,1060,1061,1063,1065,1068,1071,1079,1103,1107,1117,1134,1138,1145,1155,1159,1160,1167,1168,1169,1170,1189,1190,1193,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,520,72,72,72,72,536,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,536,72,72,72,72,72,72,72,536,536,72,72,72,72,536,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,536,72,72,72,72,934,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,536,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,536,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'qualified_name':([3,4,17,28,55,57,74,82,85,111,112,117,118,138,154,157,160,164,166,170,172,193,194,210,227,236,238,244,256,260,264,274,277,278,293,294,298,301,302,303,305,326,327,333,334,342,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,408,409,410,411,419,421,438,441,449,451,454,491,521,530,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,611,618,636,645,650,664,681,686,687,697,699,703,704,705,708,741,747,749,752,758,763,764,765,768,770,777,778,802,824,829,833,837,838,844,845,846,849,855,864,874,875,878,879,909,936,941,942,944,946,949,951,953,964,977,991,995,1003,1004,1007,1008,1009,1010,1014,1015,1033,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1103,1107,1117,1134,1138,1145,1155,1159,1160,1167,1168,1169,1170,1189,1190,1193,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'inclusive_or_expression':([3,164,170,172,278,293,294,298,301,302,303,346,379,381,394,403,409,410,411,551,552,553,576,577,578,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[75,75,75,75,75,75,75,75,543,75,75,75,75,75,75,75,75,75,75,75,75,781,75,75,805,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'literal':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'class_instance_creation_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[78,183,78,78,78,78,78,78,78,78,183,183,78,183,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,183,78,78,183,183,78,78,78,78,78,183,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,183,78,78,78,78,78,78,78,78,78,78,78,78,78,183,183,78,183,78,78,78,78,78,78,78,78,78,78,78,78,78,78,183,78,78,78,78,78,78,78,78,183,183,78,183,183,183,78,78,78,78,183,183,183,183,78,183,183,183,183,]),'field_access':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'method_invocation':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[80,182,80,80,80,80,80,80,80,80,182,182,80,182,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,182,80,80,182,182,80,80,80,80,80,182,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,182,80,80,80,80,80,80,80,80,80,80,80,80,80,182,182,80,182,80,80,80,80,80,80,80,80,80,80,80,80,80,80,182,80,80,80,80,80,80,80,80,182,182,80,182,182,182,80,80,80,80,182,182,182,182,80,182,182,182,182,]),'array_access':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'primitive_type':([3,4,57,74,82,85,111,112,117,118,138,154,157,160,164,166,170,172,193,194,210,227,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,408,409,410,411,419,438,441,449,454,491,521,547,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,650,664,681,686,687,697,699,703,704,708,741,747,752,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,864,874,875,878,879,936,941,942,944,946,949,951,953,964,977,991,995,1003,1004,1007,1008,1009,1010,1014,1015,1033,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1145,1155,1159,1160,1167,1168,1169,1170,1189,1190,1193,],[84,158,84,84,308,340,84,84,84,84,376,84,84,158,84,84,84,84,340,434,376,376,84,308,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,434,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,158,158,84,84,376,84,84,84,434,158,376,376,376,376,84,84,84,84,84,84,84,84,84,84,434,790,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,434,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,376,84,376,84,84,434,434,434,434,158,84,376,434,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,376,84,84,84,84,84,84,84,84,84,84,84,84,84,84,376,84,84,84,84,84,434,434,434,434,434,84,84,84,84,84,84,158,84,158,84,84,84,84,158,158,376,434,434,434,84,84,84,84,84,84,84,]),'exclusive_or_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,379,381,394,403,409,410,411,551,552,553,554,576,577,578,579,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[87,87,87,87,87,87,87,87,87,87,87,546,87,87,87,87,87,87,87,87,87,87,87,782,87,87,87,806,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'class_instance_creation_expression_name':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,763,764,768,770,778,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,946,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1117,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'and_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,379,381,394,403,409,410,411,551,552,553,554,555,576,577,578,579,580,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[104,104,104,104,104,104,104,104,104,104,104,104,104,616,104,104,104,104,104,104,104,104,104,104,104,783,104,104,104,104,807,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'equality_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,379,381,394,403,409,410,411,551,552,553,554,555,556,576,577,578,579,580,581,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,619,105,105,105,105,105,105,105,105,105,105,105,105,784,105,105,105,105,105,808,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'instanceof_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,350,351,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,576,577,578,579,580,581,582,583,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,620,621,106,106,106,106,106,106,106,106,106,106,106,106,106,785,786,106,106,106,106,106,106,809,810,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'relational_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,350,351,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,576,577,578,579,580,581,582,583,607,610,636,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'shift_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,350,351,353,354,355,356,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,560,561,562,563,576,577,578,579,580,581,582,583,585,586,587,588,607,610,636,645,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,623,624,625,626,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,789,791,792,793,108,108,108,108,108,108,108,108,812,813,814,815,108,108,108,789,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'additive_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,350,351,353,354,355,356,357,358,359,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,607,610,636,645,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,627,628,629,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,794,795,796,109,109,109,109,109,109,109,109,109,109,109,109,816,817,818,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'multiplicative_expression':([3,164,170,172,278,293,294,298,301,302,303,305,346,347,349,350,351,353,354,355,356,357,358,359,360,361,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,607,610,636,645,664,686,687,741,764,768,770,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,630,631,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,797,798,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,819,820,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,]),'unary_expression':([3,57,74,111,112,117,118,164,170,172,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,379,381,394,403,409,410,411,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,741,764,768,770,802,824,829,833,837,838,846,855,874,875,878,879,941,942,944,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1169,],[113,275,304,365,366,367,368,113,113,113,113,113,113,113,113,113,113,113,597,598,599,600,113,113,113,113,113,113,113,113,113,113,113,113,113,113,632,633,634,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,799,800,801,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,821,822,823,113,113,113,113,113,113,113,113,113,113,113,950,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'pre_increment_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,764,768,770,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[114,178,114,114,329,114,114,114,114,329,178,178,114,178,114,114,329,329,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,178,114,114,178,178,114,114,114,114,114,178,329,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,178,114,329,114,114,114,114,114,114,114,114,114,178,178,114,178,114,114,114,114,114,329,114,114,114,114,114,114,114,178,114,114,114,114,114,114,114,114,178,178,114,178,178,178,114,114,329,178,178,178,178,114,178,178,178,178,]),'pre_decrement_expression':([3,4,57,74,82,111,112,117,118,154,157,160,164,166,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,378,379,381,382,389,394,403,409,410,411,438,521,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,708,741,758,764,768,770,802,824,829,833,837,838,844,845,846,849,855,874,875,878,879,936,941,942,944,949,951,953,964,977,995,1003,1004,1007,1008,1036,1050,1057,1058,1059,1060,1061,1063,1068,1071,1079,1107,1134,1138,1167,1168,1169,1170,1189,1190,1193,],[115,179,115,115,330,115,115,115,115,330,179,179,115,179,115,115,330,330,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,179,115,115,179,179,115,115,115,115,115,179,330,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,179,115,330,115,115,115,115,115,115,115,115,115,179,179,115,179,115,115,115,115,115,330,115,115,115,115,115,115,115,179,115,115,115,115,115,115,115,115,179,179,115,179,179,179,115,115,330,179,179,179,179,115,179,179,179,179,]),'unary_expression_not_plus_minus':([3,57,74,111,112,117,118,164,170,172,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,379,381,394,403,409,410,411,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,741,763,764,768,770,778,802,824,829,833,837,838,846,855,874,875,878,879,941,942,944,946,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1117,1169,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,775,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,775,116,116,116,948,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,1042,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,1165,116,]),'cast_expression':([3,57,74,82,111,112,117,118,154,164,170,172,274,277,278,293,294,298,301,302,303,305,326,327,333,334,346,347,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,379,381,394,403,409,410,411,521,547,551,552,553,554,555,556,557,558,560,561,562,563,564,565,566,567,568,569,570,571,576,577,578,579,580,581,582,583,585,586,587,588,589,590,591,592,593,594,595,596,607,610,636,645,664,686,687,741,758,763,764,768,770,778,802,824,829,833,837,838,846,855,874,875,878,879,936,941,942,944,946,949,951,953,964,995,1003,1004,1007,1008,1036,1050,1057,1060,1071,1079,1107,1117,1169,],[119,119,119,335,119,119,119,119,335,119,119,119,335,335,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,335,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,335,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,335,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,335,119,119,]),'block_statement':([4,160,389,438,708,1068,1134,1138,],[120,391,662,391,662,391,391,662,]),'local_variable_declaration_statement':([4,160,389,438,708,1068,1134,1138,],[121,121,121,121,121,121,121,121,]),'statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[122,383,122,395,642,122,122,122,966,978,383,1125,642,122,122,122,966,978,1188,1125,1188,]),'local_variable_declaration':([4,160,382,389,438,708,1061,1068,1134,1138,],[129,129,654,129,129,129,654,129,129,129,]),'statement_without_trailing_substatement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[130,130,130,130,130,130,130,130,968,130,968,130,968,130,130,130,968,968,130,968,968,]),'labeled_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,]),'if_then_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,]),'if_then_else_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,]),'while_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,]),'for_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,]),'enhanced_for_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,]),'type':([4,138,160,210,227,382,389,408,438,441,449,454,491,650,681,708,747,864,991,1061,1068,1134,1138,1145,],[137,375,137,440,440,648,137,680,137,712,716,712,748,848,868,137,926,680,1077,648,137,137,137,1173,]),'block':([4,5,157,160,166,173,208,246,378,389,406,438,464,478,708,736,844,845,856,859,977,1058,1059,1068,1074,1134,1138,1167,1168,1170,1189,1193,],[139,201,139,139,139,407,436,201,139,139,407,139,201,201,139,201,139,139,988,989,139,139,139,139,1143,139,139,139,139,139,139,139,]),'expression_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'assert_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'empty_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'switch_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,]),'do_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,]),'break_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,]),'continue_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'return_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'synchronized_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'throw_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,]),'try_statement':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,]),'try_statement_with_resources':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'label':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[152,152,152,152,152,152,152,152,974,152,974,152,974,152,152,152,974,974,152,974,974,]),'enhanced_for_statement_header':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[157,157,157,157,157,157,157,157,977,157,977,157,977,157,157,157,977,977,157,977,977,]),'reference_type':([4,138,160,194,210,227,352,382,389,408,419,438,441,449,454,491,559,560,584,650,681,697,699,703,704,708,747,752,864,991,1009,1010,1014,1015,1033,1061,1068,1134,1138,1145,1155,1159,1160,],[159,159,159,428,159,159,622,159,159,159,428,159,159,159,159,159,787,428,811,159,159,885,892,895,897,159,159,932,159,159,1095,1098,1100,1102,1112,159,159,159,159,159,1179,1181,1183,]),'statement_expression':([4,157,160,166,378,382,389,438,708,844,845,849,977,1058,1059,1061,1063,1068,1134,1138,1167,1168,1170,1189,1190,1193,],[162,162,162,162,162,655,162,162,162,162,162,982,162,162,162,655,655,162,162,162,162,162,162,162,655,162,]),'explicit_constructor_invocation':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,]),'enhanced_for_statement_header_init':([4,157,160,166,378,389,438,708,844,845,977,1058,1059,1068,1134,1138,1167,1168,1170,1189,1193,],[174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,]),'class_or_interface_type':([4,85,138,160,193,194,210,227,256,260,264,342,348,352,382,389,408,419,438,441,449,454,491,530,559,560,584,618,650,681,697,699,703,704,708,747,749,752,765,777,864,909,991,1009,1010,1014,1015,1033,1061,1068,1103,1134,1138,1145,1155,1159,1160,],[175,341,175,175,341,175,175,175,494,497,497,494,494,175,175,175,175,175,175,175,175,175,175,494,175,175,175,494,175,175,175,175,175,175,175,175,497,175,494,947,175,494,175,175,175,175,175,175,175,175,494,175,175,175,175,175,175,]),'array_type':([4,138,160,194,210,227,352,382,389,408,419,438,441,449,454,491,559,560,584,650,681,697,699,703,704,708,747,752,864,991,1009,1010,1014,1015,1033,1061,1068,1134,1138,1145,1155,1159,1160,],[176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,]),'type_arguments':([4,85,157,160,166,190,193,295,296,306,336,348,378,389,412,415,416,429,438,526,530,549,708,844,845,850,851,886,977,1058,1059,1065,1068,1134,1138,1167,1168,1170,1189,1193,],[186,342,186,186,186,418,342,531,537,548,602,618,186,186,602,690,694,418,186,548,765,537,186,186,186,537,531,418,186,186,186,537,186,186,186,186,186,186,186,186,]),'class_or_interface':([4,85,138,160,193,194,210,227,256,260,264,342,348,352,382,389,408,419,438,441,449,454,491,530,559,560,584,618,650,681,697,699,703,704,708,747,749,752,765,777,864,909,991,1009,1010,1014,1015,1033,1061,1068,1103,1134,1138,1145,1155,1159,1160,],[190,190,190,190,190,429,190,190,190,190,190,190,190,190,190,190,190,429,190,190,190,190,190,190,190,429,190,190,190,190,429,886,429,429,190,190,190,429,190,190,190,190,190,886,886,886,886,429,190,190,190,190,190,190,886,886,886,]),'generic_type':([4,85,138,160,193,194,210,227,256,260,264,342,348,352,382,389,408,419,438,441,449,454,491,530,559,560,584,618,650,681,697,699,703,704,708,747,749,752,765,777,864,909,991,1009,1010,1014,1015,1033,1061,1068,1103,1134,1138,1145,1155,1159,1160,],[191,344,191,191,344,433,191,191,344,344,344,344,344,191,191,191,191,433,191,191,191,191,191,344,191,433,191,344,191,191,433,433,433,433,191,191,344,433,344,344,191,344,191,433,433,433,433,433,191,191,344,191,191,191,433,433,433,]),'class_body_declaration':([5,246,464,478,736,],[195,466,725,466,725,]),'class_member_declaration':([5,246,464,478,736,],[198,198,198,198,198,]),'static_initializer':([5,246,464,478,736,],[199,199,199,199,199,]),'constructor_declaration':([5,246,252,464,478,483,736,],[200,200,488,200,200,488,200,]),'field_declaration':([5,6,246,248,252,464,469,478,483,736,],[202,225,202,225,225,202,225,202,225,202,]),'method_declaration':([5,246,464,478,736,],[204,204,204,204,204,]),'constructor_header':([5,246,252,464,478,483,736,],[209,209,209,209,209,209,209,]),'abstract_method_declaration':([5,6,246,248,464,469,478,736,],[211,220,211,220,211,220,211,211,]),'method_header':([5,6,246,248,464,469,478,736,],[212,226,212,226,212,226,212,212,]),'constructor_header_name':([5,246,252,464,478,483,736,],[213,213,213,213,213,213,213,]),'method_header_name':([5,6,246,248,464,469,478,736,],[215,215,215,215,215,215,215,215,]),'interface_member_declaration':([6,248,469,],[216,471,729,]),'constant_declaration':([6,248,252,469,483,],[219,219,487,219,487,]),'class_body':([30,479,961,1051,1055,1114,1123,1163,],[245,737,1053,1053,1053,1053,1053,1053,]),'interface_body':([31,],[247,]),'enum_body':([32,],[249,]),'annotation_type_body':([33,],[251,]),'class_header_extends_opt':([45,48,],[253,265,]),'class_header_extends':([45,48,],[254,254,]),'interface_header_extends_opt':([46,],[257,]),'interface_header_extends':([46,],[258,]),'class_header_implements_opt':([47,253,265,],[261,492,499,]),'class_header_implements':([47,253,265,],[262,262,262,]),'type_parameters':([52,53,210,227,491,506,509,718,],[266,268,441,454,747,753,754,915,]),'assignment_operator':([62,192,],[278,278,]),'dims':([65,84,158,188,191,306,308,374,376,377,380,385,432,433,434,517,526,548,656,696,710,717,788,790,847,898,925,927,947,981,983,],[297,337,386,417,420,550,574,638,640,641,297,297,641,420,640,297,550,638,417,882,638,638,417,386,638,882,638,638,638,638,297,]),'dims_loop':([65,84,158,188,191,306,308,374,376,377,380,385,432,433,434,517,526,548,656,696,710,717,788,790,847,898,925,927,947,981,983,],[299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,299,]),'one_dim_loop':([65,84,158,188,191,299,306,308,374,376,377,380,385,432,433,434,517,526,548,656,696,710,717,788,790,847,898,925,927,947,981,983,],[300,300,300,300,300,542,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,300,]),'expression_not_name':([82,154,277,],[307,307,307,]),'assignment_expression_not_name':([82,154,277,],[309,309,309,]),'conditional_expression_not_name':([82,154,274,277,521,758,936,1107,],[311,311,516,311,516,516,516,516,]),'conditional_or_expression_not_name':([82,154,274,277,521,758,936,1107,],[312,312,312,312,312,312,312,312,]),'conditional_and_expression_not_name':([82,154,274,277,521,758,936,1107,],[316,316,316,316,316,316,316,316,]),'inclusive_or_expression_not_name':([82,154,274,277,521,758,936,1107,],[317,317,317,317,317,317,317,317,]),'exclusive_or_expression_not_name':([82,154,274,277,521,758,936,1107,],[318,318,318,318,318,318,318,318,]),'and_expression_not_name':([82,154,274,277,521,758,936,1107,],[319,319,319,319,319,319,319,319,]),'equality_expression_not_name':([82,154,274,277,521,758,936,1107,],[320,320,320,320,320,320,320,320,]),'instanceof_expression_not_name':([82,154,274,277,521,758,936,1107,],[321,321,321,321,321,321,321,321,]),'relational_expression_not_name':([82,154,274,277,521,758,936,1107,],[322,322,322,322,322,322,322,322,]),'shift_expression_not_name':([82,154,274,277,521,758,936,1107,],[323,323,323,323,323,323,323,323,]),'additive_expression_not_name':([82,154,274,277,521,758,936,1107,],[324,324,324,324,324,324,324,324,]),'multiplicative_expression_not_name':([82,154,274,277,521,758,936,1107,],[325,325,325,325,325,325,325,325,]),'unary_expression_not_name':([82,154,274,277,521,758,936,1107,],[328,328,328,328,328,328,328,328,]),'unary_expression_not_plus_minus_not_name':([82,154,274,277,521,758,936,1107,],[331,331,331,331,331,331,331,331,]),'postfix_expression_not_name':([82,154,274,277,521,758,936,1107,],[332,332,332,332,332,332,332,332,]),'class_type':([85,193,256,342,348,530,618,765,909,1103,],[343,343,493,609,617,766,839,940,1020,1020,]),'variable_declarators':([137,375,440,648,748,848,],[371,639,709,371,709,639,]),'variable_declarator':([137,375,440,635,648,748,848,],[372,372,372,840,372,372,372,]),'variable_declarator_id':([137,375,440,635,648,680,716,748,848,868,912,1075,],[373,373,373,373,373,867,911,373,373,996,1021,1144,]),'block_statements_opt':([160,438,],[387,706,]),'block_statements':([160,438,1068,1134,],[389,708,1138,1138,]),'expression_opt':([170,846,1169,],[400,979,1187,]),'try_block':([173,406,],[405,677,]),'resource_specification':([173,],[406,]),'type_argument_list1':([194,419,560,699,1009,],[422,422,422,422,422,]),'type_argument1':([194,419,560,697,699,1009,1010,1155,],[423,423,423,883,423,423,883,883,]),'type_argument_list':([194,419,560,699,1009,],[424,424,424,889,1092,]),'reference_type1':([194,419,560,697,699,703,704,752,1009,1010,1014,1015,1033,1155,1159,1160,],[425,425,425,425,425,894,896,931,425,425,894,896,1111,425,894,896,]),'wildcard1':([194,419,560,697,699,1009,1010,1155,],[426,426,426,426,426,426,426,426,]),'type_argument':([194,419,560,697,699,1009,1010,1155,],[427,427,427,884,427,427,884,884,]),'wildcard':([194,419,560,697,699,1009,1010,1155,],[431,431,431,431,431,431,431,431,]),'method_body':([209,212,],[437,443,]),'formal_parameter_list_opt':([213,215,490,],[445,452,746,]),'formal_parameter_list':([213,215,490,],[446,446,446,]),'formal_parameter':([213,215,490,715,],[448,448,448,910,]),'class_body_declarations_opt':([246,478,],[462,735,]),'class_body_declarations':([246,478,],[464,736,]),'interface_member_declarations_opt':([248,],[467,]),'interface_member_declarations':([248,],[469,]),'enum_body_declarations_opt':([250,473,474,733,],[472,731,734,921,]),'enum_constants':([250,],[474,]),'enum_declarations':([250,473,474,733,],[475,475,475,475,]),'enum_constant':([250,733,],[477,922,]),'enum_constant_header':([250,733,],[479,479,]),'enum_constant_header_name':([250,733,],[480,480,]),'annotation_type_member_declarations_opt':([252,],[482,]),'annotation_type_member_declarations':([252,],[483,]),'annotation_type_member_declaration':([252,483,],[485,744,]),'annotation_method_header':([252,483,],[486,486,]),'annotation_method_header_name':([252,483,],[490,490,]),'interface_type_list':([260,264,],[495,498,]),'interface_type':([260,264,749,],[496,496,928,]),'type_parameter_list1':([267,],[500,]),'type_parameter1':([267,750,],[501,929,]),'type_parameter_list':([267,],[502,]),'type_parameter_header':([267,750,],[503,503,]),'type_parameter':([267,750,],[504,930,]),'member_value_pairs_opt':([274,],[510,]),'single_member_annotation_member_value':([274,],[511,]),'member_value_pairs':([274,],[512,]),'member_value':([274,521,758,936,1107,],[514,762,935,1035,1162,]),'member_value_pair':([274,757,],[515,933,]),'member_value_array_initializer':([274,521,758,936,1107,],[519,519,519,519,519,]),'dims_opt':([308,374,548,710,717,847,925,927,947,981,],[573,637,776,637,914,980,914,637,1043,1064,]),'dim_with_or_without_exprs':([340,341,],[605,608,]),'dim_with_or_without_expr':([340,341,605,608,],[606,606,828,828,]),'argument_list_opt':([346,410,411,610,686,687,741,768,770,824,833,838,874,875,878,879,941,942,944,953,964,1003,1004,1007,1008,1036,],[612,683,684,834,872,873,924,943,945,952,960,963,1001,1002,1005,1006,1037,1038,1040,1047,1056,1084,1085,1088,1089,1113,]),'argument_list':([346,410,411,610,686,687,741,768,770,824,833,838,874,875,878,879,941,942,944,953,964,1003,1004,1007,1008,1036,],[613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,613,]),'for_init_opt':([382,1061,],[647,1128,]),'for_init':([382,1061,],[651,651,]),'statement_expression_list':([382,1061,1063,1190,],[653,653,1132,1132,]),'catches':([405,677,],[672,862,]),'catches_opt':([405,677,],[673,861,]),'catch_clause':([405,672,677,862,],[674,857,674,857,]),'resources':([408,],[678,]),'resource':([408,864,],[679,994,]),'wildcard_bounds1':([430,893,1096,],[701,701,701,]),'wildcard_bounds':([430,893,1096,],[702,702,702,]),'arguments_opt':([480,],[738,]),'arguments':([480,],[739,]),'member_values':([521,],[759,]),'array_initializer':([605,608,636,829,995,1050,1079,],[827,832,843,843,843,843,843,]),'variable_initializer':([636,829,995,1050,1079,],[841,958,1078,1120,1146,]),'finally':([673,861,],[858,992,]),'semi_opt':([678,],[863,]),'trailing_semicolon':([678,],[864,]),'type_argument_list2':([699,1009,],[887,887,]),'type_argument2':([699,1009,1010,1155,],[888,888,1097,1097,]),'reference_type2':([699,1009,1010,1014,1015,1155,1159,1160,],[890,890,890,1099,1101,890,1099,1101,]),'wildcard2':([699,1009,1010,1155,],[891,891,891,891,]),'method_header_throws_clause_opt':([714,913,],[906,1022,]),'method_header_throws_clause':([714,913,],[907,907,]),'method_header_extended_dims':([717,925,],[913,1026,]),'comma_opt':([829,],[954,]),'variable_initializers':([829,],[955,]),'statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[967,1062,1126,1185,1186,1191,1194,]),'labeled_statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[969,969,969,969,969,969,969,]),'if_then_else_statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[970,970,970,970,970,970,970,]),'while_statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[971,971,971,971,971,971,971,]),'for_statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[972,972,972,972,972,972,972,]),'enhanced_for_statement_no_short_if':([844,977,1059,1167,1168,1189,1193,],[973,973,973,973,973,973,973,]),'switch_block':([854,],[985,]),'catch_formal_parameter':([860,],[990,]),'wildcard_bounds2':([893,1096,],[1013,1013,]),'class_type_list':([909,],[1018,]),'class_type_elt':([909,1103,],[1019,1161,]),'additional_bound_list1':([932,],[1029,]),'additional_bound_list':([932,],[1030,]),'additional_bound1':([932,1030,],[1031,1109,]),'additional_bound':([932,1030,],[1032,1110,]),'class_body_opt':([961,1051,1055,1114,1123,1163,],[1052,1121,1122,1164,1166,1184,]),'switch_block_statements':([986,],[1067,]),'switch_labels':([986,1067,],[1068,1134,]),'switch_block_statement':([986,1067,],[1069,1135,]),'switch_label':([986,1067,1068,1134,],[1070,1070,1137,1137,]),'catch_type':([991,],[1075,]),'union_type':([991,],[1076,]),'type_argument_list3':([1009,],[1090,]),'type_argument3':([1009,1155,],[1091,1178,]),'reference_type3':([1009,1155,1159,1160,],[1093,1093,1180,1182,]),'wildcard3':([1009,1155,],[1094,1094,]),'annotation_method_header_default_value_opt':([1026,],[1104,]),'default_value':([1026,],[1105,]),'for_update_opt':([1063,1190,],[1129,1192,]),'for_update':([1063,1190,],[1130,1130,]),'constant_expression':([1071,],[1139,]),'wildcard_bounds3':([1096,],[1158,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> goal","S'",1,None,None,None),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser.py',131),
+  ('expression_not_name -> assignment_expression_not_name','expression_not_name',1,'p_expression_not_name','parser.py',135),
+  ('assignment_expression -> assignment','assignment_expression',1,'p_assignment_expression','parser.py',139),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser.py',140),
+  ('assignment_expression_not_name -> assignment','assignment_expression_not_name',1,'p_assignment_expression_not_name','parser.py',144),
+  ('assignment_expression_not_name -> conditional_expression_not_name','assignment_expression_not_name',1,'p_assignment_expression_not_name','parser.py',145),
+  ('assignment -> postfix_expression assignment_operator assignment_expression','assignment',3,'p_assignment','parser.py',149),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','parser.py',153),
+  ('assignment_operator -> TIMES_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',154),
+  ('assignment_operator -> DIVIDE_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',155),
+  ('assignment_operator -> REMAINDER_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',156),
+  ('assignment_operator -> PLUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',157),
+  ('assignment_operator -> MINUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',158),
+  ('assignment_operator -> LSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',159),
+  ('assignment_operator -> RSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',160),
+  ('assignment_operator -> RRSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',161),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',162),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',163),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser.py',164),
+  ('conditional_expression -> conditional_or_expression','conditional_expression',1,'p_conditional_expression','parser.py',168),
+  ('conditional_expression -> conditional_or_expression ? expression : conditional_expression','conditional_expression',5,'p_conditional_expression','parser.py',169),
+  ('conditional_expression_not_name -> conditional_or_expression_not_name','conditional_expression_not_name',1,'p_conditional_expression_not_name','parser.py',176),
+  ('conditional_expression_not_name -> conditional_or_expression_not_name ? expression : conditional_expression','conditional_expression_not_name',5,'p_conditional_expression_not_name','parser.py',177),
+  ('conditional_expression_not_name -> name ? expression : conditional_expression','conditional_expression_not_name',5,'p_conditional_expression_not_name','parser.py',178),
+  ('conditional_or_expression -> conditional_and_expression','conditional_or_expression',1,'p_conditional_or_expression','parser.py',191),
+  ('conditional_or_expression -> conditional_or_expression OR conditional_and_expression','conditional_or_expression',3,'p_conditional_or_expression','parser.py',192),
+  ('conditional_or_expression_not_name -> conditional_and_expression_not_name','conditional_or_expression_not_name',1,'p_conditional_or_expression_not_name','parser.py',196),
+  ('conditional_or_expression_not_name -> conditional_or_expression_not_name OR conditional_and_expression','conditional_or_expression_not_name',3,'p_conditional_or_expression_not_name','parser.py',197),
+  ('conditional_or_expression_not_name -> name OR conditional_and_expression','conditional_or_expression_not_name',3,'p_conditional_or_expression_not_name','parser.py',198),
+  ('conditional_and_expression -> inclusive_or_expression','conditional_and_expression',1,'p_conditional_and_expression','parser.py',202),
+  ('conditional_and_expression -> conditional_and_expression AND inclusive_or_expression','conditional_and_expression',3,'p_conditional_and_expression','parser.py',203),
+  ('conditional_and_expression_not_name -> inclusive_or_expression_not_name','conditional_and_expression_not_name',1,'p_conditional_and_expression_not_name','parser.py',207),
+  ('conditional_and_expression_not_name -> conditional_and_expression_not_name AND inclusive_or_expression','conditional_and_expression_not_name',3,'p_conditional_and_expression_not_name','parser.py',208),
+  ('conditional_and_expression_not_name -> name AND inclusive_or_expression','conditional_and_expression_not_name',3,'p_conditional_and_expression_not_name','parser.py',209),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','parser.py',213),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','parser.py',214),
+  ('inclusive_or_expression_not_name -> exclusive_or_expression_not_name','inclusive_or_expression_not_name',1,'p_inclusive_or_expression_not_name','parser.py',218),
+  ('inclusive_or_expression_not_name -> inclusive_or_expression_not_name | exclusive_or_expression','inclusive_or_expression_not_name',3,'p_inclusive_or_expression_not_name','parser.py',219),
+  ('inclusive_or_expression_not_name -> name | exclusive_or_expression','inclusive_or_expression_not_name',3,'p_inclusive_or_expression_not_name','parser.py',220),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','parser.py',224),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','parser.py',225),
+  ('exclusive_or_expression_not_name -> and_expression_not_name','exclusive_or_expression_not_name',1,'p_exclusive_or_expression_not_name','parser.py',229),
+  ('exclusive_or_expression_not_name -> exclusive_or_expression_not_name ^ and_expression','exclusive_or_expression_not_name',3,'p_exclusive_or_expression_not_name','parser.py',230),
+  ('exclusive_or_expression_not_name -> name ^ and_expression','exclusive_or_expression_not_name',3,'p_exclusive_or_expression_not_name','parser.py',231),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','parser.py',235),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','parser.py',236),
+  ('and_expression_not_name -> equality_expression_not_name','and_expression_not_name',1,'p_and_expression_not_name','parser.py',240),
+  ('and_expression_not_name -> and_expression_not_name & equality_expression','and_expression_not_name',3,'p_and_expression_not_name','parser.py',241),
+  ('and_expression_not_name -> name & equality_expression','and_expression_not_name',3,'p_and_expression_not_name','parser.py',242),
+  ('equality_expression -> instanceof_expression','equality_expression',1,'p_equality_expression','parser.py',246),
+  ('equality_expression -> equality_expression EQ instanceof_expression','equality_expression',3,'p_equality_expression','parser.py',247),
+  ('equality_expression -> equality_expression NEQ instanceof_expression','equality_expression',3,'p_equality_expression','parser.py',248),
+  ('equality_expression_not_name -> instanceof_expression_not_name','equality_expression_not_name',1,'p_equality_expression_not_name','parser.py',252),
+  ('equality_expression_not_name -> equality_expression_not_name EQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',253),
+  ('equality_expression_not_name -> name EQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',254),
+  ('equality_expression_not_name -> equality_expression_not_name NEQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',255),
+  ('equality_expression_not_name -> name NEQ instanceof_expression','equality_expression_not_name',3,'p_equality_expression_not_name','parser.py',256),
+  ('instanceof_expression -> relational_expression','instanceof_expression',1,'p_instanceof_expression','parser.py',260),
+  ('instanceof_expression -> instanceof_expression INSTANCEOF reference_type','instanceof_expression',3,'p_instanceof_expression','parser.py',261),
+  ('instanceof_expression_not_name -> relational_expression_not_name','instanceof_expression_not_name',1,'p_instanceof_expression_not_name','parser.py',265),
+  ('instanceof_expression_not_name -> name INSTANCEOF reference_type','instanceof_expression_not_name',3,'p_instanceof_expression_not_name','parser.py',266),
+  ('instanceof_expression_not_name -> instanceof_expression_not_name INSTANCEOF reference_type','instanceof_expression_not_name',3,'p_instanceof_expression_not_name','parser.py',267),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser.py',271),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','parser.py',272),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','parser.py',273),
+  ('relational_expression -> relational_expression GTEQ shift_expression','relational_expression',3,'p_relational_expression','parser.py',274),
+  ('relational_expression -> relational_expression LTEQ shift_expression','relational_expression',3,'p_relational_expression','parser.py',275),
+  ('relational_expression_not_name -> shift_expression_not_name','relational_expression_not_name',1,'p_relational_expression_not_name','parser.py',279),
+  ('relational_expression_not_name -> shift_expression_not_name < shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',280),
+  ('relational_expression_not_name -> name < shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',281),
+  ('relational_expression_not_name -> shift_expression_not_name > shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',282),
+  ('relational_expression_not_name -> name > shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',283),
+  ('relational_expression_not_name -> shift_expression_not_name GTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',284),
+  ('relational_expression_not_name -> name GTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',285),
+  ('relational_expression_not_name -> shift_expression_not_name LTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',286),
+  ('relational_expression_not_name -> name LTEQ shift_expression','relational_expression_not_name',3,'p_relational_expression_not_name','parser.py',287),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser.py',291),
+  ('shift_expression -> shift_expression LSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',292),
+  ('shift_expression -> shift_expression RSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',293),
+  ('shift_expression -> shift_expression RRSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser.py',294),
+  ('shift_expression_not_name -> additive_expression_not_name','shift_expression_not_name',1,'p_shift_expression_not_name','parser.py',298),
+  ('shift_expression_not_name -> shift_expression_not_name LSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',299),
+  ('shift_expression_not_name -> name LSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',300),
+  ('shift_expression_not_name -> shift_expression_not_name RSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',301),
+  ('shift_expression_not_name -> name RSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',302),
+  ('shift_expression_not_name -> shift_expression_not_name RRSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',303),
+  ('shift_expression_not_name -> name RRSHIFT additive_expression','shift_expression_not_name',3,'p_shift_expression_not_name','parser.py',304),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser.py',308),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',309),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','parser.py',310),
+  ('additive_expression_not_name -> multiplicative_expression_not_name','additive_expression_not_name',1,'p_additive_expression_not_name','parser.py',314),
+  ('additive_expression_not_name -> additive_expression_not_name + multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',315),
+  ('additive_expression_not_name -> name + multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',316),
+  ('additive_expression_not_name -> additive_expression_not_name - multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',317),
+  ('additive_expression_not_name -> name - multiplicative_expression','additive_expression_not_name',3,'p_additive_expression_not_name','parser.py',318),
+  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_multiplicative_expression','parser.py',322),
+  ('multiplicative_expression -> multiplicative_expression * unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',323),
+  ('multiplicative_expression -> multiplicative_expression / unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',324),
+  ('multiplicative_expression -> multiplicative_expression % unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser.py',325),
+  ('multiplicative_expression_not_name -> unary_expression_not_name','multiplicative_expression_not_name',1,'p_multiplicative_expression_not_name','parser.py',329),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name * unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',330),
+  ('multiplicative_expression_not_name -> name * unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',331),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name / unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',332),
+  ('multiplicative_expression_not_name -> name / unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',333),
+  ('multiplicative_expression_not_name -> multiplicative_expression_not_name % unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',334),
+  ('multiplicative_expression_not_name -> name % unary_expression','multiplicative_expression_not_name',3,'p_multiplicative_expression_not_name','parser.py',335),
+  ('unary_expression -> pre_increment_expression','unary_expression',1,'p_unary_expression','parser.py',339),
+  ('unary_expression -> pre_decrement_expression','unary_expression',1,'p_unary_expression','parser.py',340),
+  ('unary_expression -> + unary_expression','unary_expression',2,'p_unary_expression','parser.py',341),
+  ('unary_expression -> - unary_expression','unary_expression',2,'p_unary_expression','parser.py',342),
+  ('unary_expression -> unary_expression_not_plus_minus','unary_expression',1,'p_unary_expression','parser.py',343),
+  ('unary_expression_not_name -> pre_increment_expression','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',350),
+  ('unary_expression_not_name -> pre_decrement_expression','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',351),
+  ('unary_expression_not_name -> + unary_expression','unary_expression_not_name',2,'p_unary_expression_not_name','parser.py',352),
+  ('unary_expression_not_name -> - unary_expression','unary_expression_not_name',2,'p_unary_expression_not_name','parser.py',353),
+  ('unary_expression_not_name -> unary_expression_not_plus_minus_not_name','unary_expression_not_name',1,'p_unary_expression_not_name','parser.py',354),
+  ('pre_increment_expression -> PLUSPLUS unary_expression','pre_increment_expression',2,'p_pre_increment_expression','parser.py',361),
+  ('pre_decrement_expression -> MINUSMINUS unary_expression','pre_decrement_expression',2,'p_pre_decrement_expression','parser.py',365),
+  ('unary_expression_not_plus_minus -> postfix_expression','unary_expression_not_plus_minus',1,'p_unary_expression_not_plus_minus','parser.py',369),
+  ('unary_expression_not_plus_minus -> ~ unary_expression','unary_expression_not_plus_minus',2,'p_unary_expression_not_plus_minus','parser.py',370),
+  ('unary_expression_not_plus_minus -> ! unary_expression','unary_expression_not_plus_minus',2,'p_unary_expression_not_plus_minus','parser.py',371),
+  ('unary_expression_not_plus_minus -> cast_expression','unary_expression_not_plus_minus',1,'p_unary_expression_not_plus_minus','parser.py',372),
+  ('unary_expression_not_plus_minus_not_name -> postfix_expression_not_name','unary_expression_not_plus_minus_not_name',1,'p_unary_expression_not_plus_minus_not_name','parser.py',379),
+  ('unary_expression_not_plus_minus_not_name -> ~ unary_expression','unary_expression_not_plus_minus_not_name',2,'p_unary_expression_not_plus_minus_not_name','parser.py',380),
+  ('unary_expression_not_plus_minus_not_name -> ! unary_expression','unary_expression_not_plus_minus_not_name',2,'p_unary_expression_not_plus_minus_not_name','parser.py',381),
+  ('unary_expression_not_plus_minus_not_name -> cast_expression','unary_expression_not_plus_minus_not_name',1,'p_unary_expression_not_plus_minus_not_name','parser.py',382),
+  ('postfix_expression -> primary','postfix_expression',1,'p_postfix_expression','parser.py',389),
+  ('postfix_expression -> name','postfix_expression',1,'p_postfix_expression','parser.py',390),
+  ('postfix_expression -> post_increment_expression','postfix_expression',1,'p_postfix_expression','parser.py',391),
+  ('postfix_expression -> post_decrement_expression','postfix_expression',1,'p_postfix_expression','parser.py',392),
+  ('postfix_expression_not_name -> primary','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',396),
+  ('postfix_expression_not_name -> post_increment_expression','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',397),
+  ('postfix_expression_not_name -> post_decrement_expression','postfix_expression_not_name',1,'p_postfix_expression_not_name','parser.py',398),
+  ('post_increment_expression -> postfix_expression PLUSPLUS','post_increment_expression',2,'p_post_increment_expression','parser.py',402),
+  ('post_decrement_expression -> postfix_expression MINUSMINUS','post_decrement_expression',2,'p_post_decrement_expression','parser.py',406),
+  ('primary -> primary_no_new_array','primary',1,'p_primary','parser.py',410),
+  ('primary -> array_creation_with_array_initializer','primary',1,'p_primary','parser.py',411),
+  ('primary -> array_creation_without_array_initializer','primary',1,'p_primary','parser.py',412),
+  ('primary_no_new_array -> literal','primary_no_new_array',1,'p_primary_no_new_array','parser.py',416),
+  ('primary_no_new_array -> THIS','primary_no_new_array',1,'p_primary_no_new_array','parser.py',417),
+  ('primary_no_new_array -> class_instance_creation_expression','primary_no_new_array',1,'p_primary_no_new_array','parser.py',418),
+  ('primary_no_new_array -> field_access','primary_no_new_array',1,'p_primary_no_new_array','parser.py',419),
+  ('primary_no_new_array -> method_invocation','primary_no_new_array',1,'p_primary_no_new_array','parser.py',420),
+  ('primary_no_new_array -> array_access','primary_no_new_array',1,'p_primary_no_new_array','parser.py',421),
+  ('primary_no_new_array -> ( name )','primary_no_new_array',3,'p_primary_no_new_array2','parser.py',425),
+  ('primary_no_new_array -> ( expression_not_name )','primary_no_new_array',3,'p_primary_no_new_array2','parser.py',426),
+  ('primary_no_new_array -> name . THIS','primary_no_new_array',3,'p_primary_no_new_array3','parser.py',430),
+  ('primary_no_new_array -> name . SUPER','primary_no_new_array',3,'p_primary_no_new_array3','parser.py',431),
+  ('primary_no_new_array -> name . CLASS','primary_no_new_array',3,'p_primary_no_new_array4','parser.py',436),
+  ('primary_no_new_array -> name dims . CLASS','primary_no_new_array',4,'p_primary_no_new_array4','parser.py',437),
+  ('primary_no_new_array -> primitive_type dims . CLASS','primary_no_new_array',4,'p_primary_no_new_array4','parser.py',438),
+  ('primary_no_new_array -> primitive_type . CLASS','primary_no_new_array',3,'p_primary_no_new_array4','parser.py',439),
+  ('dims_opt -> dims','dims_opt',1,'p_dims_opt','parser.py',446),
+  ('dims_opt -> empty','dims_opt',1,'p_dims_opt2','parser.py',450),
+  ('dims -> dims_loop','dims',1,'p_dims','parser.py',454),
+  ('dims_loop -> one_dim_loop','dims_loop',1,'p_dims_loop','parser.py',458),
+  ('dims_loop -> dims_loop one_dim_loop','dims_loop',2,'p_dims_loop','parser.py',459),
+  ('one_dim_loop -> [ ]','one_dim_loop',2,'p_one_dim_loop','parser.py',466),
+  ('cast_expression -> ( primitive_type dims_opt ) unary_expression','cast_expression',5,'p_cast_expression','parser.py',470),
+  ('cast_expression -> ( name type_arguments dims_opt ) unary_expression_not_plus_minus','cast_expression',6,'p_cast_expression2','parser.py',474),
+  ('cast_expression -> ( name type_arguments . class_or_interface_type dims_opt ) unary_expression_not_plus_minus','cast_expression',8,'p_cast_expression3','parser.py',478),
+  ('cast_expression -> ( name ) unary_expression_not_plus_minus','cast_expression',4,'p_cast_expression4','parser.py',484),
+  ('cast_expression -> ( name dims ) unary_expression_not_plus_minus','cast_expression',5,'p_cast_expression5','parser.py',489),
+  ('block -> { block_statements_opt }','block',3,'p_block','parser.py',496),
+  ('block -> BODY','block',1,'p_block_lazy','parser.py',500),
+  ('block -> { error }','block',3,'p_block_error','parser.py',504),
+  ('block -> { block_statements error }','block',4,'p_block_error','parser.py',505),
+  ('block_statements_opt -> block_statements','block_statements_opt',1,'p_block_statements_opt','parser.py',511),
+  ('block_statements_opt -> empty','block_statements_opt',1,'p_block_statements_opt2','parser.py',515),
+  ('block_statements -> block_statement','block_statements',1,'p_block_statements','parser.py',519),
+  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','parser.py',520),
+  ('block_statement -> local_variable_declaration_statement','block_statement',1,'p_block_statement','parser.py',528),
+  ('block_statement -> statement','block_statement',1,'p_block_statement','parser.py',529),
+  ('block_statement -> class_declaration','block_statement',1,'p_block_statement','parser.py',530),
+  ('block_statement -> interface_declaration','block_statement',1,'p_block_statement','parser.py',531),
+  ('block_statement -> annotation_type_declaration','block_statement',1,'p_block_statement','parser.py',532),
+  ('block_statement -> enum_declaration','block_statement',1,'p_block_statement','parser.py',533),
+  ('block_statement -> error ;','block_statement',2,'p_block_statement_error','parser.py',537),
+  ('local_variable_declaration_statement -> local_variable_declaration ;','local_variable_declaration_statement',2,'p_local_variable_declaration_statement','parser.py',541),
+  ('local_variable_declaration -> type variable_declarators','local_variable_declaration',2,'p_local_variable_declaration','parser.py',545),
+  ('local_variable_declaration -> modifiers type variable_declarators','local_variable_declaration',3,'p_local_variable_declaration2','parser.py',549),
+  ('variable_declarators -> variable_declarator','variable_declarators',1,'p_variable_declarators','parser.py',553),
+  ('variable_declarators -> variable_declarators , variable_declarator','variable_declarators',3,'p_variable_declarators','parser.py',554),
+  ('variable_declarator -> variable_declarator_id','variable_declarator',1,'p_variable_declarator','parser.py',562),
+  ('variable_declarator -> variable_declarator_id = variable_initializer','variable_declarator',3,'p_variable_declarator','parser.py',563),
+  ('variable_declarator_id -> NAME dims_opt','variable_declarator_id',2,'p_variable_declarator_id','parser.py',570),
+  ('variable_initializer -> expression','variable_initializer',1,'p_variable_initializer','parser.py',574),
+  ('variable_initializer -> array_initializer','variable_initializer',1,'p_variable_initializer','parser.py',575),
+  ('statement -> statement_without_trailing_substatement','statement',1,'p_statement','parser.py',579),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser.py',580),
+  ('statement -> if_then_statement','statement',1,'p_statement','parser.py',581),
+  ('statement -> if_then_else_statement','statement',1,'p_statement','parser.py',582),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',583),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',584),
+  ('statement -> enhanced_for_statement','statement',1,'p_statement','parser.py',585),
+  ('statement_without_trailing_substatement -> block','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',589),
+  ('statement_without_trailing_substatement -> expression_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',590),
+  ('statement_without_trailing_substatement -> assert_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',591),
+  ('statement_without_trailing_substatement -> empty_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',592),
+  ('statement_without_trailing_substatement -> switch_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',593),
+  ('statement_without_trailing_substatement -> do_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',594),
+  ('statement_without_trailing_substatement -> break_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',595),
+  ('statement_without_trailing_substatement -> continue_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',596),
+  ('statement_without_trailing_substatement -> return_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',597),
+  ('statement_without_trailing_substatement -> synchronized_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',598),
+  ('statement_without_trailing_substatement -> throw_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',599),
+  ('statement_without_trailing_substatement -> try_statement','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',600),
+  ('statement_without_trailing_substatement -> try_statement_with_resources','statement_without_trailing_substatement',1,'p_statement_without_trailing_substatement','parser.py',601),
+  ('expression_statement -> statement_expression ;','expression_statement',2,'p_expression_statement','parser.py',605),
+  ('expression_statement -> explicit_constructor_invocation','expression_statement',1,'p_expression_statement','parser.py',606),
+  ('statement_expression -> assignment','statement_expression',1,'p_statement_expression','parser.py',613),
+  ('statement_expression -> pre_increment_expression','statement_expression',1,'p_statement_expression','parser.py',614),
+  ('statement_expression -> pre_decrement_expression','statement_expression',1,'p_statement_expression','parser.py',615),
+  ('statement_expression -> post_increment_expression','statement_expression',1,'p_statement_expression','parser.py',616),
+  ('statement_expression -> post_decrement_expression','statement_expression',1,'p_statement_expression','parser.py',617),
+  ('statement_expression -> method_invocation','statement_expression',1,'p_statement_expression','parser.py',618),
+  ('statement_expression -> class_instance_creation_expression','statement_expression',1,'p_statement_expression','parser.py',619),
+  ('comma_opt -> ,','comma_opt',1,'p_comma_opt','parser.py',623),
+  ('comma_opt -> empty','comma_opt',1,'p_comma_opt','parser.py',624),
+  ('array_initializer -> { comma_opt }','array_initializer',3,'p_array_initializer','parser.py',628),
+  ('array_initializer -> { variable_initializers }','array_initializer',3,'p_array_initializer2','parser.py',632),
+  ('array_initializer -> { variable_initializers , }','array_initializer',4,'p_array_initializer2','parser.py',633),
+  ('variable_initializers -> variable_initializer','variable_initializers',1,'p_variable_initializers','parser.py',637),
+  ('variable_initializers -> variable_initializers , variable_initializer','variable_initializers',3,'p_variable_initializers','parser.py',638),
+  ('method_invocation -> NAME ( argument_list_opt )','method_invocation',4,'p_method_invocation','parser.py',646),
+  ('method_invocation -> name . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',650),
+  ('method_invocation -> primary . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',651),
+  ('method_invocation -> SUPER . type_arguments NAME ( argument_list_opt )','method_invocation',7,'p_method_invocation2','parser.py',652),
+  ('method_invocation -> name . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',656),
+  ('method_invocation -> primary . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',657),
+  ('method_invocation -> SUPER . NAME ( argument_list_opt )','method_invocation',6,'p_method_invocation3','parser.py',658),
+  ('labeled_statement -> label : statement','labeled_statement',3,'p_labeled_statement','parser.py',662),
+  ('labeled_statement_no_short_if -> label : statement_no_short_if','labeled_statement_no_short_if',3,'p_labeled_statement_no_short_if','parser.py',667),
+  ('label -> NAME','label',1,'p_label','parser.py',672),
+  ('if_then_statement -> IF ( expression ) statement','if_then_statement',5,'p_if_then_statement','parser.py',676),
+  ('if_then_else_statement -> IF ( expression ) statement_no_short_if ELSE statement','if_then_else_statement',7,'p_if_then_else_statement','parser.py',680),
+  ('if_then_else_statement_no_short_if -> IF ( expression ) statement_no_short_if ELSE statement_no_short_if','if_then_else_statement_no_short_if',7,'p_if_then_else_statement_no_short_if','parser.py',684),
+  ('while_statement -> WHILE ( expression ) statement','while_statement',5,'p_while_statement','parser.py',688),
+  ('while_statement_no_short_if -> WHILE ( expression ) statement_no_short_if','while_statement_no_short_if',5,'p_while_statement_no_short_if','parser.py',692),
+  ('for_statement -> FOR ( for_init_opt ; expression_opt ; for_update_opt ) statement','for_statement',9,'p_for_statement','parser.py',696),
+  ('for_statement_no_short_if -> FOR ( for_init_opt ; expression_opt ; for_update_opt ) statement_no_short_if','for_statement_no_short_if',9,'p_for_statement_no_short_if','parser.py',700),
+  ('for_init_opt -> for_init','for_init_opt',1,'p_for_init_opt','parser.py',704),
+  ('for_init_opt -> empty','for_init_opt',1,'p_for_init_opt','parser.py',705),
+  ('for_init -> statement_expression_list','for_init',1,'p_for_init','parser.py',709),
+  ('for_init -> local_variable_declaration','for_init',1,'p_for_init','parser.py',710),
+  ('statement_expression_list -> statement_expression','statement_expression_list',1,'p_statement_expression_list','parser.py',714),
+  ('statement_expression_list -> statement_expression_list , statement_expression','statement_expression_list',3,'p_statement_expression_list','parser.py',715),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',723),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',724),
+  ('for_update_opt -> for_update','for_update_opt',1,'p_for_update_opt','parser.py',728),
+  ('for_update_opt -> empty','for_update_opt',1,'p_for_update_opt','parser.py',729),
+  ('for_update -> statement_expression_list','for_update',1,'p_for_update','parser.py',733),
+  ('enhanced_for_statement -> enhanced_for_statement_header statement','enhanced_for_statement',2,'p_enhanced_for_statement','parser.py',737),
+  ('enhanced_for_statement_no_short_if -> enhanced_for_statement_header statement_no_short_if','enhanced_for_statement_no_short_if',2,'p_enhanced_for_statement_no_short_if','parser.py',741),
+  ('enhanced_for_statement_header -> enhanced_for_statement_header_init : expression )','enhanced_for_statement_header',4,'p_enhanced_for_statement_header','parser.py',745),
+  ('enhanced_for_statement_header_init -> FOR ( type NAME dims_opt','enhanced_for_statement_header_init',5,'p_enhanced_for_statement_header_init','parser.py',750),
+  ('enhanced_for_statement_header_init -> FOR ( modifiers type NAME dims_opt','enhanced_for_statement_header_init',6,'p_enhanced_for_statement_header_init2','parser.py',754),
+  ('statement_no_short_if -> statement_without_trailing_substatement','statement_no_short_if',1,'p_statement_no_short_if','parser.py',758),
+  ('statement_no_short_if -> labeled_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',759),
+  ('statement_no_short_if -> if_then_else_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',760),
+  ('statement_no_short_if -> while_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',761),
+  ('statement_no_short_if -> for_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',762),
+  ('statement_no_short_if -> enhanced_for_statement_no_short_if','statement_no_short_if',1,'p_statement_no_short_if','parser.py',763),
+  ('assert_statement -> ASSERT expression ;','assert_statement',3,'p_assert_statement','parser.py',767),
+  ('assert_statement -> ASSERT expression : expression ;','assert_statement',5,'p_assert_statement','parser.py',768),
+  ('empty_statement -> ;','empty_statement',1,'p_empty_statement','parser.py',775),
+  ('switch_statement -> SWITCH ( expression ) switch_block','switch_statement',5,'p_switch_statement','parser.py',779),
+  ('switch_block -> { }','switch_block',2,'p_switch_block','parser.py',783),
+  ('switch_block -> { switch_block_statements }','switch_block',3,'p_switch_block2','parser.py',787),
+  ('switch_block -> { switch_labels }','switch_block',3,'p_switch_block3','parser.py',791),
+  ('switch_block -> { switch_block_statements switch_labels }','switch_block',4,'p_switch_block4','parser.py',795),
+  ('switch_block_statements -> switch_block_statement','switch_block_statements',1,'p_switch_block_statements','parser.py',799),
+  ('switch_block_statements -> switch_block_statements switch_block_statement','switch_block_statements',2,'p_switch_block_statements','parser.py',800),
+  ('switch_block_statement -> switch_labels block_statements','switch_block_statement',2,'p_switch_block_statement','parser.py',808),
+  ('switch_labels -> switch_label','switch_labels',1,'p_switch_labels','parser.py',812),
+  ('switch_labels -> switch_labels switch_label','switch_labels',2,'p_switch_labels','parser.py',813),
+  ('switch_label -> CASE constant_expression :','switch_label',3,'p_switch_label','parser.py',821),
+  ('switch_label -> DEFAULT :','switch_label',2,'p_switch_label','parser.py',822),
+  ('constant_expression -> expression','constant_expression',1,'p_constant_expression','parser.py',829),
+  ('do_statement -> DO statement WHILE ( expression ) ;','do_statement',7,'p_do_statement','parser.py',833),
+  ('break_statement -> BREAK ;','break_statement',2,'p_break_statement','parser.py',837),
+  ('break_statement -> BREAK NAME ;','break_statement',3,'p_break_statement','parser.py',838),
+  ('continue_statement -> CONTINUE ;','continue_statement',2,'p_continue_statement','parser.py',845),
+  ('continue_statement -> CONTINUE NAME ;','continue_statement',3,'p_continue_statement','parser.py',846),
+  ('return_statement -> RETURN expression_opt ;','return_statement',3,'p_return_statement','parser.py',853),
+  ('synchronized_statement -> SYNCHRONIZED ( expression ) block','synchronized_statement',5,'p_synchronized_statement','parser.py',857),
+  ('throw_statement -> THROW expression ;','throw_statement',3,'p_throw_statement','parser.py',861),
+  ('try_statement -> TRY try_block catches','try_statement',3,'p_try_statement','parser.py',865),
+  ('try_statement -> TRY try_block catches_opt finally','try_statement',4,'p_try_statement','parser.py',866),
+  ('try_block -> block','try_block',1,'p_try_block','parser.py',873),
+  ('catches -> catch_clause','catches',1,'p_catches','parser.py',877),
+  ('catches -> catches catch_clause','catches',2,'p_catches','parser.py',878),
+  ('catches_opt -> catches','catches_opt',1,'p_catches_opt','parser.py',886),
+  ('catches_opt -> empty','catches_opt',1,'p_catches_opt2','parser.py',890),
+  ('catch_clause -> CATCH ( catch_formal_parameter ) block','catch_clause',5,'p_catch_clause','parser.py',894),
+  ('catch_formal_parameter -> modifiers_opt catch_type variable_declarator_id','catch_formal_parameter',3,'p_catch_formal_parameter','parser.py',898),
+  ('catch_type -> union_type','catch_type',1,'p_catch_type','parser.py',902),
+  ('union_type -> type','union_type',1,'p_union_type','parser.py',906),
+  ('union_type -> union_type | type','union_type',3,'p_union_type','parser.py',907),
+  ('try_statement_with_resources -> TRY resource_specification try_block catches_opt','try_statement_with_resources',4,'p_try_statement_with_resources','parser.py',915),
+  ('try_statement_with_resources -> TRY resource_specification try_block catches_opt finally','try_statement_with_resources',5,'p_try_statement_with_resources','parser.py',916),
+  ('resource_specification -> ( resources semi_opt )','resource_specification',4,'p_resource_specification','parser.py',923),
+  ('semi_opt -> ;','semi_opt',1,'p_semi_opt','parser.py',927),
+  ('semi_opt -> empty','semi_opt',1,'p_semi_opt','parser.py',928),
+  ('resources -> resource','resources',1,'p_resources','parser.py',932),
+  ('resources -> resources trailing_semicolon resource','resources',3,'p_resources','parser.py',933),
+  ('trailing_semicolon -> ;','trailing_semicolon',1,'p_trailing_semicolon','parser.py',941),
+  ('resource -> type variable_declarator_id = variable_initializer','resource',4,'p_resource','parser.py',945),
+  ('resource -> modifiers type variable_declarator_id = variable_initializer','resource',5,'p_resource2','parser.py',949),
+  ('finally -> FINALLY block','finally',2,'p_finally','parser.py',953),
+  ('explicit_constructor_invocation -> THIS ( argument_list_opt ) ;','explicit_constructor_invocation',5,'p_explicit_constructor_invocation','parser.py',957),
+  ('explicit_constructor_invocation -> SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',5,'p_explicit_constructor_invocation','parser.py',958),
+  ('explicit_constructor_invocation -> type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',6,'p_explicit_constructor_invocation2','parser.py',962),
+  ('explicit_constructor_invocation -> type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',6,'p_explicit_constructor_invocation2','parser.py',963),
+  ('explicit_constructor_invocation -> primary . SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',967),
+  ('explicit_constructor_invocation -> name . SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',968),
+  ('explicit_constructor_invocation -> primary . THIS ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',969),
+  ('explicit_constructor_invocation -> name . THIS ( argument_list_opt ) ;','explicit_constructor_invocation',7,'p_explicit_constructor_invocation3','parser.py',970),
+  ('explicit_constructor_invocation -> primary . type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',974),
+  ('explicit_constructor_invocation -> name . type_arguments SUPER ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',975),
+  ('explicit_constructor_invocation -> primary . type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',976),
+  ('explicit_constructor_invocation -> name . type_arguments THIS ( argument_list_opt ) ;','explicit_constructor_invocation',8,'p_explicit_constructor_invocation4','parser.py',977),
+  ('class_instance_creation_expression -> NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',7,'p_class_instance_creation_expression','parser.py',981),
+  ('class_instance_creation_expression -> NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',6,'p_class_instance_creation_expression2','parser.py',985),
+  ('class_instance_creation_expression -> primary . NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',9,'p_class_instance_creation_expression3','parser.py',989),
+  ('class_instance_creation_expression -> primary . NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',8,'p_class_instance_creation_expression4','parser.py',993),
+  ('class_instance_creation_expression -> class_instance_creation_expression_name NEW class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',7,'p_class_instance_creation_expression5','parser.py',997),
+  ('class_instance_creation_expression -> class_instance_creation_expression_name NEW type_arguments class_type ( argument_list_opt ) class_body_opt','class_instance_creation_expression',8,'p_class_instance_creation_expression6','parser.py',1001),
+  ('class_instance_creation_expression_name -> name .','class_instance_creation_expression_name',2,'p_class_instance_creation_expression_name','parser.py',1005),
+  ('class_body_opt -> class_body','class_body_opt',1,'p_class_body_opt','parser.py',1009),
+  ('class_body_opt -> empty','class_body_opt',1,'p_class_body_opt','parser.py',1010),
+  ('field_access -> primary . NAME','field_access',3,'p_field_access','parser.py',1014),
+  ('field_access -> SUPER . NAME','field_access',3,'p_field_access','parser.py',1015),
+  ('array_access -> name [ expression ]','array_access',4,'p_array_access','parser.py',1019),
+  ('array_access -> primary_no_new_array [ expression ]','array_access',4,'p_array_access','parser.py',1020),
+  ('array_access -> array_creation_with_array_initializer [ expression ]','array_access',4,'p_array_access','parser.py',1021),
+  ('array_creation_with_array_initializer -> NEW primitive_type dim_with_or_without_exprs array_initializer','array_creation_with_array_initializer',4,'p_array_creation_with_array_initializer','parser.py',1025),
+  ('array_creation_with_array_initializer -> NEW class_or_interface_type dim_with_or_without_exprs array_initializer','array_creation_with_array_initializer',4,'p_array_creation_with_array_initializer','parser.py',1026),
+  ('dim_with_or_without_exprs -> dim_with_or_without_expr','dim_with_or_without_exprs',1,'p_dim_with_or_without_exprs','parser.py',1030),
+  ('dim_with_or_without_exprs -> dim_with_or_without_exprs dim_with_or_without_expr','dim_with_or_without_exprs',2,'p_dim_with_or_without_exprs','parser.py',1031),
+  ('dim_with_or_without_expr -> [ expression ]','dim_with_or_without_expr',3,'p_dim_with_or_without_expr','parser.py',1039),
+  ('dim_with_or_without_expr -> [ ]','dim_with_or_without_expr',2,'p_dim_with_or_without_expr','parser.py',1040),
+  ('array_creation_without_array_initializer -> NEW primitive_type dim_with_or_without_exprs','array_creation_without_array_initializer',3,'p_array_creation_without_array_initializer','parser.py',1047),
+  ('array_creation_without_array_initializer -> NEW class_or_interface_type dim_with_or_without_exprs','array_creation_without_array_initializer',3,'p_array_creation_without_array_initializer','parser.py',1048),
+  ('name -> simple_name','name',1,'p_name','parser.py',1054),
+  ('name -> qualified_name','name',1,'p_name','parser.py',1055),
+  ('simple_name -> NAME','simple_name',1,'p_simple_name','parser.py',1059),
+  ('qualified_name -> name . simple_name','qualified_name',3,'p_qualified_name','parser.py',1063),
+  ('literal -> NUM','literal',1,'p_literal','parser.py',1070),
+  ('literal -> CHAR_LITERAL','literal',1,'p_literal','parser.py',1071),
+  ('literal -> STRING_LITERAL','literal',1,'p_literal','parser.py',1072),
+  ('literal -> TRUE','literal',1,'p_literal','parser.py',1073),
+  ('literal -> FALSE','literal',1,'p_literal','parser.py',1074),
+  ('literal -> NULL','literal',1,'p_literal','parser.py',1075),
+  ('modifiers_opt -> modifiers','modifiers_opt',1,'p_modifiers_opt','parser.py',1081),
+  ('modifiers_opt -> empty','modifiers_opt',1,'p_modifiers_opt2','parser.py',1085),
+  ('modifiers -> modifier','modifiers',1,'p_modifiers','parser.py',1089),
+  ('modifiers -> modifiers modifier','modifiers',2,'p_modifiers','parser.py',1090),
+  ('modifier -> PUBLIC','modifier',1,'p_modifier','parser.py',1098),
+  ('modifier -> PROTECTED','modifier',1,'p_modifier','parser.py',1099),
+  ('modifier -> PRIVATE','modifier',1,'p_modifier','parser.py',1100),
+  ('modifier -> STATIC','modifier',1,'p_modifier','parser.py',1101),
+  ('modifier -> ABSTRACT','modifier',1,'p_modifier','parser.py',1102),
+  ('modifier -> FINAL','modifier',1,'p_modifier','parser.py',1103),
+  ('modifier -> NATIVE','modifier',1,'p_modifier','parser.py',1104),
+  ('modifier -> SYNCHRONIZED','modifier',1,'p_modifier','parser.py',1105),
+  ('modifier -> TRANSIENT','modifier',1,'p_modifier','parser.py',1106),
+  ('modifier -> VOLATILE','modifier',1,'p_modifier','parser.py',1107),
+  ('modifier -> STRICTFP','modifier',1,'p_modifier','parser.py',1108),
+  ('modifier -> annotation','modifier',1,'p_modifier','parser.py',1109),
+  ('type -> primitive_type','type',1,'p_type','parser.py',1113),
+  ('type -> reference_type','type',1,'p_type','parser.py',1114),
+  ('primitive_type -> BOOLEAN','primitive_type',1,'p_primitive_type','parser.py',1118),
+  ('primitive_type -> VOID','primitive_type',1,'p_primitive_type','parser.py',1119),
+  ('primitive_type -> BYTE','primitive_type',1,'p_primitive_type','parser.py',1120),
+  ('primitive_type -> SHORT','primitive_type',1,'p_primitive_type','parser.py',1121),
+  ('primitive_type -> INT','primitive_type',1,'p_primitive_type','parser.py',1122),
+  ('primitive_type -> LONG','primitive_type',1,'p_primitive_type','parser.py',1123),
+  ('primitive_type -> CHAR','primitive_type',1,'p_primitive_type','parser.py',1124),
+  ('primitive_type -> FLOAT','primitive_type',1,'p_primitive_type','parser.py',1125),
+  ('primitive_type -> DOUBLE','primitive_type',1,'p_primitive_type','parser.py',1126),
+  ('reference_type -> class_or_interface_type','reference_type',1,'p_reference_type','parser.py',1130),
+  ('reference_type -> array_type','reference_type',1,'p_reference_type','parser.py',1131),
+  ('class_or_interface_type -> class_or_interface','class_or_interface_type',1,'p_class_or_interface_type','parser.py',1135),
+  ('class_or_interface_type -> generic_type','class_or_interface_type',1,'p_class_or_interface_type','parser.py',1136),
+  ('class_type -> class_or_interface_type','class_type',1,'p_class_type','parser.py',1140),
+  ('class_or_interface -> name','class_or_interface',1,'p_class_or_interface','parser.py',1144),
+  ('class_or_interface -> generic_type . name','class_or_interface',3,'p_class_or_interface','parser.py',1145),
+  ('generic_type -> class_or_interface type_arguments','generic_type',2,'p_generic_type','parser.py',1152),
+  ('generic_type -> class_or_interface < >','generic_type',3,'p_generic_type2','parser.py',1157),
+  ('array_type -> primitive_type dims','array_type',2,'p_array_type','parser.py',1172),
+  ('array_type -> name dims','array_type',2,'p_array_type','parser.py',1173),
+  ('array_type -> generic_type dims','array_type',2,'p_array_type2','parser.py',1177),
+  ('array_type -> generic_type . name dims','array_type',4,'p_array_type3','parser.py',1182),
+  ('type_arguments -> < type_argument_list1','type_arguments',2,'p_type_arguments','parser.py',1186),
+  ('type_argument_list1 -> type_argument1','type_argument_list1',1,'p_type_argument_list1','parser.py',1190),
+  ('type_argument_list1 -> type_argument_list , type_argument1','type_argument_list1',3,'p_type_argument_list1','parser.py',1191),
+  ('type_argument_list -> type_argument','type_argument_list',1,'p_type_argument_list','parser.py',1199),
+  ('type_argument_list -> type_argument_list , type_argument','type_argument_list',3,'p_type_argument_list','parser.py',1200),
+  ('type_argument -> reference_type','type_argument',1,'p_type_argument','parser.py',1208),
+  ('type_argument -> wildcard','type_argument',1,'p_type_argument','parser.py',1209),
+  ('type_argument1 -> reference_type1','type_argument1',1,'p_type_argument1','parser.py',1213),
+  ('type_argument1 -> wildcard1','type_argument1',1,'p_type_argument1','parser.py',1214),
+  ('reference_type1 -> reference_type >','reference_type1',2,'p_reference_type1','parser.py',1218),
+  ('reference_type1 -> class_or_interface < type_argument_list2','reference_type1',3,'p_reference_type1','parser.py',1219),
+  ('type_argument_list2 -> type_argument2','type_argument_list2',1,'p_type_argument_list2','parser.py',1227),
+  ('type_argument_list2 -> type_argument_list , type_argument2','type_argument_list2',3,'p_type_argument_list2','parser.py',1228),
+  ('type_argument2 -> reference_type2','type_argument2',1,'p_type_argument2','parser.py',1236),
+  ('type_argument2 -> wildcard2','type_argument2',1,'p_type_argument2','parser.py',1237),
+  ('reference_type2 -> reference_type RSHIFT','reference_type2',2,'p_reference_type2','parser.py',1241),
+  ('reference_type2 -> class_or_interface < type_argument_list3','reference_type2',3,'p_reference_type2','parser.py',1242),
+  ('type_argument_list3 -> type_argument3','type_argument_list3',1,'p_type_argument_list3','parser.py',1250),
+  ('type_argument_list3 -> type_argument_list , type_argument3','type_argument_list3',3,'p_type_argument_list3','parser.py',1251),
+  ('type_argument3 -> reference_type3','type_argument3',1,'p_type_argument3','parser.py',1259),
+  ('type_argument3 -> wildcard3','type_argument3',1,'p_type_argument3','parser.py',1260),
+  ('reference_type3 -> reference_type RRSHIFT','reference_type3',2,'p_reference_type3','parser.py',1264),
+  ('wildcard -> ?','wildcard',1,'p_wildcard','parser.py',1268),
+  ('wildcard -> ? wildcard_bounds','wildcard',2,'p_wildcard','parser.py',1269),
+  ('wildcard_bounds -> EXTENDS reference_type','wildcard_bounds',2,'p_wildcard_bounds','parser.py',1276),
+  ('wildcard_bounds -> SUPER reference_type','wildcard_bounds',2,'p_wildcard_bounds','parser.py',1277),
+  ('wildcard1 -> ? >','wildcard1',2,'p_wildcard1','parser.py',1284),
+  ('wildcard1 -> ? wildcard_bounds1','wildcard1',2,'p_wildcard1','parser.py',1285),
+  ('wildcard_bounds1 -> EXTENDS reference_type1','wildcard_bounds1',2,'p_wildcard_bounds1','parser.py',1292),
+  ('wildcard_bounds1 -> SUPER reference_type1','wildcard_bounds1',2,'p_wildcard_bounds1','parser.py',1293),
+  ('wildcard2 -> ? RSHIFT','wildcard2',2,'p_wildcard2','parser.py',1300),
+  ('wildcard2 -> ? wildcard_bounds2','wildcard2',2,'p_wildcard2','parser.py',1301),
+  ('wildcard_bounds2 -> EXTENDS reference_type2','wildcard_bounds2',2,'p_wildcard_bounds2','parser.py',1308),
+  ('wildcard_bounds2 -> SUPER reference_type2','wildcard_bounds2',2,'p_wildcard_bounds2','parser.py',1309),
+  ('wildcard3 -> ? RRSHIFT','wildcard3',2,'p_wildcard3','parser.py',1316),
+  ('wildcard3 -> ? wildcard_bounds3','wildcard3',2,'p_wildcard3','parser.py',1317),
+  ('wildcard_bounds3 -> EXTENDS reference_type3','wildcard_bounds3',2,'p_wildcard_bounds3','parser.py',1324),
+  ('wildcard_bounds3 -> SUPER reference_type3','wildcard_bounds3',2,'p_wildcard_bounds3','parser.py',1325),
+  ('type_parameter_header -> NAME','type_parameter_header',1,'p_type_parameter_header','parser.py',1332),
+  ('type_parameters -> < type_parameter_list1','type_parameters',2,'p_type_parameters','parser.py',1336),
+  ('type_parameter_list -> type_parameter','type_parameter_list',1,'p_type_parameter_list','parser.py',1340),
+  ('type_parameter_list -> type_parameter_list , type_parameter','type_parameter_list',3,'p_type_parameter_list','parser.py',1341),
+  ('type_parameter -> type_parameter_header','type_parameter',1,'p_type_parameter','parser.py',1349),
+  ('type_parameter -> type_parameter_header EXTENDS reference_type','type_parameter',3,'p_type_parameter','parser.py',1350),
+  ('type_parameter -> type_parameter_header EXTENDS reference_type additional_bound_list','type_parameter',4,'p_type_parameter','parser.py',1351),
+  ('additional_bound_list -> additional_bound','additional_bound_list',1,'p_additional_bound_list','parser.py',1360),
+  ('additional_bound_list -> additional_bound_list additional_bound','additional_bound_list',2,'p_additional_bound_list','parser.py',1361),
+  ('additional_bound -> & reference_type','additional_bound',2,'p_additional_bound','parser.py',1369),
+  ('type_parameter_list1 -> type_parameter1','type_parameter_list1',1,'p_type_parameter_list1','parser.py',1373),
+  ('type_parameter_list1 -> type_parameter_list , type_parameter1','type_parameter_list1',3,'p_type_parameter_list1','parser.py',1374),
+  ('type_parameter1 -> type_parameter_header >','type_parameter1',2,'p_type_parameter1','parser.py',1382),
+  ('type_parameter1 -> type_parameter_header EXTENDS reference_type1','type_parameter1',3,'p_type_parameter1','parser.py',1383),
+  ('type_parameter1 -> type_parameter_header EXTENDS reference_type additional_bound_list1','type_parameter1',4,'p_type_parameter1','parser.py',1384),
+  ('additional_bound_list1 -> additional_bound1','additional_bound_list1',1,'p_additional_bound_list1','parser.py',1393),
+  ('additional_bound_list1 -> additional_bound_list additional_bound1','additional_bound_list1',2,'p_additional_bound_list1','parser.py',1394),
+  ('additional_bound1 -> & reference_type1','additional_bound1',2,'p_additional_bound1','parser.py',1402),
+  ('type_declaration -> class_declaration','type_declaration',1,'p_type_declaration','parser.py',1408),
+  ('type_declaration -> interface_declaration','type_declaration',1,'p_type_declaration','parser.py',1409),
+  ('type_declaration -> enum_declaration','type_declaration',1,'p_type_declaration','parser.py',1410),
+  ('type_declaration -> annotation_type_declaration','type_declaration',1,'p_type_declaration','parser.py',1411),
+  ('type_declaration -> ;','type_declaration',1,'p_type_declaration2','parser.py',1415),
+  ('type_declaration -> error ;','type_declaration',2,'p_type_declaration_error','parser.py',1419),
+  ('type_declaration -> error }','type_declaration',2,'p_type_declaration_error','parser.py',1420),
+  ('class_declaration -> class_header class_body','class_declaration',2,'p_class_declaration','parser.py',1424),
+  ('class_header -> class_header_name class_header_extends_opt class_header_implements_opt','class_header',3,'p_class_header','parser.py',1430),
+  ('class_header_name -> class_header_name1 type_parameters','class_header_name',2,'p_class_header_name','parser.py',1436),
+  ('class_header_name -> class_header_name1','class_header_name',1,'p_class_header_name','parser.py',1437),
+  ('class_header_name1 -> modifiers_opt CLASS NAME','class_header_name1',3,'p_class_header_name1','parser.py',1445),
+  ('class_header_extends_opt -> class_header_extends','class_header_extends_opt',1,'p_class_header_extends_opt','parser.py',1449),
+  ('class_header_extends_opt -> empty','class_header_extends_opt',1,'p_class_header_extends_opt','parser.py',1450),
+  ('class_header_extends -> EXTENDS class_type','class_header_extends',2,'p_class_header_extends','parser.py',1454),
+  ('class_header_implements_opt -> class_header_implements','class_header_implements_opt',1,'p_class_header_implements_opt','parser.py',1458),
+  ('class_header_implements_opt -> empty','class_header_implements_opt',1,'p_class_header_implements_opt','parser.py',1459),
+  ('class_header_implements -> IMPLEMENTS interface_type_list','class_header_implements',2,'p_class_header_implements','parser.py',1463),
+  ('interface_type_list -> interface_type','interface_type_list',1,'p_interface_type_list','parser.py',1467),
+  ('interface_type_list -> interface_type_list , interface_type','interface_type_list',3,'p_interface_type_list','parser.py',1468),
+  ('interface_type -> class_or_interface_type','interface_type',1,'p_interface_type','parser.py',1476),
+  ('class_body -> { class_body_declarations_opt }','class_body',3,'p_class_body','parser.py',1480),
+  ('class_body -> { error }','class_body',3,'p_class_body_error','parser.py',1484),
+  ('class_body -> { class_body_declarations error }','class_body',4,'p_class_body_error','parser.py',1485),
+  ('class_body_declarations_opt -> class_body_declarations','class_body_declarations_opt',1,'p_class_body_declarations_opt','parser.py',1491),
+  ('class_body_declarations_opt -> empty','class_body_declarations_opt',1,'p_class_body_declarations_opt2','parser.py',1495),
+  ('class_body_declarations -> class_body_declaration','class_body_declarations',1,'p_class_body_declarations','parser.py',1499),
+  ('class_body_declarations -> class_body_declarations class_body_declaration','class_body_declarations',2,'p_class_body_declarations','parser.py',1500),
+  ('class_body_declaration -> error ;','class_body_declaration',2,'p_class_body_declaration_error','parser.py',1508),
+  ('class_body_declaration -> class_member_declaration','class_body_declaration',1,'p_class_body_declaration','parser.py',1512),
+  ('class_body_declaration -> static_initializer','class_body_declaration',1,'p_class_body_declaration','parser.py',1513),
+  ('class_body_declaration -> constructor_declaration','class_body_declaration',1,'p_class_body_declaration','parser.py',1514),
+  ('class_body_declaration -> block','class_body_declaration',1,'p_class_body_declaration2','parser.py',1518),
+  ('class_member_declaration -> field_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1522),
+  ('class_member_declaration -> class_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1523),
+  ('class_member_declaration -> method_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1524),
+  ('class_member_declaration -> interface_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1525),
+  ('class_member_declaration -> enum_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1526),
+  ('class_member_declaration -> annotation_type_declaration','class_member_declaration',1,'p_class_member_declaration','parser.py',1527),
+  ('class_member_declaration -> ;','class_member_declaration',1,'p_class_member_declaration2','parser.py',1531),
+  ('field_declaration -> modifiers_opt type variable_declarators ;','field_declaration',4,'p_field_declaration','parser.py',1535),
+  ('static_initializer -> STATIC block','static_initializer',2,'p_static_initializer','parser.py',1539),
+  ('constructor_declaration -> constructor_header method_body','constructor_declaration',2,'p_constructor_declaration','parser.py',1543),
+  ('constructor_header -> constructor_header_name formal_parameter_list_opt ) method_header_throws_clause_opt','constructor_header',4,'p_constructor_header','parser.py',1549),
+  ('constructor_header_name -> modifiers_opt type_parameters NAME (','constructor_header_name',4,'p_constructor_header_name','parser.py',1555),
+  ('constructor_header_name -> modifiers_opt NAME (','constructor_header_name',3,'p_constructor_header_name','parser.py',1556),
+  ('formal_parameter_list_opt -> formal_parameter_list','formal_parameter_list_opt',1,'p_formal_parameter_list_opt','parser.py',1563),
+  ('formal_parameter_list_opt -> empty','formal_parameter_list_opt',1,'p_formal_parameter_list_opt2','parser.py',1567),
+  ('formal_parameter_list -> formal_parameter','formal_parameter_list',1,'p_formal_parameter_list','parser.py',1571),
+  ('formal_parameter_list -> formal_parameter_list , formal_parameter','formal_parameter_list',3,'p_formal_parameter_list','parser.py',1572),
+  ('formal_parameter -> modifiers_opt type variable_declarator_id','formal_parameter',3,'p_formal_parameter','parser.py',1580),
+  ('formal_parameter -> modifiers_opt type ELLIPSIS variable_declarator_id','formal_parameter',4,'p_formal_parameter','parser.py',1581),
+  ('method_header_throws_clause_opt -> method_header_throws_clause','method_header_throws_clause_opt',1,'p_method_header_throws_clause_opt','parser.py',1588),
+  ('method_header_throws_clause_opt -> empty','method_header_throws_clause_opt',1,'p_method_header_throws_clause_opt','parser.py',1589),
+  ('method_header_throws_clause -> THROWS class_type_list','method_header_throws_clause',2,'p_method_header_throws_clause','parser.py',1593),
+  ('class_type_list -> class_type_elt','class_type_list',1,'p_class_type_list','parser.py',1597),
+  ('class_type_list -> class_type_list , class_type_elt','class_type_list',3,'p_class_type_list','parser.py',1598),
+  ('class_type_elt -> class_type','class_type_elt',1,'p_class_type_elt','parser.py',1606),
+  ('method_body -> { block_statements_opt }','method_body',3,'p_method_body','parser.py',1610),
+  ('method_body -> BODY','method_body',1,'p_method_body_lazy','parser.py',1614),
+  ('method_body -> { error }','method_body',3,'p_method_body_error','parser.py',1618),
+  ('method_body -> { block_statements error }','method_body',4,'p_method_body_error','parser.py',1619),
+  ('method_declaration -> abstract_method_declaration','method_declaration',1,'p_method_declaration','parser.py',1625),
+  ('method_declaration -> method_header method_body','method_declaration',2,'p_method_declaration','parser.py',1626),
+  ('abstract_method_declaration -> method_header ;','abstract_method_declaration',2,'p_abstract_method_declaration','parser.py',1636),
+  ('method_header -> method_header_name formal_parameter_list_opt ) method_header_extended_dims method_header_throws_clause_opt','method_header',5,'p_method_header','parser.py',1643),
+  ('method_header_name -> modifiers_opt type_parameters type NAME (','method_header_name',5,'p_method_header_name','parser.py',1650),
+  ('method_header_name -> modifiers_opt type NAME (','method_header_name',4,'p_method_header_name','parser.py',1651),
+  ('method_header_extended_dims -> dims_opt','method_header_extended_dims',1,'p_method_header_extended_dims','parser.py',1658),
+  ('interface_declaration -> interface_header interface_body','interface_declaration',2,'p_interface_declaration','parser.py',1662),
+  ('interface_header -> interface_header_name interface_header_extends_opt','interface_header',2,'p_interface_header','parser.py',1669),
+  ('interface_header_name -> interface_header_name1 type_parameters','interface_header_name',2,'p_interface_header_name','parser.py',1674),
+  ('interface_header_name -> interface_header_name1','interface_header_name',1,'p_interface_header_name','parser.py',1675),
+  ('interface_header_name1 -> modifiers_opt INTERFACE NAME','interface_header_name1',3,'p_interface_header_name1','parser.py',1683),
+  ('interface_header_extends_opt -> interface_header_extends','interface_header_extends_opt',1,'p_interface_header_extends_opt','parser.py',1687),
+  ('interface_header_extends_opt -> empty','interface_header_extends_opt',1,'p_interface_header_extends_opt2','parser.py',1691),
+  ('interface_header_extends -> EXTENDS interface_type_list','interface_header_extends',2,'p_interface_header_extends','parser.py',1695),
+  ('interface_body -> { interface_member_declarations_opt }','interface_body',3,'p_interface_body','parser.py',1699),
+  ('interface_body -> { error }','interface_body',3,'p_interface_body_error','parser.py',1703),
+  ('interface_body -> { interface_member_declarations error }','interface_body',4,'p_interface_body_error','parser.py',1704),
+  ('interface_member_declaration -> error ;','interface_member_declaration',2,'p_interface_member_declaration_error','parser.py',1710),
+  ('interface_member_declarations_opt -> interface_member_declarations','interface_member_declarations_opt',1,'p_interface_member_declarations_opt','parser.py',1714),
+  ('interface_member_declarations_opt -> empty','interface_member_declarations_opt',1,'p_interface_member_declarations_opt2','parser.py',1718),
+  ('interface_member_declarations -> interface_member_declaration','interface_member_declarations',1,'p_interface_member_declarations','parser.py',1722),
+  ('interface_member_declarations -> interface_member_declarations interface_member_declaration','interface_member_declarations',2,'p_interface_member_declarations','parser.py',1723),
+  ('interface_member_declaration -> constant_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1731),
+  ('interface_member_declaration -> abstract_method_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1732),
+  ('interface_member_declaration -> class_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1733),
+  ('interface_member_declaration -> interface_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1734),
+  ('interface_member_declaration -> enum_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1735),
+  ('interface_member_declaration -> annotation_type_declaration','interface_member_declaration',1,'p_interface_member_declaration','parser.py',1736),
+  ('interface_member_declaration -> ;','interface_member_declaration',1,'p_interface_member_declaration2','parser.py',1740),
+  ('constant_declaration -> field_declaration','constant_declaration',1,'p_constant_declaration','parser.py',1744),
+  ('enum_declaration -> enum_header enum_body','enum_declaration',2,'p_enum_declaration','parser.py',1748),
+  ('enum_header -> enum_header_name class_header_implements_opt','enum_header',2,'p_enum_header','parser.py',1754),
+  ('enum_header_name -> modifiers_opt ENUM NAME','enum_header_name',3,'p_enum_header_name','parser.py',1759),
+  ('enum_header_name -> modifiers_opt ENUM NAME type_parameters','enum_header_name',4,'p_enum_header_name','parser.py',1760),
+  ('enum_body -> { enum_body_declarations_opt }','enum_body',3,'p_enum_body','parser.py',1767),
+  ('enum_body -> { , enum_body_declarations_opt }','enum_body',4,'p_enum_body2','parser.py',1771),
+  ('enum_body -> { enum_constants , enum_body_declarations_opt }','enum_body',5,'p_enum_body3','parser.py',1775),
+  ('enum_body -> { enum_constants enum_body_declarations_opt }','enum_body',4,'p_enum_body4','parser.py',1779),
+  ('enum_constants -> enum_constant','enum_constants',1,'p_enum_constants','parser.py',1783),
+  ('enum_constants -> enum_constants , enum_constant','enum_constants',3,'p_enum_constants','parser.py',1784),
+  ('enum_constant -> enum_constant_header class_body','enum_constant',2,'p_enum_constant','parser.py',1792),
+  ('enum_constant -> enum_constant_header','enum_constant',1,'p_enum_constant','parser.py',1793),
+  ('enum_constant_header -> enum_constant_header_name arguments_opt','enum_constant_header',2,'p_enum_constant_header','parser.py',1800),
+  ('enum_constant_header_name -> modifiers_opt NAME','enum_constant_header_name',2,'p_enum_constant_header_name','parser.py',1805),
+  ('arguments_opt -> arguments','arguments_opt',1,'p_arguments_opt','parser.py',1809),
+  ('arguments_opt -> empty','arguments_opt',1,'p_arguments_opt2','parser.py',1813),
+  ('arguments -> ( argument_list_opt )','arguments',3,'p_arguments','parser.py',1817),
+  ('argument_list_opt -> argument_list','argument_list_opt',1,'p_argument_list_opt','parser.py',1821),
+  ('argument_list_opt -> empty','argument_list_opt',1,'p_argument_list_opt2','parser.py',1825),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',1829),
+  ('argument_list -> argument_list , expression','argument_list',3,'p_argument_list','parser.py',1830),
+  ('enum_body_declarations_opt -> enum_declarations','enum_body_declarations_opt',1,'p_enum_body_declarations_opt','parser.py',1838),
+  ('enum_body_declarations_opt -> empty','enum_body_declarations_opt',1,'p_enum_body_declarations_opt2','parser.py',1842),
+  ('enum_declarations -> ; class_body_declarations_opt','enum_declarations',2,'p_enum_body_declarations','parser.py',1846),
+  ('annotation_type_declaration -> annotation_type_declaration_header annotation_type_body','annotation_type_declaration',2,'p_annotation_type_declaration','parser.py',1850),
+  ('annotation_type_declaration_header -> annotation_type_declaration_header_name class_header_extends_opt class_header_implements_opt','annotation_type_declaration_header',3,'p_annotation_type_declaration_header','parser.py',1857),
+  ('annotation_type_declaration_header_name -> modifiers @ INTERFACE NAME','annotation_type_declaration_header_name',4,'p_annotation_type_declaration_header_name','parser.py',1863),
+  ('annotation_type_declaration_header_name -> modifiers @ INTERFACE NAME type_parameters','annotation_type_declaration_header_name',5,'p_annotation_type_declaration_header_name2','parser.py',1867),
+  ('annotation_type_declaration_header_name -> @ INTERFACE NAME type_parameters','annotation_type_declaration_header_name',4,'p_annotation_type_declaration_header_name3','parser.py',1871),
+  ('annotation_type_declaration_header_name -> @ INTERFACE NAME','annotation_type_declaration_header_name',3,'p_annotation_type_declaration_header_name4','parser.py',1875),
+  ('annotation_type_body -> { annotation_type_member_declarations_opt }','annotation_type_body',3,'p_annotation_type_body','parser.py',1879),
+  ('annotation_type_member_declarations_opt -> annotation_type_member_declarations','annotation_type_member_declarations_opt',1,'p_annotation_type_member_declarations_opt','parser.py',1883),
+  ('annotation_type_member_declarations_opt -> empty','annotation_type_member_declarations_opt',1,'p_annotation_type_member_declarations_opt2','parser.py',1887),
+  ('annotation_type_member_declarations -> annotation_type_member_declaration','annotation_type_member_declarations',1,'p_annotation_type_member_declarations','parser.py',1891),
+  ('annotation_type_member_declarations -> annotation_type_member_declarations annotation_type_member_declaration','annotation_type_member_declarations',2,'p_annotation_type_member_declarations','parser.py',1892),
+  ('annotation_type_member_declaration -> annotation_method_header ;','annotation_type_member_declaration',2,'p_annotation_type_member_declaration','parser.py',1900),
+  ('annotation_type_member_declaration -> constant_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1901),
+  ('annotation_type_member_declaration -> constructor_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1902),
+  ('annotation_type_member_declaration -> type_declaration','annotation_type_member_declaration',1,'p_annotation_type_member_declaration','parser.py',1903),
+  ('annotation_method_header -> annotation_method_header_name formal_parameter_list_opt ) method_header_extended_dims annotation_method_header_default_value_opt','annotation_method_header',5,'p_annotation_method_header','parser.py',1907),
+  ('annotation_method_header_name -> modifiers_opt type_parameters type NAME (','annotation_method_header_name',5,'p_annotation_method_header_name','parser.py',1914),
+  ('annotation_method_header_name -> modifiers_opt type NAME (','annotation_method_header_name',4,'p_annotation_method_header_name','parser.py',1915),
+  ('annotation_method_header_default_value_opt -> default_value','annotation_method_header_default_value_opt',1,'p_annotation_method_header_default_value_opt','parser.py',1922),
+  ('annotation_method_header_default_value_opt -> empty','annotation_method_header_default_value_opt',1,'p_annotation_method_header_default_value_opt','parser.py',1923),
+  ('default_value -> DEFAULT member_value','default_value',2,'p_default_value','parser.py',1927),
+  ('member_value -> conditional_expression_not_name','member_value',1,'p_member_value','parser.py',1931),
+  ('member_value -> name','member_value',1,'p_member_value','parser.py',1932),
+  ('member_value -> annotation','member_value',1,'p_member_value','parser.py',1933),
+  ('member_value -> member_value_array_initializer','member_value',1,'p_member_value','parser.py',1934),
+  ('member_value_array_initializer -> { member_values , }','member_value_array_initializer',4,'p_member_value_array_initializer','parser.py',1938),
+  ('member_value_array_initializer -> { member_values }','member_value_array_initializer',3,'p_member_value_array_initializer','parser.py',1939),
+  ('member_value_array_initializer -> { , }','member_value_array_initializer',3,'p_member_value_array_initializer2','parser.py',1943),
+  ('member_value_array_initializer -> { }','member_value_array_initializer',2,'p_member_value_array_initializer2','parser.py',1944),
+  ('member_values -> member_value','member_values',1,'p_member_values','parser.py',1948),
+  ('member_values -> member_values , member_value','member_values',3,'p_member_values','parser.py',1949),
+  ('annotation -> normal_annotation','annotation',1,'p_annotation','parser.py',1957),
+  ('annotation -> marker_annotation','annotation',1,'p_annotation','parser.py',1958),
+  ('annotation -> single_member_annotation','annotation',1,'p_annotation','parser.py',1959),
+  ('normal_annotation -> annotation_name ( member_value_pairs_opt )','normal_annotation',4,'p_normal_annotation','parser.py',1963),
+  ('annotation_name -> @ name','annotation_name',2,'p_annotation_name','parser.py',1967),
+  ('member_value_pairs_opt -> member_value_pairs','member_value_pairs_opt',1,'p_member_value_pairs_opt','parser.py',1971),
+  ('member_value_pairs_opt -> empty','member_value_pairs_opt',1,'p_member_value_pairs_opt2','parser.py',1975),
+  ('member_value_pairs -> member_value_pair','member_value_pairs',1,'p_member_value_pairs','parser.py',1979),
+  ('member_value_pairs -> member_value_pairs , member_value_pair','member_value_pairs',3,'p_member_value_pairs','parser.py',1980),
+  ('member_value_pair -> simple_name = member_value','member_value_pair',3,'p_member_value_pair','parser.py',1988),
+  ('marker_annotation -> annotation_name','marker_annotation',1,'p_marker_annotation','parser.py',1992),
+  ('single_member_annotation -> annotation_name ( single_member_annotation_member_value )','single_member_annotation',4,'p_single_member_annotation','parser.py',1996),
+  ('single_member_annotation_member_value -> member_value','single_member_annotation_member_value',1,'p_single_member_annotation_member_value','parser.py',2000),
+  ('compilation_unit -> package_declaration','compilation_unit',1,'p_compilation_unit','parser.py',2006),
+  ('compilation_unit -> package_declaration import_declarations','compilation_unit',2,'p_compilation_unit2','parser.py',2010),
+  ('compilation_unit -> package_declaration import_declarations type_declarations','compilation_unit',3,'p_compilation_unit3','parser.py',2014),
+  ('compilation_unit -> package_declaration type_declarations','compilation_unit',2,'p_compilation_unit4','parser.py',2018),
+  ('compilation_unit -> import_declarations','compilation_unit',1,'p_compilation_unit5','parser.py',2022),
+  ('compilation_unit -> type_declarations','compilation_unit',1,'p_compilation_unit6','parser.py',2026),
+  ('compilation_unit -> import_declarations type_declarations','compilation_unit',2,'p_compilation_unit7','parser.py',2030),
+  ('compilation_unit -> empty','compilation_unit',1,'p_compilation_unit8','parser.py',2034),
+  ('package_declaration -> package_declaration_name ;','package_declaration',2,'p_package_declaration','parser.py',2038),
+  ('package_declaration_name -> modifiers PACKAGE name','package_declaration_name',3,'p_package_declaration_name','parser.py',2045),
+  ('package_declaration_name -> PACKAGE name','package_declaration_name',2,'p_package_declaration_name','parser.py',2046),
+  ('import_declarations -> import_declaration','import_declarations',1,'p_import_declarations','parser.py',2053),
+  ('import_declarations -> import_declarations import_declaration','import_declarations',2,'p_import_declarations','parser.py',2054),
+  ('import_declaration -> single_type_import_declaration','import_declaration',1,'p_import_declaration','parser.py',2062),
+  ('import_declaration -> type_import_on_demand_declaration','import_declaration',1,'p_import_declaration','parser.py',2063),
+  ('import_declaration -> single_static_import_declaration','import_declaration',1,'p_import_declaration','parser.py',2064),
+  ('import_declaration -> static_import_on_demand_declaration','import_declaration',1,'p_import_declaration','parser.py',2065),
+  ('single_type_import_declaration -> IMPORT name ;','single_type_import_declaration',3,'p_single_type_import_declaration','parser.py',2069),
+  ('type_import_on_demand_declaration -> IMPORT name . * ;','type_import_on_demand_declaration',5,'p_type_import_on_demand_declaration','parser.py',2073),
+  ('single_static_import_declaration -> IMPORT STATIC name ;','single_static_import_declaration',4,'p_single_static_import_declaration','parser.py',2077),
+  ('static_import_on_demand_declaration -> IMPORT STATIC name . * ;','static_import_on_demand_declaration',6,'p_static_import_on_demand_declaration','parser.py',2081),
+  ('type_declarations -> type_declaration','type_declarations',1,'p_type_declarations','parser.py',2085),
+  ('type_declarations -> type_declarations type_declaration','type_declarations',2,'p_type_declarations','parser.py',2086),
+  ('goal -> PLUSPLUS compilation_unit','goal',2,'p_goal_compilation_unit','parser.py',2098),
+  ('goal -> MINUSMINUS expression','goal',2,'p_goal_expression','parser.py',2102),
+  ('goal -> * block_statement','goal',2,'p_goal_statement','parser.py',2106),
+  ('goal -> ~ class_body_declaration','goal',2,'p_goal_class_member','parser.py',2110),
+  ('goal -> ! interface_member_declaration','goal',2,'p_goal_interface_member','parser.py',2114),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',2124),
+]
+_plyj_grammar_hash = 'ebf9c79255e64cd1b8f0188a44dc82690b7f93ba'
@@ -0,0 +1,244 @@
+'''
+A hand-written scanner that can stand in for the PLY lexer built from
+MyLexer.
+
+PLY tries one big alternation of all token rules at every position, and the
+block comment rule backtracks over every character of a comment. The scanner
+instead looks at the first character of a token to decide what it can be and
+then finds its end directly. It produces exactly the tokens MyLexer does,
+including its quirks.
+'''
+
+import copy
+import re
+
+import ply.lex as lex
+
+from .diagnostics import LEXICAL, report
+from .model import Comments
+from .parser import MyLexer
+
+_NAME, _NUMBER, _DOT, _CHAR, _STRING, _SLASH, _OPERATOR, _SPACE, _NEWLINE, \
+    _CARRIAGE_RETURN = range(10)
+
+_dispatch = {}
+for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_$':
+    _dispatch[c] = _NAME
+for c in '0123456789':
+    _dispatch[c] = _NUMBER
+_dispatch.update({'.': _DOT, "'": _CHAR, '"': _STRING, '/': _SLASH,
+                  ' ': _SPACE, '\t': _SPACE, '\f': _SPACE,
+                  '\n': _NEWLINE, '\r': _CARRIAGE_RETURN})
+
+# operators by their first character, longest first
+_operators = {}
+for text, type in [('||', 'OR'), ('&&', 'AND'), ('==', 'EQ'), ('!=', 'NEQ'),
+                   ('>=', 'GTEQ'), ('<=', 'LTEQ'), ('<<', 'LSHIFT'),
+                   ('>>', 'RSHIFT'), ('>>>', 'RRSHIFT'), ('*=', 'TIMES_ASSIGN'),
+                   ('%=', 'REMAINDER_ASSIGN'), ('+=', 'PLUS_ASSIGN'),
+                   ('-=', 'MINUS_ASSIGN'), ('<<=', 'LSHIFT_ASSIGN'),
+                   ('>>=', 'RSHIFT_ASSIGN'), ('>>>=', 'RRSHIFT_ASSIGN'),
+                   ('&=', 'AND_ASSIGN'), ('|=', 'OR_ASSIGN'),
+                   ('^=', 'XOR_ASSIGN'), ('++', 'PLUSPLUS'),
+                   ('--', 'MINUSMINUS')] + [(c, c) for c in MyLexer.literals]:
+    _operators.setdefault(text[0], []).append((text, type))
+for c, candidates in _operators.items():
+    candidates.sort(key=lambda candidate: -len(candidate[0]))
+    if c not in _dispatch:
+        _dispatch[c] = _OPERATOR
+
+_digits = frozenset('0123456789')
+_name_rest = re.compile('[A-Za-z0-9_$]*')
+_number_rest = re.compile('[0-9eE_lLdDa-fA-F.xXpP]*')
+_spaces = re.compile('[ \t\f]*')
+_newlines = re.compile('\n*')
+_crlfs = re.compile('(?:\r\n)*')
+_line_end = re.compile('[^\n]*')
+
+def scan(source, offset=0, lineno=1, error=None, comments=None):
+    '''
+    Yield the tokens of source starting at offset as (type, start, end,
+    lineno) tuples, where start and end are offsets into source. Characters
+    that do not start a token are skipped; if error is given it is called
+    with source, offset and line number for each of them. If comments is a
+    list, the comments are appended to it like MyLexer does.
+    '''
+    if error is None:
+        error = _ignore
+    dispatch = _dispatch
+    keywords = MyLexer.keyword_types
+    operators = _operators
+    name_rest = _name_rest.match
+    number_rest = _number_rest.match
+    spaces = _spaces.match
+    end_of_source = len(source)
+    i = offset
+    while i < end_of_source:
+        c = source[i]
+        kind = dispatch.get(c)
+        if kind is _NAME:
+            end = name_rest(source, i + 1).end()
+            yield keywords.get(source[i:end], 'NAME'), i, end, lineno
+            i = end
+        elif kind is _SPACE:
+            i = spaces(source, i + 1).end()
+        elif kind is _OPERATOR:
+            for text, type in operators[c]:
+                if source.startswith(text, i):
+                    end = i + len(text)
+                    yield type, i, end, lineno
+                    i = end
+                    break
+        elif kind is _NEWLINE:
+            end = _newlines.match(source, i + 1).end()
+            lineno += end - i
+            i = end
+        elif kind is _NUMBER:
+            end = number_rest(source, i + 1).end()
+            yield 'NUM', i, end, lineno
+            i = end
+        elif kind is _DOT:
+            if source[i + 1:i + 2] in _digits:
+                end = number_rest(source, i + 2).end()
+                yield 'NUM', i, end, lineno
+            elif source.startswith('...', i):
+                end = i + 3
+                yield 'ELLIPSIS', i, end, lineno
+            else:
+                end = i + 1
+                yield '.', i, end, lineno
+            i = end
+        elif kind is _SLASH:
+            close = source.find('*/', i + 2) if source.startswith('/*', i) else -1
+            if close >= 0:
+                end = close + 2
+                lineno += source.count('\n', i, end)
+                if comments is not None:
+                    if source.startswith('/**', i) and end - i > 4:
+                        comments.extend((i, end - i, Comments.JAVADOC))
+                    else:
+                        comments.extend((i, end - i, Comments.BLOCK))
+            elif source.startswith('//', i):
+                end = _line_end.match(source, i).end()
+                if comments is not None:
+                    comments.extend((i, end - i, Comments.LINE))
+            elif source.startswith('/=', i):
+                end = i + 2
+                yield 'DIVIDE_ASSIGN', i, end, lineno
+            else:
+                end = i + 1
+                yield '/', i, end, lineno
+            i = end
+        elif kind is _CHAR or kind is _STRING:
+            end = _quoted_end(source, i, c)
+            if end is None:
+                error(source, i, lineno)
+                i += 1
+            else:
+                yield 'CHAR_LITERAL' if kind is _CHAR else 'STRING_LITERAL', i, end, lineno
+                i = end
+        elif kind is _CARRIAGE_RETURN and source.startswith('\r\n', i):
+            end = _crlfs.match(source, i).end()
+            lineno += (end - i) // 2
+            i = end
+        else:
+            error(source, i, lineno)
+            i += 1
+
+def _ignore(source, offset, lineno):
+    pass
+
+def _quoted_end(source, start, quote):
+    # the end of a character or string literal that starts at start, None if
+    # it is not terminated on the same line
+    i = start + 1
+    end_of_source = len(source)
+    while i < end_of_source:
+        c = source[i]
+        if c == quote:
+            return i + 1
+        if c == '\\':
+            if source[i + 1:i + 2] in ('', '\n'):
+                return None
+            i += 2
+        elif c == '\n':
+            return None
+        else:
+            i += 1
+    return None
+
+class Token(object):
+    '''
+    A token as yielded by Parser.tokens(). start and end are offsets into the
+    source, its text is only sliced from the source when value is read.
+    '''
+
+    __slots__ = ('type', 'start', 'end', 'lineno', '_source')
+
+    def __init__(self, type, start, end, lineno, source):
+        self.type = type
+        self.start = start
+        self.end = end
+        self.lineno = lineno
+        self._source = source
+
+    @property
+    def value(self):
+        return self._source[self.start:self.end]
+
+    def __repr__(self):
+        return 'Token({}, {}, {}, {})'.format(self.type, self.start, self.end, self.lineno)
+
+class Scanner(object):
+    '''
+    Provides the interface of a PLY lexer on top of scan() so that it can be
+    passed to the parser. Use Parser(scanner=True) to parse with it.
+    '''
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.source_start = 0
+        self.line_index = None
+        self.comments = None
+        self.diagnostics = None
+        self.raise_errors = False
+        self.parser = None
+        self._tokens = iter(())
+
+    def clone(self):
+        return copy.copy(self)
+
+    def input(self, source):
+        self.lexdata = source
+        self.lexpos = 0
+        self._tokens = scan(source, 0, self.lineno, self._error, self.comments)
+
+    def _error(self, source, offset, lineno):
+        c = source[offset]
+        report(self, "illegal character '{}' ({})".format(c, hex(ord(c))), offset, lineno,
+               LEXICAL, c)
+
+    def token(self):
+        for type, start, end, lineno in self._tokens:
+            token = lex.LexToken()
+            token.type = type
+            token.value = self.lexdata[start:end]
+            token.lineno = lineno
+            token.lexpos = start
+            self.lexpos = end
+            self.lineno = lineno
+            return token
+        return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        token = self.token()
+        if token is None:
+            raise StopIteration
+        return token
+
+    next = __next__
@@ -0,0 +1,538 @@
+'''
+A store of many parsed compilation units in one file that is read through
+mmap, so a whole code base can be queried without loading its trees.
+
+Every element of a tree, and every value in the fields of an element, is a
+node. The nodes of all trees are numbered in prefix order and described by
+columns of integers, one entry per node:
+
+* kinds: the class of an element (an index into the class table plus
+  ELEMENT) or LIST, STRING, INT, NONE, FALSE or TRUE
+* parents, first_children and next_siblings: the indexes of related nodes,
+  -1 if there is none. The children of an element are the values of its
+  fields in the order of _fields, followed by the label of statements; the
+  children of a list are its items
+* starts and ends: the position of an element in its source, -1 if it has
+  none
+* values: the index of a string in the string table or the value of a number
+
+StoreWriter writes a store and Store opens one. Store hands out Cursors,
+which stand for a node and have the fields of the element it is, so they
+can be used much like the elements of plyj.model. Comments and diagnostics
+are not stored.
+'''
+
+import array
+import bisect
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import zlib
+
+from .model import LineIndex, SourceElement
+from . import model
+
+MAGIC = b'plyjstor'
+VERSION = 2
+
+LIST, STRING, INT, NONE, FALSE, TRUE, ELEMENT = range(7)
+
+_COLUMNS = ('kinds', 'parents', 'first_children', 'next_siblings', 'starts', 'ends', 'values')
+
+# magic, version, byte order, then the offset and length of each section:
+# the columns, line_starts, files, classes, string_offsets and string_data
+_SECTIONS = _COLUMNS + ('line_starts', 'files', 'classes', 'string_offsets', 'string_data')
+_header = struct.Struct('<8sII' + 'QQ' * len(_SECTIONS))
+
+# name, root node, offset into line_starts, number of lines, first line
+_FILE_ENTRY = 5
+
+_layouts = {}
+
+def _layout(cls):
+    # the names of the children of an element of class cls
+    layout = _layouts.get(cls)
+    if layout is None:
+        layout = tuple(cls._fields)
+        # Break and Continue have a label field instead
+        if hasattr(cls, 'label') and 'label' not in cls._fields:
+            layout += ('label',)
+        _layouts[cls] = layout
+    return layout
+
+def _checksum(cls):
+    return zlib.crc32(' '.join(_layout(cls)).encode('utf-8')) & 0x7fffffff
+
+def write_store(path, units):
+    '''
+    Write a store of units, which are (name, compilation_unit) pairs such as
+    those plyj.archive.parse_archive() yields, to path. Pairs without a
+    compilation unit are left out.
+    '''
+    with StoreWriter(path) as writer:
+        for name, unit in units:
+            if unit is not None:
+                writer.add(name, unit)
+
+class StoreWriter(object):
+    '''
+    Writes a store to path. Trees are added one at a time with add() and
+    written to temporary files next to path right away, so only the strings
+    are kept in memory; close() puts the store together.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        self._columns = [tempfile.TemporaryFile(dir=directory) for _ in _COLUMNS]
+        self._nodes = 0
+        self._line_starts = tempfile.TemporaryFile(dir=directory)
+        self._lines = 0
+        self._files = array.array('i')
+        self._classes = {}
+        self._strings = {}
+
+    def add(self, name, tree):
+        '''Add tree, usually a CompilationUnit, under name.'''
+        base = self._nodes
+        kinds = array.array('i')
+        parents = array.array('i')
+        first_children = array.array('i')
+        next_siblings = array.array('i')
+        starts = array.array('i')
+        ends = array.array('i')
+        values = array.array('i')
+        # the last child so far of every node
+        last_children = []
+        lines = None
+        stack = [(tree, -1)]
+        pop = stack.pop
+        while stack:
+            value, parent = pop()
+            index = len(kinds)
+            start = end = -1
+            number = 0
+            children = ()
+            if isinstance(value, SourceElement):
+                cls = value.__class__
+                tag = self._classes.get(cls)
+                if tag is None:
+                    tag = self._classes[cls] = len(self._classes)
+                kind = ELEMENT + tag
+                if value._start is not None:
+                    start, end = value._start, value._end
+                    if lines is None:
+                        lines = value._lines
+                children = [getattr(value, slot, None) for slot in _layout(cls)]
+            elif isinstance(value, list):
+                kind = LIST
+                children = value
+            elif value is None:
+                kind = NONE
+            elif value is True:
+                kind = TRUE
+            elif value is False:
+                kind = FALSE
+            elif isinstance(value, int):
+                kind = INT
+                number = value
+            elif isinstance(value, str):
+                kind = STRING
+                number = self._string(value)
+            else:
+                raise TypeError('can not store {!r}'.format(value))
+            kinds.append(kind)
+            parents.append(base + parent if parent >= 0 else -1)
+            first_children.append(-1)
+            next_siblings.append(-1)
+            starts.append(start)
+            ends.append(end)
+            values.append(number)
+            last_children.append(-1)
+            if parent >= 0:
+                previous = last_children[parent]
+                if previous < 0:
+                    first_children[parent] = base + index
+                else:
+                    next_siblings[previous] = base + index
+                last_children[parent] = index
+            for child in reversed(children):
+                stack.append((child, index))
+        for column, entries in zip(self._columns, (kinds, parents, first_children, next_siblings,
+                                                   starts, ends, values)):
+            entries.tofile(column)
+        first_line, line_starts = lines.__getstate__() if lines is not None else (1, [0])
+        array.array('i', line_starts).tofile(self._line_starts)
+        self._files.extend([self._string(name), base, self._lines, len(line_starts), first_line])
+        self._nodes += len(kinds)
+        self._lines += len(line_starts)
+
+    def close(self):
+        '''Write the store to path.'''
+        classes = array.array('i')
+        for cls in sorted(self._classes, key=self._classes.get):
+            classes.extend([self._string(cls.__name__), _checksum(cls)])
+        strings = sorted(self._strings, key=self._strings.get)
+        encoded = [string.encode('utf-8', 'surrogatepass') for string in strings]
+        string_offsets = array.array('q', [0])
+        for data in encoded:
+            string_offsets.append(string_offsets[-1] + len(data))
+        string_data = b''.join(encoded)
+
+        sections = [(column, self._nodes * 4) for column in self._columns]
+        sections.append((self._line_starts, self._lines * 4))
+        sections.extend([(self._files, None), (classes, None), (string_offsets, None),
+                         (string_data, None)])
+        layout = []
+        offset = _header.size
+        for content, length in sections:
+            if length is None:
+                length = len(content) * content.itemsize if isinstance(content, array.array) \
+                    else len(content)
+            # aligned, the columns are read as arrays of integers
+            offset += -offset % 8
+            layout.extend([offset, length])
+            offset += length
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_header.pack(MAGIC, VERSION, sys.byteorder == 'little', *layout))
+            for (content, _), position in zip(sections, layout[::2]):
+                f.write(b'\0' * (position - f.tell()))
+                if isinstance(content, array.array):
+                    content.tofile(f)
+                elif isinstance(content, bytes):
+                    f.write(content)
+                else:
+                    content.seek(0)
+                    shutil.copyfileobj(content, f)
+        os.rename(tmp, self.path)
+        self._discard()
+
+    def _discard(self):
+        for column in self._columns + [self._line_starts]:
+            column.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def _string(self, string):
+        index = self._strings.get(string)
+        if index is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+class Store(object):
+    '''
+    A store written by StoreWriter, opened read only. The file is mapped
+    into memory and nothing is read before it is looked at.
+
+    len(store) is the number of compilation units and store.names() their
+    names. store[name] or store[index] is the Cursor of a compilation unit.
+    '''
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can not be mapped
+            self._file.close()
+            raise ValueError('not a store: {}'.format(path))
+        if len(self._map) < _header.size:
+            self.close()
+            raise ValueError('not a store: {}'.format(path))
+        header = _header.unpack_from(self._map)
+        magic, version, little_endian = header[:3]
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('not a store of this version: {}'.format(path))
+        if little_endian != (sys.byteorder == 'little'):
+            self.close()
+            raise ValueError('store written on a machine with another byte order')
+        view = memoryview(self._map)
+        self._kinds_at = header[3]
+        self._views = []
+        for name, offset, length in zip(_SECTIONS, header[3::2], header[4::2]):
+            section = view[offset:offset + length]
+            if name == 'string_offsets':
+                section = section.cast('q')
+            elif name != 'string_data':
+                section = section.cast('i')
+            setattr(self, name, section)
+            self._views.append(section)
+        self._views.append(view)
+        self._string_cache = {}
+        self._classes = []
+        for index in range(0, len(self.classes), 2):
+            name = self.string(self.classes[index])
+            cls = getattr(model, name, None)
+            if not (isinstance(cls, type) and issubclass(cls, SourceElement)):
+                self.close()
+                raise ValueError('unknown element class {}'.format(name))
+            if self.classes[index + 1] != _checksum(cls):
+                self.close()
+                raise ValueError('{} has different fields now'.format(name))
+            self._classes.append(cls)
+        self._roots = [self.files[index + 1] for index in range(0, len(self.files), _FILE_ENTRY)]
+        self._names = None
+        self._line_indexes = {}
+
+    def close(self):
+        for view in getattr(self, '_views', ()):
+            view.release()
+        self._views = []
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._roots)
+
+    def names(self):
+        '''Return the names of the compilation units in the order they were added.'''
+        return [self.string(self.files[index])
+                for index in range(0, len(self.files), _FILE_ENTRY)]
+
+    def __getitem__(self, key):
+        if not isinstance(key, int):
+            if self._names is None:
+                self._names = dict((name, index) for index, name in enumerate(self.names()))
+            key = self._names[key]
+        return Cursor(self, self._roots[key])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def find(self, class_name):
+        '''Yield the Cursors of all elements of the class named class_name.'''
+        tags = [tag for tag, cls in enumerate(self._classes) if cls.__name__ == class_name]
+        if not tags:
+            return
+        # searched for in the mapped file, which is much faster than looking
+        # at every entry of kinds
+        pattern = array.array('i', [ELEMENT + tags[0]]).tobytes()
+        start = self._kinds_at
+        end = start + len(self.kinds) * 4
+        position = self._map.find(pattern, start, end)
+        while position >= 0:
+            offset = position - start
+            if offset % 4 == 0:
+                yield Cursor(self, offset // 4)
+                position = self._map.find(pattern, position + 4, end)
+            else:
+                position = self._map.find(pattern, position + 1, end)
+
+    def string(self, index):
+        '''Return the string at index in the string table.'''
+        string = self._string_cache.get(index)
+        if string is None:
+            data = self.string_data[self.string_offsets[index]:self.string_offsets[index + 1]]
+            string = self._string_cache[index] = data.tobytes().decode('utf-8', 'surrogatepass')
+        return string
+
+    def _file_of(self, node):
+        # the number of the compilation unit node belongs to
+        return bisect.bisect_right(self._roots, node) - 1
+
+    def _lines(self, node):
+        # the LineIndex of the source of node
+        number = self._file_of(node)
+        lines = self._line_indexes.get(number)
+        if lines is None:
+            entry = number * _FILE_ENTRY
+            offset, count, first_line = self.files[entry + 2:entry + 5]
+            lines = LineIndex.__new__(LineIndex)
+            lines.__setstate__((first_line, self.line_starts[offset:offset + count].tolist()))
+            self._line_indexes[number] = lines
+        return lines
+
+    def _value(self, node):
+        # the value node stands for, elements as Cursors
+        kind = self.kinds[node]
+        if kind >= ELEMENT:
+            return Cursor(self, node)
+        if kind == STRING:
+            return self.string(self.values[node])
+        if kind == LIST:
+            return [self._value(child) for child in self._children(node)]
+        if kind == INT:
+            return self.values[node]
+        return _constants[kind]
+
+    def _children(self, node):
+        child = self.first_children[node]
+        next_siblings = self.next_siblings
+        while child >= 0:
+            yield child
+            child = next_siblings[child]
+
+_constants = {NONE: None, FALSE: False, TRUE: True}
+
+class Cursor(object):
+    '''
+    An element in a Store. The fields of the element are attributes of its
+    cursor, with elements as Cursors and lists as lists. load() turns it
+    into the element itself.
+    '''
+
+    __slots__ = ('store', 'node')
+
+    def __init__(self, store, node):
+        self.store = store
+        self.node = node
+
+    @property
+    def element_class(self):
+        return self.store._classes[self.store.kinds[self.node] - ELEMENT]
+
+    @property
+    def kind(self):
+        '''The name of the class of the element.'''
+        return self.element_class.__name__
+
+    @property
+    def parent(self):
+        '''The Cursor of the element this one is part of, None for compilation units.'''
+        store = self.store
+        node = store.parents[self.node]
+        while node >= 0 and store.kinds[node] < ELEMENT:
+            node = store.parents[node]
+        return Cursor(store, node) if node >= 0 else None
+
+    @property
+    def file(self):
+        '''The name the compilation unit of the element was added under.'''
+        store = self.store
+        return store.string(store.files[store._file_of(self.node) * _FILE_ENTRY])
+
+    @property
+    def start(self):
+        start = self.store.starts[self.node]
+        return start if start >= 0 else None
+
+    @property
+    def end(self):
+        end = self.store.ends[self.node]
+        return end if end >= 0 else None
+
+    @property
+    def lineno(self):
+        return self._position(self.start)[0]
+
+    @property
+    def col_offset(self):
+        return self._position(self.start)[1]
+
+    @property
+    def end_lineno(self):
+        return self._position(self.end)[0]
+
+    @property
+    def end_col_offset(self):
+        return self._position(self.end)[1]
+
+    def _position(self, offset):
+        if offset is None:
+            return None, None
+        return self.store._lines(self.node).position(offset)
+
+    def __getattr__(self, name):
+        layout = _layout(self.element_class)
+        if name not in layout:
+            raise AttributeError('{} has no field {}'.format(self.kind, name))
+        store = self.store
+        child = store.first_children[self.node]
+        for _ in range(layout.index(name)):
+            child = store.next_siblings[child]
+        if name == 'label' and store.kinds[child] == NONE \
+                and 'label' not in self.element_class._fields:
+            raise AttributeError('{} has no label'.format(self.kind))
+        return store._value(child)
+
+    def walk(self):
+        '''Yield the Cursors of this element and of all elements below it in prefix order.'''
+        store = self.store
+        kinds = store.kinds
+        stack = [self.node]
+        while stack:
+            node = stack.pop()
+            if kinds[node] >= ELEMENT:
+                yield Cursor(store, node)
+            stack.extend(reversed(list(store._children(node))))
+
+    def load(self):
+        '''Return the element this cursor stands for with everything below it.'''
+        store = self.store
+        kinds = store.kinds
+        values = store.values
+        starts = store.starts
+        ends = store.ends
+        lines = store._lines(self.node)
+        classes = store._classes
+        root = []
+        # nodes to load with the container and the slot name (None for
+        # lists) the value goes to
+        stack = [(self.node, root, None)]
+        while stack:
+            node, container, slot = stack.pop()
+            kind = kinds[node]
+            children = ()
+            if kind >= ELEMENT:
+                cls = classes[kind - ELEMENT]
+                value = cls.__new__(cls)
+                start = starts[node]
+                if start >= 0:
+                    value._start, value._end, value._lines = start, ends[node], lines
+                else:
+                    value._start = value._end = value._lines = None
+                if cls is model.CompilationUnit:
+                    value.comments = None
+                    value.diagnostics = []
+                children = list(zip(store._children(node), _layout(cls)))
+            elif kind == LIST:
+                value = []
+                children = [(child, None) for child in store._children(node)]
+            elif kind == STRING:
+                value = store.string(values[node])
+            elif kind == INT:
+                value = values[node]
+            else:
+                value = _constants[kind]
+            if slot is None:
+                container.append(value)
+            elif not (slot == 'label' and value is None
+                      and 'label' not in container._fields):
+                # the element is new, no cached hash is dropped
+                object.__setattr__(container, slot, value)
+            for child, child_slot in reversed(children):
+                stack.append((child, value, child_slot))
+        return root[0]
+
+    def __eq__(self, other):
+        return isinstance(other, Cursor) and other.store is self.store and other.node == self.node
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.node)
+
+    def __repr__(self):
+        return 'Cursor({}, {})'.format(self.kind, self.node)
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import plyj.archive as archive
+import plyj.model as model
+
+class ArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'src.zip')
+        with zipfile.ZipFile(self.path, 'w') as zf:
+            zf.writestr('java/lang/', '')
+            zf.writestr('java/lang/Foo.java', 'package java.lang; class Foo { }')
+            zf.writestr('java/lang/Bar.java', u'package java.lang; /* ä */ class Bar { }'.encode('utf-8'))
+            zf.writestr('java/lang/Broken.java', 'class {')
+            zf.writestr('META-INF/MANIFEST.MF', 'Manifest-Version: 1.0')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_java_entries(self):
+        self.assertEqual(archive.java_entries(self.path),
+                         ['java/lang/Foo.java', 'java/lang/Bar.java', 'java/lang/Broken.java'])
+
+    def test_parse_archive(self):
+        for workers in (1, 2):
+            trees = dict(archive.parse_archive(self.path, workers=workers))
+            self.assertEqual(sorted(trees), ['java/lang/Bar.java', 'java/lang/Broken.java', 'java/lang/Foo.java'])
+            self.assertIsInstance(trees['java/lang/Foo.java'], model.CompilationUnit)
+            self.assertEqual(trees['java/lang/Bar.java'].type_declarations[0].name, 'Bar')
+            self.assertIsNone(trees['java/lang/Broken.java'])
+
+    def test_errors(self):
+        with zipfile.ZipFile(self.path, 'a') as zf:
+            zf.writestr('java/lang/Damaged.java', 'class Damaged { }')
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        # damage the stored content so that its checksum does not match
+        with open(self.path, 'wb') as f:
+            f.write(data.replace(b'class Damaged', b'class Dxmaged'))
+        for workers in (1, 2):
+            results = dict((result.path, result) for result in
+                           archive.parse_archive(self.path, workers=workers))
+            self.assertTrue(results['java/lang/Foo.java'].ok)
+            self.assertEqual(results['java/lang/Broken.java'].error,
+                             "java/lang/Broken.java:1: unexpected '{'")
+            self.assertTrue(results['java/lang/Damaged.java'].error.startswith('BadZip'))
+            self.assertIsNone(results['java/lang/Damaged.java'].compilation_unit)
+
+    def test_interleaved(self):
+        other = os.path.join(self.directory, 'other.zip')
+        with zipfile.ZipFile(other, 'w') as zf:
+            for n in range(3):
+                zf.writestr('Other{}.java'.format(n), 'class Other{} {{ }}'.format(n))
+        pairs = list(zip(archive.parse_archive(self.path), archive.parse_archive(other)))
+        self.assertEqual([(mine.compilation_unit.type_declarations[0].name,
+                           theirs.compilation_unit.type_declarations[0].name)
+                          for mine, theirs in pairs[:2]],
+                         [('Foo', 'Other0'), ('Bar', 'Other1')])
+        self.assertEqual(pairs[2][0].path, 'java/lang/Broken.java')
+        self.assertFalse(pairs[2][0].ok)
+
+    def test_parse_selected_entries(self):
+        trees = list(archive.parse_archive(self.path, names=['java/lang/Foo.java']))
+        self.assertEqual([name for name, _ in trees], ['java/lang/Foo.java'])
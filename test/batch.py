@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import plyj.batch as batch
+import plyj.model as model
+
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.paths = []
+        for n in range(6):
+            self.paths.append(self._write('Foo{}.java'.format(n), 'class Foo{} {{ }}'.format(n)))
+        self.paths.append(os.path.join(self.directory, 'Missing.java'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_ordered(self):
+        results = list(batch.parse_many(self.paths, workers=2))
+        self.assertEqual([r.path for r in results], self.paths)
+        for n, result in enumerate(results[:-1]):
+            self.assertTrue(result.ok)
+            self.assertIsInstance(result.compilation_unit, model.CompilationUnit)
+            self.assertEqual(result.compilation_unit.type_declarations[0].name, 'Foo{}'.format(n))
+        self.assertFalse(results[-1].ok)
+        self.assertIsNone(results[-1].compilation_unit)
+
+    def test_unordered(self):
+        results = list(batch.parse_many(self.paths, workers=2, ordered=False))
+        self.assertEqual(sorted(r.path for r in results), sorted(self.paths))
+        self.assertEqual(len([r for r in results if r.ok]), 6)
+
+    def test_single_process(self):
+        results = list(batch.parse_many(self.paths, workers=1))
+        self.assertEqual([r.ok for r in results], [True] * 6 + [False])
+
+    def test_recover(self):
+        path = self._write('Broken.java', 'class Broken { int x = ; }')
+        result, = batch.parse_many([path], workers=2)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.error, "{}:1: unexpected ';'".format(path))
+        self.assertEqual([d.offset for d in result.diagnostics], [23])
+        result, = batch.parse_many([path], workers=1, recover=True)
+        self.assertTrue(result.ok)
+        self.assertEqual(len(result.compilation_unit.diagnostics), 1)
+
+    def test_interleaved(self):
+        broken = [self._write('Broken{}.java'.format(n), 'class Broken { int x = ; }')
+                  for n in range(2)]
+        recovering = batch.parse_many(broken, workers=1, recover=True)
+        first = next(recovering)
+        other, = batch.parse_many(self.paths[:1], workers=1)
+        second = next(recovering)
+        self.assertTrue(first.ok)
+        self.assertTrue(other.ok)
+        self.assertTrue(second.ok)
+
+    def test_intern(self):
+        paths = [self._write('Bar{}.java'.format(n), 'class Bar{} {{ String s; }}'.format(n))
+                 for n in range(2)]
+        for workers in (1, 2):
+            first, second = [result.compilation_unit.type_declarations[0].body[0]
+                             for result in batch.parse_many(paths, workers=workers, intern=True)]
+            self.assertIs(first.type, second.type)
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
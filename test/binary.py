@@ -0,0 +1,112 @@
+import io
+import pickle
+import unittest
+
+import plyj.binary as binary
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''package foo;
+
+import java.util.*;
+
+/** Docs. */
+class Foo<T extends Comparable<? super T>> {
+    static final int[] NUMBERS = {1, -2, 0x7fffffff};
+    String s = "\\u00e9t\\u00e9 été";
+
+    /** More docs. */
+    void bar(int a, T... rest) throws Exception {
+        outer: for (int i = 0; i < a; i++) {
+            if (rest.length > i) continue outer;
+            else break;
+        }
+        try { baz(a + 1); } catch (RuntimeException e) { } finally { }
+    }
+}
+'''
+
+class BinaryTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        tree = plyj.Parser(comments=True).parse_string(source)
+        copy = binary.loads(binary.dumps(tree))
+        self.assertEqual(copy, tree)
+        self.assertEqual(self._positions(copy), self._positions(tree))
+        method = copy.type_declarations[0].body[2]
+        self.assertEqual(method.body[0].label, 'outer')
+        self.assertFalse(hasattr(method.body[1], 'label'))
+        self.assertEqual(copy.comments.javadoc(method), '/** More docs. */')
+        self.assertEqual(list(copy.comments), list(tree.comments))
+        self.assertEqual(copy.type_declarations[0].lineno, 6)
+
+    def test_file(self):
+        tree = plyj.Parser().parse_string(source)
+        out = io.BytesIO()
+        binary.dump(tree, out)
+        self.assertEqual(binary.load(io.BytesIO(out.getvalue())), tree)
+        self.assertLess(len(out.getvalue()), len(pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)) / 2)
+
+    def test_other_elements(self):
+        for tree in [plyj.Parser().parse_expression('a' + ' + a' * 10000),
+                     plyj.Parser().parse_statement('return;', lineno=3),
+                     model.BinaryExpression('+', model.Literal('1'), model.Name('a'))]:
+            copy = binary.loads(binary.dumps(tree))
+            self.assertEqual(copy, tree)
+            self.assertEqual(copy.start, tree.start)
+            self.assertEqual(copy.lineno, tree.lineno)
+
+    def test_diagnostics(self):
+        tree = plyj.Parser(recover=True).parse_string('class Foo { int x = ; void f() { } }')
+        copy = binary.loads(binary.dumps(tree))
+        self.assertEqual(copy, tree)
+        self.assertEqual([vars(d) for d in copy.diagnostics], [vars(d) for d in tree.diagnostics])
+
+    def test_lazy_bodies(self):
+        tree = plyj.Parser(lazy_bodies=True).parse_string(source)
+        copy = binary.loads(binary.dumps(tree))
+        body = copy.type_declarations[0].body[2].body
+        self.assertFalse(body.parsed)
+        self.assertEqual(copy, plyj.Parser().parse_string(source))
+        self.assertEqual(body[0].lineno, 12)
+
+    def test_shared_elements(self):
+        tree = plyj.Parser(intern=True).parse_string(source)
+        copy = binary.loads(binary.dumps(tree))
+        self.assertEqual(copy, tree)
+        bar = copy.type_declarations[0].body[2]
+        self.assertIs(bar.parameters[0].type, bar.body[0].init.type)
+
+    def test_invalid(self):
+        data = binary.dumps(plyj.Parser().parse_string(source))
+        for invalid in [b'', b'plyj', b'pickle' + data, data[:-1], data + b'\0']:
+            self.assertRaises(ValueError, binary.loads, invalid)
+
+    def test_damaged(self):
+        tree = plyj.Parser(comments=True, recover=True).parse_string(
+            '/** Doc */ class Foo { @A int[] x = {1}; void f(String s) { x = ; } }')
+        data = binary.dumps(tree)
+        for end in range(len(data)):
+            self.assertRaises(ValueError, binary.loads, data[:end])
+        # a flipped bit either goes unnoticed or raises ValueError
+        for index in range(len(binary.MAGIC) + 1, len(data)):
+            for bit in range(8):
+                damaged = bytearray(data)
+                damaged[index] ^= 1 << bit
+                try:
+                    binary.loads(bytes(damaged))
+                except ValueError:
+                    pass
+
+    def _positions(self, tree):
+        positions = []
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, list):
+                stack.extend(reversed(element))
+            elif isinstance(element, model.SourceElement):
+                positions.append((type(element).__name__, element.start, element.end,
+                                  element.lineno, element.end_col_offset))
+                stack.extend(reversed([getattr(element, name) for name in element._fields]))
+        return positions
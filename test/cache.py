@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import plyj.cache as cache
+import plyj.model as model
+import plyj.parser as plyj
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = cache.ParseCache(os.path.join(self.directory, 'cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit(self):
+        path = os.path.join(self.directory, 'Foo.java')
+        with open(path, 'w') as f:
+            f.write('class Foo { int i; }')
+
+        first = self.cache.parse_file(path)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        second = self.cache.parse_file(path)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertIsInstance(second, model.CompilationUnit)
+        self.assertEqual(first, second)
+
+        with open(path, 'w') as f:
+            f.write('class Foo { int j; }')
+        self.cache.parse_file(path)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_survives_restart(self):
+        self.cache.parse_string('class Foo {}')
+        other = cache.ParseCache(self.cache.directory)
+        self.assertEqual(other.parse_string('class Foo {}').type_declarations[0].name, 'Foo')
+        self.assertEqual(other.hits, 1)
+
+    def test_options_in_key(self):
+        self.cache.parse_string('class Foo {}')
+        directory = self.cache.directory
+        for parser in (plyj.Parser(comments=True), plyj.Parser(recover=True),
+                       plyj.Parser(lazy_bodies=True), plyj.Parser(intern=True),
+                       plyj.Parser(scanner=True)):
+            other = cache.ParseCache(directory, parser=parser)
+            other.parse_string('class Foo {}')
+            self.assertEqual(other.misses, 1)
+        self.assertEqual(len(self.cache._entries()), 6)
+        self.cache.parse_string('class Foo {}', encoding='latin-1')
+        self.assertEqual(self.cache.misses, 2)
+        comments = cache.ParseCache(directory, parser=plyj.Parser(comments=True))
+        self.assertIsNotNone(comments.parse_string('class Foo {}').comments)
+        self.assertEqual(comments.hits, 1)
+
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache.parse_string('class Foo {}')
+        path = self.cache._path(self.cache.key(b'class Foo {}'))
+        with open(path, 'wb') as f:
+            f.write(b'garbage')
+        self.assertIsNotNone(self.cache.parse_string('class Foo {}'))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_eviction(self):
+        small = cache.ParseCache(os.path.join(self.directory, 'small'), max_size=1)
+        small.parse_string('class Foo {}')
+        small.parse_string('class Bar {}')
+        self.assertEqual(small.evictions, 2)
+        self.assertEqual(small._entries(), [])
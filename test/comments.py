@@ -0,0 +1,70 @@
+import pickle
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''/** not documenting anything */
+package foo;
+
+/**
+ * A class.
+ */
+@Deprecated
+public class Foo {
+    // a line comment
+    /** The field. */
+    int i; /* trailing */
+
+    /** The method. */
+    // with another comment in between
+    void bar() {
+        /** not a declaration */
+        int j;
+    }
+
+    /** Orphaned. */ ;
+    void baz() { }
+    /**/ int k;
+}
+'''
+
+class CommentsTest(unittest.TestCase):
+
+    def test_disabled(self):
+        self.assertIsNone(plyj.Parser().parse_string(source).comments)
+
+    def test_comments(self):
+        for scanner in (False, True):
+            tree = plyj.Parser(scanner=scanner, comments=True).parse_string(source)
+            comments = tree.comments
+            self.assertEqual(len(comments), 10)
+            self.assertEqual(comments[0], (0, 31, model.Comments.JAVADOC))
+            self.assertEqual(comments.text(2), '// a line comment')
+            self.assertEqual(comments[2][2], model.Comments.LINE)
+            self.assertEqual(comments.text(4), '/* trailing */')
+            self.assertEqual(comments[4][2], model.Comments.BLOCK)
+            self.assertEqual(comments[-1], (source.index('/**/'), 4, model.Comments.BLOCK))
+
+    def test_javadoc(self):
+        for scanner in (False, True):
+            tree = plyj.Parser(scanner=scanner, comments=True).parse_string(source)
+            comments = tree.comments
+            cls = tree.type_declarations[0]
+            field, bar, _, baz, k = cls.body
+            self.assertEqual(comments.javadoc(cls), '/**\n * A class.\n */')
+            self.assertEqual(comments.javadoc(field), '/** The field. */')
+            self.assertEqual(comments.javadoc(bar), '/** The method. */')
+            self.assertIsNone(comments.javadoc(bar.body[0]))
+            self.assertIsNone(comments.javadoc(baz))
+            self.assertIsNone(comments.javadoc(k))
+            # elements that start where a documented declaration does
+            self.assertIsInstance(cls.modifiers[0], model.Annotation)
+            self.assertIsNone(comments.javadoc(cls.modifiers[0]))
+            self.assertIsNone(comments.javadoc(field.type))
+
+    def test_pickle(self):
+        tree = plyj.Parser(comments=True).parse_string(source)
+        tree = pickle.loads(pickle.dumps(tree, 2))
+        cls = tree.type_declarations[0]
+        self.assertEqual(tree.comments.javadoc(cls.body[0]), '/** The field. */')
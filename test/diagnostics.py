@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import plyj.parser as plyj
+from plyj.diagnostics import Diagnostics, ParseError, LEXICAL, SYNTAX
+
+class DiagnosticsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+        self.stdout = sys.stdout
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        output = sys.stdout.getvalue()
+        sys.stdout = self.stdout
+        self.assertEqual(output, '')
+
+    def test_syntax_error(self):
+        for scanner in (False, True):
+            diagnostics = Diagnostics('Foo.java')
+            parser = plyj.Parser(scanner=scanner)
+            self.assertIsNone(parser.parse_string('class Foo {\n  int x = ; }', diagnostics=diagnostics))
+            diagnostic, = diagnostics
+            self.assertEqual((diagnostic.offset, diagnostic.lineno), (22, 2))
+            self.assertEqual((diagnostic.kind, diagnostic.token), (SYNTAX, ';'))
+            self.assertIn('NAME', diagnostic.expected)
+            self.assertNotIn(';', diagnostic.expected)
+            self.assertEqual(str(diagnostic), "Foo.java:2: unexpected ';'")
+
+    def test_illegal_character(self):
+        for scanner in (False, True):
+            diagnostics = Diagnostics()
+            tree = plyj.Parser(scanner=scanner).parse_string('class Foo # { }', diagnostics=diagnostics)
+            self.assertEqual(tree.type_declarations[0].name, 'Foo')
+            self.assertEqual([(d.kind, d.offset, d.token) for d in diagnostics],
+                             [(LEXICAL, 10, '#')])
+            self.assertEqual(tree.diagnostics, diagnostics)
+
+    def test_end_of_input(self):
+        diagnostics = Diagnostics()
+        self.assertIsNone(self.parser.parse_expression('1 +', diagnostics=diagnostics))
+        diagnostic, = diagnostics
+        self.assertEqual((diagnostic.offset, diagnostic.token), (3, None))
+        self.assertEqual(diagnostic.message, 'unexpected end of input')
+        self.assertIn('NUM', diagnostic.expected)
+
+    def test_raise(self):
+        parser = plyj.Parser(raise_errors=True)
+        for source in ('class Foo { int x = ; }', 'class Foo # { }', 'class Foo {'):
+            with self.assertRaises(ParseError) as context:
+                parser.parse_string(source)
+            self.assertIsNotNone(context.exception.diagnostic.offset)
+        self.assertIsNotNone(parser.parse_string('class Foo { }'))
+
+    def test_file(self):
+        fd, path = tempfile.mkstemp(suffix='.java')
+        with os.fdopen(fd, 'w') as f:
+            f.write('class Foo # { }')
+        try:
+            tree = self.parser.parse_file(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(tree.diagnostics[0].file, path)
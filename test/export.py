@@ -0,0 +1,67 @@
+import io
+import json
+import unittest
+
+import plyj.export as export
+import plyj.parser as plyj
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+
+    def test_json(self):
+        tree = self.parser.parse_string('class Foo {\n  static int x = -1; }')
+        out = io.StringIO()
+        export.write_json(tree, out, positions=False)
+        self.assertEqual(json.loads(out.getvalue()), {
+            '_type': 'CompilationUnit', 'package_declaration': None, 'import_declarations': [],
+            'type_declarations': [{
+                '_type': 'ClassDeclaration', 'name': 'Foo', 'modifiers': [], 'type_parameters': [],
+                'extends': None, 'implements': [], 'body': [{
+                    '_type': 'FieldDeclaration', 'modifiers': ['static'], 'type': 'int',
+                    'variable_declarators': [{
+                        '_type': 'VariableDeclarator',
+                        'variable': {'_type': 'Variable', 'name': 'x', 'dimensions': 0},
+                        'initializer': {'_type': 'Unary', 'sign': '-',
+                                        'expression': {'_type': 'Literal', 'value': '1'}}}]}]}]})
+
+    def test_positions(self):
+        tree = self.parser.parse_statement('outer: while (a) {\n  break outer; }', lineno=5)
+        out = io.StringIO()
+        export.write_json(tree, out)
+        loop = json.loads(out.getvalue())
+        self.assertEqual(loop['label'], 'outer')
+        self.assertEqual((loop['start'], loop['end'], loop['lineno'], loop['col_offset'],
+                          loop['end_lineno'], loop['end_col_offset']), (0, 35, 5, 0, 6, 16))
+        self.assertNotIn('label', loop['body'])
+        self.assertEqual(loop['body']['statements'][0]['label'], 'outer')
+
+    def test_deep_tree(self):
+        code = 'a' + ' + "\\u00e9\u00e9"' * 10000
+        out = _Output()
+        export.write_json(self.parser.parse_expression(code), out)
+        self.assertGreater(len(out.parts), 1)
+        text = ''.join(out.parts)
+        # too deep for the json module to read back
+        self.assertTrue(text.startswith('{{"_type":"Additive","start":0,"end":{},'.format(len(code))))
+        self.assertTrue(text.endswith('"value":"\\"\\\\u00e9\\u00e9\\""}}'))
+
+    def test_ndjson(self):
+        out = io.StringIO()
+        export.write_ndjson([('Foo.java', self.parser.parse_string('class Foo { }')),
+                             ('Broken.java', None)], out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(records[0]['name'], 'Foo.java')
+        self.assertEqual(records[0]['compilation_unit']['type_declarations'][0]['name'], 'Foo')
+        self.assertEqual(records[1], {'name': 'Broken.java', 'compilation_unit': None})
+
+class _Output(object):
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
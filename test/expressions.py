@@ -12,8 +12,18 @@ c = model.Name('c')
 d = model.Name('d')
 e = model.Name('e')
 
+# the class the parser builds for each binary operator
+binary_classes = {
+    '||': model.ConditionalOr, '&&': model.ConditionalAnd, '|': model.Or,
+    '^': model.Xor, '&': model.And, '==': model.Equality, '!=': model.Equality,
+    '<': model.Relational, '>': model.Relational, '<=': model.Relational,
+    '>=': model.Relational, '<<': model.Shift, '>>': model.Shift, '>>>': model.Shift,
+    '+': model.Additive, '-': model.Additive, '*': model.Multiplicative,
+    '/': model.Multiplicative, '%': model.Multiplicative,
+}
+
 def bin(operator, operand1, operand2):
-    return model.BinaryExpression(operator, operand1, operand2)
+    return binary_classes[operator](operator, operand1, operand2)
 
 def u(operator, operand):
     return model.Unary(operator, operand)
@@ -0,0 +1,68 @@
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+from plyj.diagnostics import LEXICAL, Diagnostics
+
+source = '''// the header
+package com.example . app;
+
+import java.util.List;
+import java.util.*;
+import static java.lang.Math.max;
+import static
+    java.lang.Math.*;
+
+@Deprecated
+public class Foo { void bar() { this is not parsed } }
+'''
+
+class HeaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+
+    def test_header(self):
+        package, imports = self.parser.parse_header_string(source)
+        self.assertEqual(package, model.PackageDeclaration(model.Name('com.example.app')))
+        self.assertEqual(imports, [
+            model.ImportDeclaration(model.Name('java.util.List')),
+            model.ImportDeclaration(model.Name('java.util'), on_demand=True),
+            model.ImportDeclaration(model.Name('java.lang.Math.max'), static=True),
+            model.ImportDeclaration(model.Name('java.lang.Math'), static=True, on_demand=True)])
+
+    def test_same_as_parser(self):
+        code = source[:source.index('@Deprecated')] + 'class Foo { }'
+        tree = self.parser.parse_string(code, lineno=3)
+        package, imports = self.parser.parse_header_string(code, lineno=3)
+        for expected, declaration in zip([tree.package_declaration] + tree.import_declarations,
+                                         [package] + imports):
+            for expected, element in [(expected, declaration), (expected.name, declaration.name)]:
+                self.assertEqual(element, expected)
+                self.assertEqual((element.start, element.end, element.lineno, element.end_col_offset),
+                                 (expected.start, expected.end, expected.lineno,
+                                  expected.end_col_offset))
+
+    def test_no_header(self):
+        self.assertEqual(self.parser.parse_header_string('class Foo { }'), (None, []))
+        self.assertEqual(self.parser.parse_header_string(''), (None, []))
+        self.assertEqual(self.parser.parse_header_string('import a.B;'),
+                         (None, [model.ImportDeclaration(model.Name('a.B'))]))
+
+    def test_package_annotations(self):
+        package, imports = self.parser.parse_header_string('@Foo(1) package foo; import a.B;')
+        self.assertEqual(package.modifiers, [model.Annotation(model.Name('Foo'),
+                                                              single_member=model.Literal('1'))])
+        self.assertEqual(len(imports), 1)
+
+    def test_errors(self):
+        for code in ['import a.B', 'import a.*.B;', 'import a.B; package a;', 'package a.b.*;']:
+            diagnostics = Diagnostics()
+            self.assertIsNone(self.parser.parse_header_string(code, diagnostics=diagnostics), code)
+            self.assertTrue(diagnostics.syntax_errors, code)
+
+        # illegal characters are skipped like the parser does
+        diagnostics = Diagnostics()
+        self.assertEqual(self.parser.parse_header_string('import a.#B;', diagnostics=diagnostics),
+                         (None, [model.ImportDeclaration(model.Name('a.B'))]))
+        self.assertEqual([d.kind for d in diagnostics], [LEXICAL])
@@ -0,0 +1,114 @@
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''package foo;
+
+class Foo {
+    int x = 1;
+
+    void bar(int a) {
+        int y = a + 1;
+        baz(y);
+    }
+
+    class Inner {
+        int inner() { return 1; }
+    }
+
+    interface Callback {
+        void call(String s);
+    }
+
+    String s = "}";
+}
+
+class Other { int z; }
+'''
+
+class IncrementalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+
+    def test_member_reparsed(self):
+        tree = self.parser.parse_string(source)
+        field, bar, inner, callback, s = tree.type_declarations[0].body
+        other = tree.type_declarations[1]
+        new_tree = self._edit(tree, 'baz(y)', 'qux(y, 2)')
+        self.assertIs(new_tree, tree)
+        body = tree.type_declarations[0].body
+        self.assertIs(body[0], field)
+        self.assertIsNot(body[1], bar)
+        self.assertIs(body[2], inner)
+        self.assertIs(body[4], s)
+        self.assertIs(tree.type_declarations[1], other)
+        self.assertEqual(body[1].body[1].expression.name, 'qux')
+
+    def test_nested_member_reparsed(self):
+        tree = self.parser.parse_string(source)
+        inner = tree.type_declarations[0].body[2]
+        method = inner.body[0]
+        self._edit(tree, 'return 1;', 'return 1 + 2;\n')
+        self.assertIs(tree.type_declarations[0].body[2], inner)
+        self.assertIsNot(inner.body[0], method)
+
+    def test_interface_member_reparsed(self):
+        tree = self.parser.parse_string(source)
+        callback = tree.type_declarations[0].body[3]
+        self._edit(tree, 'String s)', 'String s, int i)')
+        self.assertIs(tree.type_declarations[0].body[3], callback)
+        self.assertEqual(len(callback.body[0].parameters), 2)
+
+    def test_full_parse(self):
+        # class header, between members, across members, in imports
+        for old, new in [('class Foo {', 'class Foo extends Bar {'),
+                         ('1;\n\n    void', '1;\n    int w;\n    void'),
+                         ('(y);\n    }\n\n    class', '(y); } void f() { }\n    class'),
+                         ('package foo;', 'package foo;\nimport bar.*;')]:
+            tree = self.parser.parse_string(source)
+            self.assertIsNot(self._edit(tree, old, new), tree)
+
+    def test_broken_member(self):
+        tree = self.parser.parse_string(source)
+        self.assertIsNone(self._edit(tree, 'baz(y);', 'baz(y); }'))
+        tree = self.parser.parse_string(source)
+        self.assertIsNot(self._edit(tree, 'baz(y);', 'baz(y); } void f() {'), tree)
+
+    def test_brace_in_literal(self):
+        tree = self.parser.parse_string(source)
+        self.assertIs(self._edit(tree, 'int y = a', "int y = '}' + a"), tree)
+
+    def test_successive_edits(self):
+        tree = self.parser.parse_string(source)
+        code = source
+        for old, new in [('a + 1', 'a + 1 + a'), ('int a', 'int a, int b'),
+                         ('"}"', '"{"'), ('return 1;', 'return\n2;'), ('int z', 'long z')]:
+            start = code.index(old)
+            tree = self.parser.reparse(tree, code, start, start + len(old), new)
+            code = code[:start] + new + code[start + len(old):]
+            self.assertEqual(self._positions(tree), self._positions(self.parser.parse_string(code)))
+
+    def _edit(self, tree, old, new):
+        start = source.index(old)
+        new_tree = self.parser.reparse(tree, source, start, start + len(old), new)
+        new_source = source[:start] + new + source[start + len(old):]
+        expected = self.parser.parse_string(new_source)
+        self.assertEqual(new_tree, expected)
+        if expected is not None:
+            self.assertEqual(self._positions(new_tree), self._positions(expected))
+        return new_tree
+
+    def _positions(self, tree):
+        positions = []
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, list):
+                stack.extend(reversed(element))
+            elif isinstance(element, model.SourceElement):
+                positions.append((type(element).__name__, element.start, element.end,
+                                  element.lineno, element.col_offset, element.end_lineno))
+                stack.extend(reversed([getattr(element, name) for name in element._fields]))
+        return positions
@@ -0,0 +1,75 @@
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''
+class Foo {
+    @Override
+    public int size() { return 0; }
+
+    @Override
+    public int hashCode() { int size = size(); return size == 0 ? 0 : size; }
+
+    java.util.List<String> names(java.util.List<String> names, String... more) { return names; }
+}
+'''
+
+class InternTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser(intern=True)
+
+    def test_same_tree(self):
+        tree = self.parser.parse_string(source)
+        self.assertEqual(tree, plyj.Parser().parse_string(source))
+
+    def test_leaves_shared(self):
+        size, hash_code, names = self.parser.parse_string(source).type_declarations[0].body
+        self.assertIs(size.modifiers[0], hash_code.modifiers[0])
+        self.assertIs(size.modifiers[1], hash_code.modifiers[1])
+        self.assertIs(size.return_type, hash_code.return_type)
+        self.assertIs(size.body[0].result, hash_code.body[1].result.if_true)
+        self.assertIs(names.return_type, names.parameters[0].type)
+        self.assertIs(names.parameters[0].variable.name, names.body[0].result.value)
+        # shared elements have no position, the others keep theirs
+        self.assertIsNone(names.return_type.start)
+        self.assertEqual(source[size.start:size.end], '@Override\n    public int size() { return 0; }')
+
+    def test_statements_not_shared(self):
+        tree = self.parser.parse_string('class Foo { void f() { g(); } void h() { g(); } }')
+        f, h = tree.type_declarations[0].body
+        self.assertEqual(f.body, h.body)
+        self.assertIsNot(f.body[0], h.body[0])
+        self.assertIsNot(f.body[0].expression, h.body[0].expression)
+
+    def test_shared_between_trees(self):
+        interner = model.Interner()
+        parser = plyj.Parser(intern=interner)
+        first = parser.parse_expression('(int) x')
+        second = parser.parse_statement('return (int) x;')
+        self.assertIs(first.target, second.result.target)
+        self.assertIs(first.expression, second.result.expression)
+        # a parser that interns on its own does not share between parses
+        first = self.parser.parse_expression('(int) x')
+        self.assertIsNot(first.target, self.parser.parse_expression('(int) x').target)
+
+    def test_deep_tree(self):
+        expression = self.parser.parse_expression('a' + ' + a' * 10000)
+        self.assertIs(expression.lhs.rhs, expression.rhs)
+
+    def test_lazy_bodies(self):
+        parser = plyj.Parser(lazy_bodies=True, intern=True)
+        tree = parser.parse_string(source)
+        size = tree.type_declarations[0].body[0]
+        self.assertFalse(size.body.parsed)
+        self.assertEqual(tree, plyj.Parser().parse_string(source))
+
+    def test_reparse(self):
+        tree = self.parser.parse_string(source)
+        start = source.index('return 0;')
+        tree = self.parser.reparse(tree, source, start, start + 9, 'return 1;')
+        new_source = source[:start] + 'return 1;' + source[start + 9:]
+        self.assertEqual(tree, plyj.Parser().parse_string(new_source))
+        size, hash_code, names = tree.type_declarations[0].body
+        self.assertEqual(source[hash_code.start:hash_code.end][:9], '@Override')
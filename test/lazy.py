@@ -0,0 +1,165 @@
+import pickle
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+from plyj.diagnostics import ParseError
+
+source = '''package foo;
+
+@SuppressWarnings({"unchecked", "rawtypes"})
+class Foo extends Bar<Baz> implements Runnable {
+    static int[] numbers = {1, 2, 3};
+    Runnable r = new Runnable() {
+        public void run() { r = null; }
+    };
+    Class<?> c = Foo.class;
+
+    static { numbers[0] = 0; }
+    { c = null; }
+
+    Foo(int x) throws Exception {
+        super(x);
+    }
+
+    @Deprecated({})
+    public <T> void run() {
+        class Local { void m() { } }
+        if (true) { return; }
+    }
+
+    enum E {
+        A { void m() { } }, B;
+        void m() { }
+    }
+
+    @interface A {
+        int[] value() default {1};
+    }
+
+    interface I {
+        void m();
+        class Nested { void n() { int x = 0; } }
+    }
+}
+
+enum Top { X; void m() { } }
+'''
+
+class LazyBodiesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser(lazy_bodies=True)
+
+    def test_bodies_skipped(self):
+        tree = self.parser.parse_string(source)
+        members = tree.type_declarations[0].body
+        lazy = [member for member in members if self._is_lazy(member)]
+        self.assertEqual([type(member).__name__ for member in lazy],
+                         ['ClassInitializer', 'ClassInitializer', 'ConstructorDeclaration',
+                          'MethodDeclaration'])
+        nested = members[-1].body[1]
+        self.assertTrue(self._is_lazy(nested.body[0]))
+        # fields and the bodies of enums and annotation types are parsed
+        self.assertIsInstance(members[1].variable_declarators[0].initializer.body[0].body, list)
+        self.assertFalse(isinstance(members[7].body[2].body, model.LazyBody))
+
+    def test_same_tree(self):
+        tree = self.parser.parse_string(source)
+        self.assertEqual(tree, plyj.Parser().parse_string(source))
+        self.assertEqual(self._positions(tree), self._positions(plyj.Parser().parse_string(source)))
+
+    def test_parsed_on_access(self):
+        tree = self.parser.parse_string(source)
+        method = tree.type_declarations[0].body[6]
+        body = method.body
+        self.assertFalse(body.parsed)
+        self.assertEqual(source[body.start:body.end][0], '{')
+        self.assertEqual(len(body), 2)
+        self.assertTrue(body.parsed)
+        self.assertIsInstance(body[1], model.IfThenElse)
+        self.assertEqual(body[1].lineno, 21)
+
+    def test_error_in_body(self):
+        code = 'class Foo { void bar() { int x = ; } int y; }'
+        tree = self.parser.parse_string(code)
+        self.assertEqual(len(tree.type_declarations[0].body), 2)
+        with self.assertRaises(ParseError) as context:
+            len(tree.type_declarations[0].body[0].body)
+        self.assertEqual(context.exception.diagnostic.offset, code.index('= ;') + 2)
+
+    def test_list_methods(self):
+        tree = self.parser.parse_string(source)
+        members = tree.type_declarations[0].body
+        self.assertEqual(len(members[6].body.copy()), 2)
+        body = members[5].block
+        body.clear()
+        self.assertTrue(body.parsed)
+        self.assertEqual(body, [])
+        self.assertEqual(len(2 * members[4].block.statements), 2)
+
+    def test_parser_options(self):
+        code = 'class Foo { /** Doc */ int x; void bar() { /** Local */ class L { } int x = ; } }'
+        parser = plyj.Parser(lazy_bodies=True, comments=True, recover=True, intern=True)
+        tree = parser.parse_string(code)
+        body = tree.type_declarations[0].body[1].body
+        self.assertFalse(body.parsed)
+        self.assertEqual(len(tree.diagnostics), 0)
+        self.assertEqual(len(body), 2)
+        self.assertIsInstance(body[1], model.ErrorNode)
+        self.assertEqual([d.offset for d in tree.diagnostics], [code.index('= ;') + 2])
+        self.assertEqual(tree.comments.javadoc(tree.type_declarations[0].body[0]), '/** Doc */')
+        self.assertEqual(tree.comments.javadoc(body[0]), '/** Local */')
+
+        tree = parser.parse_string('class Foo { int x; void bar() { int y; } }')
+        field, method = tree.type_declarations[0].body
+        # interned with the Interner of the tree
+        self.assertIs(method.body[0].type, field.type)
+
+    def test_unclosed_body(self):
+        self.assertIsNone(self.parser.parse_string('class Foo { void bar() { '))
+
+    def test_pickle(self):
+        tree = self.parser.parse_string(source)
+        copy = pickle.loads(pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+        self.assertFalse(copy.type_declarations[0].body[6].body.parsed)
+        self.assertEqual(copy, plyj.Parser().parse_string(source))
+
+        tree = plyj.Parser(lazy_bodies=True, recover=True).parse_string(
+            'class Foo { void bar() { int x = ; } }')
+        copy = pickle.loads(pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(len(copy.type_declarations[0].body[0].body), 1)
+        self.assertEqual(len(copy.diagnostics), 1)
+
+    def test_reparse(self):
+        tree = self.parser.parse_string(source)
+        start = source.index('super(x)')
+        tree = self.parser.reparse(tree, source, start, start + 5, 'this')
+        new_source = source[:start] + 'this' + source[start + 5:]
+        constructor = tree.type_declarations[0].body[5]
+        self.assertFalse(constructor.block.parsed)
+        expected = plyj.Parser().parse_string(new_source)
+        self.assertEqual(tree, expected)
+        self.assertEqual(self._positions(tree), self._positions(expected))
+
+    def _is_lazy(self, member):
+        for name in ('body', 'block'):
+            body = getattr(member, name, None)
+            if isinstance(body, model.Block):
+                body = body.statements
+            if isinstance(body, model.LazyBody):
+                return True
+        return False
+
+    def _positions(self, tree):
+        positions = []
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, list):
+                stack.extend(reversed(element))
+            elif isinstance(element, model.SourceElement):
+                positions.append((type(element).__name__, element.start, element.end,
+                                  element.lineno, element.end_col_offset))
+                stack.extend(reversed([getattr(element, name) for name in element._fields]))
+        return positions
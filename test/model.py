@@ -0,0 +1,229 @@
+import copy
+import pickle
+import sys
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+class ModelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+
+    def test_no_instance_dict(self):
+        for name in dir(model):
+            cls = getattr(model, name)
+            if isinstance(cls, type) and issubclass(cls, model.SourceElement):
+                self.assertIn('__slots__', cls.__dict__, name)
+                self.assertFalse(hasattr(cls.__new__(cls), '__dict__'), name)
+
+    def test_label(self):
+        loop = self.parser.parse_statement('outer: while (true) break outer;')
+        self.assertEqual(loop.label, 'outer')
+        expected = model.While(model.Literal('true'), model.Break('outer'))
+        self.assertFalse(hasattr(expected, 'label'))
+        self.assertNotEqual(loop, expected)
+        expected.label = 'outer'
+        self.assertEqual(loop, expected)
+
+        unlabeled = self.parser.parse_statement('while (true) break outer;')
+        self.assertNotEqual(loop, unlabeled)
+
+    def test_copy(self):
+        loop = self.parser.parse_statement('outer: for (;;) i++;')
+        for clone in (copy.deepcopy(loop), pickle.loads(pickle.dumps(loop, 2))):
+            self.assertEqual(clone, loop)
+            self.assertEqual(clone.label, 'outer')
+            self.assertEqual(clone.start, loop.start)
+
+    def test_accept_order(self):
+        tree = self.parser.parse_string('''
+        class Foo {
+            int x = 1;
+            void bar(int a) {
+                try { baz(a + 1); } catch (Exception e) { x++; } finally { x--; }
+                if (a > 0) { return; }
+            }
+        }''')
+        for prune in ('MethodDeclaration', 'Try', 'Additive', None):
+            expected = _Recorder(prune)
+            _recursive_accept(tree, expected)
+            actual = _Recorder(prune)
+            tree.accept(actual)
+            self.assertEqual(actual.events, expected.events)
+        # nothing pruned
+        self.assertEqual([(type(element).__name__, entering) for element, entering in tree.walk()],
+                         expected.events)
+
+    def test_deep_tree(self):
+        expression = self.parser.parse_expression('a' + ' + a' * 10000)
+        recorder = _Recorder()
+        expression.accept(recorder)
+        self.assertEqual(len(recorder.events), 2 * 20001)
+        self.assertEqual(sum(1 for _ in expression.walk()), 2 * 20001)
+
+    def test_dispatch(self):
+        tree = self.parser.parse_statement('if (a) b(c);')
+
+        class Names(model.Visitor):
+            def __init__(self):
+                super(Names, self).__init__()
+                self.names = []
+
+            def visit_Name(self, name):
+                self.names.append(name.value)
+
+            @staticmethod
+            def visit_MethodInvocation(invocation):
+                return False
+
+        class AllNames(Names):
+            def visit_MethodInvocation(self, invocation):
+                return True
+
+        for cls, names in [(Names, ['a']), (AllNames, ['a', 'c']), (Names, ['a'])]:
+            visitor = cls()
+            tree.accept(visitor)
+            self.assertEqual(visitor.names, names)
+
+        # methods of the visitor itself are used as well
+        visitor = Names()
+        visitor.visit_Name = lambda name: visitor.names.append(name.value.upper())
+        tree.accept(visitor)
+        self.assertEqual(visitor.names, ['A'])
+
+    def test_verbose_visitor(self):
+        tree = self.parser.parse_expression('a')
+        out = _Output()
+        stdout = sys.stdout
+        sys.stdout = out
+        try:
+            tree.accept(model.Visitor(verbose=True))
+        finally:
+            sys.stdout = stdout
+        lines = ''.join(out.parts).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('unimplemented call to visit_Name'))
+
+    def test_equality(self):
+        code = 'class Foo { int bar(int a) { return a + 1; } }'
+        tree = self.parser.parse_string(code)
+        self.assertEqual(tree, self.parser.parse_string(code))
+        self.assertNotEqual(tree, self.parser.parse_string(code.replace('+', '-')))
+        self.assertNotEqual(tree, self.parser.parse_string(code.replace('bar', 'baz')))
+        self.assertEqual(self.parser.parse_expression('1 + 2'),
+                         model.Additive('+', model.Literal('1'), model.Literal('2')))
+        # elements of different classes are never equal, even with the same fields
+        self.assertNotEqual(self.parser.parse_expression('1 + 2'),
+                            model.BinaryExpression('+', model.Literal('1'), model.Literal('2')))
+        self.assertNotEqual(model.Empty(), model.EmptyDeclaration())
+        self.assertNotEqual(model.Name('a'), model.Variable('a'))
+        self.assertNotEqual(model.Name('a'), 'a')
+
+        deep = 'a' + ' + a' * 10000
+        self.assertEqual(self.parser.parse_expression(deep), self.parser.parse_expression(deep))
+        self.assertNotEqual(self.parser.parse_expression(deep),
+                            self.parser.parse_expression(deep + ' + b'))
+
+    def test_hash(self):
+        tree = self.parser.parse_string('class Foo {'
+                                        '    int bar(int a) { return a + 1; }'
+                                        '    int baz(int a) { return a + 1; }'
+                                        '    int qux(int b) { return b + 1; }'
+                                        '}')
+        bar, baz, qux = tree.type_declarations[0].body
+        clones = {}
+        for method in (bar, baz, qux):
+            clones.setdefault((method.parameters[0], method.body[0]), []).append(method.name)
+        self.assertEqual(sorted(clones.values()), [['bar', 'baz'], ['qux']])
+        self.assertEqual(hash(self.parser.parse_expression('1 + 2')),
+                         hash(model.Additive('+', model.Literal('1'), model.Literal('2'))))
+
+        deep = 'a' + ' + a' * 10000
+        self.assertEqual(hash(self.parser.parse_expression(deep)),
+                         hash(self.parser.parse_expression(deep)))
+
+    def test_hash_invalidated(self):
+        statement = self.parser.parse_statement('return a + 1;')
+        other = self.parser.parse_statement('return a + 1;')
+        self.assertEqual(hash(statement), hash(other))
+        statement.result.rhs.value = '2'
+        self.assertNotEqual(statement, other)
+        self.assertEqual(hash(statement), hash(self.parser.parse_statement('return a + 2;')))
+        statement.result = other.result
+        self.assertEqual(hash(statement), hash(other))
+        self.assertEqual(statement, other)
+
+        # changing a list of subnodes in place is not noticed, equality
+        # does not depend on cached hashes though
+        block = self.parser.parse_statement('{ return; }')
+        empty = self.parser.parse_statement('{ }')
+        self.assertNotEqual(hash(block), hash(empty))
+        block.statements.pop()
+        self.assertEqual(block, empty)
+        model.forget_hashes()
+        self.assertEqual(hash(block), hash(empty))
+        block.statements.append(model.Return())
+        self.assertNotEqual(block, empty)
+        model.forget_hashes()
+        self.assertEqual(block, self.parser.parse_statement('{ return; }'))
+        self.assertEqual(hash(block), hash(self.parser.parse_statement('{ return; }')))
+
+        # hashing every subtree takes linear time
+        expression = self.parser.parse_expression('a' + ' + a' * 3000)
+        subtrees = set()
+        while isinstance(expression, model.Additive):
+            subtrees.add(expression)
+            expression = expression.lhs
+        self.assertEqual(len(subtrees), 3000)
+
+        # copies hash like the original
+        self.assertEqual(hash(pickle.loads(pickle.dumps(statement, 2))), hash(statement))
+
+class _Output(object):
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+
+class _Recorder(model.Visitor):
+
+    def __init__(self, prune=None):
+        super(_Recorder, self).__init__()
+        self.events = []
+        self.prune = prune
+
+    def __getattr__(self, name):
+        kind, _, class_name = name.partition('_')
+
+        def record(element):
+            self.events.append((class_name, kind == 'visit'))
+            return class_name != self.prune
+        return record
+
+def _recursive_accept(element, visitor):
+    # how accept() used to work
+    if isinstance(element, model.Try):
+        if visitor.visit_Try(element):
+            for s in element.block:
+                _recursive_accept(s, visitor)
+        for c in element.catches:
+            visitor.visit_Catch(c)
+        if element._finally:
+            _recursive_accept(element._finally, visitor)
+        return
+    class_name = element.__class__.__name__
+    if getattr(visitor, 'visit_' + class_name)(element):
+        for f in element._fields:
+            field = getattr(element, f)
+            if field:
+                if isinstance(field, list):
+                    for elem in field:
+                        if isinstance(elem, model.SourceElement):
+                            _recursive_accept(elem, visitor)
+                elif isinstance(field, model.SourceElement):
+                    _recursive_accept(field, visitor)
+    getattr(visitor, 'leave_' + class_name)(element)
@@ -0,0 +1,84 @@
+import pickle
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''package foo;
+
+class Foo {
+    int i = (1 + 2);
+
+    void bar() {
+        baz.qux(i);
+    }
+}
+'''
+
+class PositionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+        self.tree = self.parser.parse_string(source)
+
+    def test_offsets(self):
+        cls = self.tree.type_declarations[0]
+        self.assertEqual(self._text(self.tree.package_declaration), 'package foo;')
+        self.assertEqual(self._text(cls), source[source.index('class'):].rstrip())
+
+        field, method = cls.body
+        self.assertEqual(self._text(field), 'int i = (1 + 2);')
+        self.assertEqual(self._text(field.variable_declarators[0].initializer), '(1 + 2)')
+        self.assertEqual(self._text(field.variable_declarators[0].initializer.lhs), '1')
+
+        invocation = method.body[0].expression
+        self.assertEqual(self._text(invocation), 'baz.qux(i)')
+        self.assertEqual(self._text(invocation.target), 'baz')
+
+    def test_lines_and_columns(self):
+        method = self.tree.type_declarations[0].body[1]
+        self.assertEqual((method.lineno, method.col_offset), (6, 4))
+        self.assertEqual((method.end_lineno, method.end_col_offset), (8, 5))
+
+        invocation = method.body[0].expression
+        self.assertEqual((invocation.lineno, invocation.col_offset), (7, 8))
+
+    def test_first_line(self):
+        tree = self.parser.parse_string('class Foo {}', lineno=10)
+        self.assertEqual(tree.type_declarations[0].lineno, 10)
+
+    def test_expression(self):
+        expr = self.parser.parse_expression('a + b * c')
+        self.assertEqual((expr.start, expr.end), (0, 9))
+        self.assertEqual((expr.rhs.start, expr.rhs.end), (4, 9))
+
+    def test_nested_elements(self):
+        # elements that a grammar rule builds besides its result
+        code = 'x = (a.b[]) Foo.class; switch (x) { case 1: x++; case 2: default: }'
+        block = self.parser.parse_statement('{ ' + code + ' }')
+        assignment, switch = block.statements
+        text = lambda element: ('{ ' + code)[element.start:element.end]
+        cast = assignment.expression.rhs
+        self.assertEqual(text(cast.target), 'a.b[]')
+        self.assertEqual(text(cast.expression.type), 'Foo')
+        self.assertEqual([text(case) for case in switch.switch_cases],
+                         ['case 1: x++;', 'case 2: default:'])
+        loop = self.parser.parse_statement('for (int i[] : a) ;')
+        self.assertEqual((loop.variable.start, loop.variable.end), (9, 12))
+
+    def test_unparsed_elements(self):
+        name = model.Name('foo')
+        self.assertIsNone(name.start)
+        self.assertIsNone(name.lineno)
+
+    def test_positions_are_ignored_by_equality(self):
+        self.assertEqual(self.parser.parse_expression('foo'), model.Name('foo'))
+        self.assertEqual(self.parser.parse_expression('foo'), self.parser.parse_expression(' foo'))
+
+    def test_pickle(self):
+        tree = pickle.loads(pickle.dumps(self.tree))
+        method = tree.type_declarations[0].body[1]
+        self.assertEqual((method.lineno, method.col_offset), (6, 4))
+
+    def _text(self, element):
+        return source[element.start:element.end]
@@ -0,0 +1,64 @@
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+source = '''class Foo {
+    int x = ;
+    void bar() {
+        int y = 1;
+        foo(;
+        y++;
+    }
+    void baz() { return 1 }
+    int z;
+}
+'''
+
+class RecoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser(recover=True)
+
+    def test_without_recovery(self):
+        self.assertIsNone(plyj.Parser().parse_string(source))
+
+    def test_recovery(self):
+        tree = self.parser.parse_string(source)
+        field, bar, baz, z = tree.type_declarations[0].body
+        self.assertIsInstance(field, model.ErrorNode)
+        self.assertEqual(self._text(field), 'int x = ;')
+        self.assertEqual(len(bar.body), 3)
+        self.assertEqual(self._text(bar.body[1]), 'foo(;')
+        self.assertEqual(bar.body[2], model.ExpressionStatement(model.Unary('x++', model.Name('y'))))
+        self.assertEqual(self._text(baz.body[0]), 'return 1')
+        self.assertEqual(z.variable_declarators[0].variable.name, 'z')
+
+        self.assertEqual([(d.lineno, d.message) for d in tree.diagnostics],
+                         [(2, "unexpected ';'"), (5, "unexpected ';'"), (8, "unexpected '}'")])
+        self.assertEqual(tree.diagnostics[0].offset, source.index('= ;') + 2)
+
+    def test_clean(self):
+        tree = self.parser.parse_string('class Foo { }')
+        self.assertEqual(tree.diagnostics, [])
+
+    def test_end_of_input(self):
+        source = 'class Foo {\n    void bar() {\n        int y = 1;\n'
+        tree = self.parser.parse_string(source)
+        bar = tree.type_declarations[0].body[0]
+        self.assertEqual(len(bar.body), 1)
+        self.assertEqual([(d.offset, d.lineno, d.message) for d in tree.diagnostics],
+                         [(len(source), 4, 'unexpected end of input')])
+
+    def test_type_declaration(self):
+        tree = self.parser.parse_string('clas Foo { int x; }\nclass Bar { }')
+        self.assertIsInstance(tree.type_declarations[0], model.ErrorNode)
+        self.assertEqual(tree.type_declarations[-1].name, 'Bar')
+
+    def test_statement(self):
+        block = self.parser.parse_statement('{ foo(; bar(); }')
+        self.assertIsInstance(block.statements[0], model.ErrorNode)
+        self.assertEqual(block.statements[1].expression.name, 'bar')
+
+    def _text(self, element):
+        return source[element.start:element.end]
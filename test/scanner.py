@@ -0,0 +1,64 @@
+import ast
+import glob
+import os
+import unittest
+
+import plyj.parser as plyj
+import plyj.scanner as scanner
+
+edge_cases = (
+    '/** Javadoc\n * over several lines */ class A /* more */ {\n'
+    '    // comment at the end\n'
+    '    int a = 0x1F + 1e10 + .5f + 3.14d + 1e-5 + 07L + 1_000 + 0b1010 + 1.;\r\n'
+    '    char c = \'\\\'\', d = \'\\\\\', f = "\\"quoted\\"" + "";\r\n\r\n'
+    '\t\f  void m(String... args) {\n'
+    '        a >>>= b >>= c <<= d >>> e >> f << g >= h <= i == j != k;\n'
+    '        a = b && c || d & e | f ^ ~g & !h ? i : j;\n'
+    '        a += b -= c *= d /= e %= f &= g |= h ^= i; a++; b--; $_x1 = _;\n'
+    '    }\n'
+    '}\n')
+
+invalid = 'a..b # ` \\ \' unterminated\r "unterminated\n" /* unterminated'
+
+def corpus():
+    # the Java snippets the other tests parse
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(directory, '*.py'))):
+        with open(path) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                yield node.value
+
+class ScannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = plyj.Parser()
+
+    def tokens(self, lexer, source):
+        lexer = lexer.clone()
+        lexer.input(source)
+        return [(t.type, t.value, t.lineno, t.lexpos) for t in lexer]
+
+    def test_conforms(self):
+        for source in [edge_cases, invalid] + list(corpus()):
+            self.assertEqual(self.tokens(scanner.Scanner(), source),
+                             self.tokens(self.parser.lexer, source), source)
+
+    def test_parse(self):
+        tree = plyj.Parser(scanner=True).parse_string(edge_cases)
+        self.assertEqual(tree, self.parser.parse_string(edge_cases))
+        method = tree.type_declarations[0].body[-1]
+        self.assertEqual((method.lineno, method.col_offset), (7, 4))
+        self.assertEqual(self.parser.parse_statement('x = 1;'),
+                         plyj.Parser(scanner=True).parse_statement('x = 1;'))
+
+    def test_tokens(self):
+        source = 'int x = /* one */ 1;\nfoo("bar");'
+        tokens = list(self.parser.tokens(source))
+        self.assertEqual([(t.type, t.value, t.lineno) for t in tokens],
+                         [(t[0], t[1], t[2]) for t in self.tokens(self.parser.lexer, source)])
+        self.assertEqual([(t.start, t.end) for t in tokens[:4]],
+                         [(0, 3), (4, 5), (6, 7), (18, 19)])
+        self.assertEqual(tokens[-3].type, 'STRING_LITERAL')
+        self.assertEqual(tokens[-3].value, '"bar"')
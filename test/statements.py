@@ -27,7 +27,7 @@ class StatementTest(unittest.TestCase):
 
     def test_for(self):
         initializer = model.VariableDeclaration('int', [model.VariableDeclarator(model.Variable('i'), initializer=zero)])
-        predicate = model.BinaryExpression('<', i, ten)
+        predicate = model.Relational('<', i, ten)
         update = model.Unary('x++', i)
 
         self.assert_stmt('for(;;);', model.For(None, None, None, body=model.Empty()))
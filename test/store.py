@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+import plyj.store as store
+
+sources = {
+    'Foo.java': '''package foo;
+
+class Foo extends Bar<String> {
+    int x = -1;
+
+    void bar(int a) {
+        outer: while (a > 0) { a--; if (a == 1) continue; break outer; }
+    }
+}
+''',
+    'Baz.java': 'interface Baz { boolean baz(); }',
+}
+
+class StoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'trees.store')
+        parser = plyj.Parser()
+        self.trees = [(name, parser.parse_string(sources[name], lineno=3 if name == 'Baz.java' else 1))
+                      for name in sorted(sources)]
+        store.write_store(self.path, self.trees + [('Broken.java', None)])
+        self.store = store.Store(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_units(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.names(), ['Baz.java', 'Foo.java'])
+        self.assertEqual([unit.file for unit in self.store], ['Baz.java', 'Foo.java'])
+        for name, tree in self.trees:
+            self.assertEqual(self.store[name].load(), tree)
+            self.assertEqual(self._positions(self.store[name].load()), self._positions(tree))
+
+    def test_fields(self):
+        unit = self.store['Foo.java']
+        self.assertEqual(unit.kind, 'CompilationUnit')
+        self.assertIsNone(unit.parent)
+        self.assertEqual(unit.package_declaration.name.value, 'foo')
+        foo = unit.type_declarations[0]
+        self.assertEqual(foo.name, 'Foo')
+        self.assertEqual(foo.extends.type_arguments[0].name.value, 'String')
+        field, bar = foo.body
+        self.assertEqual(field.variable_declarators[0].initializer.load(),
+                         model.Unary('-', model.Literal('1')))
+        self.assertEqual(bar.parameters[0].type, 'int')
+        self.assertEqual(bar.modifiers, [])
+        self.assertEqual((bar.lineno, bar.col_offset, bar.end_lineno), (6, 4, 8))
+        self.assertEqual(bar.parent, foo)
+        loop = bar.body[0]
+        self.assertEqual(loop.label, 'outer')
+        self.assertRaises(AttributeError, getattr, loop.body.statements[0], 'label')
+        self.assertRaises(AttributeError, getattr, loop, 'name')
+        _, skip, stop = loop.body.statements
+        self.assertIsNone(skip.if_true.label)
+        self.assertEqual(stop.label, 'outer')
+        self.assertEqual(len(list(self.store._children(stop.node))), 1)
+        self.assertEqual(self.store['Baz.java'].type_declarations[0].lineno, 3)
+
+    def test_find(self):
+        methods = list(self.store.find('MethodDeclaration'))
+        self.assertEqual([(m.file, m.name) for m in methods], [('Baz.java', 'baz'), ('Foo.java', 'bar')])
+        self.assertEqual(list(self.store.find('Switch')), [])
+        names = [cursor.kind for cursor in self.store['Baz.java'].walk()]
+        self.assertEqual(names, ['CompilationUnit', 'InterfaceDeclaration', 'MethodDeclaration'])
+
+    def test_invalid(self):
+        path = os.path.join(self.directory, 'invalid.store')
+        for content in [b'', b'not a store' * 20]:
+            with open(path, 'wb') as f:
+                f.write(content)
+            self.assertRaises(ValueError, store.Store, path)
+
+    def _positions(self, tree):
+        positions = []
+        stack = [tree]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, list):
+                stack.extend(reversed(element))
+            elif isinstance(element, model.SourceElement):
+                positions.append((type(element).__name__, element.start, element.end,
+                                  element.lineno, element.end_col_offset))
+                stack.extend(reversed([getattr(element, name) for name in element._fields]))
+        return positions
@@ -0,0 +1,34 @@
+import unittest
+
+import plyj.parser as plyj
+
+class TablesTest(unittest.TestCase):
+
+    def test_shipped_tables_are_current(self):
+        for name in ('lextab', 'parsetab'):
+            self.assertIsNotNone(plyj._table_module(name),
+                                 '{}.py is stale, run plyj.parser.write_tables()'.format(name))
+
+    def test_grammar_hash_is_stable(self):
+        self.assertEqual(plyj.grammar_hash(), plyj.grammar_hash())
+        self.assertEqual(len(plyj.grammar_hash()), 40)
+
+    def test_parsers_share_tables(self):
+        p1 = plyj.get_parser()
+        p2 = plyj.Parser()
+        self.assertIsNot(p1.lexer, p2.lexer)
+        self.assertIsNot(p1.parser, p2.parser)
+        self.assertIs(p1.parser.action, p2.parser.action)
+        self.assertIs(p1.lexer.lexre, p2.lexer.lexre)
+
+        p1.lexer.input('class')
+        p2.lexer.input('interface')
+        self.assertEqual(p1.lexer.token().type, 'CLASS')
+        self.assertEqual(p2.lexer.token().type, 'INTERFACE')
+
+    def test_options(self):
+        parser = plyj.get_parser(scanner=True, comments=True, recover=True, raise_errors=True,
+                                 lazy_bodies=True, intern=True)
+        self.assertEqual((parser.scanner, parser.keep_comments, parser.recover,
+                          parser.raise_errors, parser.lazy_bodies, parser.intern),
+                         (True, True, True, True, True, True))
@@ -0,0 +1,65 @@
+import threading
+import unittest
+
+import plyj.parser as plyj
+import plyj.model as model
+
+class ThreadsTest(unittest.TestCase):
+
+    def test_shared_parser(self):
+        parser = plyj.Parser()
+        sources = ['class Foo{0} {{ int i{0} = {0}; void m{0}() {{ return; }} }}'.format(n)
+                   for n in range(8)]
+        expected = [plyj.Parser().parse_string(s) for s in sources]
+        results = {}
+        errors = []
+
+        def work(n):
+            try:
+                for _ in range(20):
+                    tree = parser.parse_string(sources[n])
+                    if tree != expected[n]:
+                        results[n] = tree
+                        return
+                results[n] = expected[n]
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(len(sources))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        for n, tree in enumerate(expected):
+            self.assertIsInstance(tree, model.CompilationUnit)
+            self.assertEqual(results[n], tree)
+
+    def test_lineno_is_per_call(self):
+        parser = plyj.Parser()
+        parser.parse_string('class Foo {\n\n}', lineno=10)
+        self.assertEqual(parser.lexer.lineno, 1)
+
+    def test_shared_lazy_body(self):
+        source = 'class Foo { void m() { ' + 'i++; ' * 300 + '} }'
+        for _ in range(5):
+            tree = plyj.Parser(lazy_bodies=True).parse_string(source)
+            body = tree.type_declarations[0].body[0].body
+            lengths = []
+            errors = []
+
+            def work():
+                try:
+                    lengths.append(len(body))
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            self.assertEqual(errors, [])
+            self.assertEqual(lengths, [300] * 4)